@@ -0,0 +1,70 @@
+"""add normalized property_key to properties and extracted_values
+
+Revision ID: c4e8a1f20b37
+Revises: 57754aff325d
+Create Date: 2026-10-18 09:00:00.000000
+
+Adds an indexed ``property_key`` column (lowercased name with any
+"(City, ST)" suffix stripped) so property <-> extracted value matching can
+use ``property_key IN (...)`` instead of chains of LOWER/LIKE predicates.
+Existing rows are backfilled with the same normalization as
+``app.models.property.normalize_property_key``.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a1f20b37'
+down_revision: Union[str, None] = '57754aff325d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mirrors normalize_property_key(): text before the first "(", trimmed,
+# lowercased; empty keys become NULL.
+_KEY_SQL = "NULLIF(LOWER(BTRIM(SPLIT_PART({column}, '(', 1), E' \\t\\r\\n')), '')"
+
+
+def upgrade() -> None:
+    """Add, backfill and index property_key columns."""
+    op.add_column(
+        'properties',
+        sa.Column('property_key', sa.String(length=255), nullable=True),
+    )
+    op.add_column(
+        'extracted_values',
+        sa.Column('property_key', sa.String(length=255), nullable=True),
+    )
+
+    op.execute(
+        f"UPDATE properties SET property_key = {_KEY_SQL.format(column='name')}"
+    )
+    op.execute(
+        "UPDATE extracted_values SET property_key = "
+        f"{_KEY_SQL.format(column='property_name')}"
+    )
+
+    op.create_index(
+        op.f('ix_properties_property_key'),
+        'properties',
+        ['property_key'],
+        unique=False,
+    )
+    op.create_index(
+        op.f('ix_extracted_values_property_key'),
+        'extracted_values',
+        ['property_key'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Remove property_key columns and their indexes."""
+    op.drop_index(
+        op.f('ix_extracted_values_property_key'), table_name='extracted_values'
+    )
+    op.drop_index(op.f('ix_properties_property_key'), table_name='properties')
+    op.drop_column('extracted_values', 'property_key')
+    op.drop_column('properties', 'property_key')
@@ -0,0 +1,73 @@
+"""add deal_stage_intervals table
+
+Revision ID: d7a3c91e5f02
+Revises: c4e8a1f20b37
+Create Date: 2026-10-18 10:00:00.000000
+
+Per-deal stage visits used for incremental cycle-time analytics. Existing
+history is backfilled from stage_change_logs: each logged transition opens
+an interval for its new stage that is closed by the deal's next transition.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a3c91e5f02'
+down_revision: Union[str, None] = 'c4e8a1f20b37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create deal_stage_intervals and backfill from stage_change_logs."""
+    op.create_table('deal_stage_intervals',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('deal_id', sa.Integer(), nullable=False),
+        sa.Column('stage', sa.String(length=50), nullable=False),
+        sa.Column('entered_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('exited_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('next_stage', sa.String(length=50), nullable=True),
+        sa.Column('duration_days', sa.Numeric(precision=10, scale=4), nullable=True),
+        sa.ForeignKeyConstraint(['deal_id'], ['deals.id'], name=op.f('fk_deal_stage_intervals_deal_id_deals'), ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id', name=op.f('pk_deal_stage_intervals'))
+    )
+    op.create_index(op.f('ix_deal_stage_intervals_id'), 'deal_stage_intervals', ['id'], unique=False)
+    op.create_index('ix_deal_stage_intervals_deal_open', 'deal_stage_intervals', ['deal_id', 'exited_at'], unique=False)
+    op.create_index('ix_deal_stage_intervals_stage_exited', 'deal_stage_intervals', ['stage', 'exited_at'], unique=False)
+
+    op.execute(
+        """
+        INSERT INTO deal_stage_intervals
+            (deal_id, stage, entered_at, exited_at, next_stage, duration_days)
+        SELECT
+            deal_id,
+            new_stage,
+            created_at,
+            next_at,
+            next_stage,
+            CASE WHEN next_at IS NOT NULL
+                 THEN ROUND((EXTRACT(EPOCH FROM next_at - created_at) / 86400)::numeric, 4)
+            END
+        FROM (
+            SELECT
+                deal_id,
+                new_stage,
+                created_at,
+                LEAD(created_at) OVER w AS next_at,
+                LEAD(new_stage) OVER w AS next_stage
+            FROM stage_change_logs
+            WINDOW w AS (PARTITION BY deal_id ORDER BY created_at, id)
+        ) transitions
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop deal_stage_intervals table."""
+    op.drop_index('ix_deal_stage_intervals_stage_exited', table_name='deal_stage_intervals')
+    op.drop_index('ix_deal_stage_intervals_deal_open', table_name='deal_stage_intervals')
+    op.drop_index(op.f('ix_deal_stage_intervals_id'), table_name='deal_stage_intervals')
+    op.drop_table('deal_stage_intervals')
@@ -0,0 +1,68 @@
+"""add extraction_digests table
+
+Revision ID: e2b8f4a61c93
+Revises: d7a3c91e5f02
+Create Date: 2026-10-18 11:00:00.000000
+
+Stores one content digest per (extraction run, property) so change detection
+can look up the latest digests for every property in a single query. Runs
+completed before this migration have no digests; change detection falls
+back to hashing their stored values once and records the result.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b8f4a61c93'
+down_revision: Union[str, None] = 'd7a3c91e5f02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create extraction_digests table."""
+    op.create_table(
+        'extraction_digests',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('extraction_run_id', sa.UUID(), nullable=False),
+        sa.Column('property_name', sa.String(length=255), nullable=False),
+        sa.Column('digest', sa.String(length=64), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['extraction_run_id'],
+            ['extraction_runs.id'],
+            name=op.f('fk_extraction_digests_extraction_run_id_extraction_runs'),
+            ondelete='CASCADE'
+        ),
+        sa.PrimaryKeyConstraint('id', name=op.f('pk_extraction_digests')),
+        sa.UniqueConstraint(
+            'extraction_run_id', 'property_name', name='uq_extraction_digest'
+        )
+    )
+    op.create_index(
+        op.f('ix_extraction_digests_property_name'),
+        'extraction_digests',
+        ['property_name'],
+        unique=False,
+    )
+    op.create_index(
+        op.f('ix_extraction_digests_created_at'),
+        'extraction_digests',
+        ['created_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop extraction_digests table."""
+    op.drop_index(
+        op.f('ix_extraction_digests_created_at'), table_name='extraction_digests'
+    )
+    op.drop_index(
+        op.f('ix_extraction_digests_property_name'), table_name='extraction_digests'
+    )
+    op.drop_table('extraction_digests')
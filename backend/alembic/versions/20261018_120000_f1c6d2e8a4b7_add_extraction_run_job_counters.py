@@ -0,0 +1,41 @@
+"""add job counters to extraction_runs
+
+Revision ID: f1c6d2e8a4b7
+Revises: e2b8f4a61c93
+Create Date: 2026-10-18 12:00:00.000000
+
+Fan-out extraction runs enqueue one task-queue job per file. jobs_total and
+jobs_completed track those jobs so the last one to finish can trigger the
+fan-in (property sync + hydration) exactly once.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c6d2e8a4b7'
+down_revision: Union[str, None] = 'e2b8f4a61c93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add jobs_total and jobs_completed to extraction_runs."""
+    op.add_column(
+        'extraction_runs',
+        sa.Column('jobs_total', sa.Integer(), nullable=True),
+    )
+    op.add_column(
+        'extraction_runs',
+        sa.Column(
+            'jobs_completed', sa.Integer(), nullable=False, server_default='0'
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Remove job counters from extraction_runs."""
+    op.drop_column('extraction_runs', 'jobs_completed')
+    op.drop_column('extraction_runs', 'jobs_total')
@@ -0,0 +1,39 @@
+"""add materialized frontend projection to properties
+
+Revision ID: a9d3e5c7b1f4
+Revises: f1c6d2e8a4b7
+Create Date: 2026-10-19 09:00:00.000000
+
+Stores the nested dashboard shape built by ``to_frontend_property`` on the
+row, with a version string tied to ``updated_at``. Existing rows start
+without a projection and are materialized on their next update or read.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d3e5c7b1f4'
+down_revision: Union[str, None] = 'f1c6d2e8a4b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add frontend_projection and frontend_projection_version columns."""
+    op.add_column(
+        'properties',
+        sa.Column('frontend_projection', sa.JSON(), nullable=True),
+    )
+    op.add_column(
+        'properties',
+        sa.Column('frontend_projection_version', sa.String(length=64), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Remove the frontend projection columns."""
+    op.drop_column('properties', 'frontend_projection_version')
+    op.drop_column('properties', 'frontend_projection')
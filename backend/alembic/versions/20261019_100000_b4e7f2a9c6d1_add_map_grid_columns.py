@@ -0,0 +1,87 @@
+"""add map grid columns to construction_projects and sales_data
+
+Revision ID: b4e7f2a9c6d1
+Revises: a9d3e5c7b1f4
+Create Date: 2026-10-19 10:00:00.000000
+
+Stores each row's Web Mercator pixel position at zoom 20 (see
+``app.core.map_grid``) with a composite index, so the map endpoints filter
+viewports and cluster on integers. Existing rows with coordinates are
+backfilled here; the ORM keeps the columns current afterwards.
+"""
+import math
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e7f2a9c6d1'
+down_revision: Union[str, None] = 'a9d3e5c7b1f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('construction_projects', 'sales_data')
+
+# Frozen copy of app.core.map_grid.to_grid at the time of this revision
+_WORLD_PX = 256 << 20
+_MAX_LATITUDE = 85.05112878
+
+
+def _to_grid(latitude: float, longitude: float) -> tuple[int, int]:
+    lat = max(-_MAX_LATITUDE, min(_MAX_LATITUDE, latitude))
+    lon = max(-180.0, min(180.0, longitude))
+    sin_lat = math.sin(math.radians(lat))
+    x = (lon + 180.0) / 360.0
+    y = 0.5 - math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)
+    return (
+        min(int(x * _WORLD_PX), _WORLD_PX - 1),
+        min(int(y * _WORLD_PX), _WORLD_PX - 1),
+    )
+
+
+def upgrade() -> None:
+    """Add map_grid_x/map_grid_y with a composite index and backfill them."""
+    bind = op.get_bind()
+    for table_name in TABLES:
+        op.add_column(table_name, sa.Column('map_grid_x', sa.Integer(), nullable=True))
+        op.add_column(table_name, sa.Column('map_grid_y', sa.Integer(), nullable=True))
+        op.create_index(
+            f'ix_{table_name}_map_grid',
+            table_name,
+            ['map_grid_x', 'map_grid_y'],
+        )
+
+        table = sa.table(
+            table_name,
+            sa.column('id', sa.Integer),
+            sa.column('latitude', sa.Float),
+            sa.column('longitude', sa.Float),
+            sa.column('map_grid_x', sa.Integer),
+            sa.column('map_grid_y', sa.Integer),
+        )
+        rows = bind.execute(
+            sa.select(table.c.id, table.c.latitude, table.c.longitude).where(
+                table.c.latitude.isnot(None), table.c.longitude.isnot(None)
+            )
+        ).all()
+        params = []
+        for row_id, latitude, longitude in rows:
+            grid_x, grid_y = _to_grid(latitude, longitude)
+            params.append({'row_id': row_id, 'grid_x': grid_x, 'grid_y': grid_y})
+        if params:
+            bind.execute(
+                table.update()
+                .where(table.c.id == sa.bindparam('row_id'))
+                .values(map_grid_x=sa.bindparam('grid_x'), map_grid_y=sa.bindparam('grid_y')),
+                params,
+            )
+
+
+def downgrade() -> None:
+    """Remove the map grid columns and indexes."""
+    for table_name in TABLES:
+        op.drop_index(f'ix_{table_name}_map_grid', table_name=table_name)
+        op.drop_column(table_name, 'map_grid_y')
+        op.drop_column(table_name, 'map_grid_x')
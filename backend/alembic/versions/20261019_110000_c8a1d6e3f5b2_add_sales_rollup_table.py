@@ -0,0 +1,57 @@
+"""add sales_rollup table
+
+Revision ID: c8a1d6e3f5b2
+Revises: b4e7f2a9c6d1
+Create Date: 2026-10-19 11:00:00.000000
+
+Pre-aggregated sales by (submarket, sale month, unit bucket, vintage
+bucket, star rating) for the sales analytics endpoints. The table starts
+empty and is filled by the next sales import (see
+``app.services.sales_rollup``); until then the endpoints scan sales_data.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8a1d6e3f5b2'
+down_revision: Union[str, None] = 'b4e7f2a9c6d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create sales_rollup and its (sale_month, submarket_cluster) index."""
+    op.create_table(
+        'sales_rollup',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('submarket_cluster', sa.String(length=200), nullable=True),
+        sa.Column('sale_month', sa.Date(), nullable=True),
+        sa.Column('unit_bucket', sa.String(length=20), nullable=False),
+        sa.Column('vintage_bucket', sa.String(length=20), nullable=False),
+        sa.Column('star_rating', sa.String(length=50), nullable=True),
+        sa.Column('sales_count', sa.Integer(), nullable=False),
+        sa.Column('total_volume', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('price_per_unit_sum', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('price_per_unit_count', sa.Integer(), nullable=False),
+        sa.Column('sale_price_count', sa.Integer(), nullable=False),
+        sa.Column('cap_rate_count', sa.Integer(), nullable=False),
+        sa.Column('avg_unit_sf_count', sa.Integer(), nullable=False),
+        sa.Column('property_name_count', sa.Integer(), nullable=False),
+        sa.Column('dollar_one_sales', sa.Integer(), nullable=False),
+        sa.Column('high_unit_sales', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_sales_rollup_month_submarket',
+        'sales_rollup',
+        ['sale_month', 'submarket_cluster'],
+    )
+
+
+def downgrade() -> None:
+    """Drop sales_rollup."""
+    op.drop_index('ix_sales_rollup_month_submarket', table_name='sales_rollup')
+    op.drop_table('sales_rollup')
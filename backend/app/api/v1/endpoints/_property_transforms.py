@@ -2,11 +2,18 @@
 Property data transforms — converts flat DB rows to the nested frontend shape.
 
 Extracted from properties.py to keep route definitions clean.
+
+The nested shape is materialized on the row (``frontend_projection``) when
+a property is updated through the ORM, versioned by ``updated_at`` and
+``PROJECTION_VERSION``, so list endpoints serve it without recomputing.
 """
 
 import re
+from datetime import UTC
 from decimal import Decimal
 
+from loguru import logger
+
 from app.models import Property
 
 # ---------------------------------------------------------------------------
@@ -724,3 +731,50 @@ def to_frontend_property(prop: Property) -> dict:
         },
         "lastAnalyzed": prop.updated_at.isoformat() if prop.updated_at else None,
     }
+
+
+# ---------------------------------------------------------------------------
+# Materialized projection
+# ---------------------------------------------------------------------------
+
+# Bump whenever to_frontend_property's output changes so projections stored
+# by an older build are treated as stale and rebuilt.
+PROJECTION_VERSION = 1
+
+
+def projection_version(prop: Property) -> str | None:
+    """Version a projection of *prop* in its current state carries."""
+    if prop.updated_at is None:
+        return None
+    ts = prop.updated_at
+    # SQLite returns naive UTC, PostgreSQL aware values; compare as naive UTC
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(UTC).replace(tzinfo=None)
+    return f"{PROJECTION_VERSION}:{ts.isoformat()}"
+
+
+def stored_frontend_property(prop: Property) -> dict | None:
+    """Return the stored projection if it is current, else None."""
+    if prop.frontend_projection is None:
+        return None
+    if prop.frontend_projection_version != projection_version(prop):
+        return None
+    return prop.frontend_projection
+
+
+def refresh_frontend_projection(prop: Property) -> None:
+    """Recompute and store the projection on *prop* (caller flushes).
+
+    A property the transform cannot handle is left without a projection
+    rather than failing the write; reads then rebuild it and surface the
+    error there.
+    """
+    try:
+        prop.frontend_projection = to_frontend_property(prop)
+        prop.frontend_projection_version = projection_version(prop)
+    except Exception:
+        logger.opt(exception=True).warning(
+            "property_projection_failed", property_id=prop.id
+        )
+        prop.frontend_projection = None
+        prop.frontend_projection_version = None
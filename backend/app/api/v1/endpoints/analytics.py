@@ -2,19 +2,23 @@
 Analytics endpoints for data visualization and ML predictions.
 """
 
+import asyncio
+from collections.abc import Sequence
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, literal_column, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Executable, Row, func, literal_column, select, true
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from app.core.cache import LONG_TTL, SHORT_TTL, cache
 from app.core.permissions import require_viewer
+from app.core.serialization import FastJSONResponse
 from app.db.session import get_db
 from app.models import Deal, DealStage, Property
-from app.models.activity_log import ActivityAction, ActivityLog
+from app.services.deal_cycle_times import get_cycle_times
 from app.services.ml import get_rent_growth_predictor
+from app.services.ml.prescoring import property_to_prediction_input
 
 router = APIRouter(dependencies=[Depends(require_viewer)])
 
@@ -24,6 +28,27 @@ def _decimal_to_float(value: Any) -> float | None:
     return float(value) if value is not None else None
 
 
+async def _execute_concurrently(
+    db: AsyncSession, *statements: Executable
+) -> list[Sequence[Row[Any]]]:
+    """
+    Run independent read-only statements concurrently.
+
+    Each statement gets its own pooled connection so the round-trips overlap.
+    SQLite (tests / local dev) shares a single connection, so statements run
+    sequentially on the request session there.
+    """
+    engine = db.bind
+    if not isinstance(engine, AsyncEngine) or engine.dialect.name == "sqlite":
+        return [(await db.execute(stmt)).all() for stmt in statements]
+
+    async def _run(stmt: Executable) -> Sequence[Row[Any]]:
+        async with engine.connect() as conn:
+            return (await conn.execute(stmt)).all()
+
+    return list(await asyncio.gather(*(_run(stmt) for stmt in statements)))
+
+
 def _get_time_period_start(time_period: str) -> datetime:
     """Calculate the start date based on time period."""
     now = datetime.now(UTC)
@@ -46,132 +71,7 @@ def _get_time_period_start(time_period: str) -> datetime:
         return datetime(1970, 1, 1, tzinfo=UTC)
 
 
-async def _compute_cycle_times(
-    db: AsyncSession, period_start: datetime
-) -> dict[str, float | None]:
-    """
-    Compute average deal cycle times from ActivityLog stage_changed events.
-
-    Looks at stage transitions logged in the activity_logs table to calculate
-    how long deals spend in each phase of the pipeline.
-
-    Returns dict with keys:
-        avg_initial_to_close: Average days from first stage entry to closed
-        avg_active_review: Average days spent in active review stages
-        avg_contract_to_close: Average days from under_contract to closed
-    """
-    # Fetch all stage_changed events in the period, ordered by deal and time
-    stage_events_result = await db.execute(
-        select(
-            ActivityLog.deal_id,
-            ActivityLog.meta,
-            ActivityLog.created_at,
-        )
-        .where(
-            ActivityLog.action == ActivityAction.STAGE_CHANGED,
-            ActivityLog.created_at >= period_start,
-        )
-        .order_by(ActivityLog.deal_id, ActivityLog.created_at)
-    )
-    stage_events = stage_events_result.fetchall()
-
-    if not stage_events:
-        # No stage change history available
-        return {
-            # TODO: No stage_changed events found; cycle times unavailable
-            "avg_initial_to_close": None,
-            "avg_active_review": None,
-            "avg_contract_to_close": None,
-        }
-
-    # Group events by deal_id
-    from collections import defaultdict
-
-    deal_events: dict[int, list[tuple[dict | None, datetime]]] = defaultdict(list)
-    for row in stage_events:
-        deal_events[row.deal_id].append((row.meta, row.created_at))
-
-    # Active review stages (backend enum values)
-    active_review_stages = {"underwriting", "due_diligence", "loi_submitted"}
-    # Initial stages
-    initial_stages = {"lead", "initial_review"}
-
-    initial_to_close_days: list[float] = []
-    active_review_days: list[float] = []
-    contract_to_close_days: list[float] = []
-
-    for _deal_id, events in deal_events.items():
-        first_entry_time: datetime | None = None
-        active_review_enter: datetime | None = None
-        active_review_total: float = 0
-        contract_enter: datetime | None = None
-        closed_time: datetime | None = None
-
-        for meta, created_at in events:
-            if not meta:
-                continue
-            old_stage = meta.get("old_stage")
-            new_stage = meta.get("new_stage")
-
-            # Track first pipeline entry (entering initial stages)
-            if first_entry_time is None and new_stage in (
-                initial_stages | active_review_stages | {"under_contract"}
-            ):
-                first_entry_time = created_at
-
-            # Track entering active review
-            if new_stage in active_review_stages and active_review_enter is None:
-                active_review_enter = created_at
-
-            # Track leaving active review
-            if (
-                old_stage in active_review_stages
-                and new_stage not in active_review_stages
-                and active_review_enter is not None
-            ):
-                active_review_total += (
-                    created_at - active_review_enter
-                ).total_seconds() / 86400
-                active_review_enter = None
-
-            # Track entering under_contract
-            if new_stage == "under_contract":
-                contract_enter = created_at
-
-            # Track closing
-            if new_stage == "closed":
-                closed_time = created_at
-
-        # Compute per-deal metrics
-        if first_entry_time and closed_time:
-            days = (closed_time - first_entry_time).total_seconds() / 86400
-            initial_to_close_days.append(days)
-
-        if active_review_total > 0:
-            active_review_days.append(active_review_total)
-
-        if contract_enter and closed_time:
-            days = (closed_time - contract_enter).total_seconds() / 86400
-            contract_to_close_days.append(days)
-
-    return {
-        "avg_initial_to_close": round(
-            sum(initial_to_close_days) / len(initial_to_close_days), 1
-        )
-        if initial_to_close_days
-        else None,
-        "avg_active_review": round(sum(active_review_days) / len(active_review_days), 1)
-        if active_review_days
-        else None,
-        "avg_contract_to_close": round(
-            sum(contract_to_close_days) / len(contract_to_close_days), 1
-        )
-        if contract_to_close_days
-        else None,
-    }
-
-
-@router.get("/dashboard")
+@router.get("/dashboard", response_class=FastJSONResponse)
 async def get_dashboard_metrics(
     db: AsyncSession = Depends(get_db),
 ):
@@ -184,86 +84,76 @@ async def get_dashboard_metrics(
     - Recent activity
     """
     cache_key = "analytics_dashboard"
-    cached = await cache.get(cache_key)
+    cached = await cache.get_raw(cache_key)
     if cached is not None:
-        return cached
+        return FastJSONResponse(cached)
 
-    # Query portfolio summary from Property table
-    property_stats = await db.execute(
-        select(
-            func.count(Property.id).label("total_properties"),
-            func.coalesce(func.sum(Property.total_units), 0).label("total_units"),
-            func.coalesce(func.sum(Property.total_sf), 0).label("total_sf"),
-            func.coalesce(func.sum(Property.current_value), 0).label("total_value"),
-            func.avg(Property.occupancy_rate).label("avg_occupancy"),
-            func.avg(Property.cap_rate).label("avg_cap_rate"),
-        )
-    )
-    prop_row = property_stats.fetchone()
-
-    # Get YTD start date
     ytd_start = _get_time_period_start("ytd")
+    week_start = datetime.now(UTC) - timedelta(days=7)
 
-    # Query deal pipeline metrics
-    deal_pipeline_stats = await db.execute(
-        select(func.count(Deal.id)).where(
-            Deal.stage.notin_([DealStage.CLOSED, DealStage.DEAD])
-        )
-    )
-    deals_in_pipeline = deal_pipeline_stats.scalar() or 0
-
-    # Query deals closed YTD
-    deals_closed_ytd_result = await db.execute(
-        select(
-            func.count(Deal.id).label("count"),
-            func.coalesce(func.sum(Deal.final_price), 0).label("capital_deployed"),
-        ).where(
-            Deal.stage == DealStage.CLOSED,
-            Deal.actual_close_date >= ytd_start.date(),
-        )
-    )
-    closed_row = deals_closed_ytd_result.fetchone()
-    deals_closed_ytd = closed_row.count if closed_row else 0
-    capital_deployed_ytd = _decimal_to_float(
-        closed_row.capital_deployed if closed_row else 0
-    )
-
-    # Query properties with low occupancy (alerts)
-    low_occupancy_count_result = await db.execute(
-        select(func.count(Property.id)).where(
-            Property.occupancy_rate < 90.0,
-            Property.occupancy_rate.isnot(None),
-        )
+    # Portfolio and deal aggregates in a single statement: one single-row CTE
+    # per table, each metric selected with an aggregate FILTER clause.
+    property_stats = select(
+        func.count(Property.id).label("total_properties"),
+        func.coalesce(func.sum(Property.total_units), 0).label("total_units"),
+        func.coalesce(func.sum(Property.total_sf), 0).label("total_sf"),
+        func.coalesce(func.sum(Property.current_value), 0).label("total_value"),
+        func.avg(Property.occupancy_rate).label("avg_occupancy"),
+        func.avg(Property.cap_rate).label("avg_cap_rate"),
+        func.count(Property.id)
+        .filter(Property.occupancy_rate < 90.0)
+        .label("low_occupancy_count"),
+    ).cte("property_stats")
+
+    closed_ytd = (Deal.stage == DealStage.CLOSED) & (
+        Deal.actual_close_date >= ytd_start.date()
     )
-    low_occupancy_count = low_occupancy_count_result.scalar() or 0
-
-    # Query deals entering active review this week
-    week_start = datetime.now(UTC) - timedelta(days=7)
-    active_review_result = await db.execute(
-        select(func.count(Deal.id)).where(
+    deal_stats = select(
+        func.count(Deal.id)
+        .filter(Deal.stage.notin_([DealStage.CLOSED, DealStage.DEAD]))
+        .label("deals_in_pipeline"),
+        func.count(Deal.id).filter(closed_ytd).label("deals_closed_ytd"),
+        func.coalesce(func.sum(Deal.final_price).filter(closed_ytd), 0).label(
+            "capital_deployed"
+        ),
+        func.count(Deal.id)
+        .filter(
             Deal.stage == DealStage.ACTIVE_REVIEW,
             Deal.stage_updated_at >= week_start,
         )
+        .label("active_review_count"),
+    ).cte("deal_stats")
+
+    metrics_stmt = select(property_stats, deal_stats).select_from(
+        property_stats.join(deal_stats, true())
     )
-    active_review_count = active_review_result.scalar() or 0
 
-    # Query recent deal activity (last 10 stage changes)
-    recent_deals_result = await db.execute(
+    # Recent deal stage changes and property updates (independent list queries)
+    recent_deals_stmt = (
         select(Deal.name, Deal.stage, Deal.stage_updated_at)
         .where(Deal.stage_updated_at.isnot(None))
         .order_by(Deal.stage_updated_at.desc())
         .limit(5)
     )
-    recent_deals = recent_deals_result.fetchall()
-
-    # Query recent property updates
-    recent_properties_result = await db.execute(
+    recent_properties_stmt = (
         select(Property.name, Property.updated_at)
         .where(Property.updated_at.isnot(None))
         .order_by(Property.updated_at.desc())
         .limit(5)
     )
-    recent_properties = recent_properties_result.fetchall()
+
+    metrics_rows, recent_deals, recent_properties = await _execute_concurrently(
+        db, metrics_stmt, recent_deals_stmt, recent_properties_stmt
+    )
+    prop_row = metrics_rows[0] if metrics_rows else None
+
+    deals_in_pipeline = prop_row.deals_in_pipeline if prop_row else 0
+    deals_closed_ytd = prop_row.deals_closed_ytd if prop_row else 0
+    capital_deployed_ytd = _decimal_to_float(
+        prop_row.capital_deployed if prop_row else 0
+    )
+    low_occupancy_count = prop_row.low_occupancy_count if prop_row else 0
+    active_review_count = prop_row.active_review_count if prop_row else 0
 
     # Map backend stage values to frontend display labels
     _stage_display_map = {
@@ -352,8 +242,7 @@ async def get_dashboard_metrics(
                 },
             ],
         }
-        await cache.set(cache_key, mock_result, ttl=LONG_TTL)
-        return mock_result
+        return FastJSONResponse(await cache.set(cache_key, mock_result, ttl=LONG_TTL))
 
     # Build alerts based on actual data
     alerts = []
@@ -404,8 +293,7 @@ async def get_dashboard_metrics(
         else [{"type": "info", "message": "No recent activity", "timestamp": None}],
     }
 
-    await cache.set(cache_key, result, ttl=SHORT_TTL)
-    return result
+    return FastJSONResponse(await cache.set(cache_key, result, ttl=SHORT_TTL))
 
 
 @router.get("/portfolio")
@@ -749,6 +637,58 @@ async def predict_rent_growth(
     }
 
 
+@router.get("/rent-prediction/{property_id}")
+async def get_property_rent_prediction(
+    property_id: int,
+    prediction_months: int = Query(12, ge=1, le=60),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get the rent growth forecast for a portfolio property.
+
+    Served from the precomputed prediction cache; the property is only
+    loaded and scored on a cache miss.
+
+    - **property_id**: Property ID
+    - **prediction_months**: Forecast horizon in months (1-60)
+    """
+    predictor = await get_rent_growth_predictor()
+    prediction = predictor.get_cached_prediction(property_id, prediction_months)
+    cached = prediction is not None
+
+    if prediction is None:
+        prop = await db.get(Property, property_id)
+        if prop is None or prop.is_deleted:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Property {property_id} not found",
+            )
+        prediction = predictor.predict(
+            property_to_prediction_input(prop), prediction_months
+        )
+
+    if not prediction:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Prediction failed",
+        )
+
+    return {
+        "property_id": prediction.property_id,
+        "current_rent": prediction.current_rent,
+        "predicted_rent": prediction.predicted_rent,
+        "predicted_growth_rate": prediction.predicted_growth_rate,
+        "confidence_interval": {
+            "lower": prediction.confidence_interval[0],
+            "upper": prediction.confidence_interval[1],
+        },
+        "prediction_period_months": prediction.prediction_period_months,
+        "model_version": prediction.model_version,
+        "prediction_date": prediction.prediction_date,
+        "cached": cached,
+    }
+
+
 @router.post("/rent-prediction/batch")
 async def predict_rent_growth_batch(
     properties: list[dict],
@@ -778,7 +718,7 @@ async def predict_rent_growth_batch(
     }
 
 
-@router.get("/deal-pipeline")
+@router.get("/deal-pipeline", response_class=FastJSONResponse)
 async def get_deal_pipeline_analytics(
     time_period: str = Query("ytd", pattern="^(mtd|qtd|ytd|1y|all)$"),
     db: AsyncSession = Depends(get_db),
@@ -787,9 +727,9 @@ async def get_deal_pipeline_analytics(
     Get deal pipeline analytics and metrics.
     """
     cache_key = f"deal_stats:{time_period}"
-    cached = await cache.get(cache_key)
+    cached = await cache.get_raw(cache_key)
     if cached is not None:
-        return cached
+        return FastJSONResponse(cached)
 
     # Get time period start date
     period_start = _get_time_period_start(time_period)
@@ -875,8 +815,7 @@ async def get_deal_pipeline_analytics(
                 "capital_deployed": 85000000,
             },
         }
-        await cache.set(cache_key, mock_result, ttl=LONG_TTL)
-        return mock_result
+        return FastJSONResponse(await cache.set(cache_key, mock_result, ttl=LONG_TTL))
 
     # Calculate conversion rates using the 6 frontend stages
     def calc_conversion(from_count: int, to_count: int) -> float:
@@ -941,8 +880,8 @@ async def get_deal_pipeline_analytics(
     ) or 0
     avg_deal_size = total_value / total_reviewed if total_reviewed > 0 else 0
 
-    # Compute cycle times from ActivityLog stage_changed events
-    cycle_times = await _compute_cycle_times(db, period_start)
+    # Cycle times from incrementally maintained deal stage intervals
+    cycle_times = await get_cycle_times(db, period_start)
 
     result = {
         "time_period": time_period,
@@ -968,5 +907,4 @@ async def get_deal_pipeline_analytics(
         },
     }
 
-    await cache.set(cache_key, result, ttl=SHORT_TTL)
-    return result
+    return FastJSONResponse(await cache.set(cache_key, result, ttl=SHORT_TTL))
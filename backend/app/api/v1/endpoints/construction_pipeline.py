@@ -12,17 +12,27 @@ import os
 from datetime import UTC, date, datetime
 from typing import Any
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from loguru import logger
 from sqlalchemy import case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.v1.utils.facets import facet_options
 from app.api.v1.utils.filters import (
     apply_numeric_range_filter,
     apply_search_filter,
     parse_csv_list,
 )
+from app.api.v1.utils.map_view import (
+    MapViewport,
+    cluster_select,
+    select_points,
+    to_clusters,
+)
+from app.api.v1.utils.pagination import cached_count
+from app.core.cache import cache, make_cache_key_from_params
 from app.core.permissions import require_viewer
+from app.crud.base import keyset_order, keyset_paginate
 from app.db.session import get_db, get_sync_db
 from app.models.construction import (
     ConstructionEmploymentData,
@@ -41,6 +51,8 @@ from app.schemas.construction import (
     PermitVelocityPoint,
     PipelineFunnelItem,
     PipelineSummaryItem,
+    ProjectMapPoint,
+    ProjectMapResponse,
     ProjectRecord,
     SubmarketPipelineItem,
 )
@@ -56,6 +68,7 @@ from app.schemas.construction import (
 from app.schemas.construction import (
     ConstructionImportStatusResponse as ImportStatusResponse,
 )
+from app.schemas.pagination import encode_cursor
 
 router = APIRouter(dependencies=[Depends(require_viewer)])
 
@@ -73,6 +86,9 @@ CONSTRUCTION_DATA_DIR = os.path.join(
 )
 CONSTRUCTION_DATA_DIR = os.path.normpath(CONSTRUCTION_DATA_DIR)
 
+# Cached list totals, keyed by filter set (cleared after imports)
+_COUNT_CACHE_PREFIX = "construction_count"
+
 
 # ── Shared filter helper ──────────────────────────────────────────────────────
 
@@ -144,78 +160,26 @@ def _apply_filters(
 
 @router.get("/filter-options", response_model=FilterOptionsResponse)
 async def filter_options(db: AsyncSession = Depends(get_db)):
-    """Return distinct values for filter dropdowns."""
-    submarkets = [
-        row[0]
-        for row in (
-            await db.execute(
-                select(ConstructionProject.submarket_cluster)
-                .where(
-                    ConstructionProject.submarket_cluster.isnot(None),
-                    ConstructionProject.submarket_cluster != "",
-                )
-                .distinct()
-                .order_by(ConstructionProject.submarket_cluster)
-            )
-        ).all()
-    ]
-    cities = [
-        row[0]
-        for row in (
-            await db.execute(
-                select(ConstructionProject.city)
-                .where(
-                    ConstructionProject.city.isnot(None),
-                    ConstructionProject.city != "",
-                )
-                .distinct()
-                .order_by(ConstructionProject.city)
-            )
-        ).all()
-    ]
-    statuses = [
-        row[0]
-        for row in (
-            await db.execute(
-                select(ConstructionProject.pipeline_status)
-                .where(ConstructionProject.pipeline_status.isnot(None))
-                .distinct()
-                .order_by(ConstructionProject.pipeline_status)
-            )
-        ).all()
-    ]
-    classifications = [
-        row[0]
-        for row in (
-            await db.execute(
-                select(ConstructionProject.primary_classification)
-                .where(ConstructionProject.primary_classification.isnot(None))
-                .distinct()
-                .order_by(ConstructionProject.primary_classification)
-            )
-        ).all()
-    ]
-    rent_types = [
-        row[0]
-        for row in (
-            await db.execute(
-                select(ConstructionProject.rent_type)
-                .where(
-                    ConstructionProject.rent_type.isnot(None),
-                    ConstructionProject.rent_type != "",
-                )
-                .distinct()
-                .order_by(ConstructionProject.rent_type)
-            )
-        ).all()
-    ]
-    return FilterOptionsResponse(
-        submarkets=submarkets,
-        cities=cities,
-        statuses=statuses,
-        classifications=classifications,
-        rent_types=rent_types,
+    """Return distinct values, counts and ranges for filter dropdowns.
+
+    Cached until the next import or API fetch.
+    """
+    options = await facet_options(
+        db,
+        "construction",
+        facets={
+            "submarkets": ConstructionProject.submarket_cluster,
+            "cities": ConstructionProject.city,
+            "statuses": ConstructionProject.pipeline_status,
+            "classifications": ConstructionProject.primary_classification,
+            "rent_types": ConstructionProject.rent_type,
+        },
+        ranges={
+            "units": ConstructionProject.number_of_units,
+            "year_built": ConstructionProject.year_built,
+        },
     )
+    return FilterOptionsResponse(**options)
 
 
 # ── 1. GET / — Paginated table data ──────────────────────────────────────────
@@ -243,6 +207,13 @@ async def list_projects(
     page_size: int = Query(50, ge=1, le=200),
     sort_by: str = Query("id"),
     sort_dir: str = Query("desc"),
+    cursor: str | None = Query(
+        None, description="Keyset cursor from a previous response (overrides page)"
+    ),
+    direction: str = Query(
+        "next", pattern="^(next|prev)$", description="Cursor direction"
+    ),
+    exact_total: bool = Query(False, description="Count instead of cached total"),
     search: str | None = None,
     statuses: str | None = None,
     classifications: str | None = None,
@@ -255,52 +226,73 @@ async def list_projects(
     rent_type: str | None = None,
     db: AsyncSession = Depends(get_db),
 ):
-    """Paginated, filterable, sortable list of construction projects."""
+    """Paginated, filterable, sortable list of construction projects.
+
+    Pages by ``page`` (OFFSET) or, when ``cursor`` is given, by keyset from
+    a previous response's ``next_cursor``/``prev_cursor``, which stays fast
+    on deep pages. ``total`` is a per-filter cached count unless
+    ``exact_total`` is set.
+    """
+    filters: dict[str, Any] = {
+        "search": search,
+        "statuses": statuses,
+        "classifications": classifications,
+        "submarkets": submarkets,
+        "cities": cities,
+        "min_units": min_units,
+        "max_units": max_units,
+        "min_year_built": min_year_built,
+        "max_year_built": max_year_built,
+        "rent_type": rent_type,
+    }
 
     # Count query
-    count_stmt = select(func.count()).select_from(ConstructionProject)
     count_stmt = _apply_filters(
+        select(func.count()).select_from(ConstructionProject), **filters
+    )
+    total, total_estimated = await cached_count(
+        db,
         count_stmt,
-        search,
-        statuses,
-        classifications,
-        submarkets,
-        cities,
-        min_units,
-        max_units,
-        min_year_built,
-        max_year_built,
-        rent_type,
+        make_cache_key_from_params(_COUNT_CACHE_PREFIX, **filters),
+        exact=exact_total,
     )
-    total = (await db.execute(count_stmt)).scalar() or 0
 
     # Data query
-    data_stmt = select(ConstructionProject)
-    data_stmt = _apply_filters(
-        data_stmt,
-        search,
-        statuses,
-        classifications,
-        submarkets,
-        cities,
-        min_units,
-        max_units,
-        min_year_built,
-        max_year_built,
-        rent_type,
-    )
-
+    data_stmt = _apply_filters(select(ConstructionProject), **filters)
     sort_col = _SORTABLE_COLUMNS.get(sort_by, ConstructionProject.id)
-    if sort_dir.lower() == "asc":
-        data_stmt = data_stmt.order_by(sort_col.asc().nulls_last())
-    else:
-        data_stmt = data_stmt.order_by(sort_col.desc().nulls_last())
-
-    offset = (page - 1) * page_size
-    data_stmt = data_stmt.offset(offset).limit(page_size)
+    order_desc = sort_dir.lower() != "asc"
 
-    result = await db.execute(data_stmt)
-    rows = result.scalars().all()
+    if cursor:
+        try:
+            page_result = await keyset_paginate(
+                db,
+                data_stmt,
+                sort_col=sort_col,
+                id_col=ConstructionProject.id,
+                cursor=cursor,
+                limit=page_size,
+                direction=direction,
+                order_desc=order_desc,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        rows = page_result.items
+        next_cursor, prev_cursor = page_result.next_cursor, page_result.prev_cursor
+        has_more = page_result.has_more
+    else:
+        data_stmt = data_stmt.order_by(
+            *keyset_order(sort_col, ConstructionProject.id, order_desc=order_desc)
+        )
+        offset = (page - 1) * page_size
+        result = await db.execute(data_stmt.offset(offset).limit(page_size + 1))
+        rows = list(result.scalars().all())
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        next_cursor = prev_cursor = None
+        if has_more:
+            next_cursor = encode_cursor(getattr(rows[-1], sort_col.key), rows[-1].id)
+        if rows and page > 1:
+            prev_cursor = encode_cursor(getattr(rows[0], sort_col.key), rows[0].id)
 
     records = [
         ProjectRecord(
@@ -338,6 +330,10 @@ async def list_projects(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
+        has_more=has_more,
+        total_estimated=total_estimated,
     )
 
 
@@ -358,7 +354,10 @@ async def list_all_projects(
     rent_type: str | None = None,
     db: AsyncSession = Depends(get_db),
 ):
-    """Return all projects without pagination (used by map view)."""
+    """Return all projects without pagination.
+
+    Map views should use ``/map``, which only returns the viewport.
+    """
     data_stmt = select(ConstructionProject)
     data_stmt = _apply_filters(
         data_stmt,
@@ -408,6 +407,78 @@ async def list_all_projects(
     ]
 
 
+# ── 1c. GET /map — Viewport clusters or points for the map view ─────────────
+
+
+@router.get("/map", response_model=ProjectMapResponse)
+async def project_map(
+    viewport: MapViewport = Depends(),
+    search: str | None = None,
+    statuses: str | None = None,
+    classifications: str | None = None,
+    submarkets: str | None = None,
+    cities: str | None = None,
+    min_units: int | None = None,
+    max_units: int | None = None,
+    min_year_built: int | None = None,
+    max_year_built: int | None = None,
+    rent_type: str | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Return the projects inside the map viewport.
+
+    Below ``MAP_CLUSTER_MAX_ZOOM`` projects are aggregated per grid cell;
+    from it upwards each project is a compact point, up to ``MAP_MAX_POINTS``
+    (``truncated`` is set when more match).
+    """
+    filters = (
+        search,
+        statuses,
+        classifications,
+        submarkets,
+        cities,
+        min_units,
+        max_units,
+        min_year_built,
+        max_year_built,
+        rent_type,
+    )
+
+    if viewport.clustered:
+        stmt = _apply_filters(
+            cluster_select(ConstructionProject, viewport.zoom), *filters
+        )
+        stmt = viewport.filter(stmt, ConstructionProject)
+        clusters = to_clusters(await db.execute(stmt), viewport.zoom)
+        return ProjectMapResponse(
+            zoom=viewport.zoom,
+            clustered=True,
+            total=sum(c.count for c in clusters),
+            clusters=clusters,
+        )
+
+    stmt = select(
+        ConstructionProject.id,
+        ConstructionProject.latitude,
+        ConstructionProject.longitude,
+        ConstructionProject.project_name,
+        ConstructionProject.pipeline_status,
+        ConstructionProject.primary_classification,
+        ConstructionProject.number_of_units,
+    )
+    stmt = viewport.filter(_apply_filters(stmt, *filters), ConstructionProject)
+    rows, total, truncated = await select_points(
+        db, stmt.order_by(ConstructionProject.id)
+    )
+    return ProjectMapResponse(
+        zoom=viewport.zoom,
+        clustered=False,
+        total=total,
+        truncated=truncated,
+        points=[ProjectMapPoint.model_validate(r) for r in rows],
+    )
+
+
 # ── 2. GET /analytics/pipeline-summary ────────────────────────────────────────
 
 
@@ -927,7 +998,10 @@ async def data_quality(db: AsyncSession = Depends(get_db)):
 
 
 @router.post("/import", response_model=ImportResponse)
-def trigger_import(db_sync=Depends(get_sync_db)):
+def trigger_import(
+    background_tasks: BackgroundTasks,
+    db_sync=Depends(get_sync_db),
+):
     """Import any unimported CoStar construction Excel files."""
     from app.services.construction_import import (
         get_unimported_files,
@@ -952,6 +1026,8 @@ def trigger_import(db_sync=Depends(get_sync_db)):
             total_updated += result.rows_updated
             if result.errors:
                 logger.warning(f"Import errors for {result.filename}: {result.errors}")
+        background_tasks.add_task(cache.invalidate_pattern, f"{_COUNT_CACHE_PREFIX}*")
+        background_tasks.add_task(cache.invalidate_filter_options, "construction")
 
         return ImportResponse(
             success=True,
@@ -1143,6 +1219,8 @@ async def fetch_all_apis() -> FetchAllResponse:
             logger.exception(f"{name}_manual_fetch_error")
             errors.append(f"{name}: {e}")
 
+    await cache.invalidate_filter_options("construction")
+
     msg = f"Fetched data from {len(results)} sources"
     if errors:
         msg += f" ({len(errors)} errors: {'; '.join(errors)})"
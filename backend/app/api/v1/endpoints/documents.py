@@ -2,11 +2,13 @@
 Document endpoints for document management.
 """
 
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, status
+from fastapi.responses import FileResponse
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.file_validation import validate_upload
 from app.core.permissions import require_analyst, require_manager, require_viewer
 from app.crud.crud_document import document as document_crud
 from app.db.session import get_db
@@ -19,6 +21,10 @@ from app.schemas.document import (
     DocumentUpdate,
     DocumentUploadResponse,
 )
+from app.services.document_storage import (
+    DocumentValidationError,
+    get_document_storage,
+)
 
 router = APIRouter(dependencies=[Depends(require_viewer)])
 
@@ -248,11 +254,10 @@ async def create_document(
     response_model=DocumentUploadResponse,
     dependencies=[Depends(require_analyst)],
     summary="Upload a document",
-    description="Upload a document file with metadata. File content is validated for type "
-    "and size. Note: file storage backend is not yet implemented — metadata is saved but "
-    "file content is not persisted.",
+    description="Upload a document file with metadata. The file is streamed to "
+    "content-addressed storage; type, size and content are validated while streaming.",
     responses={
-        200: {"description": "Document uploaded and metadata saved"},
+        200: {"description": "Document stored and metadata saved"},
         422: {"description": "File validation failed (invalid type, size, or content)"},
     },
 )
@@ -271,23 +276,20 @@ async def upload_document(
     """
     Upload a document file with metadata.
 
-    Note: File storage is not yet implemented. This endpoint currently
-    saves metadata only. File content will be stored when storage
-    backend is configured.
+    The file is written to storage in chunks and never held in memory as
+    a whole. Identical files are stored once.
     """
     # Parse tags from comma-separated string
     tag_list = [t.strip() for t in tags.split(",")] if tags else None
 
-    # Read file content and validate
-    file_content = await file.read()
-    validation = validate_upload(file.filename, file.content_type, file_content)
-    if not validation.valid:
+    # Stream file content to storage, validating as it is read
+    try:
+        stored = await get_document_storage().save_upload(file)
+    except DocumentValidationError as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=validation.error,
-        )
-
-    file_size = len(file_content)
+            detail=str(e),
+        ) from e
 
     # Create document data
     document_data = DocumentCreate(
@@ -295,37 +297,39 @@ async def upload_document(
         type=type,
         property_id=property_id,
         property_name=property_name,
-        size=file_size,
+        size=stored.size,
         mime_type=file.content_type,
         uploaded_by=uploaded_by,
         description=description,
         tags=tag_list,
-        url="",  # Will be set when storage is implemented
-        file_path="",  # Will be set when storage is implemented
+        url="",
+        file_path=stored.file_path,
     )
 
     # Create document in database
     new_doc = await document_crud.create(db, obj_in=document_data)
 
     logger.info(
-        f"Uploaded document: {new_doc.name} (ID: {new_doc.id}, size: {file_size})"
+        f"Uploaded document: {new_doc.name} (ID: {new_doc.id}, size: {stored.size})"
     )
 
     return DocumentUploadResponse(
         document=new_doc,  # type: ignore[arg-type]
-        message=f"Document '{file.filename}' uploaded successfully. Note: File storage not yet implemented.",
+        message=f"Document '{file.filename}' uploaded successfully.",
     )
 
 
 @router.get(
     "/{document_id}/download",
     summary="Download a document",
-    description="Download a document file by ID. Note: file storage is not yet implemented — "
-    "this endpoint currently returns 501 Not Implemented.",
+    description="Download a document file by ID. Supports `Range` requests "
+    "(206 Partial Content) for resumable and partial downloads.",
+    response_class=FileResponse,
     responses={
         200: {"description": "File content stream"},
-        404: {"description": "Document not found or deleted"},
-        501: {"description": "File download not yet implemented"},
+        206: {"description": "Requested byte range of the file"},
+        404: {"description": "Document not found, deleted, or has no stored file"},
+        416: {"description": "Requested range not satisfiable"},
     },
 )
 async def download_document(
@@ -335,7 +339,8 @@ async def download_document(
     """
     Download a document file.
 
-    Note: File storage is not yet implemented. Returns 501 Not Implemented.
+    The file is streamed from storage (or sent zero-copy where the server
+    supports it); ``Range`` and ``If-Range`` are handled by ``FileResponse``.
     """
     doc = await document_crud.get(db, document_id)
 
@@ -345,10 +350,21 @@ async def download_document(
             detail=f"Document {document_id} not found",
         )
 
-    # File storage not yet implemented
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED,
-        detail="File download not yet implemented. Storage backend required.",
+    try:
+        path = get_document_storage().resolve(doc.file_path or "")
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No stored file for document {document_id}",
+        ) from None
+
+    # Stored files are immutable, so the content hash is a strong ETag
+    return FileResponse(
+        path,
+        media_type=doc.mime_type,
+        filename=doc.name,
+        headers={"ETag": f'"{path.stem}"'},
+        stat_result=await asyncio.to_thread(path.stat),
     )
 
 
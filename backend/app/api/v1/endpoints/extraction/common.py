@@ -10,9 +10,15 @@ This module contains:
 
 import asyncio
 import hashlib
+import queue
 import re
-import tempfile
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
+from collections.abc import Callable, Generator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from pathlib import Path
 from uuid import UUID
 
@@ -26,10 +32,17 @@ from app.extraction.sharepoint import (
     SharePointClient,
     SharePointFile,
 )
+from app.extraction.workbook_store import WorkbookStore, get_workbook_store
 from app.services.extraction.metrics import FileMetrics, RunMetrics
+from app.services.progress_stream import (
+    ProgressEvent,
+    ProgressStream,
+    progress_streams,
+)
 
 # Folder name → DealStage value mapping (canonical source in stage_mapping)
 from app.services.stage_mapping import STAGE_FOLDER_MAP
+from app.services.websocket_manager import Channel
 
 logger = _base_logger.bind(component="extraction_api")
 
@@ -188,19 +201,38 @@ async def discover_sharepoint_files() -> list[SharePointFile]:
 
 
 async def download_sharepoint_file(
-    client: SharePointClient, file: SharePointFile, temp_dir: str
+    client: SharePointClient,
+    file: SharePointFile,
+    temp_dir: str | None = None,
+    store: WorkbookStore | None = None,
 ) -> tuple[str, str]:
     """
-    Download a SharePoint file to a temporary directory.
+    Fetch a SharePoint file to local disk.
+
+    By default the file is served from the workbook store, which skips
+    the download when the file's ETag is unchanged. Passing *temp_dir*
+    writes a fresh download there instead.
 
     Args:
         client: SharePointClient instance.
         file: SharePointFile to download.
-        temp_dir: Temporary directory path.
+        temp_dir: Optional directory for an uncached download.
+        store: Workbook store to use (defaults to the configured store).
 
     Returns:
         Tuple of (local file path, SHA-256 content hash).
     """
+    if temp_dir is None:
+        stored, downloaded = await (store or get_workbook_store()).fetch(client, file)
+        logger.info(
+            "sharepoint_file_downloaded" if downloaded else "sharepoint_file_cached",
+            name=file.name,
+            size=stored.size,
+            content_hash=stored.content_hash[:12],
+            deal_name=file.deal_name,
+        )
+        return str(stored.local_path), stored.content_hash
+
     content = await client.download_file(file)
     content_hash = hashlib.sha256(content).hexdigest()
     local_path = Path(temp_dir) / file.name
@@ -221,6 +253,7 @@ def _extract_single_file(
     deal_name: str,
     validate: bool = True,
     base_mappings: dict | None = None,
+    progress_callback: Callable[[int, int], None] | None = None,
 ) -> tuple[str, str, dict | None, str | None]:
     """Extract data from a single Excel file (CPU-bound, thread-safe).
 
@@ -233,6 +266,9 @@ def _extract_single_file(
     are resolved dynamically because the total row varies per file based
     on the property's unit count.
 
+    *progress_callback* is passed to ``extract_from_file`` (fields done,
+    fields total).
+
     Returns:
         Tuple of (file_path, deal_name, extracted_data_or_None, error_message_or_None).
     """
@@ -275,12 +311,348 @@ def _extract_single_file(
 
                 active_extractor = ExcelDataExtractor(working_mappings)
 
-        result = active_extractor.extract_from_file(file_path, validate=validate)
+        result = active_extractor.extract_from_file(
+            file_path, validate=validate, progress_callback=progress_callback
+        )
         return (file_path, deal_name, result, None)
     except Exception as e:
         return (file_path, deal_name, None, str(e))
 
 
+def _timed_extract(
+    extractor,
+    file_info: dict,
+    mappings: dict,
+    progress: ProgressStream | None = None,
+) -> tuple[tuple[str, str, dict | None, str | None], float]:
+    """Run ``_extract_single_file`` and return its result with the elapsed seconds."""
+    file_path = file_info["file_path"]
+    progress_callback = None
+    if progress is not None:
+
+        def progress_callback(done: int, total: int) -> None:
+            progress.update(
+                f"file:{file_path}",
+                {"status": "extracting", "fields_done": done, "fields_total": total},
+            )
+
+    start = time.perf_counter()
+    outcome = _extract_single_file(
+        extractor,
+        file_path,
+        file_info.get("deal_name", ""),
+        True,
+        mappings,
+        progress_callback=progress_callback,
+    )
+    return outcome, time.perf_counter() - start
+
+
+def _iter_extraction_results(
+    extractor,
+    files_to_process: list[dict],
+    mappings: dict,
+    run_metrics: RunMetrics,
+    max_workers: int,
+    queue_size: int,
+    progress: ProgressStream | None = None,
+) -> Generator[tuple[str, str, dict | None, str | None], None, None]:
+    """
+    Yield extraction results in completion order as workers produce them.
+
+    Worker threads hand results to the caller through a bounded queue. When
+    the caller (the DB persist stage) falls behind and the queue is full,
+    workers block instead of piling up extracted dicts, so memory is bounded
+    by ``queue_size + max_workers`` results regardless of run size.
+
+    Closing the generator early cancels outstanding work.
+    """
+    if len(files_to_process) <= 1:
+        # Single file — no threading overhead needed
+        for fi in files_to_process:
+            outcome, elapsed = _timed_extract(extractor, fi, mappings, progress)
+            run_metrics.record_stage("extract", elapsed)
+            yield outcome
+        return
+
+    results: queue.Queue = queue.Queue(maxsize=queue_size)
+    cancelled = threading.Event()
+    run_metrics.queue_capacity = queue_size
+
+    def _put(item: tuple) -> None:
+        while not cancelled.is_set():
+            try:
+                results.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    def _produce(fi: dict) -> None:
+        if cancelled.is_set():
+            return
+        try:
+            item = _timed_extract(extractor, fi, mappings, progress)
+        except BaseException as e:
+            # Always hand the consumer an outcome; it waits for one per file
+            error = str(e) or type(e).__name__
+            _put(((fi.get("file_path", ""), fi.get("deal_name", ""), None, error), 0.0))
+            raise
+        _put(item)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        for fi in files_to_process:
+            executor.submit(_produce, fi)
+        for _ in range(len(files_to_process)):
+            run_metrics.record_queue_depth(results.qsize())
+            outcome, elapsed = results.get()
+            run_metrics.record_stage("extract", elapsed)
+            yield outcome
+    finally:
+        cancelled.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+@dataclass
+class FileOutcome:
+    """Result of persisting one extracted file."""
+
+    file_path: str
+    deal_name: str
+    status: str  # completed, skipped, failed
+    property_name: str | None = None
+    values_count: int = 0
+    error: str | None = None
+
+    def status_entry(self) -> dict:
+        """Entry stored in ``ExtractionRun.per_file_status``."""
+        entry: dict = {"status": self.status}
+        if self.error is not None:
+            entry["error"] = self.error
+        return entry
+
+    def file_metrics(self) -> FileMetrics:
+        return FileMetrics(
+            file_path=self.file_path,
+            deal_name=self.deal_name,
+            status=self.status,
+            values_count=self.values_count,
+        )
+
+
+def persist_extraction_result(
+    db: Session,
+    run_id: UUID,
+    file_info: dict,
+    extraction: tuple[str, str, dict | None, str | None],
+    mappings: dict,
+    extracted_value_crud,
+    latest_digests: Mapping[str, str] | None = None,
+) -> FileOutcome:
+    """
+    Run change detection for one extracted file and insert it if changed.
+
+    Args:
+        db: Database session.
+        run_id: Extraction run ID.
+        file_info: File info dict (file_path, deal_name, optional
+            sharepoint_path).
+        extraction: Result tuple from ``_extract_single_file``.
+        mappings: Cell mappings used for extraction.
+        extracted_value_crud: CRUD class for extracted values.
+        latest_digests: Digests preloaded for the whole run; see
+            ``should_extract_deal``.
+
+    Returns:
+        FileOutcome describing what happened to the file. Errors are
+        captured in the outcome rather than raised.
+    """
+    from app.services.extraction.change_detector import should_extract_deal
+
+    file_path, deal_name, result, error_msg = extraction
+    file_name = Path(file_path).name
+
+    if error_msg is not None:
+        # Extraction failed
+        logger.error(
+            "file_processing_failed",
+            file=file_name,
+            error=error_msg,
+        )
+        return FileOutcome(file_path, deal_name, "failed", error=error_msg)
+
+    property_name: str | None = None
+    try:
+        assert result is not None  # guaranteed when error_msg is None
+        # Get property name from extracted data or use deal name
+        property_name = str(
+            result.get("PROPERTY_NAME", deal_name) or Path(file_path).stem
+        )
+
+        # Per-deal change detection: compare extracted vs DB
+        needs_update, reason = should_extract_deal(
+            db,
+            property_name,
+            result,
+            latest_digests=latest_digests,
+        )
+
+        if not needs_update:
+            logger.info(
+                "file_skipped_unchanged",
+                file=file_name,
+                property=property_name,
+            )
+            return FileOutcome(
+                file_path, deal_name, "skipped", property_name=property_name
+            )
+
+        # Data changed or new deal — insert ALL values
+        source_file = file_info.get("sharepoint_path", file_path)
+
+        extracted_value_crud.bulk_insert(
+            db,
+            extraction_run_id=run_id,
+            extracted_data=result,
+            mappings=mappings,
+            property_name=property_name,
+            source_file=source_file,
+            error_categories=result.get("_error_categories"),
+        )
+
+        logger.info(
+            "file_processed",
+            file=file_name,
+            property=property_name,
+            fields_extracted=len(result),
+            change_reason=reason,
+        )
+        return FileOutcome(
+            file_path,
+            deal_name,
+            "completed",
+            property_name=property_name,
+            values_count=len(result),
+        )
+
+    except Exception as e:
+        logger.opt(exception=True).error(
+            "file_processing_failed",
+            file=file_name,
+            error=str(e),
+        )
+        return FileOutcome(
+            file_path, deal_name, "failed", property_name=property_name, error=str(e)
+        )
+
+
+def build_error_summary(file_errors: list[dict]) -> dict | None:
+    """Summarize failed files for ``ExtractionRun.error_summary``."""
+    if not file_errors:
+        return None
+    return {
+        "failed_files": file_errors[:10],
+        "total_failures": len(file_errors),
+    }
+
+
+def finalize_extraction_run(
+    db: Session,
+    run_id: UUID,
+    extraction_run_crud,
+    *,
+    files_processed: int,
+    files_failed: int,
+    property_stages: dict[str, str] | None = None,
+    error_summary: dict | None = None,
+    per_file_status: dict[str, dict] | None = None,
+    file_metadata: dict | None = None,
+) -> None:
+    """
+    Sync and hydrate properties from a run's extracted values, then complete it.
+
+    Runs once per extraction run, after every file has been persisted.
+    """
+    # Sync extracted properties to main properties/deals tables
+    from app.crud.extraction import sync_extracted_to_properties
+
+    try:
+        sync_result = sync_extracted_to_properties(
+            db, run_id, property_stages=property_stages
+        )
+        logger.info(
+            "extraction_sync_completed",
+            run_id=str(run_id),
+            **sync_result,
+        )
+    except Exception as sync_error:
+        logger.error(
+            "extraction_sync_failed",
+            run_id=str(run_id),
+            error=str(sync_error),
+        )
+
+    # Hydrate properties table from extracted values
+    from app.crud.extraction import hydrate_properties_from_extracted
+
+    try:
+        hydrate_result = hydrate_properties_from_extracted(db)
+        logger.info(
+            "extraction_hydrate_completed",
+            run_id=str(run_id),
+            **hydrate_result,
+        )
+    except Exception as hydrate_error:
+        logger.error(
+            "extraction_hydrate_failed",
+            run_id=str(run_id),
+            error=str(hydrate_error),
+        )
+
+    # Re-score the portfolio forecasts against the freshly hydrated properties
+    from app.services.ml import get_portfolio_prescorer
+
+    get_portfolio_prescorer().request_refresh("extraction")
+
+    # Mark complete with error summary including skip stats
+    extraction_run_crud.complete(
+        db,
+        run_id,
+        files_processed=files_processed,
+        files_failed=files_failed,
+        error_summary=error_summary,
+        per_file_status=per_file_status if per_file_status else None,
+        file_metadata=file_metadata,
+    )
+
+
+def _render_extraction_progress(
+    stream: ProgressStream, events: list[ProgressEvent]
+) -> list[dict]:
+    """One ``extraction_progress`` message per flush with every changed key."""
+    return [
+        {
+            "type": "extraction_progress",
+            "extraction_id": stream.stream_id.removeprefix("extraction:"),
+            "stream": stream.stream_id,
+            "seq": events[-1].seq,
+            "events": [event.to_dict() for event in events],
+            "timestamp": datetime.now(UTC).isoformat(),
+        }
+    ]
+
+
+def extraction_progress(run_id: UUID) -> ProgressStream:
+    """Coalesced progress stream of an extraction run (``extraction:<run_id>``).
+
+    Keys are ``run`` (counts and status) and ``file:<path>`` (field progress
+    while extracting, then the file's outcome).
+    """
+    return progress_streams.open(
+        f"extraction:{run_id}", Channel.EXTRACTION, _render_extraction_progress
+    )
+
+
 def process_files(
     db: Session,
     run_id: UUID,
@@ -290,13 +662,16 @@ def process_files(
     extracted_value_crud,
     max_workers: int = 4,
     resume_run_id: UUID | None = None,
+    queue_size: int | None = None,
 ):
     """
     Process a list of files and extract data with per-deal change detection.
 
-    Excel extraction is parallelized across threads (CPU-bound). DB
-    operations (change detection + bulk_insert) remain sequential to
-    avoid session conflicts.
+    Runs as a two-stage pipeline: Excel extraction is parallelized across
+    threads (CPU-bound) and each result is streamed through a bounded queue
+    to the persist stage, which runs change detection + bulk_insert on this
+    thread while extraction continues. DB operations stay on the caller's
+    session to avoid session conflicts.
 
     Args:
         db: Database session.
@@ -307,12 +682,15 @@ def process_files(
         extracted_value_crud: CRUD class for extracted values.
         max_workers: Maximum parallel extraction threads (default 4).
         resume_run_id: If provided, skip files already completed in that run.
+        queue_size: Maximum extracted results waiting to be persisted
+            (default ``settings.EXTRACTION_PIPELINE_QUEUE_SIZE``).
     """
     from app.extraction import ExcelDataExtractor
-    from app.services.extraction.change_detector import should_extract_deal
+    from app.services.extraction.change_detector import RunDigests
 
     # Update run with file count
     extraction_run_crud.update_progress(db, run_id, files_processed=0, files_failed=0)
+    progress = extraction_progress(run_id)
 
     # Create extractor
     extractor = ExcelDataExtractor(mappings)
@@ -348,75 +726,68 @@ def process_files(
 
     # Build a file_path → file_info lookup for source_file resolution
     file_info_map = {fi["file_path"]: fi for fi in files_to_process}
+    files_total = len(files_to_process)
+    progress.update(
+        "run",
+        {
+            "status": "running",
+            "files_total": files_total,
+            "files_processed": 0,
+            "files_failed": 0,
+        },
+    )
 
-    # Phase 1: Parallel extraction (CPU-bound Excel parsing)
-    extraction_results: list[tuple[str, str, dict | None, str | None]] = []
-
-    if len(files_to_process) > 1:
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(
-                    _extract_single_file,
-                    extractor,
-                    fi["file_path"],
-                    fi.get("deal_name", ""),
-                    True,
-                    mappings,
-                ): fi["file_path"]
-                for fi in files_to_process
-            }
-            for future in as_completed(futures):
-                extraction_results.append(future.result())
-    else:
-        # Single file — no threading overhead needed
-        for fi in files_to_process:
-            extraction_results.append(
-                _extract_single_file(
-                    extractor,
-                    fi["file_path"],
-                    fi.get("deal_name", ""),
-                    base_mappings=mappings,
-                )
-            )
+    if queue_size is None:
+        queue_size = settings.EXTRACTION_PIPELINE_QUEUE_SIZE
+
+    # Latest digests of this run's properties, loaded once so per-file
+    # change detection is an in-memory comparison
+    latest_digests = RunDigests(
+        db,
+        {
+            name
+            for fi in files_to_process
+            for name in (fi.get("deal_name"), Path(fi["file_path"]).stem)
+            if name
+        },
+    )
 
-    # Phase 2: Sequential DB operations (change detection + insert)
     # Track property → source_file for collision detection (Issue 4.2)
     processed_properties: dict[str, str] = {}
     # Track property → deal_stage from folder structure
     property_stages: dict[str, str] = {}
 
-    for file_path, deal_name, result, error_msg in extraction_results:
-        file_info = file_info_map[file_path]
-
-        if error_msg is not None:
-            # Extraction failed
-            failed += 1
-            file_name = Path(file_path).name
-            file_errors.append({"file": file_name, "error": error_msg})
-            per_file_status[file_path] = {"status": "failed", "error": error_msg}
-            run_metrics.record_file(
-                FileMetrics(
-                    file_path=file_path,
-                    deal_name=deal_name,
-                    status="failed",
-                )
-            )
-            logger.error(
-                "file_processing_failed",
-                file=file_name,
-                error=error_msg,
+    # Persist stage: sequential DB operations (change detection + insert),
+    # fed by the extract stage as each file finishes
+    extraction_results = _iter_extraction_results(
+        extractor,
+        files_to_process,
+        mappings,
+        run_metrics,
+        max_workers=max_workers,
+        queue_size=max(queue_size, 1),
+        progress=progress,
+    )
+    with closing(extraction_results):
+        for extraction in extraction_results:
+            persist_start = time.perf_counter()
+            file_path = extraction[0]
+            file_info = file_info_map[file_path]
+
+            outcome = persist_extraction_result(
+                db,
+                run_id,
+                file_info,
+                extraction,
+                mappings,
+                extracted_value_crud,
+                latest_digests=latest_digests,
             )
-        else:
-            try:
-                assert result is not None  # guaranteed when error_msg is None
-                # Get property name from extracted data or use deal name
-                property_name = (
-                    result.get("PROPERTY_NAME", deal_name) or Path(file_path).stem
-                )
 
+            if outcome.property_name is not None:
                 # Collision detection: warn if another file already wrote
                 # to the same property_name (last-file-wins via upsert)
-                prop_key = str(property_name)
+                prop_key = outcome.property_name
                 if prop_key in processed_properties:
                     logger.warning(
                         "property_name_collision",
@@ -431,147 +802,66 @@ def process_files(
                 if "deal_stage" in file_info:
                     property_stages[prop_key] = file_info["deal_stage"]
 
-                # Per-deal change detection: compare extracted vs DB
-                needs_update, reason = should_extract_deal(
-                    db, str(property_name), result
+            if outcome.status == "failed":
+                failed += 1
+                file_errors.append(
+                    {"file": Path(file_path).name, "error": outcome.error}
                 )
-
-                if not needs_update:
+            else:
+                processed += 1
+                if outcome.status == "skipped":
                     skipped += 1
-                    per_file_status[file_path] = {"status": "skipped"}
-                    run_metrics.record_file(
-                        FileMetrics(
-                            file_path=file_path,
-                            deal_name=deal_name,
-                            status="skipped",
-                        )
-                    )
-                    logger.info(
-                        "file_skipped_unchanged",
-                        file=Path(file_path).name,
-                        property=property_name,
-                    )
-                    processed += 1
-                else:
-                    # Data changed or new deal — insert ALL values
-                    source_file = file_info.get("sharepoint_path", file_path)
-
-                    extracted_value_crud.bulk_insert(
-                        db,
-                        extraction_run_id=run_id,
-                        extracted_data=result,
-                        mappings=mappings,
-                        property_name=str(property_name),
-                        source_file=source_file,
-                        error_categories=result.get("_error_categories"),
-                    )
-
-                    processed += 1
-                    per_file_status[file_path] = {"status": "completed"}
-                    run_metrics.record_file(
-                        FileMetrics(
-                            file_path=file_path,
-                            deal_name=deal_name,
-                            status="completed",
-                            values_count=len(result),
-                        )
-                    )
-                    logger.info(
-                        "file_processed",
-                        file=Path(file_path).name,
-                        property=property_name,
-                        fields_extracted=len(result),
-                        change_reason=reason,
-                    )
+            per_file_status[file_path] = outcome.status_entry()
+            run_metrics.record_file(outcome.file_metrics())
+            progress.update(f"file:{file_path}", outcome.status_entry())
+            progress.update(
+                "run",
+                {
+                    "status": "running",
+                    "files_total": files_total,
+                    "files_processed": processed,
+                    "files_failed": failed,
+                },
+            )
 
-            except Exception as e:
-                failed += 1
-                file_name = Path(file_path).name
-                file_errors.append({"file": file_name, "error": str(e)})
-                per_file_status[file_path] = {"status": "failed", "error": str(e)}
-                run_metrics.record_file(
-                    FileMetrics(
-                        file_path=file_path,
-                        deal_name=deal_name,
-                        status="failed",
-                    )
+            # Update progress after each file
+            try:
+                extraction_run_crud.update_progress(
+                    db, run_id, files_processed=processed, files_failed=failed
                 )
-                logger.opt(exception=True).error(
-                    "file_processing_failed",
-                    file=file_name,
-                    error=str(e),
+            except Exception as progress_error:
+                logger.warning(
+                    "progress_update_failed",
+                    run_id=str(run_id),
+                    error=str(progress_error),
                 )
 
-        # Update progress after each file
-        try:
-            extraction_run_crud.update_progress(
-                db, run_id, files_processed=processed, files_failed=failed
-            )
-        except Exception as progress_error:
-            logger.warning(
-                "progress_update_failed",
-                run_id=str(run_id),
-                error=str(progress_error),
-            )
-
-    # Prepare error summary if there were failures
-    error_summary = None
-    if file_errors:
-        error_summary = {
-            "failed_files": file_errors[:10],
-            "total_failures": len(file_errors),
-        }
+            run_metrics.record_stage("persist", time.perf_counter() - persist_start)
 
     # Emit structured metrics and build metadata
     run_metrics.emit_run_metrics(str(run_id))
-    file_metadata = run_metrics.to_metadata()
-
-    # Sync extracted properties to main properties/deals tables
-    from app.crud.extraction import sync_extracted_to_properties
-
-    try:
-        sync_result = sync_extracted_to_properties(
-            db, run_id, property_stages=property_stages
-        )
-        logger.info(
-            "extraction_sync_completed",
-            run_id=str(run_id),
-            **sync_result,
-        )
-    except Exception as sync_error:
-        logger.error(
-            "extraction_sync_failed",
-            run_id=str(run_id),
-            error=str(sync_error),
-        )
-
-    # Hydrate properties table from extracted values
-    from app.crud.extraction import hydrate_properties_from_extracted
-
-    try:
-        hydrate_result = hydrate_properties_from_extracted(db)
-        logger.info(
-            "extraction_hydrate_completed",
-            run_id=str(run_id),
-            **hydrate_result,
-        )
-    except Exception as hydrate_error:
-        logger.error(
-            "extraction_hydrate_failed",
-            run_id=str(run_id),
-            error=str(hydrate_error),
-        )
 
-    # Mark complete with error summary including skip stats
-    extraction_run_crud.complete(
+    finalize_extraction_run(
         db,
         run_id,
+        extraction_run_crud,
         files_processed=processed,
         files_failed=failed,
-        error_summary=error_summary,
-        per_file_status=per_file_status if per_file_status else None,
-        file_metadata=file_metadata,
+        property_stages=property_stages,
+        error_summary=build_error_summary(file_errors),
+        per_file_status=per_file_status,
+        file_metadata=run_metrics.to_metadata(),
+    )
+    progress.update(
+        "run",
+        {
+            "status": "completed",
+            "files_total": files_total,
+            "files_processed": processed,
+            "files_failed": failed,
+        },
     )
+    progress_streams.close(progress.stream_id)
     logger.info(
         "extraction_completed",
         run_id=str(run_id),
@@ -581,6 +871,137 @@ def process_files(
     )
 
 
+def load_extraction_mappings() -> dict:
+    """
+    Load cell mappings from the reference file plus supplemental overrides.
+
+    Returns:
+        Dict of field_name → CellMapping.
+    """
+    from app.extraction import CellMappingParser
+    from app.extraction.cell_mapping import CellMapping
+
+    parser = CellMappingParser(str(REFERENCE_FILE))
+    mappings = parser.load_mappings()
+
+    # Inject supplemental mappings not in reference file
+    _supplemental = [
+        CellMapping(
+            category="Supplemental",
+            description="Going-In Cap Rate",
+            sheet_name="Assumptions (Summary)",
+            cell_address="F26",
+            field_name="GOING_IN_CAP_RATE",
+        ),
+        CellMapping(
+            category="Supplemental",
+            description="T3 Return on Cost",
+            sheet_name="Assumptions (Summary)",
+            cell_address="G27",
+            field_name="T3_RETURN_ON_COST",
+        ),
+        # Reference file maps these to "Assumptions (Summary)" but the values
+        # are on "Returns Metrics (Summary)" — override with correct sheet.
+        CellMapping(
+            category="Supplemental",
+            description="Unlevered Returns IRR",
+            sheet_name="Returns Metrics (Summary)",
+            cell_address="E39",
+            field_name="UNLEVERED_RETURNS_IRR",
+        ),
+        CellMapping(
+            category="Supplemental",
+            description="Unlevered Returns MOIC",
+            sheet_name="Returns Metrics (Summary)",
+            cell_address="E40",
+            field_name="UNLEVERED_RETURNS_MOIC",
+        ),
+        CellMapping(
+            category="Supplemental",
+            description="Levered Returns IRR",
+            sheet_name="Returns Metrics (Summary)",
+            cell_address="E43",
+            field_name="LEVERED_RETURNS_IRR",
+        ),
+        CellMapping(
+            category="Supplemental",
+            description="Levered Returns MOIC",
+            sheet_name="Returns Metrics (Summary)",
+            cell_address="E44",
+            field_name="LEVERED_RETURNS_MOIC",
+        ),
+    ]
+    for sm in _supplemental:
+        # Use force-overwrite for sheet corrections
+        mappings[sm.field_name] = sm
+        logger.info(
+            "supplemental_mapping_applied", field=sm.field_name, sheet=sm.sheet_name
+        )
+    return mappings
+
+
+def local_files_to_process(source: str, file_paths: list | None = None) -> list[dict]:
+    """
+    Build the file list for a non-SharePoint extraction source.
+
+    Args:
+        source: "local" (explicit paths or a LOCAL_DEALS_ROOT scan) or any
+            other value for the bundled test fixtures.
+        file_paths: Explicit local paths to extract.
+
+    Returns:
+        List of file info dicts with file_path and deal_name (and
+        deal_stage for folder scans).
+
+    Raises:
+        ValueError: If a folder scan is requested but LOCAL_DEALS_ROOT is
+            not usable.
+    """
+    if source == "local" and file_paths:
+        files_to_process = [
+            {
+                "file_path": p,
+                "deal_name": Path(p).stem.replace(" UW Model vCurrent", ""),
+            }
+            for p in file_paths
+        ]
+        logger.info("local_extraction_started", file_count=len(files_to_process))
+        return files_to_process
+
+    if source == "local":
+        # Scan the local OneDrive deals folder for UW models
+        # Skip dead/realized stages — too slow via WSL, and those deals
+        # already exist in DB. Stage updates handled by full scan separately.
+        files_to_process = discover_local_deal_files(
+            stage_filter=[
+                "initial_review",
+                "active_review",
+                "under_contract",
+                "closed",
+            ]
+        )
+        logger.info(
+            "local_deals_extraction_started",
+            file_count=len(files_to_process),
+        )
+        return files_to_process
+
+    logger.info("fixture_extraction_started", source=source)
+    fixtures_dir = (
+        Path(__file__).parent.parent.parent.parent.parent.parent
+        / "tests"
+        / "fixtures"
+        / "uw_models"
+    )
+    return [
+        {
+            "file_path": str(f),
+            "deal_name": f.stem.replace(" UW Model vCurrent", ""),
+        }
+        for f in fixtures_dir.glob("*.xlsb")
+    ]
+
+
 def run_extraction_task(run_id: UUID, source: str, file_paths: list | None = None):
     """
     Background task to run extraction.
@@ -592,111 +1013,13 @@ def run_extraction_task(run_id: UUID, source: str, file_paths: list | None = Non
     will be closed by the time this background task executes.
     """
     from app.crud.extraction import ExtractedValueCRUD, ExtractionRunCRUD
-    from app.extraction import CellMappingParser
 
     db = SessionLocal()
 
     try:
-        parser = CellMappingParser(str(REFERENCE_FILE))
-        mappings = parser.load_mappings()
-
-        # Inject supplemental mappings not in reference file
-        from app.extraction.cell_mapping import CellMapping
-
-        _supplemental = [
-            CellMapping(
-                category="Supplemental",
-                description="Going-In Cap Rate",
-                sheet_name="Assumptions (Summary)",
-                cell_address="F26",
-                field_name="GOING_IN_CAP_RATE",
-            ),
-            CellMapping(
-                category="Supplemental",
-                description="T3 Return on Cost",
-                sheet_name="Assumptions (Summary)",
-                cell_address="G27",
-                field_name="T3_RETURN_ON_COST",
-            ),
-            # Reference file maps these to "Assumptions (Summary)" but the values
-            # are on "Returns Metrics (Summary)" — override with correct sheet.
-            CellMapping(
-                category="Supplemental",
-                description="Unlevered Returns IRR",
-                sheet_name="Returns Metrics (Summary)",
-                cell_address="E39",
-                field_name="UNLEVERED_RETURNS_IRR",
-            ),
-            CellMapping(
-                category="Supplemental",
-                description="Unlevered Returns MOIC",
-                sheet_name="Returns Metrics (Summary)",
-                cell_address="E40",
-                field_name="UNLEVERED_RETURNS_MOIC",
-            ),
-            CellMapping(
-                category="Supplemental",
-                description="Levered Returns IRR",
-                sheet_name="Returns Metrics (Summary)",
-                cell_address="E43",
-                field_name="LEVERED_RETURNS_IRR",
-            ),
-            CellMapping(
-                category="Supplemental",
-                description="Levered Returns MOIC",
-                sheet_name="Returns Metrics (Summary)",
-                cell_address="E44",
-                field_name="LEVERED_RETURNS_MOIC",
-            ),
-        ]
-        for sm in _supplemental:
-            # Use force-overwrite for sheet corrections
-            mappings[sm.field_name] = sm
-            logger.info(
-                "supplemental_mapping_applied", field=sm.field_name, sheet=sm.sheet_name
-            )
-
-        if source == "local" and file_paths:
-            files_to_process = [
-                {
-                    "file_path": p,
-                    "deal_name": Path(p).stem.replace(" UW Model vCurrent", ""),
-                }
-                for p in file_paths
-            ]
-            logger.info("local_extraction_started", file_count=len(files_to_process))
-
-        elif source == "local" and not file_paths:
-            # Scan the local OneDrive deals folder for UW models
-            # Skip dead/realized stages — too slow via WSL, and those deals
-            # already exist in DB. Stage updates handled by full scan separately.
-            try:
-                files_to_process = discover_local_deal_files(
-                    stage_filter=[
-                        "initial_review",
-                        "active_review",
-                        "under_contract",
-                        "closed",
-                    ]
-                )
-            except ValueError as e:
-                logger.error("local_deals_folder_error", error=str(e))
-                ExtractionRunCRUD.fail(db, run_id, {"error": str(e)})
-                return
-
-            if not files_to_process:
-                logger.warning("no_local_deal_files_found")
-                ExtractionRunCRUD.complete(
-                    db, run_id, files_processed=0, files_failed=0
-                )
-                return
+        mappings = load_extraction_mappings()
 
-            logger.info(
-                "local_deals_extraction_started",
-                file_count=len(files_to_process),
-            )
-
-        elif source == "sharepoint":
+        if source == "sharepoint":
             logger.info("sharepoint_extraction_started")
 
             try:
@@ -716,45 +1039,47 @@ def run_extraction_task(run_id: UUID, source: str, file_paths: list | None = Non
                         return
 
                     client = SharePointClient()
+                    store = get_workbook_store()
                     files_to_process = []
 
-                    with tempfile.TemporaryDirectory(prefix="uw_models_") as temp_dir:
-                        # Concurrent downloads with semaphore limit
-                        sem = asyncio.Semaphore(5)
+                    # Concurrent downloads with semaphore limit; files with
+                    # unchanged ETags are served from the workbook store
+                    sem = asyncio.Semaphore(5)
 
-                        async def _download_one(sp_file):
-                            async with sem:
-                                return sp_file, await download_sharepoint_file(
-                                    client, sp_file, temp_dir
-                                )
+                    async def _download_one(sp_file):
+                        async with sem:
+                            return sp_file, await download_sharepoint_file(
+                                client, sp_file, store=store
+                            )
 
-                        async def _download_all():
-                            async with client:
-                                return await asyncio.gather(
-                                    *[_download_one(f) for f in sharepoint_files],
-                                    return_exceptions=True,
-                                )
+                    async def _download_all():
+                        async with client:
+                            return await asyncio.gather(
+                                *[_download_one(f) for f in sharepoint_files],
+                                return_exceptions=True,
+                            )
 
-                        results = loop.run_until_complete(_download_all())
+                    results = loop.run_until_complete(_download_all())
 
-                        for result in results:
-                            if isinstance(result, Exception):
-                                logger.error(
-                                    "sharepoint_download_failed",
-                                    error=str(result),
-                                )
-                                continue
-                            sp_file, (local_path, content_hash) = result
-                            files_to_process.append(
-                                {
-                                    "file_path": local_path,
-                                    "deal_name": sp_file.deal_name,
-                                    "deal_stage": sp_file.deal_stage,
-                                    "sharepoint_path": sp_file.path,
-                                    "content_hash": content_hash,
-                                }
+                    for result in results:
+                        if isinstance(result, Exception):
+                            logger.error(
+                                "sharepoint_download_failed",
+                                error=str(result),
                             )
+                            continue
+                        sp_file, (local_path, content_hash) = result
+                        files_to_process.append(
+                            {
+                                "file_path": local_path,
+                                "deal_name": sp_file.deal_name,
+                                "deal_stage": sp_file.deal_stage,
+                                "sharepoint_path": sp_file.path,
+                                "content_hash": content_hash,
+                            }
+                        )
 
+                    with store.pinned(f["file_path"] for f in files_to_process):
                         process_files(
                             db,
                             run_id,
@@ -763,7 +1088,7 @@ def run_extraction_task(run_id: UUID, source: str, file_paths: list | None = Non
                             ExtractionRunCRUD,
                             ExtractedValueCRUD,
                         )
-                        return
+                    return
                 finally:
                     loop.close()
 
@@ -791,21 +1116,17 @@ def run_extraction_task(run_id: UUID, source: str, file_paths: list | None = Non
                 )
                 return
 
-        else:
-            logger.info("fixture_extraction_started", source=source)
-            fixtures_dir = (
-                Path(__file__).parent.parent.parent.parent.parent.parent
-                / "tests"
-                / "fixtures"
-                / "uw_models"
-            )
-            files_to_process = [
-                {
-                    "file_path": str(f),
-                    "deal_name": f.stem.replace(" UW Model vCurrent", ""),
-                }
-                for f in fixtures_dir.glob("*.xlsb")
-            ]
+        try:
+            files_to_process = local_files_to_process(source, file_paths)
+        except ValueError as e:
+            logger.error("local_deals_folder_error", error=str(e))
+            ExtractionRunCRUD.fail(db, run_id, {"error": str(e)})
+            return
+
+        if not files_to_process and source == "local":
+            logger.warning("no_local_deal_files_found")
+            ExtractionRunCRUD.complete(db, run_id, files_processed=0, files_failed=0)
+            return
 
         process_files(
             db,
@@ -818,6 +1139,9 @@ def run_extraction_task(run_id: UUID, source: str, file_paths: list | None = Non
 
     except Exception as e:
         logger.exception("extraction_task_failed", error=str(e))
+        if (progress := progress_streams.get(f"extraction:{run_id}")) is not None:
+            progress.update("run", {"status": "failed", "error": str(e)})
+            progress_streams.close(progress.stream_id)
         try:
             from app.crud.extraction import ExtractionRunCRUD
 
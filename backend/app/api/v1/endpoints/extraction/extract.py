@@ -134,11 +134,33 @@ async def start_extraction(
         files_discovered=files_discovered,
     )
 
-    # Start background task
-    # Use common.run_extraction_task to allow patching via the package namespace
-    background_tasks.add_task(
-        common.run_extraction_task, run.id, request.source, request.file_paths
-    )
+    dispatched = False
+    if settings.EXTRACTION_DISTRIBUTED:
+        # Fan the run out to the ARQ workers (one job per file)
+        from app.tasks import enqueue_task
+
+        try:
+            await enqueue_task(
+                "run_extraction_task",
+                str(run.id),
+                request.source,
+                request.file_paths,
+                _job_id=f"extraction-run:{run.id}",
+            )
+            dispatched = True
+        except Exception as e:
+            logger.warning(
+                "extraction_enqueue_failed_running_in_process",
+                run_id=str(run.id),
+                error=str(e),
+            )
+
+    if not dispatched:
+        # Start background task
+        # Use common.run_extraction_task to allow patching via the package namespace
+        background_tasks.add_task(
+            common.run_extraction_task, run.id, request.source, request.file_paths
+        )
 
     source_label = "SharePoint" if request.source == "sharepoint" else request.source
     return ExtractionStartResponse(
@@ -43,7 +43,7 @@ async def refresh_market_data(
         engine = _get_engine()
         result = await run_fred_extraction_async(engine=engine, incremental=True)
         # Update the last refreshed timestamp in the service
-        new_timestamp = _svc().update_last_refreshed()
+        new_timestamp = await _svc().update_last_refreshed()
         logger.info("Market data refresh completed", result=result)
         return {
             "status": result.get("status", "success"),
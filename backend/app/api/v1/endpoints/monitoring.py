@@ -11,7 +11,7 @@ Provides endpoints for:
 from datetime import UTC, datetime
 from typing import Any  # noqa: F401 - used for type hints in collectors
 
-from fastapi import APIRouter, Depends, Response
+from fastapi import APIRouter, Depends, Query, Response
 from loguru import logger
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -236,7 +236,15 @@ async def pool_stats():
     tags=["monitoring"],
     dependencies=[Depends(require_admin)],
 )
-async def performance_stats():
+async def performance_stats(
+    window_minutes: float = Query(
+        5,
+        gt=0,
+        # The sample buffer holds no more than this
+        le=settings.METRICS_SAMPLE_WINDOW_MINUTES,
+        description="Window for system min/max/avg (minutes)",
+    ),
+):
     """
     Get performance statistics summary.
 
@@ -244,16 +252,17 @@ async def performance_stats():
     - Request statistics
     - Database query statistics
     - Cache performance
-    - System resource usage
+    - System resource usage (latest sample and window summary)
     """
     collector_registry = get_collector_registry()
 
-    # Collect system metrics
-    system_metrics = await collector_registry.system.collect()
+    # Latest background sample; no probing on the request path
+    all_metrics = await collector_registry.collect_all()
 
     return {
         "timestamp": datetime.now(UTC).isoformat(),
-        "system": system_metrics,
+        "system": all_metrics["system"],
+        "system_summary": collector_registry.system.summary(window_minutes),
         "note": "For detailed metrics, use /monitoring/metrics endpoint",
     }
 
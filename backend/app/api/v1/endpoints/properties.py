@@ -7,10 +7,7 @@ from loguru import logger
 from sqlalchemy import func, literal_column, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.v1.endpoints._property_transforms import (
-    _decimal_to_float,
-    to_frontend_property,
-)
+from app.api.v1.endpoints._property_transforms import _decimal_to_float
 from app.api.v1.utils.pagination import PaginationParams
 from app.core.cache import LONG_TTL, cache
 from app.core.permissions import (
@@ -19,12 +16,14 @@ from app.core.permissions import (
     require_analyst,
     require_manager,
 )
+from app.core.serialization import FastJSONResponse
 from app.crud import property as property_crud
 from app.crud.crud_activity import property_activity
 from app.db.session import get_db
 from app.models import Property
 from app.models.activity import ActivityType as ActivityTypeModel
 from app.models.extraction import ExtractedValue
+from app.models.property import normalize_property_key
 from app.models.user import User
 from app.schemas.activity import (
     ActivityType,
@@ -103,11 +102,13 @@ async def _build_projected_trends(
     ).where(
         or_(
             ExtractedValue.property_id == property_id,
-            ExtractedValue.property_name == property_name,
+            ExtractedValue.property_key == normalize_property_key(property_name),
         ),
         ExtractedValue.field_name.in_(_TREND_PROJECTION_FIELDS),
         ExtractedValue.is_error.is_(False),
     )
+    # Oldest first so the most recent extraction wins in the lookup below
+    stmt = stmt.order_by(ExtractedValue.created_at)
     result = await db.execute(stmt)
     rows = result.all()
 
@@ -168,6 +169,7 @@ async def _build_projected_trends(
 
 @router.get(
     "/dashboard",
+    response_class=FastJSONResponse,
     summary="List properties (dashboard format)",
     description="List properties in the nested frontend format used by the dashboard. "
     "Properties missing financial_data are lazily enriched from extracted values. "
@@ -191,9 +193,9 @@ async def list_properties_dashboard(
     defaults to 50 (max 500).  Pass ``?limit=500`` to retrieve more.
     """
     cache_key = f"property_dashboard_list:{pagination.skip}:{pagination.limit}"
-    cached = await cache.get(cache_key)
+    cached = await cache.get_raw(cache_key)
     if cached is not None:
-        return cached
+        return FastJSONResponse(cached)
 
     items = await property_crud.get_multi_filtered(
         db,
@@ -207,15 +209,16 @@ async def list_properties_dashboard(
     # Batch enrichment: 2 queries for all properties instead of 2-3 per property (N+1 fix)
     items = await property_crud.enrich_financial_data_batch(db, items)
 
-    properties = [to_frontend_property(p) for p in items]
+    # Materialized projections; only stale rows are recomputed
+    properties = await property_crud.get_frontend_projections(db, items)
     result = {"properties": properties, "total": total}
 
-    await cache.set(cache_key, result, ttl=LONG_TTL)
-    return result
+    return FastJSONResponse(await cache.set(cache_key, result, ttl=LONG_TTL))
 
 
 @router.get(
     "/dashboard/{property_id}",
+    response_class=FastJSONResponse,
     summary="Get property (dashboard format)",
     description="Get a single property in the nested frontend format. Lazily enriches "
     "financial_data from extracted_values if it has not been populated yet.",
@@ -248,11 +251,13 @@ async def get_property_dashboard(
     if not fd or "expenses" not in fd or "operationsByYear" not in fd:
         prop = await property_crud.enrich_financial_data(db, prop)
 
-    return to_frontend_property(prop)
+    (projection,) = await property_crud.get_frontend_projections(db, [prop])
+    return FastJSONResponse(projection)
 
 
 @router.get(
     "/summary",
+    response_class=FastJSONResponse,
     summary="Get portfolio summary",
     description="Return portfolio-level summary statistics including total properties, units, "
     "value, NOI, average occupancy, average cap rate, and equity-weighted IRR and cash-on-cash.",
@@ -276,9 +281,9 @@ async def get_portfolio_summary(
        and enable reuse by the reporting and export modules.
     """
     cache_key = "portfolio_summary"
-    cached = await cache.get(cache_key)
+    cached = await cache.get_raw(cache_key)
     if cached is not None:
-        return cached
+        return FastJSONResponse(cached)
 
     # Q-05: Push aggregation to SQL — compute totals from the full dataset
     # instead of fetching up to 200 rows and aggregating in Python.
@@ -340,8 +345,7 @@ async def get_portfolio_summary(
         "portfolioIRR": 0,
     }
 
-    await cache.set(cache_key, result, ttl=LONG_TTL)
-    return result
+    return FastJSONResponse(await cache.set(cache_key, result, ttl=LONG_TTL))
 
 
 @router.get(
@@ -5,33 +5,48 @@ All endpoints use async sessions and the SalesData model for CoStar multifamily
 sales transaction data.
 """
 
+import calendar
 import math
 import os
 from datetime import UTC, date, datetime
+from decimal import Decimal
 from typing import Any
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from loguru import logger
 from sqlalchemy import Integer as SAInteger
 from sqlalchemy import String as SAString
 from sqlalchemy import case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.v1.utils.facets import facet_options
 from app.api.v1.utils.filters import (
     apply_date_range_filter,
     apply_numeric_range_filter,
     apply_search_filter,
     parse_csv_list,
 )
+from app.api.v1.utils.map_view import (
+    MapViewport,
+    cluster_select,
+    select_points,
+    to_clusters,
+)
+from app.api.v1.utils.pagination import cached_count
+from app.core.cache import cache, make_cache_key_from_params
 from app.core.permissions import require_viewer
+from app.crud.base import keyset_order, keyset_paginate
 from app.db.session import get_db, get_sync_db
 from app.models.reminder_dismissal import ReminderDismissal
-from app.models.sales_data import SalesData
+from app.models.sales_data import SalesData, SalesRollup
+from app.schemas.pagination import encode_cursor
 from app.schemas.sales_analysis import (
     BuyerActivity,
     DistributionBucket,
     PaginatedSalesResponse,
     ReminderStatusResponse,
+    SalesMapPoint,
+    SalesMapResponse,
     SalesRecord,
     SubmarketComparison,
     TimeSeriesPoint,
@@ -48,6 +63,14 @@ from app.schemas.sales_analysis import (
 from app.schemas.sales_analysis import (
     SalesImportStatusResponse as ImportStatusResponse,
 )
+from app.services.sales_rollup import (
+    UNIT_BUCKETS,
+    UNKNOWN,
+    VINTAGE_BUCKETS,
+    bucket_labels,
+    unit_bucket,
+    vintage_bucket,
+)
 
 router = APIRouter(dependencies=[Depends(require_viewer)])
 
@@ -58,6 +81,9 @@ SALES_DATA_DIR = os.path.join(
 )
 SALES_DATA_DIR = os.path.normpath(SALES_DATA_DIR)
 
+# Cached list totals, keyed by filter set (cleared after imports)
+_COUNT_CACHE_PREFIX = "sales_count"
+
 
 # ── 0. GET /filter-options — Distinct values for filter dropdowns ────────────
 
@@ -66,19 +92,27 @@ SALES_DATA_DIR = os.path.normpath(SALES_DATA_DIR)
 async def filter_options(
     db: AsyncSession = Depends(get_db),
 ):
-    """Return distinct submarket values for filter dropdowns."""
-    stmt = (
-        select(SalesData.submarket_cluster)
-        .where(
-            SalesData.submarket_cluster.isnot(None),
-            SalesData.submarket_cluster != "",
-        )
-        .distinct()
-        .order_by(SalesData.submarket_cluster)
+    """Return distinct values, counts and ranges for filter dropdowns.
+
+    Cached until the next import.
+    """
+    options = await facet_options(
+        db,
+        "sales",
+        facets={
+            "submarkets": SalesData.submarket_cluster,
+            "cities": SalesData.property_city,
+            "star_ratings": SalesData.star_rating,
+        },
+        ranges={
+            "units": SalesData.number_of_units,
+            "year_built": SalesData.year_built,
+            "sale_price": SalesData.sale_price,
+            "price_per_unit": SalesData.price_per_unit,
+            "sale_date": SalesData.sale_date,
+        },
     )
-    result = await db.execute(stmt)
-    submarkets = [row[0] for row in result.all()]
-    return FilterOptionsResponse(submarkets=submarkets)
+    return FilterOptionsResponse(**options)
 
 
 # ── Shared filter helper ──────────────────────────────────────────────────────
@@ -142,6 +176,95 @@ def _apply_filters(
     return stmt
 
 
+# ── Rollup helpers ────────────────────────────────────────────────────────────
+
+
+def _rollup_conditions(
+    search: str | None = None,
+    submarkets: str | None = None,
+    min_units: int | None = None,
+    max_units: int | None = None,
+    min_price: float | None = None,
+    max_price: float | None = None,
+    min_price_per_unit: float | None = None,
+    max_price_per_unit: float | None = None,
+    min_year_built: int | None = None,
+    max_year_built: int | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+) -> list[Any] | None:
+    """Translate the ``_apply_filters`` criteria into ``SalesRollup`` conditions.
+
+    Returns None when the rollup cannot answer them: a search term, a price
+    filter, or a unit/year-built/date bound that falls inside a bucket or
+    below/above every bucket (dates must start and end on whole months).
+    """
+    if search or any(
+        v is not None
+        for v in (min_price, max_price, min_price_per_unit, max_price_per_unit)
+    ):
+        return None
+
+    conditions: list[Any] = []
+    sub_list = parse_csv_list(submarkets)
+    if sub_list:
+        conditions.append(SalesRollup.submarket_cluster.in_(sub_list))
+
+    for column, buckets, min_val, max_val in (
+        (SalesRollup.unit_bucket, UNIT_BUCKETS, min_units, max_units),
+        (SalesRollup.vintage_bucket, VINTAGE_BUCKETS, min_year_built, max_year_built),
+    ):
+        if min_val is None and max_val is None:
+            continue
+        labels = bucket_labels(buckets, min_val, max_val)
+        if labels is None:
+            return None
+        conditions.append(column.in_(labels))
+
+    if date_from is not None:
+        if date_from.day != 1:
+            return None
+        conditions.append(SalesRollup.sale_month >= date_from)
+    if date_to is not None:
+        if date_to.day != calendar.monthrange(date_to.year, date_to.month)[1]:
+            return None
+        conditions.append(SalesRollup.sale_month <= date_to)
+    return conditions
+
+
+async def _rollup_ready(db: AsyncSession) -> bool:
+    """Whether ``sales_rollup`` has been built (it is empty until an import)."""
+    return await db.scalar(select(SalesRollup.id).limit(1)) is not None
+
+
+# Measures summed per group by every rollup query
+_ROLLUP_MEASURES = (
+    func.sum(SalesRollup.sales_count).label("count"),
+    func.sum(SalesRollup.total_volume).label("total_volume"),
+    func.sum(SalesRollup.price_per_unit_sum).label("ppu_sum"),
+    func.sum(SalesRollup.price_per_unit_count).label("ppu_count"),
+)
+
+
+def _fold_rollup(rows: Any, key: Any) -> list[tuple[Any, int, float, float | None]]:
+    """Combine rollup rows by ``key(row)``.
+
+    Returns ``(key, count, total_volume, avg_price_per_unit)`` tuples sorted
+    by key.
+    """
+    folded: dict[Any, list[Any]] = {}
+    for r in rows:
+        acc = folded.setdefault(key(r), [0, Decimal(0), Decimal(0), 0])
+        acc[0] += r.count
+        acc[1] += Decimal(r.total_volume or 0)
+        acc[2] += Decimal(r.ppu_sum or 0)
+        acc[3] += r.ppu_count or 0
+    return [
+        (k, count, float(volume), float(ppu_sum / ppu_count) if ppu_count else None)
+        for k, (count, volume, ppu_sum, ppu_count) in sorted(folded.items())
+    ]
+
+
 # ── 1. GET / — Paginated table data ──────────────────────────────────────────
 
 
@@ -169,6 +292,13 @@ async def list_sales(
     page_size: int = Query(50, ge=1, le=200),
     sort_by: str = Query("sale_date"),
     sort_dir: str = Query("desc"),
+    cursor: str | None = Query(
+        None, description="Keyset cursor from a previous response (overrides page)"
+    ),
+    direction: str = Query(
+        "next", pattern="^(next|prev)$", description="Cursor direction"
+    ),
+    exact_total: bool = Query(False, description="Count instead of cached total"),
     search: str | None = None,
     submarkets: str | None = None,
     min_units: int | None = None,
@@ -183,58 +313,75 @@ async def list_sales(
     date_to: date | None = None,
     db: AsyncSession = Depends(get_db),
 ):
-    """Paginated, filterable, sortable list of sales records."""
+    """Paginated, filterable, sortable list of sales records.
+
+    Pages by ``page`` (OFFSET) or, when ``cursor`` is given, by keyset from
+    a previous response's ``next_cursor``/``prev_cursor``, which stays fast
+    on deep pages. ``total`` is a per-filter cached count unless
+    ``exact_total`` is set.
+    """
+    filters: dict[str, Any] = {
+        "search": search,
+        "submarkets": submarkets,
+        "min_units": min_units,
+        "max_units": max_units,
+        "min_price": min_price,
+        "max_price": max_price,
+        "min_price_per_unit": min_price_per_unit,
+        "max_price_per_unit": max_price_per_unit,
+        "min_year_built": min_year_built,
+        "max_year_built": max_year_built,
+        "date_from": date_from,
+        "date_to": date_to,
+    }
 
     # ── Count query ───────────────────────────────────────────────────────
-    count_stmt = select(func.count()).select_from(SalesData)
-    count_stmt = _apply_filters(
+    count_stmt = _apply_filters(select(func.count()).select_from(SalesData), **filters)
+    total, total_estimated = await cached_count(
+        db,
         count_stmt,
-        search,
-        submarkets,
-        min_units,
-        max_units,
-        min_price,
-        max_price,
-        min_price_per_unit,
-        max_price_per_unit,
-        min_year_built,
-        max_year_built,
-        date_from,
-        date_to,
+        make_cache_key_from_params(_COUNT_CACHE_PREFIX, **filters),
+        exact=exact_total,
     )
-    total = (await db.execute(count_stmt)).scalar() or 0
 
     # ── Data query ────────────────────────────────────────────────────────
-    data_stmt = select(SalesData)
-    data_stmt = _apply_filters(
-        data_stmt,
-        search,
-        submarkets,
-        min_units,
-        max_units,
-        min_price,
-        max_price,
-        min_price_per_unit,
-        max_price_per_unit,
-        min_year_built,
-        max_year_built,
-        date_from,
-        date_to,
-    )
-
-    # Sort
+    data_stmt = _apply_filters(select(SalesData), **filters)
     sort_col = _SORTABLE_COLUMNS.get(sort_by, SalesData.sale_date)
-    if sort_dir.lower() == "asc":
-        data_stmt = data_stmt.order_by(sort_col.asc().nulls_last())
+    order_desc = sort_dir.lower() != "asc"
+
+    if cursor:
+        try:
+            page_result = await keyset_paginate(
+                db,
+                data_stmt,
+                sort_col=sort_col,
+                id_col=SalesData.id,
+                cursor=cursor,
+                limit=page_size,
+                direction=direction,
+                order_desc=order_desc,
+            )
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+            ) from exc
+        rows = page_result.items
+        next_cursor, prev_cursor = page_result.next_cursor, page_result.prev_cursor
+        has_more = page_result.has_more
     else:
-        data_stmt = data_stmt.order_by(sort_col.desc().nulls_last())
-
-    # Pagination
-    offset = (page - 1) * page_size
-    data_stmt = data_stmt.offset(offset).limit(page_size)
-
-    result = await db.execute(data_stmt)
-    rows = result.scalars().all()
+        data_stmt = data_stmt.order_by(
+            *keyset_order(sort_col, SalesData.id, order_desc=order_desc)
+        )
+        offset = (page - 1) * page_size
+        result = await db.execute(data_stmt.offset(offset).limit(page_size + 1))
+        rows = list(result.scalars().all())
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        next_cursor = prev_cursor = None
+        if has_more:
+            next_cursor = encode_cursor(getattr(rows[-1], sort_col.key), rows[-1].id)
+        if rows and page > 1:
+            prev_cursor = encode_cursor(getattr(rows[0], sort_col.key), rows[0].id)
 
     records = []
     for r in rows:
@@ -275,6 +422,82 @@ async def list_sales(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
+        has_more=has_more,
+        total_estimated=total_estimated,
+    )
+
+
+# ── 1b. GET /map — Viewport clusters or points for the map view ─────────────
+
+
+@router.get("/map", response_model=SalesMapResponse)
+async def sales_map(
+    viewport: MapViewport = Depends(),
+    search: str | None = None,
+    submarkets: str | None = None,
+    min_units: int | None = None,
+    max_units: int | None = None,
+    min_price: float | None = None,
+    max_price: float | None = None,
+    min_price_per_unit: float | None = None,
+    max_price_per_unit: float | None = None,
+    min_year_built: int | None = None,
+    max_year_built: int | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Return the sales comps inside the map viewport.
+
+    Below ``MAP_CLUSTER_MAX_ZOOM`` comps are aggregated per grid cell; from
+    it upwards each comp is a compact point, up to ``MAP_MAX_POINTS``
+    (``truncated`` is set when more match).
+    """
+    filters = (
+        search,
+        submarkets,
+        min_units,
+        max_units,
+        min_price,
+        max_price,
+        min_price_per_unit,
+        max_price_per_unit,
+        min_year_built,
+        max_year_built,
+        date_from,
+        date_to,
+    )
+
+    if viewport.clustered:
+        stmt = _apply_filters(cluster_select(SalesData, viewport.zoom), *filters)
+        stmt = viewport.filter(stmt, SalesData)
+        clusters = to_clusters(await db.execute(stmt), viewport.zoom)
+        return SalesMapResponse(
+            zoom=viewport.zoom,
+            clustered=True,
+            total=sum(c.count for c in clusters),
+            clusters=clusters,
+        )
+
+    stmt = select(
+        SalesData.id,
+        SalesData.latitude,
+        SalesData.longitude,
+        SalesData.property_name,
+        SalesData.sale_date,
+        SalesData.sale_price,
+        SalesData.number_of_units,
+    )
+    stmt = viewport.filter(_apply_filters(stmt, *filters), SalesData)
+    rows, total, truncated = await select_points(db, stmt.order_by(SalesData.id))
+    return SalesMapResponse(
+        zoom=viewport.zoom,
+        clustered=False,
+        total=total,
+        truncated=truncated,
+        points=[SalesMapPoint.model_validate(r) for r in rows],
     )
 
 
@@ -300,6 +523,46 @@ async def time_series(
 ):
     """Transaction volume over time grouped by month, quarter, or year."""
 
+    conditions = _rollup_conditions(
+        search,
+        submarkets,
+        min_units,
+        max_units,
+        min_price,
+        max_price,
+        min_price_per_unit,
+        max_price_per_unit,
+        min_year_built,
+        max_year_built,
+        date_from,
+        date_to,
+    )
+    if conditions is not None and await _rollup_ready(db):
+        stmt = (
+            select(SalesRollup.sale_month, *_ROLLUP_MEASURES)
+            .where(SalesRollup.sale_month.isnot(None), *conditions)
+            .group_by(SalesRollup.sale_month)
+        )
+        rows = (await db.execute(stmt)).all()
+
+        def period(r: Any) -> str:
+            month: date = r.sale_month
+            if granularity == "month":
+                return f"{month.year}-{month.month:02d}"
+            if granularity == "quarter":
+                return f"{month.year}-Q{(month.month - 1) // 3 + 1}"
+            return str(month.year)
+
+        return [
+            TimeSeriesPoint(
+                period=label,
+                count=count,
+                total_volume=volume,
+                avg_price_per_unit=avg_ppu,
+            )
+            for label, count, volume, avg_ppu in _fold_rollup(rows, period)
+        ]
+
     # Build the period expression depending on granularity
     period_expr: Any
     if granularity == "month":
@@ -371,6 +634,33 @@ async def submarket_comparison(
 ):
     """Average price-per-unit and volume by submarket and year."""
 
+    if await _rollup_ready(db):
+        stmt = (
+            select(
+                SalesRollup.submarket_cluster,
+                SalesRollup.sale_month,
+                *_ROLLUP_MEASURES,
+            )
+            .where(
+                SalesRollup.submarket_cluster.isnot(None),
+                SalesRollup.sale_month.isnot(None),
+            )
+            .group_by(SalesRollup.submarket_cluster, SalesRollup.sale_month)
+        )
+        rows = (await db.execute(stmt)).all()
+        return [
+            SubmarketComparison(
+                submarket=submarket,
+                year=year,
+                avg_price_per_unit=avg_ppu,
+                sales_count=count,
+                total_volume=volume,
+            )
+            for (submarket, year), count, volume, avg_ppu in _fold_rollup(
+                rows, lambda r: (r.submarket_cluster, r.sale_month.year)
+            )
+        ]
+
     year_expr = func.extract("year", SalesData.sale_date).cast(SAInteger)
 
     stmt = (
@@ -503,25 +793,50 @@ async def distributions(
 ):
     """Distribution of sales by vintage, unit count, or star rating buckets."""
 
-    if group_by == "vintage":
-        label_expr = case(
-            (SalesData.year_built < 1990, "Pre-1990"),
-            (SalesData.year_built.between(1990, 2004), "1990-2005"),
-            (SalesData.year_built.between(2005, 2019), "2005-2020"),
-            (SalesData.year_built >= 2020, "Post-2020"),
-            else_="Unknown",
+    conditions = _rollup_conditions(
+        search,
+        submarkets,
+        min_units,
+        max_units,
+        min_price,
+        max_price,
+        min_price_per_unit,
+        max_price_per_unit,
+        min_year_built,
+        max_year_built,
+        date_from,
+        date_to,
+    )
+    if conditions is not None and await _rollup_ready(db):
+        bucket_col = {
+            "vintage": SalesRollup.vintage_bucket,
+            "unit_count": SalesRollup.unit_bucket,
+            "star_rating": SalesRollup.star_rating,
+        }[group_by]
+        stmt = (
+            select(bucket_col.label("label"), *_ROLLUP_MEASURES)
+            .where(*conditions)
+            .group_by(bucket_col)
         )
+        rows = (await db.execute(stmt)).all()
+        return [
+            DistributionBucket(
+                label=label,
+                count=count,
+                avg_price_per_unit=round(avg_ppu, 2) if avg_ppu is not None else None,
+            )
+            for label, count, _, avg_ppu in _fold_rollup(
+                rows, lambda r: r.label or UNKNOWN
+            )
+        ]
+
+    label_expr: Any
+    if group_by == "vintage":
+        label_expr = vintage_bucket()
     elif group_by == "unit_count":
-        label_expr = case(
-            (SalesData.number_of_units.between(1, 50), "1-50"),
-            (SalesData.number_of_units.between(51, 100), "51-100"),
-            (SalesData.number_of_units.between(101, 200), "101-200"),
-            (SalesData.number_of_units.between(201, 500), "201-500"),
-            (SalesData.number_of_units > 500, "500+"),
-            else_="Unknown",
-        )
+        label_expr = unit_bucket()
     else:  # star_rating
-        label_expr = func.coalesce(SalesData.star_rating, "Unknown")  # type: ignore[assignment]
+        label_expr = func.coalesce(SalesData.star_rating, UNKNOWN)
 
     stmt = (
         select(
@@ -573,11 +888,6 @@ async def data_quality(
 ):
     """Data quality overview: record counts, null rates, flagged outliers."""
 
-    # Total records
-    total = (
-        await db.execute(select(func.count()).select_from(SalesData))
-    ).scalar() or 0
-
     # Records by file
     file_stmt = (
         select(SalesData.source_file, func.count())
@@ -587,8 +897,61 @@ async def data_quality(
     file_rows = (await db.execute(file_stmt)).all()
     records_by_file = {str(r[0] or "unknown"): r[1] for r in file_rows}
 
+    if await _rollup_ready(db):
+        # Totals, non-NULL counts and outliers from the rollup in one pass
+        row = (
+            await db.execute(
+                select(
+                    func.sum(SalesRollup.sales_count).label("total"),
+                    func.sum(SalesRollup.cap_rate_count).label("actual_cap_rate"),
+                    func.sum(SalesRollup.price_per_unit_count).label("price_per_unit"),
+                    func.sum(SalesRollup.avg_unit_sf_count).label("avg_unit_sf"),
+                    func.sum(SalesRollup.property_name_count).label("property_name"),
+                    func.sum(SalesRollup.sale_price_count).label("sale_price"),
+                    func.sum(
+                        case(
+                            (
+                                SalesRollup.sale_month.isnot(None),
+                                SalesRollup.sales_count,
+                            ),
+                            else_=0,
+                        )
+                    ).label("sale_date"),
+                    func.sum(SalesRollup.dollar_one_sales).label("dollar_one_sales"),
+                    func.sum(SalesRollup.high_unit_sales).label("high_units"),
+                )
+            )
+        ).one()
+        total = int(row.total or 0)
+        null_rates: dict[str, float] = {}
+        if total > 0:
+            for field_name in (
+                "actual_cap_rate",
+                "price_per_unit",
+                "avg_unit_sf",
+                "property_name",
+                "sale_price",
+                "sale_date",
+            ):
+                present = int(getattr(row, field_name) or 0)
+                null_rates[field_name] = round((total - present) / total, 4)
+        return DataQualityReport(
+            total_records=total,
+            records_by_file=records_by_file,
+            null_rates=null_rates,
+            flagged_outliers={
+                "dollar_one_sales": int(row.dollar_one_sales or 0),
+                "high_unit_count_over_800": int(row.high_units or 0),
+            },
+        )
+
+    # Total records
+    total = (
+        await db.execute(select(func.count()).select_from(SalesData))
+    ).scalar() or 0
+
     # Null rates for key fields
-    null_rates: dict[str, float] = {}
+    null_rates = {}
     if total > 0:
         key_fields = {
             "actual_cap_rate": SalesData.actual_cap_rate,
@@ -664,6 +1027,8 @@ async def trigger_import(
             total_updated += result.rows_updated
             if result.errors:
                 logger.warning(f"Import errors for {result.filename}: {result.errors}")
+        await cache.invalidate_pattern(f"{_COUNT_CACHE_PREFIX}*")
+        await cache.invalidate_filter_options("sales")
 
         return ImportResponse(
             success=True,
@@ -19,7 +19,8 @@ from loguru import logger
 from app.core.config import settings
 from app.core.security import _get_secret_key
 from app.core.token_blacklist import token_blacklist
-from app.services.websocket_manager import get_connection_manager
+from app.services.progress_stream import progress_streams
+from app.services.websocket_manager import ConnectionManager, get_connection_manager
 
 router = APIRouter()
 
@@ -61,6 +62,38 @@ async def _authenticate_token(token: str | None) -> int | None:
         return None
 
 
+async def _resume_stream(
+    manager: ConnectionManager, connection_id: str, data: dict
+) -> None:
+    """Send a reconnecting client what a progress stream published after ``after``."""
+    stream_id = data.get("stream")
+    stream = progress_streams.get(stream_id) if isinstance(stream_id, str) else None
+    if stream is None:
+        await manager.send_to_connection(
+            connection_id,
+            {"type": "error", "message": f"Unknown or expired stream: {stream_id}"},
+        )
+        return
+
+    try:
+        after = int(data.get("after") or 0)
+    except (TypeError, ValueError):
+        after = 0
+    events = stream.events_since(after)
+    if events:
+        for message in stream.render(stream, events):
+            await manager.send_to_connection(connection_id, message)
+    await manager.send_to_connection(
+        connection_id,
+        {
+            "type": "resumed",
+            "stream": stream.stream_id,
+            "seq": stream.last_seq,
+            "count": len(events),
+        },
+    )
+
+
 @router.websocket("/ws/{channel}")
 async def websocket_endpoint(
     websocket: WebSocket,
@@ -80,12 +113,16 @@ async def websocket_endpoint(
         {"type": "pong"}                     — heartbeat response
         {"type": "subscribe", "channel": "x"} — subscribe to additional channel
         {"type": "unsubscribe", "channel": "x"} — leave a channel
+        {"type": "resume", "stream": "x", "after": n} — replay the latest
+            state of keys a progress stream changed after sequence number n
 
     Message protocol (server -> client):
         {"type": "connected", ...}           — sent on successful connect
         {"type": "ping", ...}                — heartbeat; respond with pong
         {"type": "deal_update", ...}         — deal channel event
         {"type": "extraction_progress", ...} — extraction channel event
+            (coalesced; carries "stream" and "seq" for resuming)
+        {"type": "resumed", "stream": "x", "seq": n, ...} — end of a replay
         {"type": "notification", ...}        — user notification
         {"type": "error", "message": "..."}  — error message
     """
@@ -137,6 +174,9 @@ async def websocket_endpoint(
                         },
                     )
 
+            elif msg_type == "resume":
+                await _resume_stream(manager, connection_id, data)
+
             else:
                 await manager.send_to_connection(
                     connection_id,
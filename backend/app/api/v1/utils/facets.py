@@ -0,0 +1,92 @@
+"""
+Cached filter options (facets) for list endpoints.
+
+``facet_options`` answers a ``/filter-options`` endpoint: the distinct
+values of every dropdown column with their row counts, computed in one
+``UNION ALL`` statement, plus the min/max of each range filter. The result
+is cached under ``filter_options:{dataset}`` until the dataset's import or
+fetch path calls ``cache.invalidate_filter_options(dataset)``.
+
+Usage in an endpoint::
+
+    @router.get("/filter-options", response_model=ItemFilterOptionsResponse)
+    async def filter_options(db: AsyncSession = Depends(get_db)):
+        options = await facet_options(
+            db,
+            "items",
+            facets={"cities": Item.city},
+            ranges={"units": Item.number_of_units},
+        )
+        return ItemFilterOptionsResponse(**options)
+"""
+
+from typing import Any
+
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import LONG_TTL, cache
+
+
+async def facet_options(
+    db: AsyncSession,
+    dataset: str,
+    *,
+    facets: dict[str, Any],
+    ranges: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Return the filter options of *dataset*, from the cache when possible.
+
+    Args:
+        db: Async database session.
+        dataset: Cache namespace, e.g. ``"sales"``.
+        facets: Response field name -> column. Each field gets the sorted
+            distinct non-empty values; ``counts[field]`` maps value -> rows.
+        ranges: Response range name -> column; ``ranges[name]`` holds the
+            column's ``min`` and ``max``.
+
+    Returns:
+        A dict with one list per facet, plus ``counts`` and ``ranges``.
+    """
+    cache_key = f"filter_options:{dataset}"
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    stmt = union_all(
+        *(
+            select(
+                literal(name).label("facet"),
+                column.label("value"),
+                func.count().label("n"),
+            )
+            .where(column.isnot(None), column != "")
+            .group_by(column)
+            for name, column in facets.items()
+        )
+    )
+    counts: dict[str, dict[str, int]] = {name: {} for name in facets}
+    for row in (await db.execute(stmt)).all():
+        counts[row.facet][row.value] = row.n
+
+    options: dict[str, Any] = {name: sorted(values) for name, values in counts.items()}
+    options["counts"] = counts
+
+    options["ranges"] = {}
+    if ranges:
+        bounds = (
+            await db.execute(
+                select(
+                    *(
+                        agg(column)
+                        for column in ranges.values()
+                        for agg in (func.min, func.max)
+                    )
+                )
+            )
+        ).one()
+        for i, name in enumerate(ranges):
+            options["ranges"][name] = {"min": bounds[2 * i], "max": bounds[2 * i + 1]}
+
+    await cache.set(cache_key, options, ttl=LONG_TTL)
+    return options
@@ -0,0 +1,132 @@
+"""
+Viewport and clustering helpers for map endpoints.
+
+Map endpoints take the visible bounding box and zoom level (``MapViewport``)
+and answer from the integer grid columns of ``MapGridMixin`` models (see
+``app.core.map_grid``):
+
+- below ``MAP_CLUSTER_MAX_ZOOM``, one aggregate per grid cell
+  (``cluster_select`` + ``to_clusters``)
+- from it upwards, the compact records inside the viewport, at most
+  ``MAP_MAX_POINTS`` of them (``select_points``)
+
+Usage in an endpoint::
+
+    @router.get("/map")
+    async def item_map(viewport: MapViewport = Depends(), ...):
+        if viewport.clustered:
+            stmt = viewport.filter(cluster_select(Item, viewport.zoom), Item)
+            clusters = to_clusters(await db.execute(stmt), viewport.zoom)
+        ...
+        stmt = viewport.filter(select(Item.id, Item.latitude, ...), Item)
+        rows, total, truncated = await select_points(db, stmt.order_by(Item.id))
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import HTTPException, Query, status
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.map_grid import GRID_ZOOM, cell_size, project
+from app.schemas.base import MapCluster
+
+
+@dataclass
+class MapViewport:
+    """Bounding box and zoom level query parameters of a map request.
+
+    Bounding boxes crossing the antimeridian are not supported.
+    """
+
+    west: float = Query(..., ge=-180, le=180, description="West longitude")
+    south: float = Query(..., ge=-90, le=90, description="South latitude")
+    east: float = Query(..., ge=-180, le=180, description="East longitude")
+    north: float = Query(..., ge=-90, le=90, description="North latitude")
+    zoom: int = Query(..., ge=0, le=GRID_ZOOM, description="Map zoom level")
+
+    def __post_init__(self) -> None:
+        if self.west > self.east or self.south > self.north:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Bounding box must satisfy west <= east and south <= north",
+            )
+
+    @property
+    def clustered(self) -> bool:
+        """Whether this request is answered with clusters instead of points."""
+        return self.zoom < settings.MAP_CLUSTER_MAX_ZOOM
+
+    def filter(self, stmt: Any, model: Any) -> Any:
+        """Restrict *stmt* to rows of *model* inside the bounding box.
+
+        Filters on the indexed grid columns; rows without coordinates have
+        no grid position and never match.
+        """
+        x_min, y_max = project(self.south, self.west)
+        x_max, y_min = project(self.north, self.east)
+        return stmt.where(
+            model.map_grid_x.between(x_min, x_max),
+            model.map_grid_y.between(y_min, y_max),
+        )
+
+
+def cluster_select(model: Any, zoom: int) -> Any:
+    """Per-cell aggregates of *model* at *zoom*.
+
+    Each row has ``cell_x``, ``cell_y``, ``count``, the mean position, the
+    members' bounds and ``total_units``. Callers add their filters and the
+    viewport before executing.
+    """
+    size = cell_size(zoom)
+    cell_x = (model.map_grid_x // size).label("cell_x")
+    cell_y = (model.map_grid_y // size).label("cell_y")
+    return select(
+        cell_x,
+        cell_y,
+        func.count().label("count"),
+        func.avg(model.latitude).label("latitude"),
+        func.avg(model.longitude).label("longitude"),
+        func.min(model.latitude).label("south"),
+        func.min(model.longitude).label("west"),
+        func.max(model.latitude).label("north"),
+        func.max(model.longitude).label("east"),
+        func.coalesce(func.sum(model.number_of_units), 0).label("total_units"),
+    ).group_by(cell_x, cell_y)
+
+
+def to_clusters(rows: Any, zoom: int) -> list[MapCluster]:
+    """Build ``MapCluster`` objects from ``cluster_select`` result rows."""
+    return [
+        MapCluster(
+            key=f"{zoom}/{r.cell_x}/{r.cell_y}",
+            count=r.count,
+            latitude=r.latitude,
+            longitude=r.longitude,
+            south=r.south,
+            west=r.west,
+            north=r.north,
+            east=r.east,
+            total_units=r.total_units,
+        )
+        for r in rows
+    ]
+
+
+async def select_points(db: AsyncSession, stmt: Any) -> tuple[list[Any], int, bool]:
+    """Run a point query, returning at most ``MAP_MAX_POINTS`` rows.
+
+    Returns:
+        Tuple of (rows, number of matching rows, whether rows were cut off).
+        The matching rows are only counted when the cap is exceeded.
+    """
+    limit = settings.MAP_MAX_POINTS
+    rows = list((await db.execute(stmt.limit(limit + 1))).all())
+    if len(rows) <= limit:
+        return rows, len(rows), False
+    total = await db.scalar(
+        select(func.count()).select_from(stmt.order_by(None).subquery())
+    )
+    return rows[:limit], total or 0, True
@@ -17,11 +17,19 @@ NOTE: The dashboard properties endpoint previously returned up to 1,000
 records.  With this utility the default is 50 (max 200).  Existing
 clients that relied on the unbounded response must pass an explicit
 ``limit`` query parameter to retrieve more records (max 500).
+
+``cached_count`` serves list totals from the cache, keyed by filter set, so
+paging through a large filtered table runs its ``COUNT`` once per
+``CACHE_SHORT_TTL`` instead of on every page.
 """
 
 from dataclasses import dataclass
+from typing import Any
 
 from fastapi import Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import SHORT_TTL, cache
 
 
 @dataclass
@@ -35,3 +43,22 @@ class PaginationParams:
 
     skip: int = Query(0, ge=0, description="Number of records to skip")
     limit: int = Query(50, ge=1, le=500, description="Max records to return")
+
+
+async def cached_count(
+    db: AsyncSession, count_stmt: Any, cache_key: str, *, exact: bool = False
+) -> tuple[int, bool]:
+    """Return ``(total, estimated)`` for a filtered list.
+
+    A total cached for *cache_key* within the last ``CACHE_SHORT_TTL`` is
+    returned with ``estimated=True`` (it may lag recent writes). Otherwise,
+    or when *exact* is set, *count_stmt* runs and its result is cached.
+    Build the key with ``make_cache_key_from_params`` over the filters.
+    """
+    if not exact:
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return cached, True
+    total = (await db.execute(count_stmt)).scalar() or 0
+    await cache.set(cache_key, total, ttl=SHORT_TTL)
+    return total, False
@@ -1,6 +1,19 @@
 """Core application configuration and utilities."""
 
 from .config import settings
-from .security import create_access_token, get_password_hash, verify_password
+from .security import (
+    create_access_token,
+    get_password_hash,
+    get_password_hash_async,
+    verify_password,
+    verify_password_async,
+)
 
-__all__ = ["settings", "create_access_token", "verify_password", "get_password_hash"]
+__all__ = [
+    "settings",
+    "create_access_token",
+    "verify_password",
+    "verify_password_async",
+    "get_password_hash",
+    "get_password_hash_async",
+]
@@ -4,12 +4,17 @@ Redis caching layer for frequently-accessed, rarely-changing data.
 Provides async get/set/delete/invalidate helpers with TTL-based expiration
 and an in-memory fallback when Redis is unavailable.
 
+Values are stored as the JSON bytes produced by ``app.core.serialization``,
+the same encoding ``FastJSONResponse`` sends, so endpoints can serve a hit
+from ``get_raw`` without decoding it.
+
 Key prefix scheme:
     dashboard:portfolio_summary
     dashboard:property_list
     dashboard:property_dashboard:{property_id}
     dashboard:analytics_dashboard
     dashboard:deal_stats:{time_period}
+    dashboard:filter_options:{dataset}
 """
 
 from __future__ import annotations
@@ -24,9 +29,10 @@ from typing import Any
 from loguru import logger
 
 from app.core.config import settings
+from app.core.serialization import dumps, loads
 
-# In-memory fallback cache: key -> (value_json, expires_at)
-_memory_cache: dict[str, tuple[str, float]] = {}
+# In-memory fallback cache: key -> (encoded value, expires_at)
+_memory_cache: dict[str, tuple[bytes, float]] = {}
 
 # All dashboard cache keys use this prefix for bulk invalidation
 CACHE_PREFIX = "dashboard"
@@ -68,9 +74,10 @@ class CacheService:
         try:
             import redis.asyncio as aioredis
 
+            # Raw bytes: entries are pre-encoded JSON served as-is
             self._redis = aioredis.from_url(
                 settings.REDIS_URL,
-                decode_responses=True,
+                decode_responses=False,
                 socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
             )
             await self._redis.ping()
@@ -97,6 +104,16 @@ class CacheService:
 
         Returns the deserialized Python object, or None on miss/error.
         """
+        raw = await self.get_raw(key)
+        return loads(raw) if raw is not None else None
+
+    async def get_raw(self, key: str) -> bytes | None:
+        """
+        Retrieve a cached value as its stored JSON bytes.
+
+        Returns None on miss/error. Pass the result to ``FastJSONResponse``
+        to serve it without decoding.
+        """
         full_key = f"{CACHE_PREFIX}:{key}"
         await self._ensure_redis()
 
@@ -105,7 +122,7 @@ class CacheService:
                 raw = await self._redis.get(full_key)
                 if raw is not None:
                     logger.debug(f"Cache HIT (Redis): {full_key}")
-                    return json.loads(raw)
+                    return raw
                 logger.debug(f"Cache MISS (Redis): {full_key}")
                 return None
             except Exception as e:
@@ -115,7 +132,7 @@ class CacheService:
         else:
             return self._memory_get(full_key)
 
-    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> bytes:
         """
         Store a value in the cache with optional TTL.
 
@@ -123,10 +140,13 @@ class CacheService:
             key: Cache key (prefix is added automatically).
             value: Any JSON-serializable Python object.
             ttl: Time-to-live in seconds (defaults to REDIS_CACHE_TTL).
+
+        Returns:
+            The encoded JSON bytes that were stored.
         """
         full_key = f"{CACHE_PREFIX}:{key}"
         ttl = ttl if ttl is not None else DEFAULT_TTL
-        raw = json.dumps(value, default=str)
+        raw = dumps(value)
 
         await self._ensure_redis()
 
@@ -139,6 +159,7 @@ class CacheService:
                 self._memory_set(full_key, raw, ttl)
         else:
             self._memory_set(full_key, raw, ttl)
+        return raw
 
     async def delete(self, key: str) -> None:
         """Delete a single cache entry."""
@@ -207,6 +228,10 @@ class CacheService:
         logger.info(f"Cache: invalidated {count} deal-related keys")
         return count
 
+    async def invalidate_filter_options(self, dataset: str = "") -> int:
+        """Invalidate cached filter options of *dataset* (all datasets if empty)."""
+        return await self.invalidate_pattern(f"filter_options:{dataset}*")
+
     async def get_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
         stats: dict[str, Any] = {
@@ -233,7 +258,7 @@ class CacheService:
     # In-memory fallback helpers
     # ------------------------------------------------------------------
 
-    def _memory_get(self, full_key: str) -> Any | None:
+    def _memory_get(self, full_key: str) -> bytes | None:
         entry = _memory_cache.get(full_key)
         if entry is None:
             return None
@@ -241,9 +266,9 @@ class CacheService:
         if time.time() > expires_at:
             del _memory_cache[full_key]
             return None
-        return json.loads(raw)
+        return raw
 
-    def _memory_set(self, full_key: str, raw: str, ttl: int) -> None:
+    def _memory_set(self, full_key: str, raw: bytes, ttl: int) -> None:
         _memory_cache[full_key] = (raw, time.time() + ttl)
 
     def _memory_invalidate_pattern(self, pattern: str) -> int:
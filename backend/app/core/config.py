@@ -66,6 +66,11 @@ class AppSettings(BaseSettings):
     SLOW_QUERY_THRESHOLD_MS: int = 500
     SLOW_QUERY_LOG_PARAMS: bool = False
 
+    # Monitoring collectors are sampled in the background; endpoints read
+    # the latest snapshot and window aggregates from the ring buffer
+    METRICS_SAMPLE_INTERVAL_SECONDS: float = 5.0
+    METRICS_SAMPLE_WINDOW_MINUTES: int = 15
+
     # Cache TTL (seconds)
     CACHE_SHORT_TTL: int = 300  # 5 minutes — frequently-changing data
     CACHE_LONG_TTL: int = 7200  # 2 hours — rarely-changing aggregates
@@ -80,6 +85,10 @@ class AppSettings(BaseSettings):
     UPLOAD_MAX_CSV_MB: int = 10
     UPLOAD_MAX_DOCX_MB: int = 25
 
+    # Document Storage (content-addressed files behind /documents/upload)
+    DOCUMENT_STORAGE_DIR: str = "data/documents"
+    DOCUMENT_STORAGE_CHUNK_KB: int = 1024
+
     # PDF Report Limits
     PDF_MAX_PROPERTIES: int = 10
     PDF_MAX_DEALS: int = 10
@@ -87,15 +96,39 @@ class AppSettings(BaseSettings):
     # WebSocket
     WS_HEARTBEAT_INTERVAL: int = 30
     WS_MAX_CONNECTIONS: int = 1000
+    # Deliver messages to clients connected to other workers/replicas via
+    # Redis pub/sub (process-local only when disabled or Redis is down)
+    WS_FANOUT_ENABLED: bool = True
+    # Messages queued per connection before the slow-consumer policy applies:
+    # drop_oldest, coalesce (replace the queued update for the same entity)
+    # or disconnect
+    WS_SEND_QUEUE_SIZE: int = 256
+    WS_SLOW_CONSUMER_POLICY: Literal["drop_oldest", "coalesce", "disconnect"] = (
+        "drop_oldest"
+    )
+    # Progress streams (extraction runs, stage syncs) publish the latest state
+    # per key at most this often; finished streams stay resumable for
+    # WS_PROGRESS_RETENTION_SECONDS
+    WS_PROGRESS_FLUSH_INTERVAL_SECONDS: float = 0.5
+    WS_PROGRESS_RETENTION_SECONDS: int = 900
 
     # ML Model
     ML_MODEL_PATH: str = "./models"
     ML_BATCH_SIZE: int = 32
     ML_PREDICTION_CACHE_TTL: int = 300
+    ML_PREDICTION_CACHE_MAX_ENTRIES: int = 10000
 
     # Geocoding
     GEOCODING_RATE_LIMIT_DELAY: float = 1.1
 
+    # Map endpoints (construction pipeline, sales comps): grid clusters are
+    # returned below this zoom level, individual points from it upwards
+    MAP_CLUSTER_MAX_ZOOM: int = 14
+    # Cluster cell edge in screen pixels at the requested zoom (power of two)
+    MAP_CLUSTER_CELL_PX: int = 64
+    # Most points returned per request; more sets ``truncated``
+    MAP_MAX_POINTS: int = 2000
+
     # Workflow HTTP Step
     WORKFLOW_HTTP_TIMEOUT: int = 30
 
@@ -153,6 +186,12 @@ class AuthSettings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     # Separate signing key for refresh tokens. If empty, falls back to SECRET_KEY.
     REFRESH_TOKEN_SECRET: str = ""
+    # In-process cache of resolved principals for get_current_user
+    # (seconds; 0 disables). Invalidated across replicas via Redis pub/sub.
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: float = 30.0
+    AUTH_PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    # Threads dedicated to bcrypt hashing/verification (login, user writes)
+    PASSWORD_HASH_WORKERS: int = 4
 
     # Demo credentials — must be provided via environment variables
     DEMO_USER_PASSWORD: str = ""
@@ -200,8 +239,20 @@ class DatabaseSettings(BaseSettings):
     DATABASE_MAX_OVERFLOW: int = 20
     DATABASE_POOL_TIMEOUT: int = 30
 
+    # Audit / activity log writes: "sync" writes each entry in the request
+    # transaction; "buffered" queues entries and inserts them in batches
+    # from a background task (entries still queued are lost on a crash)
+    AUDIT_LOG_DURABILITY: Literal["sync", "buffered"] = "sync"
+    AUDIT_LOG_FLUSH_BATCH_SIZE: int = 200
+    AUDIT_LOG_FLUSH_INTERVAL_SECONDS: float = 1.0
+    AUDIT_LOG_MAX_PENDING: int = 10000
+
     # Market Analysis Database (separate PostgreSQL DB)
     MARKET_ANALYSIS_DB_URL: str | None = None
+    # Market data results are served from memory for up to this long;
+    # new CoStar/FRED imports are picked up sooner via the freshness check
+    MARKET_DATA_CACHE_TTL: int = 21600
+    MARKET_DATA_FRESHNESS_CHECK_SECONDS: int = 60
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
@@ -282,6 +333,12 @@ class ExtractionSettings(BaseSettings):
     # Batch Processing
     EXTRACTION_BATCH_SIZE: int = 10
     EXTRACTION_MAX_WORKERS: int = 4
+    # Extracted results buffered between the extract and persist stages;
+    # workers block when it is full
+    EXTRACTION_PIPELINE_QUEUE_SIZE: int = 8
+    # Dispatch runs to the ARQ workers as one job per file instead of
+    # processing them in the API process
+    EXTRACTION_DISTRIBUTED: bool = False
 
     # Scheduler
     EXTRACTION_SCHEDULE_ENABLED: bool = True
@@ -301,6 +358,13 @@ class ExtractionSettings(BaseSettings):
     FILE_MONITOR_INTERVAL_MINUTES: int = 30
     AUTO_EXTRACT_ON_CHANGE: bool = True
     MONITOR_CHECK_CRON: str = "*/30 * * * *"
+    # Download changed files into the workbook store as soon as the
+    # monitor detects them, ahead of the extraction run
+    FILE_MONITOR_PREFETCH: bool = False
+
+    # Workbook Store (content-addressed cache of downloaded SharePoint files)
+    WORKBOOK_STORE_DIR: str = "data/workbook_store"
+    WORKBOOK_STORE_MAX_MB: int = 2048
 
     # Stage Sync Policies
     STAGE_SYNC_DELETE_POLICY: str = "mark_dead"  # "mark_dead" or "ignore"
@@ -78,6 +78,9 @@ MAGIC_BYTES: dict[str, list[bytes]] = {
     # CSV has no magic bytes — skip check
 }
 
+# Bytes needed from the start of a file to check its signature
+SIGNATURE_BYTES: int = max(len(sig) for sigs in MAGIC_BYTES.values() for sig in sigs)
+
 
 # ---------------------------------------------------------------------------
 # Result type
@@ -112,30 +115,44 @@ def validate_upload(
     Returns:
         A ``ValidationResult`` indicating success or an error message.
     """
-    # 1. Filename required
-    if not filename or not filename.strip():
-        return ValidationResult(valid=False, error="Filename is required.")
+    result = _validate_filename(filename)
+    name = filename or ""
+    if result.valid:
+        result = validate_upload_size(name, len(file_content))
+    if result.valid:
+        result = _validate_content_type(name, content_type)
+    if result.valid:
+        result = validate_upload_signature(name, file_content)
+    return result
+
+
+def validate_upload_metadata(
+    filename: str | None,
+    content_type: str | None,
+) -> ValidationResult:
+    """Validate the name and MIME type of an upload before reading its body.
 
-    # 2. Extension check
-    ext = _get_extension(filename)
-    if ext not in ALLOWED_EXTENSIONS:
-        return ValidationResult(
-            valid=False,
-            error=(
-                f"File type '{ext}' is not allowed. "
-                f"Accepted types: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
-            ),
-        )
+    Used with ``validate_upload_size`` and ``validate_upload_signature`` when
+    the content is streamed rather than held in memory.
+    """
+    result = _validate_filename(filename)
+    if not result.valid:
+        return result
+    return _validate_content_type(filename or "", content_type)
 
+
+def validate_upload_size(filename: str, size: int) -> ValidationResult:
+    """Check an upload's size (or the bytes received so far) against its limit."""
     # 3. Empty file check
-    if len(file_content) == 0:
+    if size == 0:
         return ValidationResult(valid=False, error="Uploaded file is empty.")
 
     # 4. Size check
+    ext = _get_extension(filename)
     max_size = MAX_FILE_SIZES[ext]
-    if len(file_content) > max_size:
+    if size > max_size:
         max_mb = max_size / (1024 * 1024)
-        file_mb = len(file_content) / (1024 * 1024)
+        file_mb = size / (1024 * 1024)
         return ValidationResult(
             valid=False,
             error=(
@@ -143,8 +160,52 @@ def validate_upload(
                 f"limit for {ext} files."
             ),
         )
+    return ValidationResult(valid=True)
+
 
+def validate_upload_signature(filename: str, head: bytes) -> ValidationResult:
+    """Check the leading bytes of an upload against its extension's magic bytes.
+
+    Args:
+        filename: Original filename from the upload.
+        head: At least the first ``SIGNATURE_BYTES`` bytes of the file (or
+            the whole file, if shorter).
+    """
+    # 6. Magic bytes check (skip for CSV — no reliable signature)
+    signatures = MAGIC_BYTES.get(_get_extension(filename))
+    if signatures and not any(head.startswith(sig) for sig in signatures):
+        return ValidationResult(
+            valid=False,
+            error=(
+                f"File content does not match expected format for "
+                f"{_get_extension(filename)}. "
+                "The file may be corrupted or mislabeled."
+            ),
+        )
+    return ValidationResult(valid=True)
+
+
+def _validate_filename(filename: str | None) -> ValidationResult:
+    # 1. Filename required
+    if not filename or not filename.strip():
+        return ValidationResult(valid=False, error="Filename is required.")
+
+    # 2. Extension check
+    ext = _get_extension(filename)
+    if ext not in ALLOWED_EXTENSIONS:
+        return ValidationResult(
+            valid=False,
+            error=(
+                f"File type '{ext}' is not allowed. "
+                f"Accepted types: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
+            ),
+        )
+    return ValidationResult(valid=True)
+
+
+def _validate_content_type(filename: str, content_type: str | None) -> ValidationResult:
     # 5. MIME type check
+    ext = _get_extension(filename)
     resolved_content_type = content_type or mimetypes.guess_type(filename)[0] or ""
     allowed_mimes = ALLOWED_MIME_TYPES[ext]
     if resolved_content_type and resolved_content_type.lower() not in {
@@ -157,18 +218,6 @@ def validate_upload(
                 f"expected types for {ext} files."
             ),
         )
-
-    # 6. Magic bytes check (skip for CSV — no reliable signature)
-    signatures = MAGIC_BYTES.get(ext)
-    if signatures and not any(file_content.startswith(sig) for sig in signatures):
-        return ValidationResult(
-            valid=False,
-            error=(
-                f"File content does not match expected format for {ext}. "
-                "The file may be corrupted or mislabeled."
-            ),
-        )
-
     return ValidationResult(valid=True)
 
 
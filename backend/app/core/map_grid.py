@@ -0,0 +1,53 @@
+"""
+Integer spatial grid behind the map endpoints.
+
+Rows with coordinates store their Web Mercator position as pixel coordinates
+at ``GRID_ZOOM`` (``map_grid_x``/``map_grid_y``, indexed together; see
+``MapGridMixin``). Map queries then only compare and divide integers:
+
+- a viewport bounding box becomes a range on both grid columns
+- the cluster cell of a row at zoom ``z`` is its grid position divided by
+  the cell size, ``MAP_CLUSTER_CELL_PX * 2 ** (GRID_ZOOM - z)``, so
+  clustering is a GROUP BY on two integer expressions
+
+Query helpers for endpoints live in ``app.api.v1.utils.map_view``.
+
+Grid pixels at ``GRID_ZOOM`` 20 are ~12 cm across at Phoenix's latitude and
+the whole world fits in 2**28, well inside a 32-bit integer column.
+"""
+
+import math
+
+from app.core.config import settings
+
+GRID_ZOOM = 20
+TILE_PX = 256
+# Web Mercator is undefined at the poles; coordinates are clamped to this
+MAX_LATITUDE = 85.05112878
+
+_WORLD_PX = TILE_PX << GRID_ZOOM
+
+
+def project(latitude: float, longitude: float) -> tuple[int, int]:
+    """Grid position of a coordinate, clamped to the Web Mercator bounds."""
+    lat = max(-MAX_LATITUDE, min(MAX_LATITUDE, latitude))
+    lon = max(-180.0, min(180.0, longitude))
+    sin_lat = math.sin(math.radians(lat))
+    x = (lon + 180.0) / 360.0
+    y = 0.5 - math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)
+    return (
+        min(int(x * _WORLD_PX), _WORLD_PX - 1),
+        min(int(y * _WORLD_PX), _WORLD_PX - 1),
+    )
+
+
+def to_grid(latitude: float | None, longitude: float | None) -> tuple[int, int] | None:
+    """Grid position of a coordinate, or None when either part is missing."""
+    if latitude is None or longitude is None:
+        return None
+    return project(latitude, longitude)
+
+
+def cell_size(zoom: int) -> int:
+    """Edge of a cluster cell at *zoom*, in grid pixels."""
+    return settings.MAP_CLUSTER_CELL_PX << (GRID_ZOOM - min(zoom, GRID_ZOOM))
@@ -15,6 +15,7 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.principal_cache import principal_cache
 from app.core.security import decode_token
 from app.core.token_blacklist import token_blacklist
 from app.crud import user as user_crud
@@ -101,7 +102,9 @@ async def get_current_user(
     """
     Dependency to get the current authenticated user.
 
-    Validates the JWT token and returns a CurrentUser object.
+    Validates the JWT token and returns a CurrentUser object. The user
+    record lookup is served from the principal cache when possible (see
+    ``app.core.principal_cache``); the returned object must not be mutated.
 
     Raises:
         HTTPException: 401 if token is invalid, expired, or revoked
@@ -131,6 +134,11 @@ async def get_current_user(
     if not user_id:
         raise credentials_exception
 
+    iat = payload.get("iat")
+    cached = principal_cache.get(user_id, iat)
+    if cached is not None:
+        return cached
+
     # Try to fetch user from database
     db_user = await user_crud.get(db, id=int(user_id))
 
@@ -152,13 +160,15 @@ async def get_current_user(
     except ValueError:
         role = Role.VIEWER  # Default to lowest permission
 
-    return CurrentUser(
+    principal = CurrentUser(
         id=db_user.id,
         email=db_user.email,
         role=role,
         full_name=db_user.full_name,
         is_active=db_user.is_active,
     )
+    principal_cache.set(user_id, iat, principal)
+    return principal
 
 
 async def get_current_active_user(
@@ -0,0 +1,207 @@
+"""
+Short-lived in-process cache of authenticated principals.
+
+``get_current_user`` runs on every authenticated request. Without a cache,
+each call costs a database round-trip just to re-read the user's role and
+``is_active`` flag. This cache keeps the resolved ``CurrentUser`` for
+``AUTH_PRINCIPAL_CACHE_TTL_SECONDS``, keyed by (user_id, token iat).
+
+Invalidation:
+- ``invalidate_user`` drops a user's entries locally and publishes the user
+  ID on a Redis channel, so every replica running ``start_listener`` drops
+  its entries too. It is called on user update/deactivation (``CRUDUser``)
+  and ``TokenBlacklist.revoke_user_tokens``.
+- While the listener is disconnected from Redis, invalidations may be
+  missed, so the whole cache is cleared on every reconnect.
+- Without Redis, invalidation is process-local and the TTL bounds how long
+  other workers may serve a stale principal.
+
+Cached ``CurrentUser`` objects are shared between requests and must be
+treated as read-only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+    from app.core.permissions import CurrentUser
+
+INVALIDATION_CHANNEL = "auth:principal_invalidated"
+
+_CacheKey = tuple[str, int | None]
+
+
+class PrincipalCache:
+    """TTL + LRU bounded cache of ``CurrentUser`` keyed by (user_id, iat)."""
+
+    # Seconds to wait before resubscribing after a Redis error
+    LISTENER_RETRY_SECONDS = 5.0
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[_CacheKey, tuple[float, CurrentUser]] = OrderedDict()
+        self._redis: Redis | None = None
+        self._init_attempted = False
+        self._listener_task: asyncio.Task[None] | None = None
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether caching is enabled (TTL > 0)."""
+        return self.ttl_seconds > 0
+
+    # ── Lookup / insert ───────────────────────────────────────────────────
+
+    def get(self, user_id: int | str, iat: int | None) -> CurrentUser | None:
+        """Return the cached principal for a token, if still fresh."""
+        if not self.enabled:
+            return None
+
+        key = (str(user_id), iat)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, principal = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return principal
+
+    def set(self, user_id: int | str, iat: int | None, principal: CurrentUser) -> None:
+        """Cache a resolved principal, evicting the LRU entry when full."""
+        if not self.enabled:
+            return
+
+        key = (str(user_id), iat)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, principal)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def evict_user(self, user_id: int | str) -> int:
+        """Drop every cached entry for a user in this process.
+
+        Returns:
+            Number of entries removed.
+        """
+        user_key = str(user_id)
+        keys = [key for key in self._entries if key[0] == user_key]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all cached principals."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ── Invalidation ──────────────────────────────────────────────────────
+
+    async def _ensure_redis(self) -> None:
+        """Lazily initialize async Redis connection if configured."""
+        if self._init_attempted:
+            return
+        self._init_attempted = True
+
+        if not settings.REDIS_URL:
+            return
+
+        try:
+            import redis.asyncio as aioredis
+
+            client = aioredis.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+            )
+            await client.ping()
+            self._redis = client
+        except Exception as e:
+            logger.warning(
+                f"Principal cache: Redis unavailable ({e}), "
+                "invalidation is process-local"
+            )
+            self._redis = None
+
+    async def invalidate_user(self, user_id: int | str) -> None:
+        """Drop a user's cached principals here and on every other replica."""
+        self.evict_user(user_id)
+
+        await self._ensure_redis()
+        if self._redis is None:
+            return
+        try:
+            await self._redis.publish(INVALIDATION_CHANNEL, str(user_id))
+        except Exception as e:
+            logger.error(f"Principal cache: invalidation publish failed: {e}")
+
+    async def start_listener(self) -> None:
+        """Start the background task applying invalidations from other replicas."""
+        if self._listener_task is not None or not self.enabled:
+            return
+        await self._ensure_redis()
+        if self._redis is None:
+            return
+        self._listener_task = asyncio.create_task(self._listen())
+        logger.info("Principal cache: invalidation listener started")
+
+    async def stop_listener(self) -> None:
+        """Cancel the invalidation listener."""
+        if self._listener_task is None:
+            return
+        self._listener_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._listener_task
+        self._listener_task = None
+        logger.info("Principal cache: invalidation listener stopped")
+
+    async def _listen(self) -> None:
+        """Subscribe to the invalidation channel, resubscribing on errors."""
+        redis = self._redis
+        if redis is None:
+            return
+        while True:
+            try:
+                pubsub = redis.pubsub()
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Invalidations published while unsubscribed were missed
+                self.clear()
+                try:
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self.evict_user(message["data"])
+                finally:
+                    await pubsub.aclose()
+            except Exception as e:
+                logger.error(f"Principal cache: invalidation listener error: {e}")
+                self.clear()
+                await asyncio.sleep(self.LISTENER_RETRY_SECONDS)
+
+
+# Global singleton instance
+principal_cache = PrincipalCache(
+    ttl_seconds=settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS,
+    max_entries=settings.AUTH_PRINCIPAL_CACHE_MAX_ENTRIES,
+)
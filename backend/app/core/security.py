@@ -2,7 +2,11 @@
 Security utilities for authentication and authorization.
 """
 
+import asyncio
+import threading
 import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -41,6 +45,56 @@ def get_password_hash(password: str) -> str:
     return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
 
+# bcrypt (rounds=12) takes ~200 ms per call. Async code hashes on this
+# dedicated, bounded pool so a burst of logins neither blocks the event
+# loop nor starves the default executor used by asyncio.to_thread.
+_hash_executor: ThreadPoolExecutor | None = None
+_hash_executor_lock = threading.Lock()
+
+
+def _get_hash_executor() -> ThreadPoolExecutor:
+    global _hash_executor
+    if _hash_executor is None:
+        with _hash_executor_lock:
+            if _hash_executor is None:
+                _hash_executor = ThreadPoolExecutor(
+                    max_workers=settings.PASSWORD_HASH_WORKERS,
+                    thread_name_prefix="password-hash",
+                )
+    return _hash_executor
+
+
+def shutdown_hash_executor() -> None:
+    """Shut down the password hashing pool (recreated on next use)."""
+    global _hash_executor
+    with _hash_executor_lock:
+        executor, _hash_executor = _hash_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def _run_hash_job[T](func: Callable[..., T], *args: Any) -> T:
+    """Run a bcrypt call on the hashing pool, tracking queue depth."""
+    from app.services.monitoring.metrics import PASSWORD_HASH_QUEUE_DEPTH
+
+    loop = asyncio.get_running_loop()
+    PASSWORD_HASH_QUEUE_DEPTH.inc()
+    try:
+        return await loop.run_in_executor(_get_hash_executor(), func, *args)
+    finally:
+        PASSWORD_HASH_QUEUE_DEPTH.dec()
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash without blocking the event loop."""
+    return await _run_hash_job(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Generate a password hash without blocking the event loop."""
+    return await _run_hash_job(get_password_hash, password)
+
+
 def create_access_token(
     subject: str | Any,
     expires_delta: timedelta | None = None,
@@ -66,6 +120,7 @@ def create_access_token(
 
     to_encode = {
         "exp": expire,
+        "iat": datetime.now(UTC),
         "sub": str(subject),
         "jti": str(uuid.uuid4()),  # Unique token ID for blacklist support
     }
@@ -86,6 +141,7 @@ def create_refresh_token(subject: str | Any) -> str:
     expire = datetime.now(UTC) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     to_encode = {
         "exp": expire,
+        "iat": datetime.now(UTC),
         "sub": str(subject),
         "type": "refresh",
         "jti": str(uuid.uuid4()),  # Unique token ID for blacklist support
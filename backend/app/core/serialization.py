@@ -0,0 +1,68 @@
+"""
+Fast JSON encoding shared by API responses and the cache.
+
+Responses and cache entries are both encoded by ``dumps`` (orjson plus
+Decimal/Pydantic support), so a cached entry holds the exact bytes an
+endpoint returns and a cache hit goes to the socket without being decoded
+and re-encoded::
+
+    raw = await cache.get_raw(key)
+    if raw is not None:
+        return FastJSONResponse(raw)
+    ...
+    return FastJSONResponse(await cache.set(key, result))
+
+Routes declaring a ``response_model`` are already serialized straight to
+JSON bytes by Pydantic; this path is for endpoints that build plain dicts,
+which FastAPI would otherwise run through ``jsonable_encoder`` and
+``json.dumps``.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(obj: Any) -> Any:
+    """Encode types orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        # Same as FastAPI's jsonable_encoder: integral values stay ints.
+        # NaN/Infinity have no numeric exponent; encode them as null, as
+        # orjson does for non-finite floats (float() rejects sNaN).
+        if not obj.is_finite():
+            return None
+        exponent = obj.as_tuple().exponent
+        return int(obj) if isinstance(exponent, int) and exponent >= 0 else float(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, set | frozenset):
+        return list(obj)
+    return str(obj)
+
+
+def dumps(value: Any) -> bytes:
+    """Encode *value* to compact JSON bytes."""
+    return orjson.dumps(value, default=_default, option=_OPTIONS)
+
+
+def loads(raw: bytes | str) -> Any:
+    """Decode JSON text or bytes."""
+    return orjson.loads(raw)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded with ``dumps``.
+
+    ``bytes`` content is treated as already-encoded JSON (e.g. a cache hit)
+    and sent unchanged.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
@@ -14,6 +14,7 @@ import time
 from loguru import logger
 
 from app.core.config import settings
+from app.core.principal_cache import principal_cache
 
 # In-memory fallback store
 _memory_blacklist: dict[str, float] = {}
@@ -106,6 +107,9 @@ class TokenBlacklist:
                 f"All tokens revoked for user {user_id} in memory (replay attack detected)"
             )
 
+        # Cached principals for this user must re-check the database
+        await principal_cache.invalidate_user(user_id)
+
     async def is_user_revoked(self, user_id: str, token_iat: int | None = None) -> bool:
         """
         Check if a user's tokens have been revoked.
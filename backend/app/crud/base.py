@@ -5,7 +5,7 @@ Base CRUD class with common database operations.
 from __future__ import annotations
 
 import math
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from typing import Any
 
@@ -425,39 +425,6 @@ class CRUDBase[
     # Cursor-based pagination
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _coerce_sort_value(raw: Any, col: Any) -> Any:
-        """Coerce a decoded cursor sort-value to match the column type.
-
-        JSON round-tripping converts datetimes to ISO strings and Decimals
-        to strings.  This restores the original Python type so SQLAlchemy
-        comparisons work correctly.
-        """
-        if raw is None:
-            return None
-
-        col_type = getattr(col, "type", None)
-        if col_type is None:
-            return raw
-
-        type_name = type(col_type).__name__
-
-        if type_name in ("DateTime", "TIMESTAMP"):
-            if isinstance(raw, str):
-                # Handle ISO format with or without timezone
-                return datetime.fromisoformat(raw)
-            return raw
-
-        if type_name in ("Numeric", "DECIMAL", "Float"):
-            if isinstance(raw, str):
-                return Decimal(raw)
-            return raw
-
-        if type_name in ("Integer", "BigInteger", "SmallInteger"):
-            return int(raw)
-
-        return raw
-
     async def get_cursor_paginated(
         self,
         db: AsyncSession,
@@ -472,13 +439,7 @@ class CRUDBase[
         """Fetch a page of records using cursor-based pagination.
 
         The cursor encodes the value of the sort column and the row ID for
-        deterministic keyset pagination.  This method:
-
-        1. Decodes the incoming cursor (if any).
-        2. Builds a keyset ``WHERE`` clause that skips to the correct
-           position without an ``OFFSET``.
-        3. Fetches ``limit + 1`` rows to detect whether more data exists.
-        4. Encodes next/prev cursors for the caller.
+        deterministic keyset pagination (see ``keyset_paginate``).
 
         Args:
             db: Async database session.
@@ -498,121 +459,220 @@ class CRUDBase[
         """
         # Resolve the sort column (fall back to ``id`` if invalid)
         sort_col_name = order_by if hasattr(self.model, order_by) else "id"
-        sort_col = getattr(self.model, sort_col_name)
-        id_col = self.model.id  # type: ignore[attr-defined]
 
-        # Base query
         query = select(self.model)
         query = self._apply_soft_delete_filter(query, include_deleted=include_deleted)
-
         for cond in conditions or []:
             query = query.where(cond)
 
-        # Decode cursor and apply keyset filter
-        if params.cursor:
-            cursor_sort_val, cursor_id = decode_cursor(params.cursor)
-            cursor_sort_val = self._coerce_sort_value(cursor_sort_val, sort_col)
-
-            if params.direction == "next":
-                if order_desc:
-                    # Descending: next page = smaller values
-                    query = query.where(
-                        (sort_col < cursor_sort_val)
-                        | ((sort_col == cursor_sort_val) & (id_col < cursor_id))
-                    )
-                else:
-                    # Ascending: next page = larger values
-                    query = query.where(
-                        (sort_col > cursor_sort_val)
-                        | ((sort_col == cursor_sort_val) & (id_col > cursor_id))
-                    )
-            else:  # direction == "prev"
-                if order_desc:
-                    # Descending: prev page = larger values (reverse)
-                    query = query.where(
-                        (sort_col > cursor_sort_val)
-                        | ((sort_col == cursor_sort_val) & (id_col > cursor_id))
-                    )
-                else:
-                    # Ascending: prev page = smaller values (reverse)
-                    query = query.where(
-                        (sort_col < cursor_sort_val)
-                        | ((sort_col == cursor_sort_val) & (id_col < cursor_id))
-                    )
-
-        # Ordering — for "prev" requests we invert the sort so we can
-        # fetch the *nearest* rows, then reverse the result list.
-        if params.direction == "prev":
-            # Invert ordering
-            if order_desc:
-                query = query.order_by(sort_col.asc(), id_col.asc())
-            else:
-                query = query.order_by(sort_col.desc(), id_col.desc())
-        else:
-            if order_desc:
-                query = query.order_by(sort_col.desc(), id_col.desc())
-            else:
-                query = query.order_by(sort_col.asc(), id_col.asc())
+        result = await keyset_paginate(
+            db,
+            query,
+            sort_col=getattr(self.model, sort_col_name),
+            id_col=self.model.id,  # type: ignore[attr-defined]
+            cursor=params.cursor,
+            limit=params.limit,
+            direction=params.direction,
+            order_desc=order_desc,
+        )
 
-        # Fetch limit + 1 to detect has_more
-        query = query.limit(params.limit + 1)
+        # Optional total count
+        if include_total:
+            result.total = await self.count_where(
+                db, conditions=conditions, include_deleted=include_deleted
+            )
+        return result
 
-        result = await db.execute(query)
-        rows = list(result.scalars().all())
 
-        has_more = len(rows) > params.limit
-        if has_more:
-            rows = rows[: params.limit]
+# ---------------------------------------------------------------------------
+# Keyset pagination helpers
+# ---------------------------------------------------------------------------
 
-        # For "prev" direction we fetched in reverse order — restore original
-        if params.direction == "prev":
-            rows.reverse()
 
-        # Build cursors
-        next_cursor: str | None = None
-        prev_cursor: str | None = None
+def _coerce_sort_value(raw: Any, col: Any) -> Any:
+    """Coerce a decoded cursor sort-value to match the column type.
 
-        if rows:
-            # Next cursor is always based on the *last* item in the page
-            last = rows[-1]
-            last_sort_val = getattr(last, sort_col_name)
-            last_id = last.id  # type: ignore[attr-defined]
+    JSON round-tripping converts dates/datetimes to ISO strings and Decimals
+    to strings.  This restores the original Python type so SQLAlchemy
+    comparisons work correctly.
+    """
+    if raw is None:
+        return None
 
-            if has_more or params.direction == "prev":
-                # There are more rows ahead, or we came from a "prev"
-                # direction so forward is always valid.
-                next_cursor = encode_cursor(last_sort_val, last_id)
+    col_type = getattr(col, "type", None)
+    if col_type is None:
+        return raw
 
-            # Prev cursor is based on the *first* item
-            first = rows[0]
-            first_sort_val = getattr(first, sort_col_name)
-            first_id = first.id  # type: ignore[attr-defined]
-
-            if params.cursor is not None:
-                # We're not on the very first page
-                prev_cursor = encode_cursor(first_sort_val, first_id)
-
-        # If we went "prev" and there *are* items, has_more refers to
-        # whether there are older items (the "prev" direction).  But we
-        # report has_more relative to the *next* direction by convention.
-        if params.direction == "prev":
-            # When going backwards, "has_more" means there are earlier
-            # items.  But the caller typically cares about forward
-            # has_more.  We approximate: if we have a next cursor, more
-            # exist ahead.  The caller can still use next_cursor != None.
-            has_more = next_cursor is not None
+    type_name = type(col_type).__name__
 
-        # Optional total count
-        total: int | None = None
-        if include_total:
-            total = await self.count_where(
-                db, conditions=conditions, include_deleted=include_deleted
+    if type_name in ("DateTime", "TIMESTAMP"):
+        if isinstance(raw, str):
+            # Handle ISO format with or without timezone
+            return datetime.fromisoformat(raw)
+        return raw
+
+    if type_name == "Date":
+        if isinstance(raw, str):
+            return date.fromisoformat(raw)
+        return raw
+
+    if type_name in ("Numeric", "DECIMAL", "Float"):
+        if isinstance(raw, str):
+            return Decimal(raw)
+        return raw
+
+    if type_name in ("Integer", "BigInteger", "SmallInteger"):
+        return int(raw)
+
+    return raw
+
+
+def _rows_after(
+    sort_col: Any,
+    id_col: Any,
+    sort_value: Any,
+    row_id: int,
+    *,
+    descending: bool,
+    nulls_last: bool,
+) -> Any:
+    """Rows strictly after ``(sort_value, row_id)`` in the given ordering.
+
+    The ordering is ``sort_col`` then ``id_col``, both ascending or both
+    descending, with NULL sort values grouped at one end.
+    """
+    id_after = id_col < row_id if descending else id_col > row_id
+    if sort_value is None:
+        # Cursor row is in the NULL group
+        if nulls_last:
+            return sort_col.is_(None) & id_after
+        return sort_col.is_not(None) | (sort_col.is_(None) & id_after)
+
+    sort_after = sort_col < sort_value if descending else sort_col > sort_value
+    condition = sort_after | ((sort_col == sort_value) & id_after)
+    if nulls_last:
+        condition = condition | sort_col.is_(None)
+    return condition
+
+
+def keyset_order(sort_col: Any, id_col: Any, *, order_desc: bool) -> list[Any]:
+    """``ORDER BY`` clauses matching ``keyset_paginate`` (NULLs last, ID tiebreak).
+
+    Offset-paginated queries ordered this way can hand out cursors that
+    continue exactly where their page ended.
+    """
+    if order_desc:
+        return [sort_col.desc().nulls_last(), id_col.desc()]
+    return [sort_col.asc().nulls_last(), id_col.asc()]
+
+
+async def keyset_paginate(
+    db: AsyncSession,
+    query: Any,
+    *,
+    sort_col: Any,
+    id_col: Any,
+    cursor: str | None,
+    limit: int,
+    direction: str = "next",
+    order_desc: bool = True,
+) -> CursorPaginatedResult[Any]:
+    """Fetch one keyset page of an ORM ``select`` (``total`` is left unset).
+
+    Rows are ordered by ``sort_col`` then ``id_col`` with NULL sort values
+    last, so nullable sort columns page without gaps.  This:
+
+    1. Decodes the incoming cursor (if any).
+    2. Builds a keyset ``WHERE`` clause that skips to the correct
+       position without an ``OFFSET``.
+    3. Fetches ``limit + 1`` rows to detect whether more data exists.
+    4. Encodes next/prev cursors for the caller.
+
+    Raises:
+        ValueError: If the cursor string is malformed.
+    """
+    if cursor:
+        cursor_sort_val, cursor_id = decode_cursor(cursor)
+        cursor_sort_val = _coerce_sort_value(cursor_sort_val, sort_col)
+
+        if direction == "next":
+            query = query.where(
+                _rows_after(
+                    sort_col,
+                    id_col,
+                    cursor_sort_val,
+                    cursor_id,
+                    descending=order_desc,
+                    nulls_last=True,
+                )
+            )
+        else:  # direction == "prev": rows after the cursor in reverse order
+            query = query.where(
+                _rows_after(
+                    sort_col,
+                    id_col,
+                    cursor_sort_val,
+                    cursor_id,
+                    descending=not order_desc,
+                    nulls_last=False,
+                )
             )
 
-        return CursorPaginatedResult(
-            items=rows,
-            next_cursor=next_cursor,
-            prev_cursor=prev_cursor,
-            has_more=has_more,
-            total=total,
-        )
+    # Ordering — for "prev" requests we invert the sort so we can
+    # fetch the *nearest* rows, then reverse the result list.
+    if direction == "prev":
+        if order_desc:
+            query = query.order_by(sort_col.asc().nulls_first(), id_col.asc())
+        else:
+            query = query.order_by(sort_col.desc().nulls_first(), id_col.desc())
+    else:
+        query = query.order_by(*keyset_order(sort_col, id_col, order_desc=order_desc))
+
+    # Fetch limit + 1 to detect has_more
+    query = query.limit(limit + 1)
+
+    result = await db.execute(query)
+    rows = list(result.scalars().all())
+
+    has_more = len(rows) > limit
+    if has_more:
+        rows = rows[:limit]
+
+    # For "prev" direction we fetched in reverse order — restore original
+    if direction == "prev":
+        rows.reverse()
+
+    # Build cursors
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+    if rows:
+        # Next cursor is always based on the *last* item in the page
+        last = rows[-1]
+        if has_more or direction == "prev":
+            # There are more rows ahead, or we came from a "prev"
+            # direction so forward is always valid.
+            next_cursor = encode_cursor(getattr(last, sort_col.key), last.id)
+
+        # Prev cursor is based on the *first* item
+        if cursor is not None:
+            # We're not on the very first page
+            first = rows[0]
+            prev_cursor = encode_cursor(getattr(first, sort_col.key), first.id)
+
+    # If we went "prev" and there *are* items, has_more refers to
+    # whether there are older items (the "prev" direction).  But we
+    # report has_more relative to the *next* direction by convention.
+    if direction == "prev":
+        # When going backwards, "has_more" means there are earlier
+        # items.  But the caller typically cares about forward
+        # has_more.  We approximate: if we have a next cursor, more
+        # exist ahead.  The caller can still use next_cursor != None.
+        has_more = next_cursor is not None
+
+    return CursorPaginatedResult(
+        items=rows,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
+        has_more=has_more,
+    )
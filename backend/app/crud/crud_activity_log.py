@@ -2,12 +2,15 @@
 CRUD operations for ActivityLog model.
 """
 
+import uuid
+from datetime import UTC, datetime
 from typing import Any
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.base import CRUDBase
+from app.db.audit_sink import audit_sink
 from app.models.activity_log import ActivityAction, ActivityLog
 from app.schemas.activity_log import ActivityLogCreate
 
@@ -104,18 +107,24 @@ class CRUDActivityLog(CRUDBase[ActivityLog, ActivityLogCreate, ActivityLogCreate
             meta: Optional JSONB metadata
 
         Returns:
-            Created ActivityLog record
+            Created ActivityLog record. With buffered audit durability the
+            row is queued on ``audit_sink`` and a transient (unsaved)
+            instance is returned.
         """
-        import uuid
-
-        activity = ActivityLog(
-            id=str(uuid.uuid4()),  # Convert to string for SQLite compatibility
-            deal_id=deal_id,
-            user_id=user_id,
-            action=action,
-            description=description,
-            meta=meta,
-        )
+        values = {
+            "id": str(uuid.uuid4()),  # Convert to string for SQLite compatibility
+            "deal_id": deal_id,
+            "user_id": user_id,
+            "action": action,
+            "description": description,
+            "meta": meta,
+            "created_at": datetime.now(UTC),
+        }
+        if audit_sink.buffered:
+            await audit_sink.write(ActivityLog, values)
+            return ActivityLog(**values, is_deleted=False)
+
+        activity = ActivityLog(**values)
         db.add(activity)
         await db.flush()
         await db.refresh(activity)
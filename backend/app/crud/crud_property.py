@@ -10,11 +10,13 @@ service for transformation, then persist the results.
 from typing import Any
 
 from loguru import logger
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.crud.base import CRUDBase
 from app.models import Property
+from app.models.property import normalize_property_key
 from app.schemas.property import PropertyCreate, PropertyUpdate
 from app.services.enrichment import (
     build_base_expenses,
@@ -24,8 +26,7 @@ from app.services.enrichment import (
     fetch_bulk_base_rows,
     fetch_bulk_year_rows,
     fetch_year_field_rows,
-    get_property_name_variants,
-    match_prop_name,
+    group_rows_by_property_key,
     resolve_field_aliases,
     update_property_columns,
 )
@@ -161,9 +162,10 @@ class CRUDProperty(CRUDBase[Property, PropertyCreate, PropertyUpdate]):
         """Batch-enrich multiple properties that are missing financial_data.
 
         Instead of issuing 2-3 DB queries per property (N+1 pattern), this
-        method collects all name variants, executes two bulk queries (base
-        fields + YEAR_N fields), partitions the results by property name,
-        and then delegates to the existing per-property enrichment logic.
+        method collects each property's normalized ``property_key``, executes
+        two bulk queries (base fields + YEAR_N fields) against the indexed
+        key column, groups the results by key, and then delegates to the
+        existing per-property enrichment logic.
 
         Properties whose ``financial_data`` is missing or incomplete are
         enriched. A blob is considered complete only when key sections
@@ -171,8 +173,6 @@ class CRUDProperty(CRUDBase[Property, PropertyCreate, PropertyUpdate]):
 
         Returns the full list with enriched properties in their original positions.
         """
-        from app.models.extraction import ExtractedValue
-
         # Identify properties needing enrichment
         needs_enrichment = [
             p for p in properties if _financial_data_needs_enrichment(p.financial_data)
@@ -180,40 +180,38 @@ class CRUDProperty(CRUDBase[Property, PropertyCreate, PropertyUpdate]):
         if not needs_enrichment:
             return properties
 
-        # Build name→property mapping and collect all name variants
-        all_names: list[str] = []
-        name_to_props: dict[str, list[Property]] = {}
-        for prop in needs_enrichment:
-            variants = get_property_name_variants(prop)
-            for v in variants:
-                name_to_props.setdefault(v, []).append(prop)
-                all_names.append(v)
+        # Collect the normalized name key for every property to enrich
+        prop_keys = {
+            prop.id: prop.property_key or normalize_property_key(prop.name)
+            for prop in needs_enrichment
+        }
+        all_keys = {key for key in prop_keys.values() if key}
 
-        if not all_names:
+        if not all_keys:
             return properties
 
-        # Build OR conditions for all property name variants
-        name_conditions = []
-        for name in set(all_names):
-            name_conditions.append(ExtractedValue.property_name == name)
-            name_conditions.append(ExtractedValue.property_name.like(name + " (%"))
+        # Bulk queries via service helpers (property_key IN (...) index lookups)
+        base_rows = await fetch_bulk_base_rows(db, all_keys)
+        year_rows = await fetch_bulk_year_rows(db, all_keys)
 
-        # Bulk queries via service helpers
-        base_rows = await fetch_bulk_base_rows(db, name_conditions)
-        year_rows = await fetch_bulk_year_rows(db, name_conditions)
+        base_by_key = group_rows_by_property_key(base_rows)
+        year_by_key = group_rows_by_property_key(year_rows)
 
         for prop in needs_enrichment:
+            key = prop_keys[prop.id]
+            if key is None:
+                # No name to match extracted values on
+                continue
+
             # Build per-property base field dict (dedup by field_name, first=latest)
             prop_base: dict[str, float | str | None] = {}
-            for pname, fname, vnumeric, vtext in base_rows:
-                if fname not in prop_base and match_prop_name(pname, prop):
+            for _key, fname, vnumeric, vtext in base_by_key.get(key, ()):
+                if fname not in prop_base:
                     prop_base[fname] = vnumeric if vnumeric is not None else vtext
 
             # Build per-property year rows list
             prop_year: list[tuple[str, float | None]] = [
-                (fname, vnumeric)
-                for pname, fname, vnumeric in year_rows
-                if match_prop_name(pname, prop)
+                (fname, vnumeric) for _key, fname, vnumeric in year_by_key.get(key, ())
             ]
 
             await self.enrich_financial_data(
@@ -232,6 +230,52 @@ class CRUDProperty(CRUDBase[Property, PropertyCreate, PropertyUpdate]):
 
         return properties
 
+    async def get_frontend_projections(
+        self, db: AsyncSession, properties: list[Property]
+    ) -> list[dict]:
+        """Return the frontend projection of each property, in order.
+
+        Projections materialized at update time are served as stored. Rows
+        without a current one (inserted rows, bulk UPDATEs, an older
+        ``PROJECTION_VERSION``) are recomputed and written back in one
+        executemany that leaves ``updated_at`` unchanged.
+        """
+        from app.api.v1.endpoints._property_transforms import (
+            projection_version,
+            stored_frontend_property,
+            to_frontend_property,
+        )
+
+        projections: list[dict] = []
+        stale: list[dict[str, Any]] = []
+        for prop in properties:
+            projection = stored_frontend_property(prop)
+            if projection is None:
+                projection = to_frontend_property(prop)
+                version = projection_version(prop)
+                stale.append(
+                    {
+                        "id": prop.id,
+                        "frontend_projection": projection,
+                        "frontend_projection_version": version,
+                        # Explicit value suppresses the onupdate timestamp
+                        "updated_at": prop.updated_at,
+                    }
+                )
+                # Keep the loaded instance in sync without marking it dirty
+                set_committed_value(prop, "frontend_projection", projection)
+                set_committed_value(prop, "frontend_projection_version", version)
+            projections.append(projection)
+
+        if stale:
+            await db.execute(update(Property), stale)
+            logger.info(
+                "property_projections_rebuilt",
+                rebuilt=len(stale),
+                served=len(properties) - len(stale),
+            )
+        return projections
+
     def _build_property_conditions(
         self,
         *,
@@ -11,7 +11,8 @@ from loguru import logger
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import get_password_hash, verify_password
+from app.core.principal_cache import principal_cache
+from app.core.security import get_password_hash_async, verify_password_async
 from app.crud.base import CRUDBase
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
@@ -35,7 +36,7 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
 
         # Hash password before storing
         if "password" in obj_in_data:
-            obj_in_data["hashed_password"] = get_password_hash(
+            obj_in_data["hashed_password"] = await get_password_hash_async(
                 obj_in_data.pop("password")
             )
 
@@ -52,7 +53,11 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         db_obj: User,
         obj_in: UserUpdate | dict[str, Any],
     ) -> User:
-        """Update user with password hashing support."""
+        """Update user with password hashing support.
+
+        Also invalidates the user's cached principals (see
+        ``app.core.principal_cache``).
+        """
         if isinstance(obj_in, dict):
             update_data = obj_in.copy()
         else:
@@ -60,11 +65,14 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
 
         # Hash password if provided
         if "password" in update_data:
-            update_data["hashed_password"] = get_password_hash(
+            update_data["hashed_password"] = await get_password_hash_async(
                 update_data.pop("password")
             )
 
-        return await super().update(db, db_obj=db_obj, obj_in=update_data)
+        updated = await super().update(db, db_obj=db_obj, obj_in=update_data)
+        # Role / is_active may have changed; drop cached principals everywhere
+        await principal_cache.invalidate_user(updated.id)
+        return updated
 
     async def update_last_login(self, db: AsyncSession, *, user: User) -> User:
         """Update user's last login timestamp with transaction safety."""
@@ -96,7 +104,7 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         if not user:
             return None
         try:
-            if not verify_password(password, user.hashed_password):
+            if not await verify_password_async(password, user.hashed_password):
                 return None
         except Exception:
             # Invalid/corrupt hash in DB — treat as auth failure
@@ -24,8 +24,12 @@ from app.extraction.domain_validators import validate_domain_range
 from app.extraction.error_handler import NullValue
 from app.models.deal import Deal, DealStage
 from app.models.extraction import ExtractedValue, ExtractionRun
-from app.models.property import Property
+from app.models.property import Property, normalize_property_key
 from app.services.enrichment import FIELD_ALIASES, resolve_field_aliases
+from app.services.extraction.change_detector import (
+    compute_extraction_hash,
+    record_digest,
+)
 
 # Extraction runs older than this are considered stale/crashed
 STALE_RUN_TIMEOUT_MINUTES = 30
@@ -137,6 +141,52 @@ class ExtractionRunCRUD:
             db.refresh(run)
         return run
 
+    @staticmethod
+    def start_fan_out(
+        db: Session, run_id: UUID, jobs_total: int
+    ) -> ExtractionRun | None:
+        """Record how many per-file jobs a fan-out run is waiting for."""
+        run = db.get(ExtractionRun, run_id)
+        if run:
+            run.jobs_total = jobs_total
+            run.jobs_completed = 0
+            run.files_discovered = jobs_total
+            db.commit()
+            db.refresh(run)
+        return run
+
+    @staticmethod
+    def record_file_result(
+        db: Session, run_id: UUID, file_path: str, status_entry: dict
+    ) -> bool:
+        """Record one finished per-file job of a fan-out run.
+
+        The run row is locked for the update so concurrent workers
+        serialize their counter and per_file_status changes. A file that
+        was already recorded (e.g. a retried job) is not counted twice.
+
+        Returns:
+            True when every job of the run has now completed.
+        """
+        run = db.execute(
+            select(ExtractionRun).where(ExtractionRun.id == run_id).with_for_update()
+        ).scalar_one_or_none()
+        if run is None:
+            return False
+
+        statuses = dict(run.per_file_status or {})
+        if file_path not in statuses:
+            statuses[file_path] = status_entry
+            run.per_file_status = statuses
+            if status_entry.get("status") == "failed":
+                run.files_failed += 1
+            else:
+                run.files_processed += 1
+            run.jobs_completed += 1
+        db.commit()
+
+        return run.jobs_total is not None and run.jobs_completed >= run.jobs_total
+
     @staticmethod
     def complete(
         db: Session,
@@ -206,6 +256,9 @@ class ExtractedValueCRUD:
         """
         Bulk insert extracted values from a single file extraction.
 
+        Also records the extraction's content digest for the property so
+        later runs can detect changes without re-reading these values.
+
         Args:
             db: Database session
             extraction_run_id: ID of the extraction run
@@ -219,19 +272,18 @@ class ExtractedValueCRUD:
         Returns:
             Number of values inserted
         """
-        # Resolve property_id from the Property table (if match exists)
-        # Try exact match first, then prefix match for "Name (City, ST)" pattern
-        prop_row = db.execute(
-            select(Property.id)
-            .where(
-                or_(
-                    func.lower(Property.name) == func.lower(property_name),
-                    func.lower(Property.name).like(func.lower(property_name) + " (%"),
-                )
-            )
-            .limit(1)
-        ).scalar_one_or_none()
-        property_id: int | None = prop_row if prop_row is not None else None
+        # Resolve property_id from the Property table (if match exists).
+        # property_key strips the "(City, ST)" suffix, so "Name" and
+        # "Name (City, ST)" resolve through the same index lookup.
+        property_key = normalize_property_key(property_name)
+        property_id: int | None = None
+        if property_key:
+            property_id = db.execute(
+                select(Property.id)
+                .where(Property.property_key == property_key)
+                .order_by(Property.id)
+                .limit(1)
+            ).scalar_one_or_none()
 
         values_to_insert = []
 
@@ -297,6 +349,7 @@ class ExtractedValueCRUD:
                     "extraction_run_id": extraction_run_id,
                     "property_id": property_id,
                     "property_name": property_name,
+                    "property_key": property_key,
                     "field_name": field_name,
                     "field_category": mapping.category if mapping else None,
                     "sheet_name": mapping.sheet_name if mapping else None,
@@ -331,6 +384,12 @@ class ExtractedValueCRUD:
                 },
             )
             db.execute(stmt)
+            record_digest(
+                db,
+                extraction_run_id,
+                property_name,
+                compute_extraction_hash(extracted_data),
+            )
             db.commit()
 
         return len(values_to_insert)
@@ -456,22 +515,24 @@ def sync_extracted_to_properties(
         }
 
     # ── Pre-fetch all existing properties in bulk ──
-    # Build OR conditions for all unlinked names
-    name_conditions = []
-    for prop_name in unlinked:
-        name_conditions.append(func.lower(Property.name) == func.lower(prop_name))
-        name_conditions.append(
-            func.lower(Property.name).like(func.lower(prop_name) + " (%")
-        )
+    # Map each unlinked name to its normalized key and match on the indexed
+    # properties.property_key column (exact and "Name (City, ST)" variants).
+    unlinked_keys = {name: normalize_property_key(name) for name in unlinked}
 
     existing_props_rows = db.execute(
-        select(Property.id, Property.name).where(or_(*name_conditions))
+        select(Property.id, Property.property_key)
+        .where(
+            Property.property_key.in_(
+                {key for key in unlinked_keys.values() if key is not None}
+            )
+        )
+        .order_by(Property.id)
     ).all()
 
-    # Build a lookup: lowercase-name -> property_id (for exact and prefix match)
+    # Build a lookup: property_key -> property_id (lowest id wins)
     existing_lookup: dict[str, int] = {}
-    for pid, pname in existing_props_rows:
-        existing_lookup[pname.lower()] = pid
+    for pid, pkey in existing_props_rows:
+        existing_lookup.setdefault(pkey, pid)
 
     # ── Pre-fetch all extracted field values for unlinked properties in bulk ──
     _SYNC_FIELDS = [
@@ -515,14 +576,8 @@ def sync_extracted_to_properties(
 
     for prop_name in unlinked:
         # Try to find existing property via the pre-fetched lookup
-        prop_id: int | None = None
-        prop_name_lower = prop_name.lower()
-        for existing_name_lower, existing_pid in existing_lookup.items():
-            if existing_name_lower == prop_name_lower or existing_name_lower.startswith(
-                f"{prop_name_lower} ("
-            ):
-                prop_id = existing_pid
-                break
+        prop_key = unlinked_keys[prop_name]
+        prop_id: int | None = existing_lookup.get(prop_key) if prop_key else None
 
         if prop_id is None:
             # Create new Property + Deal using pre-fetched fields
@@ -580,6 +635,9 @@ def sync_extracted_to_properties(
             db.flush()  # Get the ID
             prop_id = new_prop.id
             created_properties += 1
+            # Later names in this run with the same key link to this property
+            if new_prop.property_key:
+                existing_lookup.setdefault(new_prop.property_key, prop_id)
 
             new_deal = Deal(
                 name=display_name,
@@ -927,7 +985,8 @@ def hydrate_properties_from_extracted(db: Session) -> dict[str, Any]:
     per field_name and uses it to fill in missing data.
 
     Uses bulk queries to avoid N+1: fetches all relevant extracted values
-    in a single query, then groups them by property_name in Python.
+    in a single query keyed on the indexed ``property_key`` column, then
+    groups them by key in Python.
 
     Returns summary of updated records.
     """
@@ -936,104 +995,60 @@ def hydrate_properties_from_extracted(db: Session) -> dict[str, Any]:
     if not all_props:
         return {"total_properties": 0, "properties_updated": 0}
 
-    # Build name variants for all properties
-    # Map: variant (lowercase) -> list of Property objects
-    variant_to_props: dict[str, list[Property]] = defaultdict(list)
+    # Group properties by normalized name key
+    props_by_key: dict[str, list[Property]] = defaultdict(list)
     all_target_fields = list(_FINANCIAL_DATA_FIELDS) + list(_EXTRACTED_FIELD_MAP.keys())
 
     for prop in all_props:
-        if not prop.name:
-            continue
-        full_lower = prop.name.lower()
-        variant_to_props[full_lower].append(prop)
-        short_name = prop.name.split("(")[0].strip()
-        if short_name and short_name != prop.name:
-            variant_to_props[short_name.lower()].append(prop)
+        key = prop.property_key or normalize_property_key(prop.name)
+        if key:
+            props_by_key[key].append(prop)
 
-    # ── Single bulk query for ALL extracted values across all properties ──
-    # Build OR conditions for all name variants
-    name_conditions = []
-    all_variant_names = list(variant_to_props.keys())
-    for variant in all_variant_names:
-        name_conditions.append(func.lower(ExtractedValue.property_name) == variant)
-        name_conditions.append(
-            func.lower(ExtractedValue.property_name).like(variant + " (%")
-        )
-
-    if not name_conditions:
+    if not props_by_key:
         return {"total_properties": len(all_props), "properties_updated": 0}
 
+    # ── Single bulk query for ALL extracted values across all properties ──
     bulk_rows = db.execute(
         select(
-            ExtractedValue.property_name,
+            ExtractedValue.property_key,
             ExtractedValue.field_name,
             ExtractedValue.value_numeric,
             ExtractedValue.value_text,
         )
         .where(
             and_(
-                or_(*name_conditions),
+                ExtractedValue.property_key.in_(list(props_by_key)),
                 ExtractedValue.is_error.is_(False),
                 ExtractedValue.field_name.in_(all_target_fields),
             )
         )
         .order_by(
-            ExtractedValue.property_name,
+            ExtractedValue.property_key,
             ExtractedValue.field_name,
             ExtractedValue.created_at.desc(),
         )
     ).all()
 
-    # Group extracted values by property_name (lowercase)
-    # Keep first occurrence per (property_name, field_name) since ordered by
+    # Group extracted values by property_key.
+    # Keep first occurrence per (property_key, field_name) since ordered by
     # created_at DESC
-    values_by_ev_name: dict[str, dict[str, float | str | None]] = defaultdict(dict)
-    for ev_pname, ev_fname, ev_vnumeric, ev_vtext in bulk_rows:
-        ev_key = ev_pname.lower()
-        if ev_fname not in values_by_ev_name[ev_key]:
-            values_by_ev_name[ev_key] = values_by_ev_name.get(ev_key, {})
-            if ev_fname not in values_by_ev_name[ev_key]:
-                values_by_ev_name[ev_key][ev_fname] = (
-                    ev_vnumeric if ev_vnumeric is not None else ev_vtext
-                )
+    values_by_key: dict[str, dict[str, float | str | None]] = defaultdict(dict)
+    for ev_key, ev_fname, ev_vnumeric, ev_vtext in bulk_rows:
+        key_values = values_by_key[ev_key]
+        if ev_fname not in key_values:
+            key_values[ev_fname] = ev_vnumeric if ev_vnumeric is not None else ev_vtext
 
     # Match extracted values back to properties
     updated = 0
-    for prop in all_props:
-        if not prop.name:
-            continue
-
-        # Try full name first, then short name
-        full_lower = prop.name.lower()
-        short_name = prop.name.split("(")[0].strip().lower()
-
-        field_values: dict[str, float | str | None] = {}
-
-        # Check direct match on full name
-        if full_lower in values_by_ev_name:
-            field_values = values_by_ev_name[full_lower]
-        elif short_name and short_name != full_lower:
-            # Check short name match
-            if short_name in values_by_ev_name:
-                field_values = values_by_ev_name[short_name]
-            else:
-                # Check prefix matches: any ev_name that starts with short_name + " ("
-                for ev_name, ev_fields in values_by_ev_name.items():
-                    if ev_name.startswith(f"{short_name} ("):
-                        field_values = ev_fields
-                        break
-        else:
-            # Check prefix matches for full name
-            for ev_name, ev_fields in values_by_ev_name.items():
-                if ev_name.startswith(f"{full_lower} ("):
-                    field_values = ev_fields
-                    break
-
+    for key, props in props_by_key.items():
+        field_values = values_by_key.get(key)
         if not field_values:
             continue
 
-        if _apply_hydration(prop, field_values):
-            updated += 1
+        for prop in props:
+            # _apply_hydration resolves aliases in place — give each its own copy
+            if _apply_hydration(prop, dict(field_values)):
+                updated += 1
 
     db.commit()
     logger.info(
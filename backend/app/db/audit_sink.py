@@ -0,0 +1,191 @@
+"""
+Buffered writer for audit and activity log entries.
+
+With ``AUDIT_LOG_DURABILITY="sync"`` (the default) callers write entries in
+their own request transaction, costing a flush round-trip per audited
+action. With ``"buffered"``, ``write`` appends the entry to an in-process
+queue and a background task inserts queued entries in batches (one
+multi-row INSERT per table):
+- when ``AUDIT_LOG_FLUSH_BATCH_SIZE`` entries are queued, or
+- every ``AUDIT_LOG_FLUSH_INTERVAL_SECONDS``, whichever comes first.
+
+Buffered entries are committed independently of the request transaction,
+and entries still queued when the process dies are lost. If the queue
+reaches ``AUDIT_LOG_MAX_PENDING`` (e.g. the database is down), writers wait
+for a flush; entries beyond that bound are dropped after a failed flush.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections.abc import Callable
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.base import Base
+
+
+class AuditSink:
+    """In-process queue of log rows, flushed in batches by a background task."""
+
+    def __init__(
+        self,
+        durability: str,
+        batch_size: int,
+        flush_interval: float,
+        max_pending: int,
+        session_factory: Callable[[], AsyncSession] | None = None,
+    ):
+        self.durability = durability
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._session_factory = session_factory
+
+        self._pending: list[tuple[type[Base], dict[str, Any]]] = []
+        self._flush_lock = asyncio.Lock()
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def buffered(self) -> bool:
+        """Whether ``write`` queues entries (buffered mode, writer running)."""
+        return self._task is not None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    # ── Queue ─────────────────────────────────────────────────────────────
+
+    async def write(self, model: type[Base], values: dict[str, Any]) -> None:
+        """Queue one row of *model* for the next batch insert.
+
+        Args:
+            model: Mapped class the row belongs to.
+            values: Attribute values, as accepted by ``insert(model)``.
+        """
+        self._pending.append((model, values))
+        self._set_depth()
+
+        if len(self._pending) >= self.max_pending:
+            # Backpressure: don't let the queue grow without bound
+            await self.flush()
+        elif len(self._pending) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+
+    async def flush(self) -> int:
+        """Insert all queued entries.
+
+        Failures are logged and the entries are kept for the next flush
+        (up to ``max_pending``); this method never raises.
+
+        Returns:
+            Number of entries written.
+        """
+        from app.services.monitoring.metrics import (
+            AUDIT_LOG_FLUSH_LATENCY,
+            AUDIT_LOG_FLUSHED,
+        )
+
+        async with self._flush_lock:
+            batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+
+            rows_by_model: dict[type[Base], list[dict[str, Any]]] = {}
+            for model, values in batch:
+                rows_by_model.setdefault(model, []).append(values)
+
+            start = time.perf_counter()
+            try:
+                async with self._get_session_factory()() as session:
+                    for model, rows in rows_by_model.items():
+                        await session.execute(insert(model), rows)
+                    await session.commit()
+            except Exception:
+                logger.opt(exception=True).error(
+                    "audit_log_flush_failed", entries=len(batch)
+                )
+                AUDIT_LOG_FLUSHED.labels(status="failed").inc(len(batch))
+                self._requeue(batch)
+                return 0
+            finally:
+                AUDIT_LOG_FLUSH_LATENCY.observe(time.perf_counter() - start)
+                self._set_depth()
+
+            AUDIT_LOG_FLUSHED.labels(status="written").inc(len(batch))
+            logger.debug(
+                "audit_log_flushed",
+                entries=len(batch),
+                tables=[m.__tablename__ for m in rows_by_model],
+            )
+            return len(batch)
+
+    def _requeue(self, batch: list[tuple[type[Base], dict[str, Any]]]) -> None:
+        """Put a failed batch back in front of newer entries, dropping overflow."""
+        self._pending[:0] = batch
+        overflow = len(self._pending) - self.max_pending
+        if overflow > 0:
+            del self._pending[:overflow]
+            logger.error("audit_log_entries_dropped", dropped=overflow)
+
+    def _set_depth(self) -> None:
+        from app.services.monitoring.metrics import AUDIT_LOG_QUEUE_DEPTH
+
+        AUDIT_LOG_QUEUE_DEPTH.set(len(self._pending))
+
+    def _get_session_factory(self) -> Callable[[], AsyncSession]:
+        if self._session_factory is None:
+            from app.db.session import AsyncSessionLocal
+
+            self._session_factory = AsyncSessionLocal
+        return self._session_factory
+
+    # ── Background writer ─────────────────────────────────────────────────
+
+    async def start(self) -> None:
+        """Start the background writer (no-op unless durability is buffered)."""
+        if self._task is not None or self.durability != "buffered":
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            "audit_log_writer_started",
+            batch_size=self.batch_size,
+            flush_interval=self.flush_interval,
+        )
+
+    async def stop(self) -> None:
+        """Stop the background writer and flush anything still queued."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        self._wakeup = None
+        await self.flush()
+        logger.info("audit_log_writer_stopped")
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            self._wakeup.clear()
+            await self.flush()
+
+
+# Global singleton instance
+audit_sink = AuditSink(
+    durability=settings.AUDIT_LOG_DURABILITY,
+    batch_size=settings.AUDIT_LOG_FLUSH_BATCH_SIZE,
+    flush_interval=settings.AUDIT_LOG_FLUSH_INTERVAL_SECONDS,
+    max_pending=settings.AUDIT_LOG_MAX_PENDING,
+)
@@ -38,12 +38,14 @@ from app.models.construction import (  # noqa: E402, F401
     ConstructionSourceLog,
 )
 from app.models.deal import Deal  # noqa: E402, F401
+from app.models.deal_stage_interval import DealStageInterval  # noqa: E402, F401
 from app.models.delta_token import DeltaToken  # noqa: E402, F401
 from app.models.document import Document  # noqa: E402, F401
 
 # Extraction Models (SharePoint UW Model Integration)
 from app.models.extraction import (  # noqa: E402, F401
     ExtractedValue,
+    ExtractionDigest,
     ExtractionRun,
 )
 
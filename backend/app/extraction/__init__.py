@@ -7,6 +7,7 @@ Components:
 - cell_mapping: Cell mapping parser and dataclass
 - extractor: Excel data extraction for .xlsb and .xlsx files
 - sharepoint: SharePoint discovery and file download
+- workbook_store: Content-addressed local cache of downloaded workbooks
 - file_filter: Configurable file filtering for discovery and extraction
 - batch: Batch processing with parallel execution
 - scheduler: APScheduler integration for nightly extraction
@@ -62,6 +63,7 @@ from .variant_detector import (
     detect_variant,
     resolve_unit_matrix_totals,
 )
+from .workbook_store import StoredWorkbook, WorkbookStore, get_workbook_store
 
 __all__ = [
     # Error handling
@@ -112,6 +114,10 @@ __all__ = [
     "is_file_locked",
     "compute_content_hash",
     "compute_content_hash_bytes",
+    # Workbook store
+    "StoredWorkbook",
+    "WorkbookStore",
+    "get_workbook_store",
     # Variant detection
     "VariantDetectionResult",
     "VariantRemap",
@@ -93,6 +93,7 @@ class SharePointFile:
     modified_date: datetime
     deal_name: str
     deal_stage: str | None = None
+    etag: str | None = None
 
 
 @dataclass
@@ -118,6 +119,7 @@ class DeltaChange:
     size: int | None = None
     modified_date: datetime | None = None
     is_folder: bool = False
+    etag: str | None = None
 
 
 @dataclass
@@ -684,6 +686,7 @@ class SharePointClient:
                 modified_date=modified_date,
                 deal_name=deal_name,
                 deal_stage=deal_stage,
+                etag=item.get("eTag"),
             )
         )
 
@@ -724,19 +727,27 @@ class SharePointClient:
         result = await self._make_request("GET", endpoint)
         return result.get("eTag")
 
-    async def should_download(self, file_path: str, stored_etag: str | None) -> bool:
+    async def should_download(
+        self,
+        file_path: str,
+        stored_etag: str | None,
+        remote_etag: str | None = None,
+    ) -> bool:
         """Check if a file needs to be re-downloaded by comparing ETags (UR-030).
 
         Args:
             file_path: SharePoint file path.
             stored_etag: Previously stored ETag from MonitoredFile.
+            remote_etag: Current ETag if already known (e.g. from a folder
+                listing or delta query); skips the metadata request.
 
         Returns:
             True if the file should be downloaded (ETags differ or no stored ETag).
         """
         if stored_etag is None:
             return True
-        remote_etag = await self.get_file_etag(file_path)
+        if remote_etag is None:
+            remote_etag = await self.get_file_etag(file_path)
         if remote_etag is None:
             return True  # Cannot compare — download to be safe
         return remote_etag != stored_etag
@@ -962,6 +973,7 @@ class SharePointClient:
             size=item.get("size"),
             modified_date=modified_date,
             is_folder=False,
+            etag=item.get("eTag"),
         )
 
     @staticmethod
@@ -0,0 +1,345 @@
+"""
+B&R Capital Dashboard - SharePoint Workbook Store
+
+Persistent, content-addressed local cache for downloaded UW model workbooks:
+- Blobs are stored under their SHA-256 content hash
+  (``objects/ab/abcd….xlsb``), so identical workbooks share one file
+- A small ref file per SharePoint path records the ETag and content hash
+  last downloaded for it
+- Unchanged files (same ETag, see ``SharePointClient.should_download``)
+  are served from disk instead of being downloaded again
+- Total blob size is held under a byte budget by evicting the least
+  recently used blobs (blob mtime is refreshed on every hit)
+
+Blobs and refs are written via atomic rename, so extraction workers in
+separate processes can share one store directory. A blob being read is
+pinned with a shared ``flock`` on ``pins/<blob>.lock``; eviction takes an
+exclusive non-blocking lock on the same file and skips blobs it cannot lock,
+so one worker never deletes a workbook another worker is reading. Where
+``fcntl`` is unavailable (Windows) pins only cover the current process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import tempfile
+import threading
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+from app.core.config import settings
+
+from .sharepoint import compute_content_hash_bytes
+
+if TYPE_CHECKING:
+    from .sharepoint import SharePointClient, SharePointFile
+
+
+@dataclass(frozen=True)
+class StoredWorkbook:
+    """A workbook available on local disk."""
+
+    sharepoint_path: str
+    local_path: Path
+    content_hash: str
+    etag: str | None
+    size: int
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write *data* to *path* so readers never observe a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+class WorkbookStore:
+    """Content-addressed workbook cache with byte-budgeted LRU eviction."""
+
+    def __init__(self, root: str | Path, max_bytes: int):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.logger = logger.bind(component="WorkbookStore")
+
+        # Blobs in use by this process are never evicted
+        self._lock = threading.Lock()
+        self._pinned: Counter[Path] = Counter()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ── Layout ────────────────────────────────────────────────────────────
+
+    def _ref_path(self, sharepoint_path: str) -> Path:
+        key = compute_content_hash_bytes(sharepoint_path.encode("utf-8"))
+        return self.root / "refs" / f"{key[:32]}.json"
+
+    def _blob_path(self, content_hash: str, suffix: str) -> Path:
+        return self.root / "objects" / content_hash[:2] / f"{content_hash}{suffix}"
+
+    def _pin_path(self, blob: Path) -> Path:
+        return self.root / "pins" / f"{blob.name}.lock"
+
+    def _open_pin(self, blob: Path) -> int:
+        pin_path = self._pin_path(blob)
+        pin_path.parent.mkdir(parents=True, exist_ok=True)
+        return os.open(pin_path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    # ── Lookup / insert ───────────────────────────────────────────────────
+
+    def lookup(self, sharepoint_path: str) -> StoredWorkbook | None:
+        """Return the stored workbook for a SharePoint path, if present."""
+        try:
+            ref = json.loads(self._ref_path(sharepoint_path).read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+
+        local_path = self._blob_path(ref["content_hash"], ref.get("suffix", ""))
+        try:
+            size = local_path.stat().st_size
+        except FileNotFoundError:
+            # Blob was evicted; the stale ref is overwritten on next put
+            return None
+
+        return StoredWorkbook(
+            sharepoint_path=sharepoint_path,
+            local_path=local_path,
+            content_hash=ref["content_hash"],
+            etag=ref.get("etag"),
+            size=size,
+        )
+
+    def put(
+        self, sharepoint_path: str, content: bytes, etag: str | None
+    ) -> StoredWorkbook:
+        """Store downloaded content and point the path's ref at it."""
+        content_hash = compute_content_hash_bytes(content)
+        suffix = PurePosixPath(sharepoint_path).suffix.lower()
+        local_path = self._blob_path(content_hash, suffix)
+
+        if local_path.exists():
+            self._touch(local_path)
+        else:
+            _atomic_write(local_path, content)
+
+        ref = {
+            "path": sharepoint_path,
+            "content_hash": content_hash,
+            "etag": etag,
+            "suffix": suffix,
+        }
+        _atomic_write(self._ref_path(sharepoint_path), json.dumps(ref).encode("utf-8"))
+
+        self.evict(keep=local_path)
+        return StoredWorkbook(
+            sharepoint_path=sharepoint_path,
+            local_path=local_path,
+            content_hash=content_hash,
+            etag=etag,
+            size=len(content),
+        )
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        with suppress(FileNotFoundError):
+            os.utime(path)
+
+    # ── Eviction ──────────────────────────────────────────────────────────
+
+    def _blobs(self) -> list[tuple[float, int, Path]]:
+        blobs = []
+        for path in (self.root / "objects").glob("*/*"):
+            if path.name.startswith(".tmp-"):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            blobs.append((stat.st_mtime, stat.st_size, path))
+        return blobs
+
+    def total_bytes(self) -> int:
+        """Current size of all stored blobs."""
+        return sum(size for _, size, _ in self._blobs())
+
+    def evict(self, keep: Path | None = None) -> int:
+        """Evict least recently used blobs until under the byte budget.
+
+        Args:
+            keep: Blob that must survive (typically the one just written).
+
+        Returns:
+            Number of blobs evicted.
+        """
+        blobs = self._blobs()
+        total = sum(size for _, size, _ in blobs)
+        if total <= self.max_bytes:
+            return 0
+
+        with self._lock:
+            pinned = set(self._pinned)
+
+        evicted = 0
+        for _, size, path in sorted(blobs):
+            if total <= self.max_bytes:
+                break
+            if path == keep or path in pinned or not self._unlink_unpinned(path):
+                continue
+            total -= size
+            evicted += 1
+
+        self.evictions += evicted
+        self.logger.info(
+            "workbook_store_evicted",
+            evicted=evicted,
+            total_bytes=total,
+            max_bytes=self.max_bytes,
+        )
+        return evicted
+
+    def _unlink_unpinned(self, path: Path) -> bool:
+        """Delete a blob unless another process holds a pin on it."""
+        if fcntl is None:
+            path.unlink(missing_ok=True)
+            return True
+
+        fd = self._open_pin(path)
+        try:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return False
+            path.unlink(missing_ok=True)
+            self._pin_path(path).unlink(missing_ok=True)
+            return True
+        finally:
+            os.close(fd)
+
+    @contextmanager
+    def pinned(self, local_paths: Iterable[str | Path]) -> Iterator[None]:
+        """Protect blobs from eviction, by any process, while they are read."""
+        paths = [Path(p) for p in local_paths]
+        with self._lock:
+            self._pinned.update(paths)
+        fds: list[int] = []
+        try:
+            if fcntl is not None:
+                for path in paths:
+                    fds.append(self._open_pin(path))
+                    fcntl.flock(fds[-1], fcntl.LOCK_SH)
+            yield
+        finally:
+            for fd in fds:
+                os.close(fd)
+            with self._lock:
+                self._pinned.subtract(paths)
+                for path in paths:
+                    if self._pinned[path] <= 0:
+                        self._pinned.pop(path, None)
+
+    # ── SharePoint ────────────────────────────────────────────────────────
+
+    async def fetch(
+        self, client: SharePointClient, file: SharePointFile
+    ) -> tuple[StoredWorkbook, bool]:
+        """Return a SharePoint file from the store, downloading if changed.
+
+        Args:
+            client: SharePointClient used for the ETag check and download.
+            file: File to fetch. ``file.etag`` (from discovery or a delta
+                query) avoids a metadata request when present.
+
+        Returns:
+            Tuple of (stored workbook, whether it was downloaded).
+        """
+        stored = await asyncio.to_thread(self.lookup, file.path)
+        if stored is not None and not await client.should_download(
+            file.path, stored.etag, remote_etag=file.etag
+        ):
+            await asyncio.to_thread(self._touch, stored.local_path)
+            self.hits += 1
+            self.logger.debug(
+                "workbook_store_hit",
+                name=file.name,
+                content_hash=stored.content_hash[:12],
+            )
+            return stored, False
+
+        self.misses += 1
+        content = await client.download_file(file)
+        stored = await asyncio.to_thread(self.put, file.path, content, file.etag)
+        return stored, True
+
+    async def prefetch(
+        self,
+        client: SharePointClient,
+        files: list[SharePointFile],
+        concurrency: int = 4,
+    ) -> int:
+        """Fetch files into the store ahead of extraction.
+
+        Failures are logged and skipped; extraction downloads the file
+        itself if it is still missing.
+
+        Returns:
+            Number of files downloaded.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _fetch_one(file: SharePointFile) -> bool:
+            async with sem:
+                _, downloaded = await self.fetch(client, file)
+                return downloaded
+
+        results = await asyncio.gather(
+            *(_fetch_one(f) for f in files), return_exceptions=True
+        )
+        downloaded = 0
+        for file, result in zip(files, results, strict=True):
+            if isinstance(result, BaseException):
+                self.logger.warning(
+                    "workbook_prefetch_failed", name=file.name, error=str(result)
+                )
+            elif result:
+                downloaded += 1
+
+        self.logger.info(
+            "workbook_prefetch_completed",
+            requested=len(files),
+            downloaded=downloaded,
+        )
+        return downloaded
+
+
+_workbook_store: WorkbookStore | None = None
+
+
+def get_workbook_store() -> WorkbookStore:
+    """Get the process-wide workbook store configured from settings."""
+    global _workbook_store
+    if _workbook_store is None:
+        _workbook_store = WorkbookStore(
+            settings.WORKBOOK_STORE_DIR,
+            settings.WORKBOOK_STORE_MAX_MB * 1024 * 1024,
+        )
+    return _workbook_store
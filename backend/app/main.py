@@ -16,8 +16,8 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from loguru import logger
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.api.v1.router import api_router
 from app.core.config import settings
@@ -36,8 +36,20 @@ from app.services.interest_rate_scheduler import InterestRateScheduler
 from app.services.monitoring import MetricsMiddleware, get_metrics_manager
 from app.services.report_worker import get_report_worker
 
+# Security headers added to every response (only if not already present)
+_SECURITY_HEADERS = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    # Set to 0: the "1; mode=block" value can introduce XSS vulnerabilities
+    # in older browsers. Modern browsers ignore this header entirely.
+    # See: https://owasp.org/www-project-secure-headers/
+    "X-XSS-Protection": "0",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    "Permissions-Policy": "geolocation=(), microphone=(), camera=(), payment=()",
+}
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+
+class SecurityHeadersMiddleware:
     """
     Security headers middleware for defense-in-depth.
 
@@ -45,60 +57,57 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     if Nginx headers are not present.
     """
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        response = await call_next(request)
-
-        # Security headers (only add if not already present)
-        if "X-Content-Type-Options" not in response.headers:
-            response.headers["X-Content-Type-Options"] = "nosniff"
-        if "X-Frame-Options" not in response.headers:
-            response.headers["X-Frame-Options"] = "DENY"
-        if "X-XSS-Protection" not in response.headers:
-            # Set to 0: the "1; mode=block" value can introduce XSS vulnerabilities
-            # in older browsers. Modern browsers ignore this header entirely.
-            # See: https://owasp.org/www-project-secure-headers/
-            response.headers["X-XSS-Protection"] = "0"
-        if "Referrer-Policy" not in response.headers:
-            response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        if "Permissions-Policy" not in response.headers:
-            response.headers["Permissions-Policy"] = (
-                "geolocation=(), microphone=(), camera=(), payment=()"
-            )
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        # Cache control for API responses (prevent caching of sensitive data)
-        if (
-            request.url.path.startswith("/api/")
-            and "Cache-Control" not in response.headers
-        ):
-            response.headers["Cache-Control"] = "no-store, private"
-
-        # HSTS — only in production (behind TLS termination)
-        if (
-            settings.ENVIRONMENT == "production"
-            and "Strict-Transport-Security" not in response.headers
-        ):
-            response.headers["Strict-Transport-Security"] = (
-                "max-age=63072000; includeSubDomains; preload"
-            )
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Content Security Policy (restrictive default)
-        if "Content-Security-Policy" not in response.headers:
-            response.headers["Content-Security-Policy"] = (
-                "default-src 'self'; "
-                "script-src 'self'; "
-                "style-src 'self' 'unsafe-inline'; "
-                "img-src 'self' data: https:; "
-                "font-src 'self'; "
-                "connect-src 'self' wss:; "
-                "frame-ancestors 'none'; "
-                "base-uri 'self'; "
-                "form-action 'self'"
-            )
+        is_api = scope["path"].startswith("/api/")
+
+        async def send_with_security_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+
+                # Security headers (only add if not already present)
+                for name, value in _SECURITY_HEADERS.items():
+                    if name not in headers:
+                        headers[name] = value
+
+                # Cache control for API responses (prevent caching of sensitive data)
+                if is_api and "Cache-Control" not in headers:
+                    headers["Cache-Control"] = "no-store, private"
 
-        return response
+                # HSTS — only in production (behind TLS termination)
+                if (
+                    settings.ENVIRONMENT == "production"
+                    and "Strict-Transport-Security" not in headers
+                ):
+                    headers["Strict-Transport-Security"] = (
+                        "max-age=63072000; includeSubDomains; preload"
+                    )
+
+                # Content Security Policy (restrictive default)
+                if "Content-Security-Policy" not in headers:
+                    headers["Content-Security-Policy"] = (
+                        "default-src 'self'; "
+                        "script-src 'self'; "
+                        "style-src 'self' 'unsafe-inline'; "
+                        "img-src 'self' data: https:; "
+                        "font-src 'self'; "
+                        "connect-src 'self' wss:; "
+                        "frame-ancestors 'none'; "
+                        "base-uri 'self'; "
+                        "form-action 'self'"
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_with_security_headers)
 
 
-class OriginValidationMiddleware(BaseHTTPMiddleware):
+class OriginValidationMiddleware:
     """
     Origin validation for state-changing requests.
 
@@ -117,10 +126,14 @@ class OriginValidationMiddleware(BaseHTTPMiddleware):
     # Methods that modify state and should be origin-checked
     STATE_CHANGING_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        if request.method in self.STATE_CHANGING_METHODS:
-            origin = request.headers.get("origin")
-            referer = request.headers.get("referer")
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["method"] in self.STATE_CHANGING_METHODS:
+            headers = Headers(scope=scope)
+            origin = headers.get("origin")
+            referer = headers.get("referer")
 
             # Extract origin from Referer if Origin header is absent
             check_origin = origin
@@ -139,18 +152,20 @@ class OriginValidationMiddleware(BaseHTTPMiddleware):
                     logger.warning(
                         "Rejected request from disallowed origin",
                         origin=check_origin,
-                        method=request.method,
-                        path=request.url.path,
+                        method=scope["method"],
+                        path=scope["path"],
                     )
-                    return JSONResponse(
+                    response = JSONResponse(
                         status_code=403,
                         content={"detail": "Origin not allowed"},
                     )
+                    await response(scope, receive, send)
+                    return
 
             # No origin/referer header = non-browser client (curl, server-to-server)
             # These are safe because browsers always send Origin on cross-origin requests
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
 
 @asynccontextmanager
@@ -186,6 +201,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     collector_registry.connection_pool.set_sync_engine(sync_engine)
     logger.info("Connection pool monitoring initialized")
 
+    # Sample collectors in the background so monitoring endpoints never probe
+    await collector_registry.start_sampling(settings.METRICS_SAMPLE_INTERVAL_SECONDS)
+
     # Initialize Redis (cache, rate limiter, token blacklist)
     try:
         from app.services.redis_service import get_redis_service
@@ -208,9 +226,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
         from app.services.websocket_manager import get_connection_manager
 
         ws_manager = get_connection_manager()
+        await ws_manager.broker.start()
         logger.info(
             "WebSocket connection manager initialized",
             max_per_client=ws_manager._max_connections_per_client,
+            fanout=ws_manager.broker.active,
         )
     except Exception as e:
         logger.warning(f"WebSocket manager initialization failed: {e}")
@@ -218,6 +238,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
 
     # await load_ml_models()
 
+    # Start portfolio prescorer (keeps rent growth forecasts cached)
+    from app.services.ml import get_portfolio_prescorer
+
+    prescorer = get_portfolio_prescorer()
+    await prescorer.start()
+    prescorer.request_refresh("startup")
+    logger.info("Portfolio prescorer started")
+
     # Initialize extraction scheduler
     extraction_scheduler = get_extraction_scheduler()
     await extraction_scheduler.initialize(
@@ -275,6 +303,21 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     await cache_service.start_cleanup_task()
     logger.info("Cache cleanup task started")
 
+    # Apply principal cache invalidations published by other replicas
+    from app.core.principal_cache import principal_cache
+
+    await principal_cache.start_listener()
+
+    # Batch audit/activity log writes (AUDIT_LOG_DURABILITY=buffered)
+    from app.db.audit_sink import audit_sink
+
+    await audit_sink.start()
+
+    # Publish coalesced extraction/stage-sync progress to WebSocket clients
+    from app.services.progress_stream import progress_streams
+
+    await progress_streams.start()
+
     logger.info("Application startup complete")
 
     yield
@@ -286,6 +329,21 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     await cache_service.stop_cleanup_task()
     logger.info("Cache cleanup task stopped")
 
+    # Stop principal cache invalidation listener
+    await principal_cache.stop_listener()
+
+    # Stop password hashing pool
+    from app.core.security import shutdown_hash_executor
+
+    shutdown_hash_executor()
+
+    # Stop metrics sampler
+    await collector_registry.stop_sampling()
+
+    # Stop portfolio prescorer
+    await prescorer.stop()
+    logger.info("Portfolio prescorer stopped")
+
     # Shutdown report worker
     await report_worker.stop()
     logger.info("Report generation worker stopped")
@@ -306,6 +364,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     await extraction_scheduler.shutdown()
     logger.info("Extraction scheduler shutdown complete")
 
+    # Write any queued audit/activity log entries
+    await audit_sink.stop()
+
+    # Publish the last progress updates before closing WebSockets
+    await progress_streams.stop()
+
     # Cleanup Redis
     try:
         from app.services.redis_service import _redis_service
@@ -319,6 +383,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     # Gracefully disconnect all WebSocket connections
     try:
         if ws_manager is not None:
+            await ws_manager.broker.stop()
             active = ws_manager.connection_count
             if active > 0:
                 for cid in list(ws_manager._connections.keys()):
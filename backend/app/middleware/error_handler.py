@@ -25,8 +25,7 @@ from fastapi.responses import JSONResponse
 from loguru import logger
 from pydantic import ValidationError
 from sqlalchemy.exc import SQLAlchemyError
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.middleware.request_id import get_request_id
 
@@ -81,7 +80,87 @@ def _build_error_response(
     )
 
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
+def _exception_to_response(exc: Exception, request: Request) -> JSONResponse:
+    """Log an unhandled exception and map it to a structured error response."""
+    rid = get_request_id() or "unknown"
+
+    if isinstance(exc, SQLAlchemyError):
+        logger.error(
+            "database_error request_id={} path={} method={} error={}",
+            rid,
+            request.url.path,
+            request.method,
+            str(exc),
+        )
+        return _build_error_response(
+            status_code=500,
+            detail="A database error occurred. Please try again later.",
+            error_type="database_error",
+            request_id=rid,
+        )
+
+    if isinstance(exc, ValidationError):
+        raw_message = str(exc)
+        logger.warning(
+            "validation_error request_id={} path={} method={} error_count={}",
+            rid,
+            request.url.path,
+            request.method,
+            exc.error_count(),
+        )
+        return _build_error_response(
+            status_code=422,
+            detail=_sanitize_error_message(raw_message, "validation_error"),
+            error_type="validation_error",
+            request_id=rid,
+        )
+
+    if isinstance(exc, PermissionError):
+        raw_message = str(exc)
+        logger.warning(
+            "permission_denied request_id={} path={} method={}",
+            rid,
+            request.url.path,
+            request.method,
+        )
+        return _build_error_response(
+            status_code=403,
+            detail=_sanitize_error_message(raw_message, "permission_error"),
+            error_type="permission_error",
+            request_id=rid,
+        )
+
+    if isinstance(exc, ValueError):
+        raw_message = str(exc)
+        logger.warning(
+            "value_error request_id={} path={} method={} detail={}",
+            rid,
+            request.url.path,
+            request.method,
+            raw_message,
+        )
+        return _build_error_response(
+            status_code=400,
+            detail=_sanitize_error_message(raw_message, "value_error"),
+            error_type="value_error",
+            request_id=rid,
+        )
+
+    logger.opt(exception=exc).error(
+        "unhandled_exception request_id={} path={} method={}",
+        rid,
+        request.url.path,
+        request.method,
+    )
+    return _build_error_response(
+        status_code=500,
+        detail="An unexpected error occurred",
+        error_type="internal_error",
+        request_id=rid,
+    )
+
+
+class ErrorHandlerMiddleware:
     """
     Middleware that catches unhandled exceptions and returns structured
     JSON error responses with request_id correlation.
@@ -90,88 +169,33 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
     them (preserving status codes, headers, and detail messages).
 
     All other exceptions are caught, logged, and mapped to appropriate
-    HTTP status codes.
+    HTTP status codes. Exceptions raised after the response has started
+    cannot be turned into an error response and are re-raised.
     """
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_tracking_start(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            return await call_next(request)
+            await self.app(scope, receive, send_tracking_start)
         except HTTPException:
             # Let FastAPI's built-in exception handler deal with these
             raise
-        except SQLAlchemyError as exc:
-            rid = get_request_id() or "unknown"
-            logger.error(
-                "database_error request_id={} path={} method={} error={}",
-                rid,
-                request.url.path,
-                request.method,
-                str(exc),
-            )
-            return _build_error_response(
-                status_code=500,
-                detail="A database error occurred. Please try again later.",
-                error_type="database_error",
-                request_id=rid,
-            )
-        except ValidationError as exc:
-            rid = get_request_id() or "unknown"
-            raw_message = str(exc)
-            logger.warning(
-                "validation_error request_id={} path={} method={} error_count={}",
-                rid,
-                request.url.path,
-                request.method,
-                exc.error_count(),
-            )
-            return _build_error_response(
-                status_code=422,
-                detail=_sanitize_error_message(raw_message, "validation_error"),
-                error_type="validation_error",
-                request_id=rid,
-            )
-        except PermissionError as exc:
-            rid = get_request_id() or "unknown"
-            raw_message = str(exc)
-            logger.warning(
-                "permission_denied request_id={} path={} method={}",
-                rid,
-                request.url.path,
-                request.method,
-            )
-            return _build_error_response(
-                status_code=403,
-                detail=_sanitize_error_message(raw_message, "permission_error"),
-                error_type="permission_error",
-                request_id=rid,
-            )
-        except ValueError as exc:
-            rid = get_request_id() or "unknown"
-            raw_message = str(exc)
-            logger.warning(
-                "value_error request_id={} path={} method={} detail={}",
-                rid,
-                request.url.path,
-                request.method,
-                raw_message,
-            )
-            return _build_error_response(
-                status_code=400,
-                detail=_sanitize_error_message(raw_message, "value_error"),
-                error_type="value_error",
-                request_id=rid,
-            )
-        except Exception:
-            rid = get_request_id() or "unknown"
-            logger.opt(exception=True).error(
-                "unhandled_exception request_id={} path={} method={}",
-                rid,
-                request.url.path,
-                request.method,
-            )
-            return _build_error_response(
-                status_code=500,
-                detail="An unexpected error occurred",
-                error_type="internal_error",
-                request_id=rid,
-            )
+        except Exception as exc:
+            if response_started:
+                raise
+            response = _exception_to_response(exc, Request(scope))
+            await response(scope, receive, send)
@@ -11,17 +11,19 @@ hash of the response body to avoid redundant SHA-256 computations for
 repeated identical responses.
 
 Only applies to:
-- GET requests
-- Non-streaming responses (responses with a body attribute)
+- GET requests answered with 200 OK
+- Non-streaming responses (the whole body arrives in a single ASGI
+  ``http.response.body`` message); streamed responses pass through
+  untouched without being buffered
 """
 
 import hashlib
 from collections import OrderedDict
 
 from loguru import logger
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Maximum number of cached ETag entries.  Sized to cover the most
 # frequently-accessed GET endpoints without consuming excessive memory
@@ -70,60 +72,100 @@ class _LRUETagCache:
 _etag_cache = _LRUETagCache()
 
 
-class ETagMiddleware(BaseHTTPMiddleware):
+def _compute_etag(body: bytes) -> str:
+    """Return the quoted SHA-256 ETag for *body*, via the LRU cache."""
+    # Use Python's built-in hash (fast, C-level) as the cache key.
+    # On cache miss, fall back to full SHA-256 computation.
+    body_hash = hash(body)
+    etag = _etag_cache.get(body_hash)
+    if etag is None:
+        etag = f'"{hashlib.sha256(body).hexdigest()}"'
+        _etag_cache.put(body_hash, etag)
+    return etag
+
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    """Check an If-None-Match header (comma-separated or ``*``) against *etag*."""
+    client_etags = [t.strip() for t in if_none_match.split(",")]
+    return etag in client_etags or "*" in client_etags
+
+
+class ETagMiddleware:
     """
     Middleware that adds ETag headers and handles conditional GET requests.
 
     Flow:
     1. Non-GET requests pass through unchanged.
-    2. GET requests are processed normally to obtain the response.
-    3. If the response has a body, compute its SHA-256 digest as the ETag.
-       Uses an LRU cache to skip recomputation for recently-seen bodies.
+    2. GET requests are processed normally; the response start message is
+       held back until the first body message arrives. Non-200 responses
+       and responses that already carry an ETag pass through unchanged.
+    3. If that message carries the complete, non-empty body, compute its
+       SHA-256 digest as the ETag. Uses an LRU cache to skip recomputation
+       for recently-seen bodies.
     4. If the request's If-None-Match header matches the ETag, return 304.
-    5. Otherwise, attach the ETag header and return the full response.
+    5. Otherwise, attach the ETag header and send the full response.
     """
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         # Only handle GET requests
-        if request.method != "GET":
-            return await call_next(request)
-
-        response = await call_next(request)
-
-        # Skip streaming responses (no .body attribute)
-        if not hasattr(response, "body"):
-            return response
-
-        body: bytes = response.body
-
-        # Skip empty bodies
-        if not body:
-            return response
-
-        # Use Python's built-in hash (fast, C-level) as the cache key.
-        # On cache miss, fall back to full SHA-256 computation.
-        body_hash = hash(body)
-        etag = _etag_cache.get(body_hash)
-        if etag is None:
-            etag = f'"{hashlib.sha256(body).hexdigest()}"'
-            _etag_cache.put(body_hash, etag)
-
-        # Check If-None-Match header
-        if_none_match = request.headers.get("if-none-match")
-        if if_none_match:
-            # Handle multiple ETags in If-None-Match (comma-separated)
-            client_etags = [t.strip() for t in if_none_match.split(",")]
-            if etag in client_etags or "*" in client_etags:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+        passthrough = False
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal start_message, passthrough
+
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                # Only full 200 responses are tagged: errors must not turn
+                # into 304s, and partial content and responses with their
+                # own validator (e.g. FileResponse) are passed through as-is
+                if message["status"] != 200 or "etag" in Headers(
+                    raw=message.get("headers", [])
+                ):
+                    passthrough = True
+                    await send(message)
+                    return
+                start_message = message
+                return
+
+            passthrough = True
+            assert start_message is not None  # ASGI always sends start first
+            body: bytes = message.get("body", b"")
+
+            # Skip streaming responses and empty bodies
+            if message["type"] != "http.response.body" or (
+                message.get("more_body", False) or not body
+            ):
+                await send(start_message)
+                await send(message)
+                return
+
+            etag = _compute_etag(body)
+
+            if_none_match = Headers(scope=scope).get("if-none-match")
+            if if_none_match and _etag_matches(etag, if_none_match):
                 logger.debug(
                     "etag_match_304",
-                    path=request.url.path,
+                    path=scope["path"],
                     etag=etag,
                 )
-                return Response(
-                    status_code=304,
-                    headers={"ETag": etag},
-                )
+                not_modified = Response(status_code=304, headers={"ETag": etag})
+                await not_modified(scope, receive, send)
+                return
+
+            # Attach ETag to the response
+            MutableHeaders(scope=start_message)["ETag"] = etag
+            await send(start_message)
+            await send(message)
 
-        # Attach ETag to the response
-        response.headers["ETag"] = etag
-        return response
+        await self.app(scope, receive, send_with_etag)
@@ -9,14 +9,14 @@ import asyncio
 import time
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Optional
 
-from fastapi import Request, Response, status
+from fastapi import Request, status
 from fastapi.responses import JSONResponse
 from loguru import logger
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.config import settings
 
@@ -345,7 +345,7 @@ class RateLimiter:
         return cls._instance
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """
     FastAPI middleware for rate limiting requests.
 
@@ -354,11 +354,11 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         limiter: RateLimiter | None = None,
         exclude_paths: list[str] | None = None,
     ):
-        super().__init__(app)
+        self.app = app
         self.limiter = limiter or self._create_default_limiter()
         self.exclude_paths = exclude_paths or [
             "/health",
@@ -402,16 +402,25 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         return limiter
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and apply rate limiting."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+
         # Skip rate limiting for excluded paths
-        if any(request.url.path.startswith(path) for path in self.exclude_paths):
-            return await call_next(request)
+        if any(path.startswith(excluded) for excluded in self.exclude_paths):
+            await self.app(scope, receive, send)
+            return
 
         # Skip non-API paths
-        if not request.url.path.startswith("/api"):
-            return await call_next(request)
+        if not path.startswith("/api"):
+            await self.app(scope, receive, send)
+            return
 
+        request = Request(scope)
         try:
             (
                 is_limited,
@@ -419,36 +428,39 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 retry_after,
                 config,
             ) = await self.limiter.check_rate_limit(request)
-
-            if is_limited:
-                logger.warning(
-                    f"Rate limit exceeded for {request.url.path} from {self.limiter.get_client_key(request)}"
-                )
-                return JSONResponse(
-                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                    content={
-                        "detail": "Too many requests. Please slow down.",
-                        "retry_after": retry_after,
-                    },
-                    headers={
-                        "Retry-After": str(retry_after),
-                        "X-RateLimit-Limit": str(config.requests),
-                        "X-RateLimit-Remaining": "0",
-                        "X-RateLimit-Reset": str(retry_after),
-                    },
-                )
-
-            # Process request
-            response = await call_next(request)
-
-            # Add rate limit headers to successful responses
-            response.headers["X-RateLimit-Limit"] = str(config.requests)
-            response.headers["X-RateLimit-Remaining"] = str(remaining)
-            response.headers["X-RateLimit-Reset"] = str(config.window)
-
-            return response
-
         except Exception as e:
             logger.error(f"Rate limit middleware error: {e}")
             # Fail open - allow request if rate limiting fails
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
+
+        if is_limited:
+            logger.warning(
+                f"Rate limit exceeded for {path} from {self.limiter.get_client_key(request)}"
+            )
+            response = JSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={
+                    "detail": "Too many requests. Please slow down.",
+                    "retry_after": retry_after,
+                },
+                headers={
+                    "Retry-After": str(retry_after),
+                    "X-RateLimit-Limit": str(config.requests),
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Reset": str(retry_after),
+                },
+            )
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add rate limit headers to successful responses
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(config.requests)
+                headers["X-RateLimit-Remaining"] = str(remaining)
+                headers["X-RateLimit-Reset"] = str(config.window)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
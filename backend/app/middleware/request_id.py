@@ -11,9 +11,8 @@ making it available via:
 import uuid
 from contextvars import ContextVar
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Context variable holding the current request's correlation ID.
 # Accessible from anywhere in the async call stack during a request.
@@ -27,7 +26,7 @@ def get_request_id() -> str:
     return request_id_ctx.get()
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+class RequestIDMiddleware:
     """
     Middleware that assigns a correlation ID to every request.
 
@@ -41,20 +40,29 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
     - The ID is returned to the client via the ``X-Request-ID`` response header.
     """
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Accept client-provided ID or generate a new one
-        rid = request.headers.get(REQUEST_ID_HEADER) or str(uuid.uuid4())
+        rid = Headers(scope=scope).get(REQUEST_ID_HEADER) or str(uuid.uuid4())
 
         # Store in request state (available to route handlers)
-        request.state.request_id = rid
+        scope.setdefault("state", {})["request_id"] = rid
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Echo the ID back to the caller
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = rid
+            await send(message)
 
         # Store in contextvar (available to loguru and any async code)
         token = request_id_ctx.set(rid)
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_request_id)
         finally:
             request_id_ctx.reset(token)
-
-        # Echo the ID back to the caller
-        response.headers[REQUEST_ID_HEADER] = rid
-        return response
@@ -17,6 +17,7 @@ from .construction import (
     ProjectClassification,
 )
 from .deal import Deal, DealStage
+from .deal_stage_interval import DealStageInterval
 from .delta_token import DeltaToken
 from .document import Document, DocumentType
 
@@ -41,7 +42,7 @@ from .report_template import (
     ReportTemplate,
     ScheduleFrequency,
 )
-from .sales_data import SalesData
+from .sales_data import SalesData, SalesRollup
 
 # Schema Drift Alert Model
 from .schema_drift_alert import SchemaDriftAlert
@@ -75,6 +76,7 @@ __all__ = [
     "Property",
     "Deal",
     "DealStage",
+    "DealStageInterval",
     "DeltaToken",
     "StageChangeLog",
     "StageChangeSource",
@@ -118,6 +120,7 @@ __all__ = [
     # Sales Analysis Models
     "ReminderDismissal",
     "SalesData",
+    "SalesRollup",
     # Construction Pipeline Models
     "ConstructionProject",
     "ConstructionSourceLog",
@@ -4,9 +4,11 @@ Base model mixins for common functionality.
 
 from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, DateTime
+from sqlalchemy import Boolean, DateTime, Integer, event
 from sqlalchemy.orm import Mapped, mapped_column
 
+from app.core.map_grid import to_grid
+
 
 class TimestampMixin:
     """Mixin for created_at and updated_at timestamps."""
@@ -48,3 +50,23 @@ class SoftDeleteMixin:
         """Restore a soft-deleted record."""
         self.is_deleted = False
         self.deleted_at = None
+
+
+class MapGridMixin:
+    """Mixin for the integer map grid position of ``latitude``/``longitude``.
+
+    The position is kept in step with the coordinates on every ORM insert
+    and update; subclasses index ``(map_grid_x, map_grid_y)`` for the map
+    endpoints (see ``app.core.map_grid``).
+    """
+
+    map_grid_x: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    map_grid_y: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+
+@event.listens_for(MapGridMixin, "before_insert", propagate=True)
+@event.listens_for(MapGridMixin, "before_update", propagate=True)
+def _set_map_grid(mapper, connection, target) -> None:
+    target.map_grid_x, target.map_grid_y = to_grid(
+        target.latitude, target.longitude
+    ) or (None, None)
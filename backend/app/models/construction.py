@@ -33,7 +33,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
-from app.models.base import TimestampMixin
+from app.models.base import MapGridMixin, TimestampMixin
 
 # ── Enums ────────────────────────────────────────────────────────────────────
 
@@ -64,7 +64,7 @@ class ProjectClassification(StrEnum):
 # ── Table 1: construction_projects ───────────────────────────────────────────
 
 
-class ConstructionProject(Base, TimestampMixin):
+class ConstructionProject(Base, TimestampMixin, MapGridMixin):
     """Master project registry for Phoenix MSA multifamily development pipeline."""
 
     __tablename__ = "construction_projects"
@@ -79,6 +79,7 @@ class ConstructionProject(Base, TimestampMixin):
         Index("ix_construction_projects_status", "pipeline_status"),
         Index("ix_construction_projects_classification", "primary_classification"),
         Index("ix_construction_projects_city", "city"),
+        Index("ix_construction_projects_map_grid", "map_grid_x", "map_grid_y"),
         CheckConstraint(
             "number_of_units > 0",
             name="ck_construction_projects_number_of_units_positive",
@@ -0,0 +1,56 @@
+"""
+DealStageInterval model — time a deal spent in each pipeline stage.
+
+One row per (deal, stage visit). The interval for the deal's current stage
+is open (``exited_at`` is NULL); it is closed with ``next_stage`` and
+``duration_days`` when the next stage change is recorded. Cycle-time
+analytics aggregate these rows in SQL instead of replaying stage history.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class DealStageInterval(Base):
+    """A single visit of a deal to a pipeline stage."""
+
+    __tablename__ = "deal_stage_intervals"
+
+    __table_args__ = (
+        Index("ix_deal_stage_intervals_deal_open", "deal_id", "exited_at"),
+        Index("ix_deal_stage_intervals_stage_exited", "stage", "exited_at"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+
+    deal_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("deals.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    stage: Mapped[str] = mapped_column(String(50), nullable=False)
+
+    entered_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+
+    # Set when the deal leaves this stage
+    exited_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    next_stage: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    duration_days: Mapped[Decimal | None] = mapped_column(
+        Numeric(10, 4),
+        nullable=True,
+    )
+
+    def __repr__(self) -> str:
+        return f"<DealStageInterval deal={self.deal_id} {self.stage}>"
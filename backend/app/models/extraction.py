@@ -27,10 +27,11 @@ from sqlalchemy import (
     UniqueConstraint,
 )
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.db.base import Base
 from app.models.base import TimestampMixin
+from app.models.property import normalize_property_key
 
 
 class ExtractionRun(Base, TimestampMixin):
@@ -80,10 +81,20 @@ class ExtractionRun(Base, TimestampMixin):
     # Aggregated file metadata (durations, value counts, error categories)
     file_metadata: Mapped[dict | None] = mapped_column(JSON, nullable=True)
 
+    # Fan-out runs (one task queue job per file): jobs enqueued / finished.
+    # The job that brings jobs_completed up to jobs_total triggers fan-in.
+    jobs_total: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    jobs_completed: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
     # Relationships
     extracted_values: Mapped[list["ExtractedValue"]] = relationship(
         "ExtractedValue", back_populates="extraction_run", cascade="all, delete-orphan"
     )
+    digests: Mapped[list["ExtractionDigest"]] = relationship(
+        "ExtractionDigest", cascade="all, delete-orphan", passive_deletes=True
+    )
 
     def __repr__(self) -> str:
         return f"<ExtractionRun {self.id} ({self.status})>"
@@ -136,6 +147,10 @@ class ExtractedValue(Base, TimestampMixin):
 
     # Property name (for cases where property_id doesn't exist yet)
     property_name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    # Normalized name for joining to properties.property_key, maintained on write
+    property_key: Mapped[str | None] = mapped_column(
+        String(255), nullable=True, index=True
+    )
 
     # Field metadata
     field_name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
@@ -182,6 +197,11 @@ class ExtractedValue(Base, TimestampMixin):
         Index("idx_extracted_values_lookup", "property_name", "field_name"),
     )
 
+    @validates("property_name")
+    def _sync_property_key(self, _key: str, property_name: str) -> str:
+        self.property_key = normalize_property_key(property_name)
+        return property_name
+
     def __repr__(self) -> str:
         return f"<ExtractedValue {self.property_name}.{self.field_name}>"
 
@@ -193,3 +213,38 @@ class ExtractedValue(Base, TimestampMixin):
         if self.value_date is not None:
             return self.value_date
         return self.value_text
+
+
+class ExtractionDigest(Base, TimestampMixin):
+    """
+    Content digest of one property's extracted values within a run.
+
+    Written alongside the values by ``ExtractedValueCRUD.bulk_insert`` so
+    change detection can compare a fresh extraction against the latest
+    completed run without re-reading and re-hashing its EAV rows.
+    """
+
+    __tablename__ = "extraction_digests"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    extraction_run_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("extraction_runs.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    property_name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+
+    # SHA-256 hex digest from compute_extraction_hash()
+    digest: Mapped[str] = mapped_column(String(64), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "extraction_run_id",
+            "property_name",
+            name="uq_extraction_digest",
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ExtractionDigest {self.property_name} {self.digest[:12]}>"
@@ -2,16 +2,39 @@
 Property model for real estate assets.
 """
 
-from datetime import date
+from datetime import UTC, date, datetime
 from decimal import Decimal
 
-from sqlalchemy import JSON, CheckConstraint, Date, Integer, Numeric, String, Text
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import (
+    JSON,
+    CheckConstraint,
+    Date,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    event,
+)
+from sqlalchemy.orm import Mapped, mapped_column, object_session, validates
 
 from app.db.base import Base
 from app.models.base import SoftDeleteMixin, TimestampMixin
 
 
+def normalize_property_key(name: str | None) -> str | None:
+    """
+    Return the normalized matching key for a property name.
+
+    Lowercases the name and strips any parenthesised suffix, so
+    ``"Hayden Park (Phoenix, AZ)"`` and ``"hayden park"`` share the key
+    ``"hayden park"``. Used to join properties to extracted values.
+    """
+    if not name:
+        return None
+    key = name.split("(")[0].strip().lower()
+    return key or None
+
+
 class Property(Base, TimestampMixin, SoftDeleteMixin):
     """Property model representing real estate assets."""
 
@@ -59,6 +82,10 @@ class Property(Base, TimestampMixin, SoftDeleteMixin):
 
     # Basic Information
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    # Normalized name (see normalize_property_key), maintained on write
+    property_key: Mapped[str | None] = mapped_column(
+        String(255), nullable=True, index=True
+    )
     property_type: Mapped[str] = mapped_column(
         String(50),
         nullable=False,
@@ -131,6 +158,14 @@ class Property(Base, TimestampMixin, SoftDeleteMixin):
     # Extended Financial Data (JSON blob for nested frontend fields)
     financial_data: Mapped[dict | None] = mapped_column(JSON, nullable=True)
 
+    # Materialized to_frontend_property() output, rebuilt on every ORM update.
+    # Current only while frontend_projection_version matches
+    # projection_version(self) (see _property_transforms).
+    frontend_projection: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    frontend_projection_version: Mapped[str | None] = mapped_column(
+        String(64), nullable=True
+    )
+
     # Additional Data
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     amenities: Mapped[dict | None] = mapped_column(JSON, nullable=True)
@@ -148,6 +183,11 @@ class Property(Base, TimestampMixin, SoftDeleteMixin):
     # Relationships
     # deals: Mapped[List["Deal"]] = relationship("Deal", back_populates="property")
 
+    @validates("name")
+    def _sync_property_key(self, _key: str, name: str) -> str:
+        self.property_key = normalize_property_key(name)
+        return name
+
     def __repr__(self) -> str:
         return f"<Property {self.name} ({self.city}, {self.state})>"
 
@@ -164,3 +204,22 @@ class Property(Base, TimestampMixin, SoftDeleteMixin):
         if self.purchase_price and self.total_sf:
             return self.purchase_price / self.total_sf
         return None
+
+
+@event.listens_for(Property, "before_update")
+def _refresh_frontend_projection(mapper, connection, target: Property) -> None:
+    """Rebuild the stored frontend projection as part of each row update.
+
+    Bulk/Core UPDATEs bypass this hook; their rows are left with a stale
+    version and rebuilt on the next read.
+    """
+    session = object_session(target)
+    if session is None or not session.is_modified(target):
+        return
+
+    from app.api.v1.endpoints._property_transforms import refresh_frontend_projection
+
+    # Stamp updated_at here rather than via onupdate so the stored version
+    # matches the value written.
+    target.updated_at = datetime.now(UTC)
+    refresh_frontend_projection(target)
@@ -24,10 +24,10 @@ from sqlalchemy import (
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
-from app.models.base import TimestampMixin
+from app.models.base import MapGridMixin, TimestampMixin
 
 
-class SalesData(Base, TimestampMixin):
+class SalesData(Base, TimestampMixin, MapGridMixin):
     """CoStar multifamily sales transaction record."""
 
     __tablename__ = "sales_data"
@@ -37,6 +37,7 @@ class SalesData(Base, TimestampMixin):
         Index("ix_sales_data_submarket", "submarket_name"),
         Index("ix_sales_data_sale_date", "sale_date"),
         Index("ix_sales_data_market", "market"),
+        Index("ix_sales_data_map_grid", "map_grid_x", "map_grid_y"),
         CheckConstraint(
             "sale_price >= 0", name="ck_sales_data_sale_price_non_negative"
         ),
@@ -254,3 +255,48 @@ class SalesData(Base, TimestampMixin):
             f"<SalesData(id={self.id}, comp_id={self.comp_id}, "
             f"address={self.property_address}, sale_date={self.sale_date})>"
         )
+
+
+class SalesRollup(Base):
+    """Pre-aggregated sales by submarket, month, size, vintage and star rating.
+
+    Rebuilt from ``sales_data`` after every import (see
+    ``app.services.sales_rollup``); the analytics endpoints read it instead
+    of scanning ``sales_data`` when their filters fall on bucket boundaries.
+    NULL dimensions mean the source value was missing.
+    """
+
+    __tablename__ = "sales_rollup"
+
+    __table_args__ = (
+        Index("ix_sales_rollup_month_submarket", "sale_month", "submarket_cluster"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    # ── Dimensions ───────────────────────────────────────────────────────
+    submarket_cluster: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    sale_month: Mapped[date | None] = mapped_column(Date, nullable=True)
+    unit_bucket: Mapped[str] = mapped_column(String(20), nullable=False)
+    vintage_bucket: Mapped[str] = mapped_column(String(20), nullable=False)
+    star_rating: Mapped[str | None] = mapped_column(String(50), nullable=True)
+
+    # ── Measures ─────────────────────────────────────────────────────────
+    sales_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    total_volume: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False)
+    price_per_unit_sum: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False)
+    # Non-NULL counts, for averages and data-quality null rates
+    price_per_unit_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    sale_price_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    cap_rate_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    avg_unit_sf_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    property_name_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Data-quality outliers
+    dollar_one_sales: Mapped[int] = mapped_column(Integer, nullable=False)
+    high_unit_sales: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<SalesRollup(submarket={self.submarket_cluster}, "
+            f"month={self.sale_month}, count={self.sales_count})>"
+        )
@@ -2,7 +2,7 @@
 Base schema configurations and common fields.
 """
 
-from datetime import datetime
+from datetime import date, datetime
 
 from pydantic import BaseModel, ConfigDict
 
@@ -43,3 +43,24 @@ class PaginatedResponse(BaseModel):
     total_pages: int
     has_next: bool
     has_prev: bool
+
+
+class MapCluster(BaseSchema):
+    """Aggregate of the records in one map grid cell."""
+
+    key: str  # "<zoom>/<cell_x>/<cell_y>", stable while the zoom is unchanged
+    count: int
+    latitude: float
+    longitude: float
+    south: float
+    west: float
+    north: float
+    east: float
+    total_units: int = 0
+
+
+class FacetRange(BaseSchema):
+    """Smallest and largest value of a range filter (None without data)."""
+
+    min: float | date | None = None
+    max: float | date | None = None
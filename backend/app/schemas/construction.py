@@ -8,7 +8,7 @@ to follow the project convention of schemas in app/schemas/.
 from datetime import date
 from typing import Any
 
-from .base import BaseSchema
+from .base import BaseSchema, FacetRange, MapCluster
 
 
 class ProjectRecord(BaseSchema):
@@ -47,6 +47,35 @@ class PaginatedProjectsResponse(BaseSchema):
     page: int
     page_size: int
     total_pages: int
+    # Keyset cursors: pass as ``cursor`` to page without OFFSET scans
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+    has_more: bool = False
+    # True when ``total`` is a cached count that may lag recent imports
+    total_estimated: bool = False
+
+
+class ProjectMapPoint(BaseSchema):
+    """Compact construction project marker for the map view."""
+
+    id: int
+    latitude: float
+    longitude: float
+    project_name: str | None = None
+    pipeline_status: str | None = None
+    primary_classification: str | None = None
+    number_of_units: int | None = None
+
+
+class ProjectMapResponse(BaseSchema):
+    """Construction projects in a map viewport: clusters or points by zoom."""
+
+    zoom: int
+    clustered: bool
+    total: int
+    truncated: bool = False  # points capped at MAP_MAX_POINTS; zoom in
+    clusters: list[MapCluster] = []
+    points: list[ProjectMapPoint] = []
 
 
 class ConstructionFilterOptionsResponse(BaseSchema):
@@ -57,6 +86,10 @@ class ConstructionFilterOptionsResponse(BaseSchema):
     statuses: list[str]
     classifications: list[str]
     rent_types: list[str]
+    # Facet name -> value -> number of projects
+    counts: dict[str, dict[str, int]] = {}
+    # units, year_built
+    ranges: dict[str, FacetRange] = {}
 
 
 class PipelineSummaryItem(BaseSchema):
@@ -7,7 +7,7 @@ to follow the project convention of schemas in app/schemas/.
 
 from datetime import date
 
-from .base import BaseSchema
+from .base import BaseSchema, FacetRange, MapCluster
 
 
 class SalesRecord(BaseSchema):
@@ -41,6 +41,35 @@ class PaginatedSalesResponse(BaseSchema):
     page: int
     page_size: int
     total_pages: int
+    # Keyset cursors: pass as ``cursor`` to page without OFFSET scans
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+    has_more: bool = False
+    # True when ``total`` is a cached count that may lag recent imports
+    total_estimated: bool = False
+
+
+class SalesMapPoint(BaseSchema):
+    """Compact sales comp marker for the map view."""
+
+    id: int
+    latitude: float
+    longitude: float
+    property_name: str | None = None
+    sale_date: date | None = None
+    sale_price: float | None = None
+    number_of_units: int | None = None
+
+
+class SalesMapResponse(BaseSchema):
+    """Sales comps in a map viewport: clusters or points by zoom."""
+
+    zoom: int
+    clustered: bool
+    total: int
+    truncated: bool = False  # points capped at MAP_MAX_POINTS; zoom in
+    clusters: list[MapCluster] = []
+    points: list[SalesMapPoint] = []
 
 
 class TimeSeriesPoint(BaseSchema):
@@ -119,3 +148,9 @@ class SalesFilterOptionsResponse(BaseSchema):
     """Available filter values for sales analysis dropdowns."""
 
     submarkets: list[str]
+    cities: list[str] = []
+    star_ratings: list[str] = []
+    # Facet name -> value -> number of sales
+    counts: dict[str, dict[str, int]] = {}
+    # units, year_built, sale_price, price_per_unit, sale_date
+    ranges: dict[str, FacetRange] = {}
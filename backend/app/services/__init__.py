@@ -1,5 +1,6 @@
 """Application services module."""
 
+from .document_storage import DocumentStorage, get_document_storage
 from .email_service import EmailService, get_email_service
 from .export_service import ExcelExportService, get_excel_service
 from .interest_rates import InterestRatesService, get_interest_rates_service
@@ -13,6 +14,8 @@ __all__ = [
     "get_redis_service",
     "WebSocketManager",
     "get_websocket_manager",
+    "DocumentStorage",
+    "get_document_storage",
     "EmailService",
     "get_email_service",
     "ExcelExportService",
@@ -2,7 +2,9 @@
 Audit logging service for admin actions.
 
 Provides fire-and-forget audit logging that never blocks the main request.
-Errors are swallowed and logged as warnings.
+Errors are swallowed and logged as warnings. With buffered durability
+(``AUDIT_LOG_DURABILITY``), entries are queued on ``audit_sink`` instead of
+being flushed in the request transaction.
 """
 
 import json
@@ -14,6 +16,7 @@ from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.permissions import CurrentUser
+from app.db.audit_sink import audit_sink
 from app.models.audit_log import AuditLog
 
 
@@ -60,20 +63,23 @@ async def log_action(
             details_json = json.dumps(details, default=str)
 
         now = datetime.now(UTC)
-        entry = AuditLog(
-            timestamp=now,
-            user_id=user.id,
-            user_email=user.email,
-            action=action,
-            resource_type=resource_type,
-            resource_id=str(resource_id) if resource_id is not None else None,
-            details=details_json,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            created_at=now,
-        )
-        db.add(entry)
-        await db.flush()
+        values = {
+            "timestamp": now,
+            "user_id": user.id,
+            "user_email": user.email,
+            "action": action,
+            "resource_type": resource_type,
+            "resource_id": str(resource_id) if resource_id is not None else None,
+            "details": details_json,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+            "created_at": now,
+        }
+        if audit_sink.buffered:
+            await audit_sink.write(AuditLog, values)
+        else:
+            db.add(AuditLog(**values))
+            await db.flush()
 
         logger.info(
             "audit_action_logged",
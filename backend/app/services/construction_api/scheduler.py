@@ -14,6 +14,8 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from loguru import logger
 
+from app.core.cache import cache
+
 
 class ConstructionSchedulerState:
     """Tracks construction data scheduler state."""
@@ -393,6 +395,7 @@ class ConstructionDataScheduler:
             except Exception:
                 logger.exception("gilbert_scheduled_fetch_error")
 
+            await cache.invalidate_filter_options("construction")
             self.state.last_municipal_run = datetime.now(UTC)
             logger.info(
                 "municipal_scheduled_fetch_complete",
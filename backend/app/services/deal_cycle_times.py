@@ -0,0 +1,202 @@
+"""
+Incrementally maintained deal cycle-time statistics.
+
+Every stage change closes the deal's open ``DealStageInterval`` and opens a
+new one (see ``change_deal_stage`` in ``app.services.stage_mapping``).
+Cycle-time averages are then a single aggregate query over closed
+intervals, so their cost does not grow with the stage-change history of
+every deal.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import Select, and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.deal_stage_interval import DealStageInterval
+
+if TYPE_CHECKING:
+    from app.models.deal import Deal, DealStage
+
+# Active review stages (current value plus pre-2026-02 legacy values that
+# can appear in backfilled history)
+ACTIVE_REVIEW_STAGES: frozenset[str] = frozenset(
+    {"active_review", "underwriting", "due_diligence", "loi_submitted"}
+)
+# Stages counted from first pipeline entry up to closing
+PIPELINE_STAGES: frozenset[str] = frozenset(
+    {"lead", "initial_review", "under_contract"} | ACTIVE_REVIEW_STAGES
+)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes (SQLite) as UTC."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+def _days_between(start: datetime, end: datetime) -> Decimal:
+    seconds = (_as_utc(end) - _as_utc(start)).total_seconds()
+    return Decimal(str(round(max(seconds, 0.0) / 86400, 4)))
+
+
+def _open_interval_stmt(deal_id: int) -> Select[tuple[DealStageInterval]]:
+    return (
+        select(DealStageInterval)
+        .where(
+            DealStageInterval.deal_id == deal_id,
+            DealStageInterval.exited_at.is_(None),
+        )
+        .order_by(DealStageInterval.entered_at.desc())
+        .limit(1)
+    )
+
+
+def _apply_transition(
+    open_interval: DealStageInterval | None,
+    deal: Deal,
+    new_stage: DealStage,
+    changed_at: datetime,
+) -> list[DealStageInterval]:
+    """Close the current interval and return the new rows to add."""
+    new_rows: list[DealStageInterval] = []
+
+    if open_interval is not None:
+        open_interval.exited_at = changed_at
+        open_interval.next_stage = new_stage.value
+        open_interval.duration_days = _days_between(
+            open_interval.entered_at, changed_at
+        )
+    elif deal.stage is not None:
+        # First transition tracked for this deal: reconstruct the stage it
+        # is leaving from the deal's own timestamps.
+        entered_at = deal.stage_updated_at or deal.created_at
+        if entered_at is not None:
+            new_rows.append(
+                DealStageInterval(
+                    deal_id=deal.id,
+                    stage=deal.stage.value,
+                    entered_at=entered_at,
+                    exited_at=changed_at,
+                    next_stage=new_stage.value,
+                    duration_days=_days_between(entered_at, changed_at),
+                )
+            )
+
+    new_rows.append(
+        DealStageInterval(
+            deal_id=deal.id,
+            stage=new_stage.value,
+            entered_at=changed_at,
+        )
+    )
+    return new_rows
+
+
+async def record_stage_transition(
+    db: AsyncSession,
+    deal: Deal,
+    new_stage: DealStage,
+    changed_at: datetime,
+) -> None:
+    """Update the deal's stage intervals for a transition to ``new_stage``.
+
+    Must be called before ``deal.stage`` / ``deal.stage_updated_at`` are
+    updated. The caller is responsible for committing the transaction.
+    """
+    open_interval = (
+        await db.execute(_open_interval_stmt(deal.id))
+    ).scalar_one_or_none()
+    db.add_all(_apply_transition(open_interval, deal, new_stage, changed_at))
+
+
+def record_stage_transition_sync(
+    db: Session,
+    deal: Deal,
+    new_stage: DealStage,
+    changed_at: datetime,
+) -> None:
+    """Synchronous variant of ``record_stage_transition``."""
+    open_interval = db.execute(_open_interval_stmt(deal.id)).scalar_one_or_none()
+    db.add_all(_apply_transition(open_interval, deal, new_stage, changed_at))
+
+
+def build_cycle_times_query(period_start: datetime) -> Select[Any]:
+    """
+    Build the single-statement cycle-time aggregation for a period.
+
+    - avg_initial_to_close: per closed deal, days spent in pipeline stages
+      before closing, averaged over deals closed in the period
+    - avg_active_review: per deal, total days in active review stages
+      (intervals exited in the period), averaged over deals
+    - avg_contract_to_close: days in under_contract for contracts that
+      closed in the period
+    """
+    interval = DealStageInterval
+
+    closed_deals = (
+        select(
+            interval.deal_id,
+            func.min(interval.entered_at).label("closed_at"),
+        )
+        .where(interval.stage == "closed", interval.entered_at >= period_start)
+        .group_by(interval.deal_id)
+        .subquery("closed_deals")
+    )
+    initial_to_close = (
+        select(func.sum(interval.duration_days).label("days"))
+        .join(closed_deals, interval.deal_id == closed_deals.c.deal_id)
+        .where(
+            interval.stage.in_(PIPELINE_STAGES),
+            interval.exited_at <= closed_deals.c.closed_at,
+        )
+        .group_by(interval.deal_id)
+        .subquery("initial_to_close")
+    )
+    active_review = (
+        select(func.sum(interval.duration_days).label("days"))
+        .where(
+            interval.stage.in_(ACTIVE_REVIEW_STAGES),
+            interval.exited_at >= period_start,
+        )
+        .group_by(interval.deal_id)
+        .having(func.sum(interval.duration_days) > 0)
+        .subquery("active_review")
+    )
+    contract_to_close = select(func.avg(interval.duration_days)).where(
+        and_(
+            interval.stage == "under_contract",
+            interval.next_stage == "closed",
+            interval.exited_at >= period_start,
+        )
+    )
+
+    return select(
+        select(func.avg(initial_to_close.c.days))
+        .scalar_subquery()
+        .label("avg_initial_to_close"),
+        select(func.avg(active_review.c.days))
+        .scalar_subquery()
+        .label("avg_active_review"),
+        contract_to_close.scalar_subquery().label("avg_contract_to_close"),
+    )
+
+
+def _round_days(value: Any) -> float | None:
+    return round(float(value), 1) if value is not None else None
+
+
+async def get_cycle_times(
+    db: AsyncSession, period_start: datetime
+) -> dict[str, float | None]:
+    """Return average cycle times (days) for deals active since ``period_start``."""
+    row = (await db.execute(build_cycle_times_query(period_start))).one()
+    return {
+        "avg_initial_to_close": _round_days(row.avg_initial_to_close),
+        "avg_active_review": _round_days(row.avg_active_review),
+        "avg_contract_to_close": _round_days(row.avg_contract_to_close),
+    }
@@ -0,0 +1,167 @@
+"""
+B&R Capital Dashboard - Document Storage
+
+Local filesystem storage for uploaded documents:
+- Uploads are streamed to disk in ``DOCUMENT_STORAGE_CHUNK_KB`` chunks,
+  hashed incrementally, and never held in memory as a whole
+- Size limits and magic bytes are checked while streaming, so oversized
+  or mislabeled files are rejected without being written out in full
+- Files are stored under their SHA-256 content hash
+  (``objects/ab/abcd….pdf``); identical uploads share one file
+- Downloads are served from the stored path (see ``resolve``), which lets
+  ``FileResponse`` handle ``Range`` requests and zero-copy sends
+
+Stored files are immutable and may be referenced by several documents, so
+soft-deleting a document leaves its file in place.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import IO
+
+from fastapi import UploadFile
+from loguru import logger
+
+from app.core.config import settings
+from app.core.file_validation import (
+    SIGNATURE_BYTES,
+    ValidationResult,
+    validate_upload_metadata,
+    validate_upload_signature,
+    validate_upload_size,
+)
+
+
+class DocumentValidationError(Exception):
+    """Raised when an upload fails validation while being stored."""
+
+
+@dataclass(frozen=True)
+class StoredDocument:
+    """A document file written to storage."""
+
+    file_path: str  # relative to the storage root
+    content_hash: str
+    size: int
+
+
+def _check(result: ValidationResult) -> None:
+    if not result.valid:
+        raise DocumentValidationError(result.error)
+
+
+def _write_chunk(fh: IO[bytes], hasher: hashlib._Hash, chunk: bytes) -> None:
+    # hashlib and file writes release the GIL for large buffers
+    hasher.update(chunk)
+    fh.write(chunk)
+
+
+class DocumentStorage:
+    """Content-addressed document files on the local filesystem."""
+
+    def __init__(self, root: str | Path, chunk_size: int = 1024 * 1024):
+        self.root = Path(root)
+        self.chunk_size = chunk_size
+        self.logger = logger.bind(component="DocumentStorage")
+
+    def _blob_path(self, content_hash: str, suffix: str) -> str:
+        return f"objects/{content_hash[:2]}/{content_hash}{suffix}"
+
+    def resolve(self, file_path: str) -> Path:
+        """Return the absolute path of a stored file.
+
+        Raises:
+            FileNotFoundError: If *file_path* is empty, escapes the storage
+                root, or the file does not exist.
+        """
+        root = self.root.resolve()
+        path = (root / file_path).resolve()
+        if not file_path or not path.is_relative_to(root) or not path.is_file():
+            raise FileNotFoundError(file_path)
+        return path
+
+    async def save_upload(self, upload: UploadFile) -> StoredDocument:
+        """Validate and store an upload, streaming it to disk in chunks.
+
+        Raises:
+            DocumentValidationError: If the name, type, size or content of
+                the upload is not allowed.
+        """
+        filename = upload.filename or ""
+        _check(validate_upload_metadata(upload.filename, upload.content_type))
+
+        tmp_dir = self.root / "tmp"
+        await asyncio.to_thread(tmp_dir.mkdir, parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=tmp_dir, prefix=".upload-")
+
+        hasher = hashlib.sha256()
+        size = 0
+        head = b""
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                while chunk := await upload.read(self.chunk_size):
+                    if len(head) < SIGNATURE_BYTES:
+                        head += chunk[: SIGNATURE_BYTES - len(head)]
+                        if len(head) == SIGNATURE_BYTES:
+                            _check(validate_upload_signature(filename, head))
+                    size += len(chunk)
+                    _check(validate_upload_size(filename, size))
+                    await asyncio.to_thread(_write_chunk, fh, hasher, chunk)
+
+            _check(validate_upload_size(filename, size))
+            if len(head) < SIGNATURE_BYTES:
+                _check(validate_upload_signature(filename, head))
+
+            content_hash = hasher.hexdigest()
+            suffix = PurePosixPath(filename).suffix.lower()
+            file_path = self._blob_path(content_hash, suffix)
+            deduplicated = await asyncio.to_thread(
+                self._commit, Path(tmp_name), self.root / file_path
+            )
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        self.logger.info(
+            "document_stored",
+            name=filename,
+            size=size,
+            content_hash=content_hash[:12],
+            deduplicated=deduplicated,
+        )
+        return StoredDocument(file_path=file_path, content_hash=content_hash, size=size)
+
+    @staticmethod
+    def _commit(tmp_path: Path, dest: Path) -> bool:
+        """Move a fully written upload into place.
+
+        Returns:
+            True if identical content was already stored (the upload is
+            discarded), False if it was moved into place.
+        """
+        if dest.exists():
+            tmp_path.unlink(missing_ok=True)
+            return True
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp_path, dest)
+        return False
+
+
+_document_storage: DocumentStorage | None = None
+
+
+def get_document_storage() -> DocumentStorage:
+    """Get the process-wide document storage configured from settings."""
+    global _document_storage
+    if _document_storage is None:
+        _document_storage = DocumentStorage(
+            settings.DOCUMENT_STORAGE_DIR,
+            settings.DOCUMENT_STORAGE_CHUNK_KB * 1024,
+        )
+    return _document_storage
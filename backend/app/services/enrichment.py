@@ -7,6 +7,8 @@ business logic while retaining responsibility for DB persistence.
 """
 
 import re
+from collections import defaultdict
+from collections.abc import Collection, Sequence
 from decimal import Decimal
 from typing import Any
 
@@ -263,6 +265,20 @@ def match_prop_name(prop_name_from_db: str, prop: Property) -> bool:
     )
 
 
+def group_rows_by_property_key(
+    rows: Sequence[Sequence[Any]],
+) -> dict[str, list[Sequence[Any]]]:
+    """Partition bulk extracted-value rows by their leading ``property_key``.
+
+    Row order is preserved within each group, so callers relying on the
+    query's ``created_at DESC`` ordering still see the latest value first.
+    """
+    grouped: dict[str, list[Sequence[Any]]] = defaultdict(list)
+    for row in rows:
+        grouped[row[0]].append(row)
+    return grouped
+
+
 # ---------------------------------------------------------------------------
 # Core enrichment logic — pure business logic, no DB writes
 # ---------------------------------------------------------------------------
@@ -816,27 +832,30 @@ async def fetch_year_field_rows(
 
 async def fetch_bulk_base_rows(
     db: AsyncSession,
-    name_conditions: list,
+    property_keys: Collection[str],
 ) -> list:
-    """Bulk-fetch base hydration fields for multiple properties."""
+    """Bulk-fetch base hydration fields for multiple properties.
+
+    Rows are ``(property_key, field_name, value_numeric, value_text)``.
+    """
     from app.models.extraction import ExtractedValue
 
     result = await db.execute(
         select(
-            ExtractedValue.property_name,
+            ExtractedValue.property_key,
             ExtractedValue.field_name,
             ExtractedValue.value_numeric,
             ExtractedValue.value_text,
         )
         .where(
             and_(
-                or_(*name_conditions),
+                ExtractedValue.property_key.in_(list(property_keys)),
                 ExtractedValue.is_error.is_(False),
                 ExtractedValue.field_name.in_(list(ALL_HYDRATION_FIELDS)),
             )
         )
         .order_by(
-            ExtractedValue.property_name,
+            ExtractedValue.property_key,
             ExtractedValue.field_name,
             ExtractedValue.created_at.desc(),
         )
@@ -846,26 +865,29 @@ async def fetch_bulk_base_rows(
 
 async def fetch_bulk_year_rows(
     db: AsyncSession,
-    name_conditions: list,
+    property_keys: Collection[str],
 ) -> list:
-    """Bulk-fetch YEAR_N fields for multiple properties."""
+    """Bulk-fetch YEAR_N fields for multiple properties.
+
+    Rows are ``(property_key, field_name, value_numeric)``.
+    """
     from app.models.extraction import ExtractedValue
 
     result = await db.execute(
         select(
-            ExtractedValue.property_name,
+            ExtractedValue.property_key,
             ExtractedValue.field_name,
             ExtractedValue.value_numeric,
         )
         .where(
             and_(
-                or_(*name_conditions),
+                ExtractedValue.property_key.in_(list(property_keys)),
                 ExtractedValue.is_error.is_(False),
                 ExtractedValue.field_name.like("%_YEAR_%"),
             )
         )
         .order_by(
-            ExtractedValue.property_name,
+            ExtractedValue.property_key,
             ExtractedValue.created_at.desc(),
         )
     )
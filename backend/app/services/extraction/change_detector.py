@@ -10,18 +10,28 @@ Logic per user requirements:
 - Compare extracted values hash vs. latest DB values hash
 - If identical → skip this deal (no insertion)
 - If different → proceed with full bulk_insert of ALL values for this deal
+
+The hash of every inserted deal is persisted as an ``ExtractionDigest``, so
+a run loads the latest digest of its properties with one query
+(``RunDigests``) instead of re-reading and re-hashing each deal's values. Deals last extracted before digests existed fall back to hashing
+their stored values once (``get_db_values_hash``), and that digest is
+recorded for next time.
 """
 
 import hashlib
 import json
+from collections.abc import Collection, Iterator, Mapping
 from typing import Any
+from uuid import UUID
 
 import numpy as np
 from loguru import logger
-from sqlalchemy import text
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from app.extraction.error_handler import NullValue
+from app.models.extraction import ExtractionDigest, ExtractionRun
 
 
 def _normalize_value(value: Any) -> str:
@@ -68,20 +78,95 @@ def compute_extraction_hash(extracted_data: dict[str, Any]) -> str:
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
-def get_db_values_hash(db: Session, property_name: str) -> str | None:
+def get_latest_digests(
+    db: Session, property_names: Collection[str] | None = None
+) -> dict[str, str]:
     """
-    Compute a SHA-256 hash of the latest extracted values in the DB for a property.
-
-    Queries the most recent extraction run's values for this property and
-    hashes them in the same way as compute_extraction_hash().
+    Load the digest from each property's latest completed extraction run.
 
     Args:
         db: Database session.
-        property_name: Property/deal name to look up.
+        property_names: Restrict to these properties (default: all).
 
     Returns:
-        Hex digest if data exists, None if no prior extraction data found.
+        Dict of property_name → hex digest. Properties with no recorded
+        digest are absent.
+    """
+    ranked = (
+        select(
+            ExtractionDigest.property_name,
+            ExtractionDigest.digest,
+            func.row_number()
+            .over(
+                partition_by=ExtractionDigest.property_name,
+                order_by=(
+                    ExtractionRun.completed_at.desc().nulls_last(),
+                    ExtractionRun.created_at.desc(),
+                ),
+            )
+            .label("rn"),
+        )
+        .join(ExtractionRun, ExtractionDigest.extraction_run_id == ExtractionRun.id)
+        .where(ExtractionRun.status == "completed")
+    )
+    if property_names is not None:
+        if not property_names:
+            return {}
+        ranked = ranked.where(ExtractionDigest.property_name.in_(property_names))
+
+    latest = ranked.subquery()
+    rows = db.execute(
+        select(latest.c.property_name, latest.c.digest).where(latest.c.rn == 1)
+    ).all()
+    return {row.property_name: row.digest for row in rows}
+
+
+class RunDigests(Mapping[str, str]):
     """
+    Latest digests for the properties of one extraction run.
+
+    The digests of the expected property names (e.g. each file's deal name)
+    are loaded with one ``get_latest_digests`` query. A name outside that
+    set, such as a workbook whose PROPERTY_NAME differs from its deal name,
+    is looked up on first use.
+    """
+
+    def __init__(self, db: Session, property_names: Collection[str]) -> None:
+        self._db = db
+        self._loaded = set(property_names)
+        self._digests = get_latest_digests(db, self._loaded)
+
+    def __getitem__(self, property_name: str) -> str:
+        if property_name not in self._loaded:
+            self._loaded.add(property_name)
+            self._digests.update(get_latest_digests(self._db, [property_name]))
+        return self._digests[property_name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._digests)
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+
+def record_digest(
+    db: Session, extraction_run_id: UUID, property_name: str, digest: str
+) -> None:
+    """Upsert the digest for a property within a run (caller commits)."""
+    stmt = insert(ExtractionDigest).values(
+        extraction_run_id=extraction_run_id,
+        property_name=property_name,
+        digest=digest,
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_extraction_digest",
+        set_={"digest": stmt.excluded.digest, "updated_at": func.now()},
+    )
+    db.execute(stmt)
+
+
+def _latest_values_digest(db: Session, property_name: str) -> tuple[UUID, str] | None:
+    """Hash the stored values of a property's latest completed run."""
     # Get the latest extraction run ID that has values for this property
     latest_run_stmt = text("""
         SELECT ev.extraction_run_id
@@ -121,7 +206,28 @@ def get_db_values_hash(db: Session, property_name: str) -> str | None:
     # ("1234.5000").
     pairs = sorted((row[0], _normalize_value_from_text(row[1])) for row in rows)
     payload = json.dumps(pairs, sort_keys=True)
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    # Raw SQL returns the UUID as text on some drivers (e.g. SQLite)
+    run_uuid = run_id if isinstance(run_id, UUID) else UUID(str(run_id))
+    return run_uuid, hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_db_values_hash(db: Session, property_name: str) -> str | None:
+    """
+    Compute a SHA-256 hash of the latest extracted values in the DB for a property.
+
+    Queries the most recent extraction run's values for this property and
+    hashes them in the same way as compute_extraction_hash(). Only needed
+    for runs that predate ``ExtractionDigest``; see ``get_latest_digests``.
+
+    Args:
+        db: Database session.
+        property_name: Property/deal name to look up.
+
+    Returns:
+        Hex digest if data exists, None if no prior extraction data found.
+    """
+    latest = _latest_values_digest(db, property_name)
+    return latest[1] if latest else None
 
 
 def _normalize_value_from_text(value_text: str | None) -> str:
@@ -152,6 +258,7 @@ def should_extract_deal(
     db: Session,
     property_name: str,
     extracted_data: dict[str, Any],
+    latest_digests: Mapping[str, str] | None = None,
 ) -> tuple[bool, str]:
     """
     Determine whether a deal needs extraction by comparing hashes.
@@ -160,6 +267,8 @@ def should_extract_deal(
         db: Database session.
         property_name: The deal/property name.
         extracted_data: Freshly extracted data dict from Excel.
+        latest_digests: Digests preloaded with ``get_latest_digests`` for
+            the whole run. If omitted, this property's digest is queried.
 
     Returns:
         Tuple of (should_extract: bool, reason: str).
@@ -168,7 +277,17 @@ def should_extract_deal(
         - (False, "unchanged") if data is identical to DB
     """
     new_hash = compute_extraction_hash(extracted_data)
-    db_hash = get_db_values_hash(db, property_name)
+    if latest_digests is None:
+        latest_digests = get_latest_digests(db, [property_name])
+    db_hash = latest_digests.get(property_name)
+
+    if db_hash is None:
+        # No digest yet: hash values stored by a pre-digest run and record
+        # the result so the next run finds it in the batched lookup
+        legacy = _latest_values_digest(db, property_name)
+        if legacy is not None:
+            legacy_run_id, db_hash = legacy
+            record_digest(db, legacy_run_id, property_name, db_hash)
 
     if db_hash is None:
         logger.info(
@@ -7,6 +7,7 @@ Provides polling-based monitoring of SharePoint for file changes:
 - Detects deleted files
 - Optionally triggers extraction when changes are detected
 - Delta query support for incremental sync (when enabled)
+- Optionally prefetches changed files into the workbook store
 
 Uses a database-backed state store to track file metadata between checks.
 """
@@ -31,10 +32,22 @@ from app.extraction.sharepoint import (
     SharePointFile,
 )
 from app.models.file_monitor import FileChangeLog, MonitoredFile
+from app.services.progress_stream import (
+    ProgressEvent,
+    ProgressStream,
+    progress_streams,
+)
 
 if TYPE_CHECKING:
     from app.extraction.sharepoint import DeltaChange
 
+# Coalesced stream of SharePoint-driven stage changes (latest per deal)
+STAGE_CHANGE_STREAM = "deal-stages"
+
+# Strong references to in-flight prefetch tasks (the event loop only keeps
+# weak ones)
+_prefetch_tasks: set[asyncio.Task] = set()
+
 
 def _ensure_aware(dt: datetime) -> datetime:
     """Ensure a datetime is timezone-aware (assume UTC if naive).
@@ -48,6 +61,51 @@ def _ensure_aware(dt: datetime) -> datetime:
     return dt
 
 
+def _render_stage_changes(
+    stream: ProgressStream, events: list[ProgressEvent]
+) -> list[dict]:
+    """Render coalesced stage changes as WebSocket messages.
+
+    Sends individual ``deal_update`` (``stage_changed``) events when the
+    number of changes is at or below ``STAGE_SYNC_BATCH_THRESHOLD``. For
+    larger batches a single ``batch_stage_changed`` event is sent instead,
+    preventing notification spam during bulk folder moves.
+    """
+    timestamp = datetime.now(UTC).isoformat()
+    batch_threshold = getattr(settings, "STAGE_SYNC_BATCH_THRESHOLD", 5)
+
+    if len(events) > batch_threshold:
+        return [
+            {
+                "type": "batch_stage_changed",
+                "count": len(events),
+                "deals": [{**e.data, "seq": e.seq} for e in events],
+                "source": "sharepoint_sync",
+                "stream": stream.stream_id,
+                "seq": events[-1].seq,
+                "timestamp": timestamp,
+            }
+        ]
+    return [
+        {
+            "type": "deal_update",
+            "action": "stage_changed",
+            "deal_id": e.data["deal_id"],
+            "data": {
+                "deal_name": e.data["deal_name"],
+                "old_stage": e.data["old_stage"],
+                "new_stage": e.data["new_stage"],
+                "source": "sharepoint_sync",
+            },
+            "triggered_by": None,
+            "stream": stream.stream_id,
+            "seq": e.seq,
+            "timestamp": timestamp,
+        }
+        for e in events
+    ]
+
+
 @dataclass
 class FileChange:
     """Represents a detected file change."""
@@ -61,6 +119,7 @@ class FileChange:
     old_size_bytes: int | None = None
     new_size_bytes: int | None = None
     detected_at: datetime | None = None
+    etag: str | None = None
 
     def __post_init__(self):
         if self.detected_at is None:
@@ -179,6 +238,8 @@ class SharePointFileMonitor:
             # Update stored state with current files
             await self._update_stored_state(current_files)
 
+            self._schedule_prefetch(changes)
+
             # Trigger extraction BEFORE logging so we can record the run_id
             extraction_run_id = None
             extraction_triggered = False
@@ -285,6 +346,8 @@ class SharePointFileMonitor:
                 if file_change is not None:
                     changes.append(file_change)
 
+            self._schedule_prefetch(changes)
+
             # Persist the new delta token
             if delta_result.new_delta_token:
                 await DeltaTokenCRUD.upsert_token(
@@ -380,6 +443,7 @@ class SharePointFileMonitor:
             new_modified_date=delta_change.modified_date,
             old_size_bytes=None,
             new_size_bytes=delta_change.size,
+            etag=delta_change.etag,
         )
 
     async def _get_stored_state(self) -> dict[str, MonitoredFile]:
@@ -427,6 +491,7 @@ class SharePointFileMonitor:
                         new_modified_date=file.modified_date,
                         old_size_bytes=None,
                         new_size_bytes=file.size,
+                        etag=file.etag,
                     )
                 )
                 self.logger.debug(
@@ -478,6 +543,7 @@ class SharePointFileMonitor:
                             new_modified_date=file.modified_date,
                             old_size_bytes=stored.size_bytes,
                             new_size_bytes=file.size,
+                            etag=file.etag,
                         )
                     )
                     self.logger.debug(
@@ -530,6 +596,7 @@ class SharePointFileMonitor:
                 existing.deal_name = file.deal_name
                 existing.size_bytes = file.size
                 existing.modified_date = file.modified_date
+                existing.etag = file.etag or existing.etag
                 existing.last_checked = now
                 existing.deal_stage = file.deal_stage
                 existing.is_active = True
@@ -545,6 +612,7 @@ class SharePointFileMonitor:
                     deal_name=file.deal_name,
                     size_bytes=file.size,
                     modified_date=file.modified_date,
+                    etag=file.etag,
                     first_seen=now,
                     last_checked=now,
                     is_active=True,
@@ -681,64 +749,36 @@ class SharePointFileMonitor:
         self,
         changes: list[dict[str, object]],
     ) -> None:
-        """Emit WebSocket notifications for stage changes.
+        """Queue WebSocket notifications for stage changes.
 
-        Sends individual ``stage_changed`` events when the number of changes
-        is at or below ``STAGE_SYNC_BATCH_THRESHOLD``.  For larger batches a
-        single ``batch_stage_changed`` event is sent instead, preventing
-        notification spam during bulk folder moves.
+        Changes go to the coalesced ``deal-stages`` progress stream (latest
+        change per deal), which publishes them at a fixed maximum rate (see
+        ``_render_stage_changes``). Without a running publisher they are
+        published immediately.
 
         Args:
             changes: List of dicts with deal_id, deal_name, old_stage,
                      new_stage for each changed deal.
         """
-        from app.services.websocket_manager import get_connection_manager
+        from app.services.websocket_manager import Channel
 
         try:
-            manager = get_connection_manager()
-            batch_threshold = getattr(settings, "STAGE_SYNC_BATCH_THRESHOLD", 5)
-
-            if len(changes) > batch_threshold:
-                # Batch notification
-                await manager.send_to_channel(
-                    "deals",
+            stream = progress_streams.open(
+                STAGE_CHANGE_STREAM, Channel.DEALS, _render_stage_changes
+            )
+            for change in changes:
+                stream.update(
+                    f"deal:{change['deal_id']}",
                     {
-                        "type": "batch_stage_changed",
-                        "count": len(changes),
-                        "deals": [
-                            {
-                                "deal_id": c["deal_id"],
-                                "deal_name": c["deal_name"],
-                                "old_stage": c["old_stage"],
-                                "new_stage": c["new_stage"],
-                            }
-                            for c in changes
-                        ],
-                        "source": "sharepoint_sync",
-                        "timestamp": datetime.now(UTC).isoformat(),
+                        "deal_id": int(str(change["deal_id"])),
+                        "deal_name": change["deal_name"],
+                        "old_stage": change["old_stage"],
+                        "new_stage": change["new_stage"],
                     },
                 )
-                self.logger.info(
-                    "batch_stage_change_notification_sent",
-                    count=len(changes),
-                )
-            else:
-                # Individual notifications
-                for change in changes:
-                    await manager.notify_deal_update(
-                        deal_id=int(str(change["deal_id"])),
-                        action="stage_changed",
-                        data={
-                            "deal_name": change["deal_name"],
-                            "old_stage": change["old_stage"],
-                            "new_stage": change["new_stage"],
-                            "source": "sharepoint_sync",
-                        },
-                    )
-                self.logger.debug(
-                    "individual_stage_change_notifications_sent",
-                    count=len(changes),
-                )
+            if not progress_streams.running:
+                await progress_streams.publish(stream)
+            self.logger.debug("stage_change_notifications_queued", count=len(changes))
         except Exception:
             # Fire-and-forget — never block the sync on notification failures
             self.logger.opt(exception=True).warning(
@@ -865,6 +905,39 @@ class SharePointFileMonitor:
             await self.db.commit()
             self.logger.debug("changes_logged", count=len(changes))
 
+    def _schedule_prefetch(self, changes: list[FileChange]) -> None:
+        """Start downloading added/modified files into the workbook store.
+
+        Runs in the background so the check returns immediately; by the
+        time the triggered extraction run reaches these files they are
+        usually already on disk and are not downloaded again.
+        """
+        if not getattr(settings, "FILE_MONITOR_PREFETCH", False):
+            return
+
+        files = [
+            SharePointFile(
+                name=c.file_name,
+                path=c.file_path,
+                download_url="",
+                size=c.new_size_bytes or 0,
+                modified_date=c.new_modified_date or c.detected_at or datetime.now(UTC),
+                deal_name=c.deal_name,
+                etag=c.etag,
+            )
+            for c in changes
+            if c.change_type in ("added", "modified")
+        ]
+        if not files:
+            return
+
+        from app.extraction.workbook_store import get_workbook_store
+
+        task = asyncio.create_task(get_workbook_store().prefetch(self.client, files))
+        _prefetch_tasks.add(task)
+        task.add_done_callback(_prefetch_tasks.discard)
+        self.logger.info("workbook_prefetch_scheduled", file_count=len(files))
+
     def _create_extraction_run_sync(self, files_discovered: int) -> UUID | None:
         """
         Create an extraction run using sync CRUD operations.
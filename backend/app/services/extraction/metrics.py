@@ -5,6 +5,7 @@ Emits structured log events via loguru that can be consumed by
 log aggregation systems (ELK, Datadog, CloudWatch, etc.) for:
 - Per-run throughput and duration
 - Per-file extraction statistics
+- Per-stage (extract / persist) throughput and pipeline queue depth
 - Error category breakdowns
 """
 
@@ -31,6 +32,32 @@ class FileMetrics:
     duration_ms: float = 0.0
 
 
+@dataclass
+class StageMetrics:
+    """Busy time and item count for one pipeline stage."""
+
+    items: int = 0
+    busy_seconds: float = 0.0
+
+    def record(self, duration_seconds: float) -> None:
+        self.items += 1
+        self.busy_seconds += duration_seconds
+
+    def to_dict(self, elapsed_seconds: float) -> dict:
+        return {
+            "items": self.items,
+            "busy_seconds": round(self.busy_seconds, 2),
+            "avg_ms": (
+                round(self.busy_seconds / self.items * 1000, 1) if self.items else 0.0
+            ),
+            "throughput_per_minute": (
+                round(self.items / elapsed_seconds * 60, 1)
+                if elapsed_seconds > 0
+                else 0.0
+            ),
+        }
+
+
 @dataclass
 class RunMetrics:
     """Aggregated metrics for an extraction run."""
@@ -43,6 +70,11 @@ class RunMetrics:
     total_errors: int = 0
     error_categories: dict[str, int] = field(default_factory=dict)
     per_file: dict[str, FileMetrics] = field(default_factory=dict)
+    stages: dict[str, StageMetrics] = field(default_factory=dict)
+    queue_capacity: int = 0
+    queue_depth_max: int = 0
+    _queue_depth_total: int = 0
+    _queue_depth_samples: int = 0
     _start_time: float = field(default_factory=time.monotonic)
 
     def record_file(self, fm: FileMetrics) -> None:
@@ -59,6 +91,37 @@ class RunMetrics:
         for cat, count in fm.error_categories.items():
             self.error_categories[cat] = self.error_categories.get(cat, 0) + count
 
+    def record_stage(self, stage: str, duration_seconds: float) -> None:
+        """Record one item passing through a pipeline stage."""
+        self.stages.setdefault(stage, StageMetrics()).record(duration_seconds)
+
+    def record_queue_depth(self, depth: int) -> None:
+        """Sample the number of results waiting between pipeline stages."""
+        self.queue_depth_max = max(self.queue_depth_max, depth)
+        self._queue_depth_total += depth
+        self._queue_depth_samples += 1
+
+    @property
+    def queue_depth_avg(self) -> float:
+        if self._queue_depth_samples:
+            return self._queue_depth_total / self._queue_depth_samples
+        return 0.0
+
+    def _stages_summary(self) -> dict | None:
+        if not self.stages:
+            return None
+        elapsed = self.duration_seconds
+        return {name: sm.to_dict(elapsed) for name, sm in self.stages.items()}
+
+    def _queue_summary(self) -> dict | None:
+        if not self._queue_depth_samples:
+            return None
+        return {
+            "capacity": self.queue_capacity,
+            "max": self.queue_depth_max,
+            "avg": round(self.queue_depth_avg, 2),
+        }
+
     @property
     def duration_seconds(self) -> float:
         return time.monotonic() - self._start_time
@@ -84,6 +147,8 @@ class RunMetrics:
             total_errors=self.total_errors,
             throughput_fpm=round(self.throughput_files_per_minute, 1),
             error_categories=self.error_categories or None,
+            stages=self._stages_summary(),
+            queue_depth=self._queue_summary(),
         )
 
     def to_metadata(self) -> dict:
@@ -109,5 +174,7 @@ class RunMetrics:
             "total_errors": self.total_errors,
             "throughput_fpm": round(self.throughput_files_per_minute, 1),
             "error_categories": self.error_categories or None,
+            "stages": self._stages_summary(),
+            "queue_depth": self._queue_summary(),
             "per_file": per_file_summary,
         }
@@ -6,15 +6,25 @@ Provides current and historical interest rate data with 2-tier fallback:
 2. Direct FRED API calls
 
 Returns an error/empty response when neither source is available.
+
+Results are served from a MarketDataCache (app.services.market_cache) for
+INTEREST_RATE_CACHE_TTL seconds and reloaded in the background when a new
+FRED import lands. The sync DB engine is only used from worker threads.
 """
 
+import asyncio
 from datetime import UTC, datetime
-from typing import Any
+from functools import partial
+from typing import TYPE_CHECKING
 
 import httpx
 from loguru import logger
 
 from app.core.config import settings
+from app.services.market_cache import MarketDataCache
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
 
 # FRED series ID → display config mapping
 _RATE_DISPLAY = {
@@ -100,6 +110,11 @@ _HISTORICAL_SERIES = {
 }
 
 
+def _has_data(data: dict) -> bool:
+    """Tier 3 (unavailable) responses are not cached."""
+    return data.get("data_source") != "unavailable"
+
+
 class InterestRatesService:
     """
     Service for fetching interest rate data.
@@ -111,13 +126,22 @@ class InterestRatesService:
     CACHE_TTL = settings.INTEREST_RATE_CACHE_TTL
 
     def __init__(self) -> None:
-        self._cache: dict[str, tuple[Any, datetime]] = {}
+        self._cache = MarketDataCache(
+            "interest_rates",
+            ttl=self.CACHE_TTL,
+            check_interval=settings.MARKET_DATA_FRESHNESS_CHECK_SECONDS,
+            probe=self._data_version,
+        )
         self._fred_api_key: str | None = getattr(settings, "FRED_API_KEY", None)
-        self._market_db_engine = None
+        self._market_db_engine: Engine | None = None
         self._db_available = False
 
     async def _get_db_engine(self):
-        """Lazily create sync engine for market data DB."""
+        """Lazily create sync engine for market data DB.
+
+        Creating the engine and testing its connection block, so both run
+        in a worker thread.
+        """
         if self._market_db_engine is not None:
             return self._market_db_engine
 
@@ -126,37 +150,45 @@ class InterestRatesService:
             self._db_available = False
             return None
 
+        return await asyncio.to_thread(self._connect_db_engine, db_url)
+
+    def _connect_db_engine(self, db_url: str):
         try:
             from sqlalchemy import create_engine, text
 
-            self._market_db_engine = create_engine(
+            engine = create_engine(
                 db_url,
                 pool_size=settings.INTEREST_RATE_DB_POOL_SIZE,
                 max_overflow=settings.INTEREST_RATE_DB_MAX_OVERFLOW,
             )
+            self._market_db_engine = engine
             # Test connection
-            with self._market_db_engine.connect() as conn:
+            with engine.connect() as conn:
                 conn.execute(text("SELECT 1"))
             self._db_available = True
-            return self._market_db_engine
+            return engine
         except Exception as e:
             logger.debug(f"Market data DB not available for interest rates: {e}")
             self._db_available = False
             return None
 
-    def _is_cache_valid(self, key: str) -> bool:
-        if key not in self._cache:
-            return False
-        _, timestamp = self._cache[key]
-        return (datetime.now(UTC) - timestamp).total_seconds() < self.CACHE_TTL
+    async def _data_version(self) -> str | None:
+        """Latest FRED import timestamp, or None without a DB."""
+        engine = await self._get_db_engine()
+        if engine is None or not self._db_available:
+            return None
+        return await asyncio.to_thread(self._fred_imported_at, engine)
 
-    def _get_cached(self, key: str) -> Any | None:
-        if self._is_cache_valid(key):
-            return self._cache[key][0]
-        return None
+    @staticmethod
+    def _fred_imported_at(engine: "Engine") -> str:
+        from sqlalchemy import text
 
-    def _set_cache(self, key: str, data: Any) -> None:
-        self._cache[key] = (data, datetime.now(UTC))
+        with engine.connect() as conn:
+            return str(
+                conn.execute(
+                    text("SELECT MAX(imported_at) FROM fred_timeseries")
+                ).scalar()
+            )
 
     # ── FRED API direct fetch ──
 
@@ -443,17 +475,55 @@ class InterestRatesService:
     # ── Public methods ──
 
     async def get_key_rates(self, force_refresh: bool = False) -> dict:
+        """Get current key interest rates (cached; see ``_load_key_rates``)."""
+        return await self._cache.get(
+            "key_rates",
+            self._load_key_rates,
+            force_load=partial(self._load_key_rates, force_refresh=True)
+            if force_refresh
+            else None,
+            cache_if=_has_data,
+        )
+
+    async def get_yield_curve(self, force_refresh: bool = False) -> dict:
+        """Get Treasury yield curve (cached; see ``_load_yield_curve``)."""
+        return await self._cache.get(
+            "yield_curve",
+            self._load_yield_curve,
+            force_load=partial(self._load_yield_curve, force_refresh=True)
+            if force_refresh
+            else None,
+            cache_if=_has_data,
+        )
+
+    async def get_historical_rates(
+        self, months: int = 12, force_refresh: bool = False
+    ) -> dict:
+        """Get historical rates (cached; see ``_load_historical_rates``)."""
+        return await self._cache.get(
+            "historical_rates",
+            self._load_historical_rates,
+            months,
+            force_load=partial(self._load_historical_rates, months, force_refresh=True)
+            if force_refresh
+            else None,
+            cache_if=_has_data,
+        )
+
+    async def get_rate_spreads(self, months: int = 12) -> dict:
+        """Get calculated rate spreads (cached; see ``_load_rate_spreads``)."""
+        return await self._cache.get(
+            "rate_spreads", self._load_rate_spreads, months, cache_if=_has_data
+        )
+
+    # ── Loaders ──
+
+    async def _load_key_rates(self, force_refresh: bool = False) -> dict:
         """Get current key interest rates.
 
         When ``force_refresh`` is True: FRED API first, DB fallback.
-        Otherwise: cache → DB → FRED API.
+        Otherwise: DB → FRED API.
         """
-        cache_key = "key_rates"
-        if not force_refresh:
-            cached = self._get_cached(cache_key)
-            if cached:
-                return cached
-
         await self._get_db_engine()
         series_ids = list(_RATE_DISPLAY.keys())
 
@@ -462,7 +532,7 @@ class InterestRatesService:
             rates, db_records = await self._fetch_key_rates_from_fred()
             if len(rates) >= 5:
                 # Write back to DB for subsequent non-refresh reads
-                self._write_rates_to_db(db_records)
+                await asyncio.to_thread(self._write_rates_to_db, db_records)
                 logger.info(
                     "Key rates sourced from FRED API (force_refresh)", count=len(rates)
                 )
@@ -472,11 +542,10 @@ class InterestRatesService:
                     "source": "fred_api",
                     "data_source": "fred_api",
                 }
-                self._set_cache(cache_key, data)
                 return data
 
             # Tier 2 (refresh): fall back to DB
-            db_rates = self._get_rates_from_db(series_ids)
+            db_rates = await asyncio.to_thread(self._get_rates_from_db, series_ids)
             if db_rates and len(db_rates) >= 5:
                 rates = self._build_key_rates_from_db(db_rates)
                 if rates:
@@ -490,11 +559,10 @@ class InterestRatesService:
                         "source": "database",
                         "data_source": "database",
                     }
-                    self._set_cache(cache_key, data)
                     return data
         else:
             # Tier 1 (normal): DB first
-            db_rates = self._get_rates_from_db(series_ids)
+            db_rates = await asyncio.to_thread(self._get_rates_from_db, series_ids)
             if db_rates and len(db_rates) >= 5:
                 rates = self._build_key_rates_from_db(db_rates)
                 if rates:
@@ -505,14 +573,13 @@ class InterestRatesService:
                         "source": "database",
                         "data_source": "database",
                     }
-                    self._set_cache(cache_key, data)
                     return data
 
             # Tier 2 (normal): FRED API
             if self._fred_api_key:
                 rates, db_records = await self._fetch_key_rates_from_fred()
                 if len(rates) >= 5:
-                    self._write_rates_to_db(db_records)
+                    await asyncio.to_thread(self._write_rates_to_db, db_records)
                     logger.info("Key rates sourced from FRED API", count=len(rates))
                     data = {
                         "key_rates": rates,
@@ -520,7 +587,6 @@ class InterestRatesService:
                         "source": "fred_api",
                         "data_source": "fred_api",
                     }
-                    self._set_cache(cache_key, data)
                     return data
 
         # Tier 3: No data available
@@ -534,18 +600,12 @@ class InterestRatesService:
         }
         return data
 
-    async def get_yield_curve(self, force_refresh: bool = False) -> dict:
+    async def _load_yield_curve(self, force_refresh: bool = False) -> dict:
         """Get Treasury yield curve.
 
         When ``force_refresh`` is True: FRED API first, DB fallback.
-        Otherwise: cache → DB → FRED API.
+        Otherwise: DB → FRED API.
         """
-        cache_key = "yield_curve"
-        if not force_refresh:
-            cached = self._get_cached(cache_key)
-            if cached:
-                return cached
-
         await self._get_db_engine()
         series_ids = [s[0] for s in _YIELD_CURVE_SERIES]
 
@@ -607,7 +667,7 @@ class InterestRatesService:
         if force_refresh and self._fred_api_key:
             curve, db_records, as_of = await _fetch_curve_from_fred()
             if len(curve) >= 6:
-                self._write_rates_to_db(db_records)
+                await asyncio.to_thread(self._write_rates_to_db, db_records)
                 logger.info(
                     "Yield curve sourced from FRED API (force_refresh)",
                     points=len(curve),
@@ -619,11 +679,10 @@ class InterestRatesService:
                     "source": "fred_api",
                     "data_source": "fred_api",
                 }
-                self._set_cache(cache_key, data)
                 return data
 
             # Fallback to DB
-            db_rates = self._get_rates_from_db(series_ids)
+            db_rates = await asyncio.to_thread(self._get_rates_from_db, series_ids)
             if db_rates and len(db_rates) >= 6:
                 curve, as_of = _build_curve_from_db(db_rates)
                 if curve:
@@ -638,11 +697,10 @@ class InterestRatesService:
                         "source": "database",
                         "data_source": "database",
                     }
-                    self._set_cache(cache_key, data)
                     return data
         else:
             # Normal: DB first
-            db_rates = self._get_rates_from_db(series_ids)
+            db_rates = await asyncio.to_thread(self._get_rates_from_db, series_ids)
             if db_rates and len(db_rates) >= 6:
                 curve, as_of = _build_curve_from_db(db_rates)
                 if curve:
@@ -654,14 +712,13 @@ class InterestRatesService:
                         "source": "database",
                         "data_source": "database",
                     }
-                    self._set_cache(cache_key, data)
                     return data
 
             # Normal: FRED API
             if self._fred_api_key:
                 curve, db_records, as_of = await _fetch_curve_from_fred()
                 if len(curve) >= 6:
-                    self._write_rates_to_db(db_records)
+                    await asyncio.to_thread(self._write_rates_to_db, db_records)
                     logger.info("Yield curve sourced from FRED API", points=len(curve))
                     data = {
                         "yield_curve": curve,
@@ -670,7 +727,6 @@ class InterestRatesService:
                         "source": "fred_api",
                         "data_source": "fred_api",
                     }
-                    self._set_cache(cache_key, data)
                     return data
 
         # Tier 3: No data available
@@ -685,20 +741,14 @@ class InterestRatesService:
         }
         return data
 
-    async def get_historical_rates(
+    async def _load_historical_rates(
         self, months: int = 12, force_refresh: bool = False
     ) -> dict:
         """Get historical rates.
 
         When ``force_refresh`` is True: FRED API first, DB fallback.
-        Otherwise: cache → DB → FRED API.
+        Otherwise: DB → FRED API.
         """
-        cache_key = f"historical_rates_{months}"
-        if not force_refresh:
-            cached = self._get_cached(cache_key)
-            if cached:
-                return cached
-
         await self._get_db_engine()
 
         if force_refresh and self._fred_api_key:
@@ -718,11 +768,12 @@ class InterestRatesService:
                     "source": "fred_api",
                     "data_source": "fred_api",
                 }
-                self._set_cache(cache_key, data)
                 return data
 
             # Fallback to DB
-            db_historical = self._get_historical_from_db(months)
+            db_historical = await asyncio.to_thread(
+                self._get_historical_from_db, months
+            )
             if db_historical:
                 logger.info(
                     "Historical rates sourced from database (FRED unavailable)",
@@ -737,11 +788,12 @@ class InterestRatesService:
                     "source": "database",
                     "data_source": "database",
                 }
-                self._set_cache(cache_key, data)
                 return data
         else:
             # Normal: DB first
-            db_historical = self._get_historical_from_db(months)
+            db_historical = await asyncio.to_thread(
+                self._get_historical_from_db, months
+            )
             if db_historical:
                 logger.info(
                     "Historical rates sourced from database",
@@ -756,7 +808,6 @@ class InterestRatesService:
                     "source": "database",
                     "data_source": "database",
                 }
-                self._set_cache(cache_key, data)
                 return data
 
             # Normal: FRED API
@@ -776,7 +827,6 @@ class InterestRatesService:
                         "source": "fred_api",
                         "data_source": "fred_api",
                     }
-                    self._set_cache(cache_key, data)
                     return data
 
         # Tier 3: No data available
@@ -846,13 +896,8 @@ class InterestRatesService:
         )
         return result[-months:] if result else None
 
-    async def get_rate_spreads(self, months: int = 12) -> dict:
+    async def _load_rate_spreads(self, months: int = 12) -> dict:
         """Get calculated rate spreads."""
-        cache_key = f"rate_spreads_{months}"
-        cached = self._get_cached(cache_key)
-        if cached:
-            return cached
-
         # Use historical rates (which already do DB -> FRED API fallback)
         historical_data = await self.get_historical_rates(months)
         rates = historical_data.get("rates", [])
@@ -864,7 +909,6 @@ class InterestRatesService:
             "source": historical_data.get("source", "unavailable"),
             "data_source": historical_data.get("data_source", "unavailable"),
         }
-        self._set_cache(cache_key, data)
         return data
 
     async def get_lending_context(self) -> dict:
@@ -0,0 +1,210 @@
+"""
+Two-level cache for results read from the market analysis database.
+
+Used by ``MarketDataService`` and ``InterestRatesService``:
+
+- Level 1 is a dict in this process, so market pages are served from
+  memory between data refreshes.
+- Level 2 is the shared ``app.core.cache`` (Redis, or its memory fallback),
+  so a result loaded by one worker is reused by the others.
+
+Entries are keyed by method name plus parameters and tagged with the
+*data version*, a freshness stamp of the source tables (e.g.
+``MAX(imported_at)`` of ``fred_timeseries``) returned by the service's
+probe. The probe runs on first use and then in the background at most every
+``MARKET_DATA_FRESHNESS_CHECK_SECONDS``. When the version changes, every
+level-1 entry is reloaded in the background (refresh-ahead) and requests
+keep getting the previous value until its reload lands. The TTL bounds how
+long any entry is served.
+
+Concurrent misses for the same key share one load.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+from loguru import logger
+
+from app.core.cache import cache
+
+
+@dataclass
+class _Entry:
+    value: Any
+    version: str | None
+    expires_at: float
+    load: Callable[[], Awaitable[Any]]
+    cache_if: Callable[[Any], bool] | None
+
+
+class MarketDataCache:
+    """TTL'd two-level cache of a service's results, refreshed on new data."""
+
+    def __init__(
+        self,
+        namespace: str,
+        *,
+        ttl: float,
+        check_interval: float,
+        probe: Callable[[], Awaitable[str | None]] | None = None,
+    ) -> None:
+        """
+        Args:
+            namespace: Prefix of the level-2 keys, e.g. ``"market"``.
+            ttl: Seconds an entry may be served after it was loaded.
+            check_interval: Minimum seconds between data version probes.
+            probe: Returns the current data version, or None when unknown.
+        """
+        self.namespace = namespace
+        self.ttl = ttl
+        self.check_interval = check_interval
+        self._probe = probe
+        self._entries: dict[str, _Entry] = {}
+        self._loads: dict[str, asyncio.Task[Any]] = {}
+        self._version: str | None = None
+        self._checked_at: float | None = None
+        self._probe_task: asyncio.Task[None] | None = None
+
+    async def get(
+        self,
+        method: str,
+        load: Callable[..., Awaitable[Any]],
+        *params: Any,
+        force_load: Callable[[], Awaitable[Any]] | None = None,
+        decode: Callable[[Any], Any] | None = None,
+        cache_if: Callable[[Any], bool] | None = None,
+    ) -> Any:
+        """Return ``load(*params)``, from the cache when possible.
+
+        Args:
+            method: Name of the cached method; with *params* forms the key.
+            load: Loads the value from the data source.
+            force_load: When given, skip both levels, cache and return its
+                result (background refreshes still use *load*).
+            decode: Rebuilds a value read from level 2, which holds JSON
+                (e.g. ``SomeResponse.model_validate``).
+            cache_if: Values for which it returns False are not cached.
+        """
+        key = ":".join([method, *map(str, params)])
+        bound = partial(load, *params)
+        await self._check_version()
+
+        if force_load is not None:
+            return await self._load(key, force_load, bound, cache_if)
+
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry.expires_at:
+            if entry.version != self._version:
+                self._refresh_in_background(key, entry)
+            return entry.value
+
+        shared = await cache.get(self._shared_key(key, self._version))
+        if shared is not None:
+            value = decode(shared) if decode else shared
+            self._store(key, value, self._version, bound, cache_if)
+            return value
+
+        task = self._loads.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, bound, bound, cache_if))
+            self._loads[key] = task
+            task.add_done_callback(lambda _: self._loads.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def clear(self) -> None:
+        """Drop both levels and re-probe the data version on next use."""
+        self._entries.clear()
+        self._checked_at = None
+        await cache.invalidate_pattern(f"market_cache:{self.namespace}:*")
+
+    # ── Internals ─────────────────────────────────────────────────────────
+
+    def _shared_key(self, key: str, version: str | None) -> str:
+        return f"market_cache:{self.namespace}:{version}:{key}"
+
+    def _store(
+        self,
+        key: str,
+        value: Any,
+        version: str | None,
+        load: Callable[[], Awaitable[Any]],
+        cache_if: Callable[[Any], bool] | None,
+    ) -> None:
+        self._entries[key] = _Entry(
+            value=value,
+            version=version,
+            expires_at=time.monotonic() + self.ttl,
+            load=load,
+            cache_if=cache_if,
+        )
+
+    async def _load(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        load: Callable[[], Awaitable[Any]],
+        cache_if: Callable[[Any], bool] | None,
+    ) -> Any:
+        version = self._version
+        value = await fetch()
+        if cache_if is None or cache_if(value):
+            self._store(key, value, version, load, cache_if)
+            await cache.set(
+                self._shared_key(key, version), value, ttl=max(1, math.ceil(self.ttl))
+            )
+        return value
+
+    def _refresh_in_background(self, key: str, entry: _Entry) -> None:
+        if key in self._loads:
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._load(key, entry.load, entry.load, entry.cache_if)
+            except Exception as e:
+                logger.warning(f"Market cache: refresh of {key} failed: {e}")
+
+        task = asyncio.ensure_future(refresh())
+        self._loads[key] = task
+        task.add_done_callback(lambda _: self._loads.pop(key, None))
+
+    async def _check_version(self) -> None:
+        """Probe the data version: awaited on first use, then in the background."""
+        if self._probe is None:
+            return
+        if self._checked_at is None:
+            await self._run_probe()
+        elif (
+            time.monotonic() - self._checked_at >= self.check_interval
+            and self._probe_task is None
+        ):
+            self._probe_task = asyncio.ensure_future(self._run_probe())
+
+    async def _run_probe(self) -> None:
+        probe = self._probe
+        if probe is None:
+            return
+        self._checked_at = time.monotonic()
+        try:
+            version = await probe()
+        except Exception as e:
+            logger.warning(f"Market cache: {self.namespace} version probe failed: {e}")
+            return
+        finally:
+            self._probe_task = None
+
+        if version == self._version:
+            return
+        logger.info(
+            f"Market cache: {self.namespace} data version {self._version} -> {version}"
+        )
+        self._version = version
+        for key, entry in list(self._entries.items()):
+            self._refresh_in_background(key, entry)
@@ -15,6 +15,10 @@ Architecture:
   Each public method follows a 3-tier pattern:
     Database query -> Static fallback -> Empty/error
   Static methods are prefixed with _static_ and kept intact as fallbacks.
+  Overview, submarket and trend results read from the database are served
+  from a MarketDataCache (app.services.market_cache) and reloaded when a
+  CoStar or FRED import lands; the uncached loaders are the matching
+  _load_* methods.
 """
 
 from datetime import UTC, datetime
@@ -34,6 +38,7 @@ from app.schemas.market_data import (
     SubmarketMetrics,
     SubmarketsResponse,
 )
+from app.services.market_cache import MarketDataCache
 
 
 def _extract_submarket_name(geography_name: str) -> str:
@@ -48,6 +53,13 @@ def _extract_submarket_name(geography_name: str) -> str:
     return geography_name.strip()
 
 
+def _from_database(
+    response: MarketOverviewResponse | SubmarketsResponse | MarketTrendsResponse,
+) -> bool:
+    """Only database results are cached; static fallbacks are rebuilt."""
+    return response.source != "static_fallback"
+
+
 class MarketDataService:
     """Service for market data operations.
 
@@ -63,13 +75,20 @@ class MarketDataService:
         self._market_db_engine = None
         self._market_db_available = False
         self._market_data_freshness: str | None = None
+        self._cache = MarketDataCache(
+            "market",
+            ttl=settings.MARKET_DATA_CACHE_TTL,
+            check_interval=settings.MARKET_DATA_FRESHNESS_CHECK_SECONDS,
+            probe=self._data_version,
+        )
         self._init_market_db()
 
-    def update_last_refreshed(self) -> str:
+    async def update_last_refreshed(self) -> str:
         """Update the last refreshed timestamp. Called after successful data refresh."""
         self._last_updated = datetime.now(UTC)
         # Also update market_data_freshness so MSA overview shows current date
         self._market_data_freshness = self._last_updated.strftime("%Y-%m-%d")
+        await self._cache.clear()
         logger.info(f"Market data last_updated set to {self._last_updated}")
         return self._last_updated.strftime("%Y-%m-%d")
 
@@ -140,6 +159,25 @@ class MarketDataService:
             self._market_db_available = False
             return None
 
+    async def _data_version(self) -> str | None:
+        """Latest CoStar and FRED import timestamps, or None without a DB."""
+        engine = await self._ensure_market_db()
+        if engine is None:
+            return None
+
+        from sqlalchemy import text
+
+        async with engine.connect() as conn:
+            row = (
+                await conn.execute(
+                    text(
+                        "SELECT (SELECT MAX(imported_at) FROM costar_timeseries), "
+                        "(SELECT MAX(imported_at) FROM fred_timeseries)"
+                    )
+                )
+            ).one()
+        return f"{row[0]}|{row[1]}"
+
     # ==================================================================
     # get_market_overview
     # ==================================================================
@@ -147,6 +185,18 @@ class MarketDataService:
     async def get_market_overview(self) -> MarketOverviewResponse:
         """Get market overview with MSA stats and economic indicators.
 
+        Served from the market data cache; see ``_load_market_overview``.
+        """
+        return await self._cache.get(
+            "get_market_overview",
+            self._load_market_overview,
+            decode=MarketOverviewResponse.model_validate,
+            cache_if=_from_database,
+        )
+
+    async def _load_market_overview(self) -> MarketOverviewResponse:
+        """Get market overview with MSA stats and economic indicators.
+
         Tries market_analysis DB first, falls back to static data.
         """
         engine = await self._ensure_market_db()
@@ -558,6 +608,18 @@ class MarketDataService:
     async def get_submarkets(self) -> SubmarketsResponse:
         """Get submarket breakdown with performance metrics.
 
+        Served from the market data cache; see ``_load_submarkets``.
+        """
+        return await self._cache.get(
+            "get_submarkets",
+            self._load_submarkets,
+            decode=SubmarketsResponse.model_validate,
+            cache_if=_from_database,
+        )
+
+    async def _load_submarkets(self) -> SubmarketsResponse:
+        """Get submarket breakdown with performance metrics.
+
         Tries market_analysis DB first, falls back to static data.
         """
         engine = await self._ensure_market_db()
@@ -815,6 +877,21 @@ class MarketDataService:
     async def get_market_trends(self, period_months: int = 12) -> MarketTrendsResponse:
         """Get market trends over time.
 
+        Served from the market data cache; see ``_load_market_trends``.
+        """
+        return await self._cache.get(
+            "get_market_trends",
+            self._load_market_trends,
+            period_months,
+            decode=MarketTrendsResponse.model_validate,
+            cache_if=_from_database,
+        )
+
+    async def _load_market_trends(
+        self, period_months: int = 12
+    ) -> MarketTrendsResponse:
+        """Get market trends over time.
+
         Tries market_analysis DB first, falls back to static data.
         """
         engine = await self._ensure_market_db()
@@ -1223,6 +1300,18 @@ class MarketDataService:
     async def get_usa_market_overview(self) -> MarketOverviewResponse:
         """Get national (USA) market overview with economic indicators.
 
+        Served from the market data cache; see ``_load_usa_market_overview``.
+        """
+        return await self._cache.get(
+            "get_usa_market_overview",
+            self._load_usa_market_overview,
+            decode=MarketOverviewResponse.model_validate,
+            cache_if=_from_database,
+        )
+
+    async def _load_usa_market_overview(self) -> MarketOverviewResponse:
+        """Get national (USA) market overview with economic indicators.
+
         Tries market_analysis DB first, falls back to static data.
         """
         engine = await self._ensure_market_db()
@@ -1535,6 +1624,21 @@ class MarketDataService:
     ) -> MarketTrendsResponse:
         """Get national market trends over time.
 
+        Served from the market data cache; see ``_load_usa_market_trends``.
+        """
+        return await self._cache.get(
+            "get_usa_market_trends",
+            self._load_usa_market_trends,
+            period_months,
+            decode=MarketTrendsResponse.model_validate,
+            cache_if=_from_database,
+        )
+
+    async def _load_usa_market_trends(
+        self, period_months: int = 12
+    ) -> MarketTrendsResponse:
+        """Get national market trends over time.
+
         Tries market_analysis DB for national FRED series, falls back to static data.
         """
         engine = await self._ensure_market_db()
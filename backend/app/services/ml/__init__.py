@@ -1,6 +1,8 @@
 """Machine Learning services for analytics and predictions."""
 
 from .model_manager import ModelManager, get_model_manager
+from .prediction_cache import PredictionCache
+from .prescoring import PortfolioPrescorer, get_portfolio_prescorer
 from .rent_growth_predictor import RentGrowthPredictor, get_rent_growth_predictor
 
 __all__ = [
@@ -8,4 +10,7 @@ __all__ = [
     "get_rent_growth_predictor",
     "ModelManager",
     "get_model_manager",
+    "PredictionCache",
+    "PortfolioPrescorer",
+    "get_portfolio_prescorer",
 ]
@@ -5,6 +5,7 @@ Model Manager for loading, saving, and managing ML models.
 import json
 import os
 import pickle
+from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -23,14 +24,37 @@ class ModelManager:
     - Metadata tracking (training date, metrics, parameters)
     - Model registry for quick access
     - Automatic model selection based on performance
+    - Publish listeners notified when a new version is saved
     """
 
     def __init__(self, model_path: str | None = None):
         self.model_path = Path(model_path or settings.ML_MODEL_PATH)
         self._models: dict[str, Any] = {}
         self._metadata: dict[str, dict] = {}
+        self._publish_listeners: list[Callable[[str, str], None]] = []
         self._ensure_model_directory()
 
+    def add_publish_listener(self, listener: Callable[[str, str], None]) -> None:
+        """
+        Register a callback invoked as ``listener(model_name, version)``
+        whenever ``save_model`` publishes a new latest version.
+        """
+        if listener not in self._publish_listeners:
+            self._publish_listeners.append(listener)
+
+    def remove_publish_listener(self, listener: Callable[[str, str], None]) -> None:
+        """Unregister a previously added publish listener."""
+        if listener in self._publish_listeners:
+            self._publish_listeners.remove(listener)
+
+    def _notify_published(self, model_name: str, version: str) -> None:
+        """Notify publish listeners; listener errors never fail the save."""
+        for listener in list(self._publish_listeners):
+            try:
+                listener(model_name, version)
+            except Exception as e:
+                logger.error(f"Model publish listener failed for {model_name}: {e}")
+
     def _ensure_model_directory(self) -> None:
         """Create model directory if it doesn't exist."""
         self.model_path.mkdir(parents=True, exist_ok=True)
@@ -99,13 +123,18 @@ class ModelManager:
             with open(metadata_path, "w") as f:
                 json.dump(existing_metadata, f, indent=2)
 
+            # The unversioned cache entry points at the previous latest version
+            self._models.pop(model_name, None)
+
             logger.info(f"Saved model {model_name} version {version}")
-            return str(model_path)
 
         except Exception as e:
             logger.error(f"Failed to save model {model_name}: {e}")
             raise
 
+        self._notify_published(model_name, version)
+        return str(model_path)
+
     def load_model(self, model_name: str, version: str | None = None) -> Any | None:
         """
         Load a model from disk.
@@ -0,0 +1,192 @@
+"""
+In-process cache for rent growth predictions.
+
+Entries are keyed by ``(model_version, feature_hash, horizon)`` so that a new
+model version can never serve a result computed by an older one. A secondary
+``(property_id, horizon)`` index lets dashboard requests for a known property
+resolve to a cached prediction without rebuilding its feature vector.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from loguru import logger
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from .rent_growth_predictor import RentPrediction
+
+CacheKey = tuple[str, str, int]
+
+
+class PredictionCache:
+    """
+    Bounded LRU cache of ``RentPrediction`` results with TTL expiry.
+
+    Features:
+    - Keys include the model version (new versions never hit old entries)
+    - Property index for O(1) dashboard lookups by property id
+    - LRU eviction once ``max_entries`` is reached
+    - Hit/miss counters for monitoring
+    """
+
+    def __init__(
+        self,
+        ttl: int | None = None,
+        max_entries: int | None = None,
+    ) -> None:
+        self.ttl = ttl if ttl is not None else settings.ML_PREDICTION_CACHE_TTL
+        self.max_entries = (
+            max_entries
+            if max_entries is not None
+            else settings.ML_PREDICTION_CACHE_MAX_ENTRIES
+        )
+        # key -> (prediction, expires_at)
+        self._entries: OrderedDict[CacheKey, tuple[RentPrediction, float]] = (
+            OrderedDict()
+        )
+        # (property_id, horizon) -> key, and key -> the index entries naming it
+        self._by_property: dict[tuple[int, int], CacheKey] = {}
+        self._properties_by_key: dict[CacheKey, set[tuple[int, int]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def hash_features(features: np.ndarray) -> str:
+        """Return a stable digest of a prepared feature vector."""
+        data = np.ascontiguousarray(features, dtype=np.float64).tobytes()
+        return hashlib.sha256(data).hexdigest()[:32]
+
+    def get(
+        self, model_version: str, feature_hash: str, horizon: int
+    ) -> RentPrediction | None:
+        """Look up a prediction by model version, feature hash and horizon."""
+        key = (model_version, feature_hash, horizon)
+        prediction = self._get_entry(key)
+        if prediction is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return prediction
+
+    def set(
+        self,
+        model_version: str,
+        feature_hash: str,
+        horizon: int,
+        prediction: RentPrediction,
+    ) -> None:
+        """Store a prediction and index it by property id when one is set."""
+        key = (model_version, feature_hash, horizon)
+        self._entries[key] = (prediction, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        if prediction.property_id:
+            self._index(prediction.property_id, horizon, key)
+
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._unindex(evicted)
+
+    def get_for_property(
+        self, property_id: int, horizon: int, model_version: str | None = None
+    ) -> RentPrediction | None:
+        """
+        Look up the most recent prediction scored for a property.
+
+        Args:
+            property_id: Property primary key
+            horizon: Forecast horizon in months
+            model_version: If given, only return entries from this version
+
+        Returns:
+            Cached RentPrediction (relabelled for the property) or None
+        """
+        key = self._by_property.get((property_id, horizon))
+        if key is None or (model_version is not None and key[0] != model_version):
+            self.misses += 1
+            return None
+
+        prediction = self._get_entry(key)
+        if prediction is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        if prediction.property_id != property_id:
+            # Identical feature vectors share one entry across properties
+            prediction = replace(prediction, property_id=property_id)
+        return prediction
+
+    def invalidate(self, model_version: str | None = None) -> int:
+        """
+        Drop cached predictions.
+
+        Args:
+            model_version: Only drop entries for this version (default: all)
+
+        Returns:
+            Number of entries removed
+        """
+        if model_version is None:
+            count = len(self._entries)
+            self._entries.clear()
+            self._by_property.clear()
+            self._properties_by_key.clear()
+        else:
+            stale = [k for k in self._entries if k[0] == model_version]
+            for key in stale:
+                del self._entries[key]
+                self._unindex(key)
+            count = len(stale)
+
+        logger.info(
+            f"Prediction cache invalidated: {count} entries "
+            f"(version={model_version or 'all'})"
+        )
+        return count
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "indexed_properties": len(self._by_property),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "ttl": self.ttl,
+            "max_entries": self.max_entries,
+        }
+
+    def _get_entry(self, key: CacheKey) -> RentPrediction | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        prediction, expires_at = entry
+        if time.monotonic() > expires_at:
+            del self._entries[key]
+            self._unindex(key)
+            return None
+        self._entries.move_to_end(key)
+        return prediction
+
+    def _index(self, property_id: int, horizon: int, key: CacheKey) -> None:
+        property_key = (property_id, horizon)
+        previous = self._by_property.get(property_key)
+        if previous is not None and previous != key:
+            self._properties_by_key.get(previous, set()).discard(property_key)
+        self._by_property[property_key] = key
+        self._properties_by_key.setdefault(key, set()).add(property_key)
+
+    def _unindex(self, key: CacheKey) -> None:
+        """Drop the property index entries of a removed cache entry."""
+        for property_key in self._properties_by_key.pop(key, ()):
+            if self._by_property.get(property_key) == key:
+                del self._by_property[property_key]
@@ -0,0 +1,196 @@
+"""
+Background pre-scoring of the property portfolio.
+
+Keeps the rent growth prediction cache warm so dashboard forecast requests
+are cache lookups rather than model calls. A refresh is requested after each
+model load/publish and after each extraction run, and entries are re-scored
+before their TTL lapses.
+
+Integration with app lifecycle (main.py lifespan):
+    prescorer = get_portfolio_prescorer()
+    await prescorer.start()
+    yield
+    await prescorer.stop()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.property import Property
+
+from .rent_growth_predictor import get_rent_growth_predictor
+
+# Forecast horizons (months) scored for every property
+PRESCORE_HORIZONS: tuple[int, ...] = (12,)
+
+# Property columns passed through to the feature builder
+_PREDICTION_FIELDS = (
+    "total_units",
+    "year_built",
+    "occupancy_rate",
+    "avg_rent_per_unit",
+    "avg_rent_per_sf",
+    "cap_rate",
+    "latitude",
+    "longitude",
+)
+
+
+def property_to_prediction_input(prop: Property) -> dict[str, Any]:
+    """Build the predictor's ``property_data`` dict from a Property row."""
+    data: dict[str, Any] = {
+        "id": prop.id,
+        "property_type": prop.property_type or "multifamily",
+        "market": prop.market or "unknown",
+    }
+    for field in _PREDICTION_FIELDS:
+        value = getattr(prop, field)
+        if value is not None:
+            data[field] = float(value) if isinstance(value, Decimal) else value
+    return data
+
+
+class PortfolioPrescorer:
+    """Background task that scores every active property into the prediction cache."""
+
+    def __init__(self, horizons: tuple[int, ...] = PRESCORE_HORIZONS) -> None:
+        self.horizons = horizons
+        self._task: asyncio.Task[None] | None = None
+        self._running = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._refresh_event: asyncio.Event | None = None
+        self.last_run_at: datetime | None = None
+        self.last_scored = 0
+
+    @property
+    def refresh_interval(self) -> float:
+        """Re-score before cached entries expire (seconds)."""
+        return max(settings.ML_PREDICTION_CACHE_TTL * 0.8, 30.0)
+
+    async def start(self) -> None:
+        """Start the background scoring loop."""
+        if self._running:
+            logger.warning("Portfolio prescorer already running")
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._refresh_event = asyncio.Event()
+        self._running = True
+        self._task = asyncio.create_task(self._run(), name="portfolio-prescorer")
+        logger.info(
+            "Portfolio prescorer started",
+            horizons=list(self.horizons),
+            refresh_interval=self.refresh_interval,
+        )
+
+    async def stop(self) -> None:
+        """Stop the background scoring loop."""
+        if not self._running:
+            return
+
+        self._running = False
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self._loop = None
+        self._refresh_event = None
+        logger.info("Portfolio prescorer stopped")
+
+    def request_refresh(self, reason: str = "manual") -> None:
+        """
+        Ask for a full re-score as soon as possible.
+
+        Safe to call from worker threads (e.g. the extraction pipeline).
+        A no-op when the prescorer is not running in this process.
+        """
+        loop, event = self._loop, self._refresh_event
+        if not self._running or loop is None or event is None:
+            return
+
+        logger.debug(f"Portfolio prescore requested ({reason})")
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is loop:
+            event.set()
+        else:
+            with contextlib.suppress(RuntimeError):  # loop already closed
+                loop.call_soon_threadsafe(event.set)
+
+    async def _run(self) -> None:
+        """Main loop — scores on request, or when cached entries are about to lapse."""
+        assert self._refresh_event is not None
+        while self._running:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._refresh_event.wait(), timeout=self.refresh_interval
+                )
+            self._refresh_event.clear()
+
+            try:
+                await self.prescore_all()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Portfolio prescorer failed")
+
+    async def prescore_all(self) -> int:
+        """
+        Score every active property for each configured horizon.
+
+        Returns:
+            Number of predictions written to the cache
+        """
+        predictor = await get_rent_growth_predictor()
+        # Refresh requests raised while loading the model are served by this run
+        if self._refresh_event is not None:
+            self._refresh_event.clear()
+
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(Property).where(Property.is_deleted.is_(False))
+            )
+            inputs = [property_to_prediction_input(p) for p in result.scalars().all()]
+
+        batch_size = max(settings.ML_BATCH_SIZE, 1)
+        scored = 0
+        for horizon in self.horizons:
+            for start in range(0, len(inputs), batch_size):
+                batch = inputs[start : start + batch_size]
+                scored += len(predictor.predict_batch(batch, horizon))
+                # Yield between batches so request handlers are not starved
+                await asyncio.sleep(0)
+
+        self.last_run_at = datetime.now(UTC)
+        self.last_scored = scored
+        logger.info(
+            f"Portfolio prescore complete: {scored} predictions "
+            f"({len(inputs)} properties, model {predictor.model_version})"
+        )
+        return scored
+
+
+# Singleton instance
+_prescorer: PortfolioPrescorer | None = None
+
+
+def get_portfolio_prescorer() -> PortfolioPrescorer:
+    """Get or create PortfolioPrescorer singleton."""
+    global _prescorer
+    if _prescorer is None:
+        _prescorer = PortfolioPrescorer()
+    return _prescorer
@@ -2,7 +2,7 @@
 Rent Growth Prediction Service using ML models.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from typing import Any
 
@@ -10,6 +10,7 @@ import numpy as np
 from loguru import logger
 
 from .model_manager import get_model_manager
+from .prediction_cache import PredictionCache
 
 
 @dataclass
@@ -36,9 +37,12 @@ class RentGrowthPredictor:
     - Feature engineering for real estate data
     - Confidence interval estimation
     - Batch prediction support
-    - Caching of predictions
+    - Caching of predictions (keyed by model version, features and horizon)
     """
 
+    MODEL_NAME = "rent_growth"
+    MOCK_MODEL_VERSION = "mock_v1"
+
     # Feature columns expected by the model
     FEATURE_COLUMNS = [
         "total_units",
@@ -74,15 +78,25 @@ class RentGrowthPredictor:
         self._model_version = None
         self._model_manager = get_model_manager()
         self._feature_scaler = None
+        self._cache = PredictionCache()
+        self._model_manager.add_publish_listener(self._on_model_published)
+
+    @property
+    def model_version(self) -> str:
+        """Version string that predictions are currently produced (and cached) under."""
+        if self._model is None:
+            return self.MOCK_MODEL_VERSION
+        return self._model_version or "unknown"
 
     async def initialize(self) -> bool:
         """Load model and prepare for predictions."""
         try:
-            self._model = self._model_manager.load_model("rent_growth")
+            self._model = self._model_manager.load_model(self.MODEL_NAME)
             if self._model:
-                model_info = self._model_manager.get_model_info("rent_growth")
+                model_info = self._model_manager.get_model_info(self.MODEL_NAME)
                 self._model_version = model_info.get("latest_version", "unknown")
                 logger.info(f"Rent growth model loaded: version {self._model_version}")
+                self._request_prescore("model_load")
                 return True
             else:
                 logger.warning("No rent growth model found - predictions unavailable")
@@ -137,12 +151,37 @@ class RentGrowthPredictor:
 
         return np.array(features).reshape(1, -1)
 
+    def _on_model_published(self, model_name: str, version: str) -> None:
+        """Swap in a newly saved model version and drop stale cached predictions."""
+        if model_name != self.MODEL_NAME:
+            return
+
+        model = self._model_manager.load_model(model_name, version)
+        if model is None:
+            logger.warning(f"Published rent growth model {version} could not be loaded")
+            return
+
+        self._model = model
+        self._model_version = version
+        self._cache.invalidate()
+        logger.info(f"Rent growth model switched to published version {version}")
+        self._request_prescore("model_publish")
+
+    def _request_prescore(self, reason: str) -> None:
+        """Ask the portfolio prescorer (if running) to re-score all properties."""
+        from .prescoring import get_portfolio_prescorer
+
+        get_portfolio_prescorer().request_refresh(reason)
+
     def predict(
         self, property_data: dict, prediction_months: int = 12
     ) -> RentPrediction | None:
         """
         Predict rent growth for a single property.
 
+        Results are served from the prediction cache when the same feature
+        vector was already scored with the current model version.
+
         Args:
             property_data: Dictionary with property attributes
             prediction_months: Forecast horizon in months
@@ -150,6 +189,55 @@ class RentGrowthPredictor:
         Returns:
             RentPrediction object or None if prediction fails
         """
+        try:
+            feature_hash = self._cache.hash_features(
+                self._prepare_features(property_data)
+            )
+        except Exception as e:
+            logger.debug(
+                f"Prediction cache bypassed for property {property_data.get('id')}: {e}"
+            )
+            return self._predict_uncached(property_data, prediction_months)
+
+        version = self.model_version
+        cached = self._cache.get(version, feature_hash, prediction_months)
+        if cached is not None:
+            property_id = property_data.get("id", 0)
+            if cached.property_id != property_id:
+                cached = replace(cached, property_id=property_id)
+                self._cache.set(version, feature_hash, prediction_months, cached)
+            return cached
+
+        prediction = self._predict_uncached(property_data, prediction_months)
+        if prediction is not None:
+            self._cache.set(version, feature_hash, prediction_months, prediction)
+        return prediction
+
+    def get_cached_prediction(
+        self, property_id: int, prediction_months: int = 12
+    ) -> RentPrediction | None:
+        """
+        Look up a precomputed prediction for a property.
+
+        Args:
+            property_id: Property primary key
+            prediction_months: Forecast horizon in months
+
+        Returns:
+            Cached RentPrediction for the current model version, or None
+        """
+        return self._cache.get_for_property(
+            property_id, prediction_months, self.model_version
+        )
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Get prediction cache statistics."""
+        return {"model_version": self.model_version, **self._cache.get_stats()}
+
+    def _predict_uncached(
+        self, property_data: dict, prediction_months: int
+    ) -> RentPrediction | None:
+        """Run the model (or mock heuristics) without consulting the cache."""
         if self._model is None:
             # Return mock prediction if model not loaded
             return self._generate_mock_prediction(property_data, prediction_months)
@@ -230,7 +318,7 @@ class RentGrowthPredictor:
                 round(period_growth + 1.5, 2),
             ),
             prediction_period_months=prediction_months,
-            model_version="mock_v1",
+            model_version=self.MOCK_MODEL_VERSION,
             prediction_date=datetime.now(UTC).isoformat(),
             features_used={"mock": True},
         )
@@ -5,16 +5,22 @@ Provides collectors for gathering metrics from various system components:
 - System metrics (CPU, memory, disk)
 - Database metrics (connections, queries)
 - Application metrics (users, deals, models)
+
+``CollectorRegistry.start_sampling`` samples all collectors in the
+background so request handlers only read the latest snapshot.
 """
 
 import asyncio
+import contextlib
 import os
 import platform
+from collections import deque
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from loguru import logger
 
+from app.core.config import settings
 from app.services.monitoring.metrics import (
     ACTIVE_USERS,
     DB_CONNECTION_POOL_CHECKED_IN,
@@ -26,9 +32,21 @@ from app.services.monitoring.metrics import (
     REDIS_CONNECTION_POOL_AVAILABLE,
     REDIS_CONNECTION_POOL_IN_USE,
     REDIS_CONNECTION_POOL_SIZE,
+    SYSTEM_CPU_PERCENT,
+    SYSTEM_DISK_PERCENT,
+    SYSTEM_MEMORY_PERCENT,
     UNDERWRITING_MODELS_COUNT,
 )
 
+# Numeric system metrics summarized over the sample window
+SUMMARY_FIELDS: tuple[tuple[str, str], ...] = (
+    ("cpu", "percent"),
+    ("memory", "percent"),
+    ("disk", "percent"),
+    ("process", "memory_mb"),
+    ("process", "cpu_percent"),
+)
+
 
 class SystemMetricsCollector:
     """
@@ -39,22 +57,34 @@ class SystemMetricsCollector:
     - Memory usage (total, available, used)
     - Disk usage
     - Process information
+
+    The psutil probes block, so they run in a worker thread. CPU percent is
+    measured since the previous sample rather than by sleeping. Each sample
+    is kept in a ring buffer so window aggregates (see ``summary``) need no
+    extra probing.
     """
 
-    def __init__(self) -> None:
-        """Initialize system metrics collector."""
+    def __init__(self, max_samples: int = 180) -> None:
+        """Initialize system metrics collector.
+
+        Args:
+            max_samples: Ring buffer capacity (e.g. 15 minutes at 5 s).
+        """
         self._last_collection: datetime | None = None
         self._cache_duration = timedelta(seconds=5)
         self._cached_metrics: dict[str, Any] = {}
+        self._samples: deque[tuple[datetime, dict[str, Any]]] = deque(
+            maxlen=max_samples
+        )
+        self._process: Any = None
 
-    async def collect(self) -> dict[str, Any]:
-        """Collect system metrics."""
-        now = datetime.now(UTC)
-
-        # Return cached if still valid
-        if self._last_collection and now - self._last_collection < self._cache_duration:
-            return self._cached_metrics
+    @property
+    def capacity(self) -> int | None:
+        """Number of samples the ring buffer holds."""
+        return self._samples.maxlen
 
+    def _sample(self, now: datetime) -> dict[str, Any]:
+        """Probe the host; blocking, call from a worker thread."""
         metrics: dict[str, Any] = {
             "timestamp": now.isoformat(),
             "platform": {
@@ -72,9 +102,15 @@ class SystemMetricsCollector:
         try:
             import psutil
 
+            # The first reading has no baseline; take a short blocking one
+            # (in this thread) and measure between samples afterwards
+            first = self._process is None
+            if first:
+                self._process = psutil.Process(os.getpid())
+
             # CPU metrics
             metrics["cpu"] = {
-                "percent": psutil.cpu_percent(interval=0.1),
+                "percent": psutil.cpu_percent(interval=0.1 if first else None),
                 "count": psutil.cpu_count(),
                 "load_avg": os.getloadavg() if hasattr(os, "getloadavg") else None,
             }
@@ -98,24 +134,69 @@ class SystemMetricsCollector:
             }
 
             # Process metrics
-            process = psutil.Process(os.getpid())
+            process = self._process
             metrics["process"]["memory_mb"] = round(
                 process.memory_info().rss / (1024**2), 2
             )
             metrics["process"]["cpu_percent"] = process.cpu_percent()
             metrics["process"]["threads"] = process.num_threads()
 
+            SYSTEM_CPU_PERCENT.set(metrics["cpu"]["percent"])
+            SYSTEM_MEMORY_PERCENT.set(memory.percent)
+            SYSTEM_DISK_PERCENT.set(disk.percent)
+
         except ImportError:
             logger.debug("psutil not available, skipping system metrics")
             metrics["cpu"] = {"available": False}
             metrics["memory"] = {"available": False}
             metrics["disk"] = {"available": False}
 
+        return metrics
+
+    async def collect(self, refresh: bool = False) -> dict[str, Any]:
+        """Collect system metrics.
+
+        Args:
+            refresh: Take a new sample even if the cached one is fresh.
+        """
+        now = datetime.now(UTC)
+
+        # Return cached if still valid
+        if (
+            not refresh
+            and self._last_collection
+            and now - self._last_collection < self._cache_duration
+        ):
+            return self._cached_metrics
+
+        metrics = await asyncio.to_thread(self._sample, now)
+
         self._cached_metrics = metrics
         self._last_collection = now
+        self._samples.append((now, metrics))
 
         return metrics
 
+    def summary(self, minutes: float = 5) -> dict[str, Any]:
+        """Min/max/avg of numeric metrics over the last *minutes* of samples."""
+        cutoff = datetime.now(UTC) - timedelta(minutes=minutes)
+        window = [m for ts, m in self._samples if ts >= cutoff]
+
+        stats: dict[str, Any] = {"minutes": minutes, "samples": len(window)}
+        for group, field in SUMMARY_FIELDS:
+            values = [
+                m[group][field]
+                for m in window
+                if isinstance(m.get(group, {}).get(field), int | float)
+            ]
+            if values:
+                stats[f"{group}_{field}"] = {
+                    "min": min(values),
+                    "max": max(values),
+                    "avg": round(sum(values) / len(values), 2),
+                }
+        return stats
+
 
 class DatabaseMetricsCollector:
     """
@@ -497,27 +578,35 @@ class CollectorRegistry:
     Registry for managing all metric collectors.
 
     Provides centralized access to all collectors and
-    coordinated metric collection.
+    coordinated metric collection. Once ``start_sampling`` is running,
+    collectors are sampled on a fixed interval in the background and
+    ``collect_all`` returns the latest snapshot without probing.
     """
 
-    def __init__(self) -> None:
-        """Initialize collector registry."""
-        self.system = SystemMetricsCollector()
+    def __init__(self, sample_buffer_size: int = 180) -> None:
+        """Initialize collector registry.
+
+        Args:
+            sample_buffer_size: Number of system samples kept for summaries.
+        """
+        self.system = SystemMetricsCollector(max_samples=sample_buffer_size)
         self.database = DatabaseMetricsCollector()
         self.application = ApplicationMetricsCollector()
         self.connection_pool = ConnectionPoolCollector()
+        self._latest: dict[str, Any] | None = None
+        self._sampler_task: asyncio.Task[None] | None = None
 
-    async def collect_all(self) -> dict[str, Any]:
-        """Collect metrics from all collectors."""
+    async def sample(self) -> dict[str, Any]:
+        """Collect metrics from all collectors and store the snapshot."""
         results = await asyncio.gather(
-            self.system.collect(),
+            self.system.collect(refresh=True),
             self.database.collect(),
             self.application.collect(),
             self.connection_pool.collect(),
             return_exceptions=True,
         )
 
-        return {
+        self._latest = {
             "system": results[0]
             if not isinstance(results[0], Exception)
             else {"error": str(results[0])},
@@ -531,6 +620,46 @@ class CollectorRegistry:
             if not isinstance(results[3], Exception)
             else {"error": str(results[3])},
         }
+        return self._latest
+
+    async def collect_all(self) -> dict[str, Any]:
+        """Latest snapshot of all collectors.
+
+        Served from the background sampler when it is running; otherwise
+        the collectors are sampled inline.
+        """
+        if self._sampler_task is not None and self._latest is not None:
+            return self._latest
+        return await self.sample()
+
+    async def start_sampling(self, interval_seconds: float) -> None:
+        """Start the background sampling task."""
+        if self._sampler_task is not None:
+            return  # already running
+        self._sampler_task = asyncio.create_task(self._sample_loop(interval_seconds))
+        logger.info(
+            f"Metrics sampler started (interval={interval_seconds}s, "
+            f"buffer={self.system.capacity} samples)"
+        )
+
+    async def stop_sampling(self) -> None:
+        """Cancel the background sampling task."""
+        if self._sampler_task is None:
+            return
+        self._sampler_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._sampler_task
+        self._sampler_task = None
+        logger.info("Metrics sampler stopped")
+
+    async def _sample_loop(self, interval_seconds: float) -> None:
+        """Loop that samples all collectors on a fixed interval."""
+        while True:
+            try:
+                await self.sample()
+            except Exception as e:
+                logger.error(f"Metrics sampler error: {e}")
+            await asyncio.sleep(interval_seconds)
 
 
 # Singleton registry instance
@@ -541,5 +670,11 @@ def get_collector_registry() -> CollectorRegistry:
     """Get or create the collector registry singleton."""
     global _collector_registry
     if _collector_registry is None:
-        _collector_registry = CollectorRegistry()
+        # Ring buffer sized to hold the configured summary window
+        window_seconds = settings.METRICS_SAMPLE_WINDOW_MINUTES * 60
+        _collector_registry = CollectorRegistry(
+            sample_buffer_size=max(
+                1, int(window_seconds / settings.METRICS_SAMPLE_INTERVAL_SECONDS)
+            )
+        )
     return _collector_registry
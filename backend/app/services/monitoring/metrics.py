@@ -184,6 +184,70 @@ WEBSOCKET_MESSAGES = Counter(
     labelnames=["direction", "channel", "message_type"],
 )
 
+WEBSOCKET_SEND_QUEUE_OVERFLOWS = Counter(
+    name="websocket_send_queue_overflows_total",
+    documentation="Messages that found a connection's send queue full, by action taken",
+    labelnames=["action"],
+)
+
+PROGRESS_EVENTS = Counter(
+    name="websocket_progress_events_total",
+    documentation="Progress stream updates, queued or coalesced into a pending one",
+    labelnames=["outcome"],
+)
+
+
+# =============================================================================
+# System Metrics (updated by the background sampler, see collectors.py)
+# =============================================================================
+
+SYSTEM_CPU_PERCENT = Gauge(
+    name="system_cpu_percent",
+    documentation="Host CPU utilization percent at the latest sample",
+)
+
+SYSTEM_MEMORY_PERCENT = Gauge(
+    name="system_memory_percent",
+    documentation="Host memory utilization percent at the latest sample",
+)
+
+SYSTEM_DISK_PERCENT = Gauge(
+    name="system_disk_percent",
+    documentation="Root filesystem utilization percent at the latest sample",
+)
+
+
+# =============================================================================
+# Auth Metrics
+# =============================================================================
+
+PASSWORD_HASH_QUEUE_DEPTH = Gauge(
+    name="password_hash_queue_depth",
+    documentation="Password hashing jobs queued or running on the hashing pool",
+)
+
+
+# =============================================================================
+# Audit Log Metrics (buffered writer, see app/db/audit_sink.py)
+# =============================================================================
+
+AUDIT_LOG_QUEUE_DEPTH = Gauge(
+    name="audit_log_queue_depth",
+    documentation="Audit/activity log entries queued and not yet written",
+)
+
+AUDIT_LOG_FLUSH_LATENCY = Histogram(
+    name="audit_log_flush_duration_seconds",
+    documentation="Time to write one batch of queued audit/activity log entries",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+AUDIT_LOG_FLUSHED = Counter(
+    name="audit_log_entries_flushed_total",
+    documentation="Audit/activity log entries written by the buffered writer",
+    labelnames=["status"],
+)
+
 
 # =============================================================================
 # Business Metrics
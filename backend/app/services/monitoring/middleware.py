@@ -10,12 +10,10 @@ Provides automatic request/response metrics collection:
 
 import contextlib
 import time
-from collections.abc import Callable
 
 from loguru import logger
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.services.monitoring.metrics import (
     REQUEST_COUNT,
@@ -26,7 +24,7 @@ from app.services.monitoring.metrics import (
 )
 
 
-class MetricsMiddleware(BaseHTTPMiddleware):
+class MetricsMiddleware:
     """
     Middleware that collects HTTP request metrics.
 
@@ -47,45 +45,60 @@ class MetricsMiddleware(BaseHTTPMiddleware):
         "/health",
     }
 
-    def __init__(self, app, exclude_paths: set[str] | None = None):
+    def __init__(self, app: ASGIApp, exclude_paths: set[str] | None = None):
         """Initialize middleware with optional custom exclusions."""
-        super().__init__(app)
+        self.app = app
         self.exclude_paths = exclude_paths or self.EXCLUDED_PATHS
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and collect metrics."""
-        path = request.url.path
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
 
         # Skip metrics for excluded paths
         if path in self.exclude_paths:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Normalize path for metrics (replace IDs with placeholders)
         endpoint = self._normalize_path(path)
-        method = request.method
+        method = scope["method"]
 
         # Track request in progress
         REQUEST_IN_PROGRESS.labels(method=method, endpoint=endpoint).inc()
 
         # Get request body size
         request_size = 0
-        if request.headers.get("content-length"):
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length:
             with contextlib.suppress(ValueError, TypeError):
-                request_size = int(request.headers["content-length"])
+                request_size = int(content_length)
+
+        status_code = 500
+        response_size = 0
+
+        async def send_with_metrics(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+                # Get response body size
+                response_length = Headers(raw=message.get("headers", [])).get(
+                    "content-length"
+                )
+                if response_length:
+                    with contextlib.suppress(ValueError, TypeError):
+                        response_size = int(response_length)
+            await send(message)
 
         # Time the request
         start_time = time.perf_counter()
 
         try:
-            response = await call_next(request)
-            status_code = response.status_code
-
-            # Get response body size
-            response_size = 0
-            if hasattr(response, "headers") and response.headers.get("content-length"):
-                with contextlib.suppress(ValueError, TypeError):
-                    response_size = int(response.headers["content-length"])
-
+            await self.app(scope, receive, send_with_metrics)
         except Exception:
             # Track exceptions as 500 errors
             status_code = 500
@@ -130,8 +143,6 @@ class MetricsMiddleware(BaseHTTPMiddleware):
                     f"(status: {status_code})"
                 )
 
-        return response
-
     def _normalize_path(self, path: str) -> str:
         """
         Normalize path by replacing IDs with placeholders.
@@ -185,7 +196,7 @@ class MetricsMiddleware(BaseHTTPMiddleware):
         return False
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """
     Middleware that logs request details.
 
@@ -194,33 +205,39 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
     EXCLUDED_PATHS = {"/health", "/metrics", "/api/v1/health"}
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Log request and response details."""
-        if request.url.path in self.EXCLUDED_PATHS:
-            return await call_next(request)
+        if scope["type"] != "http" or scope["path"] in self.EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
 
         # Generate request ID
-        request_id = str(id(request))[:8]
+        request_id = str(id(scope))[:8]
 
         # Log request
+        client = scope.get("client")
         logger.info(
-            f"[{request_id}] {request.method} {request.url.path} "
-            f"from {request.client.host if request.client else 'unknown'}"
+            f"[{request_id}] {scope['method']} {scope['path']} "
+            f"from {client[0] if client else 'unknown'}"
         )
 
         start_time = time.perf_counter()
 
-        try:
-            response = await call_next(request)
-            duration = time.perf_counter() - start_time
+        async def send_with_logging(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                duration = time.perf_counter() - start_time
 
-            # Log response
-            logger.info(
-                f"[{request_id}] Response {response.status_code} in {duration:.3f}s"
-            )
-
-            return response
+                # Log response
+                logger.info(
+                    f"[{request_id}] Response {message['status']} in {duration:.3f}s"
+                )
+            await send(message)
 
+        try:
+            await self.app(scope, receive, send_with_logging)
         except Exception as exc:
             duration = time.perf_counter() - start_time
             logger.error(f"[{request_id}] Error after {duration:.3f}s: {exc}")
@@ -0,0 +1,209 @@
+"""
+Coalesced, resumable progress event streams for WebSocket clients.
+
+Extraction runs and SharePoint stage syncs can report progress far faster
+than a browser can use it (per batch of fields, per file, per deal). Each
+producer writes to a named stream instead of sending WebSocket messages:
+
+- ``update(key, data)`` records the latest state for a key (e.g. ``run``,
+  ``file:<path>``, ``deal:<id>``). It is thread-safe and cheap; updates to
+  a key that has not been published yet replace each other.
+- A background task flushes changed keys at most every
+  ``WS_PROGRESS_FLUSH_INTERVAL_SECONDS``, stamping each event with a
+  sequence number that increases within the stream, and sends the stream's
+  rendered messages to its WebSocket channel.
+- A client that reconnects sends ``{"type": "resume", "stream": ...,
+  "after": <last seq seen>}`` and receives only the keys that changed since
+  (their latest state). Finished streams stay resumable for
+  ``WS_PROGRESS_RETENTION_SECONDS``.
+
+Streams live in the process producing the events: runs executed by ARQ
+workers are not streamed (their progress is on the ``ExtractionRun`` row).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from loguru import logger
+
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """Latest state of one key, as of sequence number ``seq``."""
+
+    seq: int
+    key: str
+    data: dict[str, Any]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"seq": self.seq, "key": self.key, **self.data}
+
+
+# render(stream, events) -> WebSocket messages for those events
+RenderFn = Callable[["ProgressStream", list[ProgressEvent]], list[dict[str, Any]]]
+
+
+class ProgressStream:
+    """Latest-state-per-key event stream with sequence numbers."""
+
+    def __init__(self, stream_id: str, channel: str, render: RenderFn) -> None:
+        self.stream_id = stream_id
+        self.channel = channel
+        self.render = render
+        self.closed_at: float | None = None
+        self._lock = threading.Lock()
+        self._seq = 0
+        # Keys updated since the last flush (latest data wins)
+        self._pending: dict[str, dict[str, Any]] = {}
+        # Latest published event per key
+        self._latest: dict[str, ProgressEvent] = {}
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the most recently published event."""
+        return self._seq
+
+    def update(self, key: str, data: dict[str, Any]) -> None:
+        """Record the latest state for *key* (safe to call from any thread)."""
+        from app.services.monitoring.metrics import PROGRESS_EVENTS
+
+        with self._lock:
+            coalesced = key in self._pending
+            self._pending[key] = data
+        PROGRESS_EVENTS.labels(outcome="coalesced" if coalesced else "queued").inc()
+
+    def drain(self) -> list[ProgressEvent]:
+        """Assign sequence numbers to pending updates and return them in order."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            events = []
+            for key, data in pending.items():
+                self._seq += 1
+                event = ProgressEvent(self._seq, key, data)
+                self._latest[key] = event
+                events.append(event)
+        return events
+
+    def events_since(self, after: int) -> list[ProgressEvent]:
+        """Latest published event for every key that changed after *after*."""
+        with self._lock:
+            events = [e for e in self._latest.values() if e.seq > after]
+        return sorted(events, key=lambda e: e.seq)
+
+
+class ProgressStreams:
+    """Registry of live streams and the task publishing them at a fixed rate."""
+
+    def __init__(self, flush_interval: float, retention_seconds: float) -> None:
+        self.flush_interval = flush_interval
+        self.retention_seconds = retention_seconds
+        self._streams: dict[str, ProgressStream] = {}
+        self._lock = threading.Lock()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def open(self, stream_id: str, channel: str, render: RenderFn) -> ProgressStream:
+        """Get the stream with this ID, creating it if needed."""
+        with self._lock:
+            stream = self._streams.get(stream_id)
+            if stream is None:
+                stream = ProgressStream(stream_id, channel, render)
+                self._streams[stream_id] = stream
+            return stream
+
+    def get(self, stream_id: str) -> ProgressStream | None:
+        return self._streams.get(stream_id)
+
+    def close(self, stream_id: str) -> None:
+        """Mark a stream finished; it stays resumable for the retention period.
+
+        Without a running flusher nothing would publish or expire it, so it
+        is dropped immediately.
+        """
+        with self._lock:
+            stream = self._streams.get(stream_id)
+            if stream is None:
+                return
+            if self._task is None:
+                del self._streams[stream_id]
+            else:
+                stream.closed_at = time.monotonic()
+
+    async def flush(self) -> int:
+        """Publish pending updates of every stream. Returns events published."""
+        with self._lock:
+            streams = list(self._streams.values())
+        published = 0
+        for stream in streams:
+            published += await self.publish(stream)
+        self._expire()
+        return published
+
+    async def publish(self, stream: ProgressStream) -> int:
+        """Publish one stream's pending updates now. Returns events published."""
+        from app.services.websocket_manager import get_connection_manager
+
+        events = stream.drain()
+        if not events:
+            return 0
+        try:
+            manager = get_connection_manager()
+            for message in stream.render(stream, events):
+                await manager.send_to_channel(stream.channel, message)
+        except Exception:
+            # Fire-and-forget: clients can resume from the last seq
+            logger.opt(exception=True).warning(
+                "progress_publish_failed", stream=stream.stream_id
+            )
+        return len(events)
+
+    def _expire(self) -> None:
+        cutoff = time.monotonic() - self.retention_seconds
+        with self._lock:
+            for stream_id, stream in list(self._streams.items()):
+                if stream.closed_at is not None and stream.closed_at < cutoff:
+                    del self._streams[stream_id]
+
+    # ── Background publisher ──────────────────────────────────────────────
+
+    async def start(self) -> None:
+        """Start publishing streams every ``flush_interval`` seconds."""
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.info("progress_streams_started", flush_interval=self.flush_interval)
+
+    async def stop(self) -> None:
+        """Stop the publisher after a final flush."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        await self.flush()
+        logger.info("progress_streams_stopped")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+
+# Global singleton instance
+progress_streams = ProgressStreams(
+    flush_interval=settings.WS_PROGRESS_FLUSH_INTERVAL_SECONDS,
+    retention_seconds=settings.WS_PROGRESS_RETENTION_SECONDS,
+)
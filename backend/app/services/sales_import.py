@@ -17,6 +17,7 @@ from sqlalchemy import func, text
 from sqlalchemy.orm import Session
 
 from app.models.sales_data import SalesData
+from app.services.sales_rollup import refresh_sales_rollup
 
 # Exact mapping from CoStar Excel headers to database column names
 COSTAR_COLUMN_MAP = {
@@ -408,6 +409,7 @@ def import_sales_file(
             result.rows_imported += 1
 
     db.commit()
+    refresh_sales_rollup(db)
 
     # Log warnings for zero/negative prices
     zero_prices = (
@@ -0,0 +1,169 @@
+"""
+Pre-aggregated sales analytics rollup.
+
+``sales_rollup`` holds one row per (submarket, sale month, unit-size bucket,
+vintage bucket, star rating) with counts and sums, rebuilt from
+``sales_data`` by ``refresh_sales_rollup`` after every import. The sales
+analytics endpoints answer from it when their filters can be expressed on
+those dimensions; any other filter (search, price ranges, unit/vintage/date
+bounds inside a bucket) falls back to scanning ``sales_data``.
+
+Bucket labels match the ``/analytics/distributions`` buckets, so both paths
+return the same labels.
+"""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+from loguru import logger
+from sqlalchemy import CursorResult, case, delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.sales_data import SalesData, SalesRollup
+
+UNKNOWN = "Unknown"
+
+# (label, lowest value, highest value), inclusive; None is unbounded
+UNIT_BUCKETS: list[tuple[str, int | None, int | None]] = [
+    ("1-50", 1, 50),
+    ("51-100", 51, 100),
+    ("101-200", 101, 200),
+    ("201-500", 201, 500),
+    ("500+", 501, None),
+]
+VINTAGE_BUCKETS: list[tuple[str, int | None, int | None]] = [
+    ("Pre-1990", None, 1989),
+    ("1990-2005", 1990, 2004),
+    ("2005-2020", 2005, 2019),
+    ("Post-2020", 2020, None),
+]
+
+
+def _bucket_expr(column: Any, buckets: list[tuple[str, int | None, int | None]]):
+    whens = []
+    for label, low, high in buckets:
+        if low is None:
+            whens.append((column <= high, label))
+        elif high is None:
+            whens.append((column >= low, label))
+        else:
+            whens.append((column.between(low, high), label))
+    return case(*whens, else_=UNKNOWN)
+
+
+def unit_bucket(column: Any = SalesData.number_of_units):
+    """SQL expression labelling a unit count with its ``UNIT_BUCKETS`` label."""
+    return _bucket_expr(column, UNIT_BUCKETS)
+
+
+def vintage_bucket(column: Any = SalesData.year_built):
+    """SQL expression labelling a year built with its ``VINTAGE_BUCKETS`` label."""
+    return _bucket_expr(column, VINTAGE_BUCKETS)
+
+
+def _month_start(db: Session, column: Any):
+    if db.get_bind().dialect.name == "postgresql":
+        return func.date_trunc("month", column).cast(SalesRollup.sale_month.type)
+    return func.date(column, "start of month")
+
+
+def refresh_sales_rollup(db: Session) -> int:
+    """Rebuild ``sales_rollup`` from ``sales_data``. Returns rows written.
+
+    Readers keep seeing the previous rollup until the transaction commits.
+    """
+    # Label rows in a subquery so the GROUP BY is on plain columns
+    rows = select(
+        SalesData.submarket_cluster,
+        _month_start(db, SalesData.sale_date).label("sale_month"),
+        unit_bucket().label("unit_bucket"),
+        vintage_bucket().label("vintage_bucket"),
+        SalesData.star_rating,
+        SalesData.sale_price,
+        SalesData.price_per_unit,
+        SalesData.actual_cap_rate,
+        SalesData.avg_unit_sf,
+        SalesData.property_name,
+        SalesData.number_of_units,
+    ).subquery()
+    dimensions = (
+        rows.c.submarket_cluster,
+        rows.c.sale_month,
+        rows.c.unit_bucket,
+        rows.c.vintage_bucket,
+        rows.c.star_rating,
+    )
+    source = select(
+        *dimensions,
+        func.count(),
+        func.coalesce(func.sum(rows.c.sale_price), 0),
+        func.coalesce(func.sum(rows.c.price_per_unit), 0),
+        func.count(rows.c.price_per_unit),
+        func.count(rows.c.sale_price),
+        func.count(rows.c.actual_cap_rate),
+        func.count(rows.c.avg_unit_sf),
+        func.count(rows.c.property_name),
+        func.count(case((rows.c.sale_price <= 1, 1))),
+        func.count(case((rows.c.number_of_units > 800, 1))),
+    ).group_by(*dimensions)
+
+    db.execute(delete(SalesRollup))
+    stmt = insert(SalesRollup).from_select(
+        [
+            "submarket_cluster",
+            "sale_month",
+            "unit_bucket",
+            "vintage_bucket",
+            "star_rating",
+            "sales_count",
+            "total_volume",
+            "price_per_unit_sum",
+            "price_per_unit_count",
+            "sale_price_count",
+            "cap_rate_count",
+            "avg_unit_sf_count",
+            "property_name_count",
+            "dollar_one_sales",
+            "high_unit_sales",
+        ],
+        source,
+    )
+    result = cast(CursorResult[Any], db.execute(stmt))
+    db.commit()
+    logger.info("sales_rollup_refreshed", rows=result.rowcount)
+    return result.rowcount
+
+
+def bucket_labels(
+    buckets: list[tuple[str, int | None, int | None]],
+    min_val: int | None,
+    max_val: int | None,
+) -> list[str] | None:
+    """Labels of the buckets covering exactly ``[min_val, max_val]``.
+
+    Returns None when a bound falls inside a bucket or outside the buckets'
+    range (the rollup cannot answer: values there are filed as Unknown, but
+    the raw scan matches them). Unknown values never match a range filter.
+    """
+    first_low, last_high = buckets[0][1], buckets[-1][2]
+    for bound in (min_val, max_val):
+        if bound is not None and (
+            (first_low is not None and bound < first_low)
+            or (last_high is not None and bound > last_high)
+        ):
+            return None
+
+    labels = []
+    for label, low, high in buckets:
+        inside = (min_val is None or (low is not None and low >= min_val)) and (
+            max_val is None or (high is not None and high <= max_val)
+        )
+        outside = (max_val is not None and low is not None and low > max_val) or (
+            min_val is not None and high is not None and high < min_val
+        )
+        if inside:
+            labels.append(label)
+        elif not outside:
+            return None
+    return labels
@@ -122,8 +122,9 @@ async def change_deal_stage(
 ) -> StageChangeLog:
     """Record a deal stage transition and update the deal.
 
-    Sets ``deal.stage``, ``deal.stage_updated_at``, and creates a
-    ``StageChangeLog`` audit record.  The caller is responsible for
+    Sets ``deal.stage``, ``deal.stage_updated_at``, creates a
+    ``StageChangeLog`` audit record and updates the deal's
+    ``DealStageInterval`` rows.  The caller is responsible for
     committing the transaction.
 
     Args:
@@ -138,12 +139,17 @@ async def change_deal_stage(
         The newly created StageChangeLog entry.
     """
     from app.models.stage_change_log import StageChangeLog
+    from app.services.deal_cycle_times import record_stage_transition
 
     old_stage = deal.stage
+    changed_at = datetime.now(UTC)
+
+    # Maintain stage intervals for cycle-time analytics (reads the old stage)
+    await record_stage_transition(db, deal, new_stage, changed_at)
 
     # Update the deal
     deal.stage = new_stage
-    deal.stage_updated_at = datetime.now(UTC)
+    deal.stage_updated_at = changed_at
 
     # Create audit log entry
     log_entry = StageChangeLog(
@@ -184,11 +190,15 @@ def change_deal_stage_sync(
     The caller is responsible for committing the transaction.
     """
     from app.models.stage_change_log import StageChangeLog
+    from app.services.deal_cycle_times import record_stage_transition_sync
 
     old_stage = deal.stage
+    changed_at = datetime.now(UTC)
+
+    record_stage_transition_sync(db, deal, new_stage, changed_at)
 
     deal.stage = new_stage
-    deal.stage_updated_at = datetime.now(UTC)
+    deal.stage_updated_at = changed_at
 
     log_entry = StageChangeLog(
         deal_id=deal.id,
@@ -0,0 +1,213 @@
+"""
+Cross-process fan-out for WebSocket messages over Redis pub/sub.
+
+``ConnectionManager`` only knows the sockets connected to its own process.
+The broker lets a message sent on one worker or replica reach clients
+connected to any other:
+
+- The sending process delivers to its local subscribers directly and
+  publishes the message once to Redis (``ws:channel:<name>``,
+  ``ws:user:<id>`` or ``ws:broadcast``).
+- Every process holds a single pub/sub connection, subscribed to the Redis
+  channels its local connections need: a WebSocket channel or user is
+  subscribed when its first local connection arrives and unsubscribed when
+  the last one leaves. There is no per-connection Redis subscription.
+- Received messages are handed to ``deliver`` for local delivery; messages
+  a process published itself are skipped, as they were delivered locally.
+
+Without Redis (``WS_FANOUT_ENABLED`` off, Redis not configured or
+unreachable, or ``start`` not called), publishing is a no-op and delivery
+is process-local.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+    from redis.asyncio.client import PubSub
+
+REDIS_CHANNEL_PREFIX = "ws"
+BROADCAST_TOPIC = "broadcast"
+
+# deliver(kind, target, message, exclude) -> local send count.
+# kind is "channel", "user" or "broadcast"; target is the channel name,
+# user ID or "" respectively.
+DeliverFn = Callable[[str, str, dict, str | None], Awaitable[int]]
+
+
+def _topic(kind: str, target: str | int = "") -> str:
+    if kind == BROADCAST_TOPIC:
+        return f"{REDIS_CHANNEL_PREFIX}:{BROADCAST_TOPIC}"
+    return f"{REDIS_CHANNEL_PREFIX}:{kind}:{target}"
+
+
+class WebSocketBroker:
+    """Per-process Redis pub/sub bridge for ``ConnectionManager``."""
+
+    # Seconds to wait before resubscribing after a Redis error
+    LISTENER_RETRY_SECONDS = 5.0
+
+    def __init__(self, deliver: DeliverFn):
+        self._deliver = deliver
+        self.process_id = uuid.uuid4().hex
+        self._redis: Redis | None = None
+        self._pubsub: PubSub | None = None
+        self._listener_task: asyncio.Task[None] | None = None
+        # Redis channels this process needs, always including broadcast
+        self._topics: set[str] = {_topic(BROADCAST_TOPIC)}
+
+    @property
+    def active(self) -> bool:
+        """Whether messages are being fanned out through Redis."""
+        return self._listener_task is not None
+
+    # ── Lifecycle ─────────────────────────────────────────────────────────
+
+    async def start(self) -> None:
+        """Connect to Redis and start receiving messages from other processes."""
+        if (
+            self._listener_task is not None
+            or not settings.WS_FANOUT_ENABLED
+            or not settings.REDIS_URL
+        ):
+            return
+        try:
+            client = self._redis
+            if client is None:
+                import redis.asyncio as aioredis
+
+                client = aioredis.from_url(
+                    settings.REDIS_URL,
+                    decode_responses=True,
+                    socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+                )
+                self._redis = client
+            await client.ping()
+        except Exception as e:
+            logger.warning(
+                f"WebSocket broker: Redis unavailable ({e}), "
+                "live updates are process-local"
+            )
+            self._redis = None
+            return
+
+        ready = asyncio.Event()
+        self._listener_task = asyncio.create_task(self._listen(ready))
+        await ready.wait()
+        logger.info("WebSocket broker: cross-process fan-out started")
+
+    async def stop(self) -> None:
+        """Stop receiving messages and close the Redis connection."""
+        if self._listener_task is None:
+            return
+        self._listener_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._listener_task
+        self._listener_task = None
+        if self._redis is not None:
+            with contextlib.suppress(Exception):
+                await self._redis.aclose()
+            self._redis = None
+        logger.info("WebSocket broker: cross-process fan-out stopped")
+
+    # ── Subscriptions ─────────────────────────────────────────────────────
+
+    async def watch(self, kind: str, target: str | int) -> None:
+        """Receive messages for a channel/user that now has local connections."""
+        topic = _topic(kind, target)
+        if topic in self._topics:
+            return
+        self._topics.add(topic)
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.subscribe(topic)
+            except Exception as e:
+                # The listener resubscribes to all topics on reconnect
+                logger.warning(f"WebSocket broker: subscribe {topic} failed: {e}")
+
+    async def unwatch(self, kind: str, target: str | int) -> None:
+        """Stop receiving messages for a channel/user with no local connections."""
+        topic = _topic(kind, target)
+        if topic not in self._topics:
+            return
+        self._topics.discard(topic)
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.unsubscribe(topic)
+            except Exception as e:
+                logger.warning(f"WebSocket broker: unsubscribe {topic} failed: {e}")
+
+    # ── Publish / receive ─────────────────────────────────────────────────
+
+    async def publish(
+        self,
+        kind: str,
+        target: str | int,
+        message: dict,
+        exclude: str | None = None,
+    ) -> None:
+        """Send a message to the other processes (local delivery is the caller's)."""
+        if self._redis is None or self._listener_task is None:
+            return
+        envelope = {
+            "origin": self.process_id,
+            "kind": kind,
+            "target": str(target),
+            "exclude": exclude,
+            "message": message,
+        }
+        try:
+            await self._redis.publish(
+                _topic(kind, target), json.dumps(envelope, default=str)
+            )
+        except Exception as e:
+            logger.error(f"WebSocket broker: publish failed: {e}")
+
+    async def _handle(self, data: str) -> None:
+        envelope: dict[str, Any] = json.loads(data)
+        if envelope.get("origin") == self.process_id:
+            return
+        await self._deliver(
+            envelope["kind"],
+            envelope["target"],
+            envelope["message"],
+            envelope.get("exclude"),
+        )
+
+    async def _listen(self, ready: asyncio.Event) -> None:
+        """Hold the pub/sub connection, resubscribing on errors."""
+        redis = self._redis
+        if redis is None:
+            return
+        while True:
+            try:
+                pubsub = redis.pubsub()
+                await pubsub.subscribe(*self._topics)
+                self._pubsub = pubsub
+                ready.set()
+                try:
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        try:
+                            await self._handle(message["data"])
+                        except Exception as e:
+                            logger.warning(f"WebSocket broker: bad message: {e}")
+                finally:
+                    self._pubsub = None
+                    await pubsub.aclose()
+            except Exception as e:
+                logger.error(f"WebSocket broker: listener error: {e}")
+                ready.set()
+                await asyncio.sleep(self.LISTENER_RETRY_SECONDS)
@@ -9,14 +9,20 @@ Provides channel-based connection pooling for:
 Features:
 - Named channels (rooms) for topic-based subscriptions
 - Per-client connection limits to prevent resource exhaustion
-- Broadcast to all connections in a channel
+- Broadcast to all connections in a channel, serialized once per message
+- Per-connection bounded send queue drained by its own writer task, so a
+  slow client never delays the others (see WS_SLOW_CONSUMER_POLICY)
 - Send to specific connection or user
 - Connection lifecycle management with heartbeat/ping-pong
 - Graceful cleanup on disconnect
+- Cross-worker/replica delivery via Redis pub/sub (see websocket_broker)
 """
 
 import asyncio
+import json
 import uuid
+from collections import deque
+from collections.abc import Hashable, Iterable
 from datetime import UTC, datetime
 from enum import StrEnum
 from typing import Any
@@ -25,6 +31,7 @@ from fastapi import WebSocket
 from loguru import logger
 
 from app.core.config import settings
+from app.services.websocket_broker import BROADCAST_TOPIC, WebSocketBroker
 
 
 class Channel(StrEnum):
@@ -37,6 +44,81 @@ class Channel(StrEnum):
     ANALYTICS = "analytics"
 
 
+# Fields identifying the entity a message is about. Under the "coalesce"
+# policy a newer message of the same type for the same entity replaces the
+# queued one.
+_COALESCE_ID_FIELDS = ("deal_id", "extraction_id", "property_id")
+
+
+def _encode(message: dict) -> str:
+    """Serialize a message once for all recipients (same format as send_json)."""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def _coalesce_key(message: dict) -> Hashable | None:
+    for field in _COALESCE_ID_FIELDS:
+        if field in message:
+            return (message.get("type"), field, message[field])
+    return None
+
+
+class _Outbox:
+    """Bounded queue of encoded messages for one connection."""
+
+    def __init__(self, maxsize: int, policy: str) -> None:
+        self.maxsize = maxsize
+        self.policy = policy
+        self.closed = False
+        self._items: deque[tuple[Hashable | None, str]] = deque()
+        self._ready = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, text: str, key: Hashable | None = None) -> bool:
+        """Queue a message. Returns False if the outbox is (now) closed."""
+        if self.closed:
+            return False
+        if len(self._items) >= self.maxsize and not self._overflow(key):
+            return False
+        self._items.append((key, text))
+        self._ready.set()
+        return True
+
+    async def get(self) -> str | None:
+        """Wait for the next message; None once the outbox is closed."""
+        while not self._items and not self.closed:
+            self._ready.clear()
+            await self._ready.wait()
+        if self.closed:
+            return None
+        return self._items.popleft()[1]
+
+    def close(self) -> None:
+        self.closed = True
+        self._items.clear()
+        self._ready.set()
+
+    def _overflow(self, key: Hashable | None) -> bool:
+        """Apply the slow-consumer policy to a full queue."""
+        from app.services.monitoring.metrics import WEBSOCKET_SEND_QUEUE_OVERFLOWS
+
+        action = "dropped_oldest"
+        if self.policy == "disconnect":
+            self.close()
+            action = "disconnected"
+        elif self.policy == "coalesce" and key is not None:
+            for i, (queued_key, _) in enumerate(self._items):
+                if queued_key == key:
+                    del self._items[i]
+                    action = "coalesced"
+                    break
+        if action == "dropped_oldest":
+            self._items.popleft()
+        WEBSOCKET_SEND_QUEUE_OVERFLOWS.labels(action=action).inc()
+        return not self.closed
+
+
 class ConnectionManager:
     """
     WebSocket connection manager that tracks active connections
@@ -51,6 +133,8 @@ class ConnectionManager:
     def __init__(
         self,
         max_connections_per_client: int | None = None,
+        send_queue_size: int | None = None,
+        slow_consumer_policy: str | None = None,
     ) -> None:
         # Active connections: {connection_id: WebSocket}
         self._connections: dict[str, WebSocket] = {}
@@ -62,10 +146,21 @@ class ConnectionManager:
         self._metadata: dict[str, dict[str, Any]] = {}
         # Heartbeat tasks: {connection_id: Task}
         self._heartbeat_tasks: dict[str, asyncio.Task[None]] = {}
+        # Outbound queues and the tasks writing them to the socket
+        self._outboxes: dict[str, _Outbox] = {}
+        self._writer_tasks: dict[str, asyncio.Task[None]] = {}
+        # Disconnects of slow consumers in progress
+        self._closing_tasks: set[asyncio.Task[None]] = set()
+        self._send_queue_size = send_queue_size or settings.WS_SEND_QUEUE_SIZE
+        self._slow_consumer_policy = (
+            slow_consumer_policy or settings.WS_SLOW_CONSUMER_POLICY
+        )
         # Per-client limit
         self._max_connections_per_client = (
             max_connections_per_client or self.DEFAULT_MAX_CONNECTIONS_PER_CLIENT
         )
+        # Fan-out to connections held by other processes
+        self.broker = WebSocketBroker(deliver=self._deliver_remote)
 
     @property
     def connection_count(self) -> int:
@@ -135,17 +230,23 @@ class ConnectionManager:
             "channels": list(channels or []),
             "last_heartbeat": datetime.now(UTC).isoformat(),
         }
+        outbox = _Outbox(self._send_queue_size, self._slow_consumer_policy)
+        self._outboxes[connection_id] = outbox
+        self._writer_tasks[connection_id] = asyncio.create_task(
+            self._writer_loop(connection_id, websocket, outbox)
+        )
 
         # Track user connections
         if user_id is not None:
             if user_id not in self._user_connections:
                 self._user_connections[user_id] = set()
+                await self.broker.watch("user", user_id)
             self._user_connections[user_id].add(connection_id)
 
         # Subscribe to channels
         if channels:
             for channel in channels:
-                self._add_to_channel(connection_id, channel)
+                await self._add_to_channel(connection_id, channel)
 
         # Start heartbeat
         self._heartbeat_tasks[connection_id] = asyncio.create_task(
@@ -184,6 +285,15 @@ class ConnectionManager:
         if task is not None:
             task.cancel()
 
+        # Discard queued messages and stop the writer (unless it is the
+        # writer disconnecting after a failed send)
+        outbox = self._outboxes.pop(connection_id, None)
+        if outbox is not None:
+            outbox.close()
+        writer = self._writer_tasks.pop(connection_id, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+
         # Get metadata before cleanup
         metadata = self._metadata.get(connection_id, {})
         user_id = metadata.get("user_id")
@@ -193,12 +303,11 @@ class ConnectionManager:
             self._user_connections[user_id].discard(connection_id)
             if not self._user_connections[user_id]:
                 del self._user_connections[user_id]
+                await self.broker.unwatch("user", user_id)
 
         # Remove from all channels
         for channel in list(self._channels.keys()):
-            self._channels[channel].discard(connection_id)
-            if not self._channels[channel]:
-                del self._channels[channel]
+            await self._remove_from_channel(connection_id, channel)
 
         # Close WebSocket
         try:
@@ -215,15 +324,24 @@ class ConnectionManager:
 
     # ==================== Channel Management ====================
 
-    def _add_to_channel(self, connection_id: str, channel: str) -> None:
+    async def _add_to_channel(self, connection_id: str, channel: str) -> None:
         """Add a connection to a channel (internal, no message sent)."""
         if channel not in self._channels:
             self._channels[channel] = set()
+            await self.broker.watch("channel", channel)
         self._channels[channel].add(connection_id)
 
+    async def _remove_from_channel(self, connection_id: str, channel: str) -> None:
+        """Remove a connection from a channel, dropping the channel when empty."""
+        if channel in self._channels:
+            self._channels[channel].discard(connection_id)
+            if not self._channels[channel]:
+                del self._channels[channel]
+                await self.broker.unwatch("channel", channel)
+
     async def subscribe(self, connection_id: str, channel: str) -> None:
         """Subscribe a connection to a channel."""
-        self._add_to_channel(connection_id, channel)
+        await self._add_to_channel(connection_id, channel)
 
         # Update metadata
         if connection_id in self._metadata:
@@ -235,10 +353,7 @@ class ConnectionManager:
 
     async def unsubscribe(self, connection_id: str, channel: str) -> None:
         """Unsubscribe a connection from a channel."""
-        if channel in self._channels:
-            self._channels[channel].discard(connection_id)
-            if not self._channels[channel]:
-                del self._channels[channel]
+        await self._remove_from_channel(connection_id, channel)
 
         if connection_id in self._metadata:
             channels = self._metadata[connection_id].get("channels", [])
@@ -249,31 +364,54 @@ class ConnectionManager:
 
     # ==================== Message Sending ====================
 
-    async def _send_json(self, connection_id: str, message: dict) -> bool:
-        """Send a JSON message to a specific connection. Returns True on success."""
-        ws = self._connections.get(connection_id)
-        if ws is None:
+    def _enqueue(
+        self, connection_id: str, text: str, key: Hashable | None = None
+    ) -> bool:
+        """Queue an encoded message for a connection. Returns True if queued."""
+        outbox = self._outboxes.get(connection_id)
+        if outbox is None or outbox.closed:
             return False
-        try:
-            await ws.send_json(message)
+        if outbox.put(text, key):
             return True
+        # Queue full under the "disconnect" policy. The writer may be stuck
+        # in a send to this client, so close the connection from outside it.
+        logger.warning(
+            f"Disconnecting slow WebSocket consumer {connection_id} (send queue full)"
+        )
+        task = asyncio.create_task(self.disconnect(connection_id))
+        self._closing_tasks.add(task)
+        task.add_done_callback(self._closing_tasks.discard)
+        return False
+
+    async def _send_json(self, connection_id: str, message: dict) -> bool:
+        """Queue a JSON message for a specific connection. Returns True if queued."""
+        return self._enqueue(connection_id, _encode(message), _coalesce_key(message))
+
+    async def _writer_loop(
+        self, connection_id: str, websocket: WebSocket, outbox: _Outbox
+    ) -> None:
+        """Write queued messages to the socket until the outbox is closed."""
+        try:
+            while (text := await outbox.get()) is not None:
+                await websocket.send_text(text)
+        except asyncio.CancelledError:
+            pass
         except Exception as e:
             logger.warning(f"Send failed for {connection_id}: {e}")
             await self.disconnect(connection_id)
-            return False
 
     async def send_to_connection(self, connection_id: str, message: dict) -> bool:
         """Send a message to a specific connection by ID."""
         return await self._send_json(connection_id, message)
 
     async def send_to_user(self, user_id: int, message: dict) -> int:
-        """Send a message to all connections belonging to a user. Returns send count."""
-        sent = 0
-        conn_ids = self._user_connections.get(user_id, set()).copy()
-        for cid in conn_ids:
-            if await self._send_json(cid, message):
-                sent += 1
-        return sent
+        """Send a message to all connections belonging to a user.
+
+        Connections held by other processes receive it via the broker.
+        Returns the local send count.
+        """
+        await self.broker.publish("user", user_id, message)
+        return self._deliver_to_user(user_id, message)
 
     async def send_to_channel(
         self,
@@ -281,21 +419,55 @@ class ConnectionManager:
         message: dict,
         exclude: str | None = None,
     ) -> int:
-        """Broadcast a message to all connections in a channel. Returns send count."""
-        sent = 0
-        conn_ids = self._channels.get(channel, set()).copy()
-        for cid in conn_ids:
-            if cid != exclude and await self._send_json(cid, message):
-                sent += 1
-        return sent
+        """Broadcast a message to all connections in a channel.
+
+        Connections held by other processes receive it via the broker.
+        Returns the local send count.
+        """
+        await self.broker.publish("channel", channel, message, exclude)
+        return self._deliver_to_channel(channel, message, exclude)
 
     async def broadcast(self, message: dict, exclude: str | None = None) -> int:
-        """Broadcast a message to every active connection. Returns send count."""
-        sent = 0
-        for cid in list(self._connections.keys()):
-            if cid != exclude and await self._send_json(cid, message):
-                sent += 1
-        return sent
+        """Broadcast a message to every active connection.
+
+        Connections held by other processes receive it via the broker.
+        Returns the local send count.
+        """
+        await self.broker.publish(BROADCAST_TOPIC, "", message, exclude)
+        return self._deliver_to_all(message, exclude)
+
+    def _deliver_to_user(self, user_id: int, message: dict) -> int:
+        return self._deliver(self._user_connections.get(user_id, ()), message)
+
+    def _deliver_to_channel(
+        self, channel: str, message: dict, exclude: str | None = None
+    ) -> int:
+        return self._deliver(self._channels.get(channel, ()), message, exclude)
+
+    def _deliver_to_all(self, message: dict, exclude: str | None = None) -> int:
+        return self._deliver(self._connections, message, exclude)
+
+    def _deliver(
+        self,
+        connection_ids: Iterable[str],
+        message: dict,
+        exclude: str | None = None,
+    ) -> int:
+        """Encode a message once and queue it for each connection."""
+        text, key = _encode(message), _coalesce_key(message)
+        return sum(
+            self._enqueue(cid, text, key) for cid in connection_ids if cid != exclude
+        )
+
+    async def _deliver_remote(
+        self, kind: str, target: str, message: dict, exclude: str | None
+    ) -> int:
+        """Deliver a message published by another process to local connections."""
+        if kind == "channel":
+            return self._deliver_to_channel(target, message, exclude)
+        if kind == "user":
+            return self._deliver_to_user(int(target), message)
+        return self._deliver_to_all(message, exclude)
 
     # ==================== Heartbeat ====================
 
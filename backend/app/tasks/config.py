@@ -61,7 +61,11 @@ def _get_task_functions() -> list:  # type: ignore[type-arg]
 
     Deferred import avoids circular dependencies at module load time.
     """
-    from app.tasks.extraction import run_extraction_task
+    from app.tasks.extraction import (
+        extract_file_task,
+        finalize_extraction_task,
+        run_extraction_task,
+    )
     from app.tasks.market_data import (
         refresh_all_market_data_task,
         refresh_census_data_task,
@@ -77,6 +81,8 @@ def _get_task_functions() -> list:  # type: ignore[type-arg]
         refresh_all_market_data_task,
         generate_report_task,
         run_extraction_task,
+        extract_file_task,
+        finalize_extraction_task,
     ]
 
 
@@ -1,16 +1,90 @@
 """
 ARQ task definitions for proforma extraction.
 
-Thin wrapper around the existing extraction pipeline in
-``app.api.v1.endpoints.extraction.common``.
+An extraction run is fanned out across workers so throughput scales with
+the number of worker processes:
+
+- ``run_extraction_task`` discovers the run's files, records the job count
+  on the ``ExtractionRun`` row and enqueues one ``extract_file_task`` per
+  file.
+- ``extract_file_task`` fetches (SharePoint, via the shared workbook
+  store), extracts and persists a single file on whichever worker picks it
+  up, then records its outcome on the run. A job that errors, times out or
+  is cancelled on its last try records the file as failed, so the run
+  still completes.
+- The job that completes the run enqueues ``finalize_extraction_task``
+  (fan-in), which syncs and hydrates properties once and marks the run
+  completed.
+
+When run inline without Redis (see ``app.tasks.fallback``) there is no
+queue to fan out to, so the whole run is processed in-process by
+``common.run_extraction_task``.
 """
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import asdict
+from datetime import UTC, datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
+from uuid import UUID
 
 from loguru import logger
 
+# Deduplicates the fan-in job if several file jobs observe completion
+FINALIZE_JOB_ID = "extraction-finalize:{run_id}"
+
+# A file job gives up this long before ARQ's job timeout, leaving time to
+# record the file as failed
+FILE_JOB_TIMEOUT_MARGIN_SECONDS = 30
+
+
+@lru_cache(maxsize=1)
+def _get_mappings() -> dict:
+    """Cell mappings, parsed once per worker process."""
+    from app.api.v1.endpoints.extraction.common import load_extraction_mappings
+
+    return load_extraction_mappings()
+
+
+async def _discover_files(source: str, file_paths: list[str] | None) -> list[dict]:
+    """Build serializable per-file job payloads for a run."""
+    from app.api.v1.endpoints.extraction import common
+
+    if source == "sharepoint":
+        sharepoint_files = await common.discover_sharepoint_files()
+        return [
+            {
+                "file_path": sp_file.path,
+                "deal_name": sp_file.deal_name,
+                "deal_stage": sp_file.deal_stage,
+                "sharepoint_path": sp_file.path,
+                "sharepoint_file": asdict(sp_file),
+            }
+            for sp_file in sharepoint_files
+        ]
+
+    return await asyncio.to_thread(common.local_files_to_process, source, file_paths)
+
+
+def _start_run(run_id: UUID, jobs_total: int, error: str | None = None) -> None:
+    """Record the fan-out size, or close the run if there is nothing to do."""
+    from app.crud.extraction import ExtractionRunCRUD
+    from app.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        if error is not None:
+            ExtractionRunCRUD.fail(db, run_id, {"error": error})
+        elif jobs_total == 0:
+            ExtractionRunCRUD.complete(db, run_id, files_processed=0, files_failed=0)
+        else:
+            ExtractionRunCRUD.start_fan_out(db, run_id, jobs_total)
+    finally:
+        db.close()
+
 
 async def run_extraction_task(
     ctx: dict[str, Any],
@@ -18,20 +92,17 @@ async def run_extraction_task(
     source: str = "local",
     file_paths: list[str] | None = None,
 ) -> dict[str, Any]:
-    """ARQ task: Run proforma extraction for a batch of files.
-
-    Wraps ``common.run_extraction_task`` from the extraction endpoints.
-    This is the same function that BackgroundTasks currently calls,
-    now dispatchable via ARQ.
+    """ARQ task: Fan an extraction run out into per-file jobs.
 
     Args:
-        ctx: ARQ job context (contains job_id, etc.).
+        ctx: ARQ job context (contains job_id and, under a worker, redis).
         run_id: UUID of the ExtractionRun record (as string).
         source: Extraction source ("local", "sharepoint").
         file_paths: Optional list of specific file paths to process.
 
     Returns:
-        Dictionary with extraction result summary.
+        Dictionary with the run ID, source, status and number of file jobs
+        enqueued ("fanned_out"), or "completed" when run inline.
     """
     job_id = ctx.get("job_id", "unknown")
     logger.info(
@@ -39,18 +110,309 @@ async def run_extraction_task(
         f"source={source} files={len(file_paths) if file_paths else 'auto'}"
     )
 
-    from uuid import UUID
+    from app.api.v1.endpoints.extraction import common
 
-    from app.api.v1.endpoints.extraction.common import (
-        run_extraction_task as _run_extraction,
-    )
+    redis = ctx.get("redis")
+    if redis is None:
+        # Inline execution: no queue to fan out to
+        await asyncio.to_thread(
+            common.run_extraction_task, UUID(run_id), source, file_paths
+        )
+        logger.info(f"[task:{job_id}] Extraction run {run_id} complete")
+        return {
+            "run_id": run_id,
+            "source": source,
+            "status": "completed",
+        }
+
+    from app.extraction.sharepoint import SharePointAuthError
+
+    try:
+        files = await _discover_files(source, file_paths)
+    except (SharePointAuthError, ValueError) as exc:
+        logger.error(f"[task:{job_id}] Extraction discovery failed: {exc}")
+        await asyncio.to_thread(_start_run, UUID(run_id), 0, str(exc))
+        return {"run_id": run_id, "source": source, "status": "failed"}
 
-    # The existing function handles its own DB session management
-    await _run_extraction(UUID(run_id), source, file_paths)
+    await asyncio.to_thread(_start_run, UUID(run_id), len(files))
+    if not files:
+        logger.warning(f"[task:{job_id}] No files found for run {run_id}")
+        return {"run_id": run_id, "source": source, "status": "completed", "jobs": 0}
+
+    await asyncio.gather(
+        *(
+            redis.enqueue_job(
+                "extract_file_task",
+                run_id,
+                file_info,
+                _job_id=f"extraction-file:{run_id}:{index}",
+            )
+            for index, file_info in enumerate(files)
+        )
+    )
 
-    logger.info(f"[task:{job_id}] Extraction run {run_id} complete")
+    logger.info(f"[task:{job_id}] Enqueued {len(files)} file jobs for run {run_id}")
     return {
         "run_id": run_id,
         "source": source,
-        "status": "completed",
+        "status": "fanned_out",
+        "jobs": len(files),
     }
+
+
+def _process_file(
+    run_id: UUID, file_info: dict, status_key: str
+) -> tuple[dict | None, bool]:
+    """Extract and persist one file, then record it on the run.
+
+    Returns:
+        Tuple of (per_file_status entry or None if the run is no longer
+        running, whether this job completed the run).
+    """
+    from app.api.v1.endpoints.extraction import common
+    from app.crud.extraction import ExtractedValueCRUD, ExtractionRunCRUD
+    from app.db.session import SessionLocal
+    from app.extraction import ExcelDataExtractor
+
+    db = SessionLocal()
+    try:
+        run = ExtractionRunCRUD.get(db, run_id)
+        if run is None or run.status != "running":
+            return None, False
+
+        if "error" in file_info:
+            # Download failed before extraction could start
+            entry: dict = {"status": "failed", "error": file_info["error"]}
+        else:
+            mappings = _get_mappings()
+            extraction = common._extract_single_file(
+                ExcelDataExtractor(mappings),
+                file_info["file_path"],
+                file_info.get("deal_name", ""),
+                True,
+                mappings,
+            )
+            outcome = common.persist_extraction_result(
+                db, run_id, file_info, extraction, mappings, ExtractedValueCRUD
+            )
+            entry = outcome.status_entry()
+            entry["values_count"] = outcome.values_count
+            if outcome.property_name is not None:
+                entry["property_name"] = outcome.property_name
+        if file_info.get("deal_stage"):
+            entry["deal_stage"] = file_info["deal_stage"]
+
+        finished = ExtractionRunCRUD.record_file_result(db, run_id, status_key, entry)
+        return entry, finished
+    finally:
+        db.close()
+
+
+def _record_file_failure(
+    run_id: UUID, status_key: str, entry: dict
+) -> tuple[dict | None, bool]:
+    """Record a file whose job failed outright, like ``_process_file`` does."""
+    from app.crud.extraction import ExtractionRunCRUD
+    from app.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        run = ExtractionRunCRUD.get(db, run_id)
+        if run is None or run.status != "running":
+            return None, False
+        finished = ExtractionRunCRUD.record_file_result(db, run_id, status_key, entry)
+        return entry, finished
+    finally:
+        db.close()
+
+
+def _worker_limits() -> tuple[int, int]:
+    """The worker's (max_tries, job_timeout) for file jobs."""
+    from app.tasks.config import WorkerSettings
+
+    return WorkerSettings.max_tries, WorkerSettings.job_timeout
+
+
+async def _enqueue_finalize(ctx: dict[str, Any], run_id: str) -> None:
+    await ctx["redis"].enqueue_job(
+        "finalize_extraction_task",
+        run_id,
+        _job_id=FINALIZE_JOB_ID.format(run_id=run_id),
+    )
+
+
+async def _extract_file(
+    job_id: str, run_id: str, file_info: dict[str, Any], status_key: str
+) -> tuple[dict | None, bool]:
+    """Fetch (if on SharePoint), extract and record one file."""
+    sharepoint_file = file_info.get("sharepoint_file")
+    if sharepoint_file is None:
+        return await asyncio.to_thread(
+            _process_file, UUID(run_id), file_info, status_key
+        )
+    from app.api.v1.endpoints.extraction.common import download_sharepoint_file
+    from app.extraction.sharepoint import SharePointClient, SharePointFile
+    from app.extraction.workbook_store import get_workbook_store
+
+    store = get_workbook_store()
+    local_info = {k: v for k, v in file_info.items() if k != "sharepoint_file"}
+    try:
+        client = SharePointClient()
+        async with client:
+            local_path, content_hash = await download_sharepoint_file(
+                client, SharePointFile(**sharepoint_file), store=store
+            )
+        local_info["file_path"] = local_path
+        local_info["content_hash"] = content_hash
+    except Exception as exc:
+        logger.error(
+            f"[task:{job_id}] SharePoint download failed for {status_key}: {exc}"
+        )
+        local_info["error"] = f"Download failed: {exc}"
+    with store.pinned([local_info["file_path"]]):
+        return await asyncio.to_thread(
+            _process_file, UUID(run_id), local_info, status_key
+        )
+
+
+async def extract_file_task(
+    ctx: dict[str, Any],
+    run_id: str,
+    file_info: dict[str, Any],
+) -> dict[str, Any]:
+    """ARQ task: Extract and persist a single file of a fan-out run.
+
+    Args:
+        ctx: ARQ job context (contains job_id and redis).
+        run_id: UUID of the ExtractionRun record (as string).
+        file_info: File payload built by ``run_extraction_task``.
+
+    Returns:
+        Dictionary with the file's status and whether it completed the run.
+    """
+    job_id = ctx.get("job_id", "unknown")
+    status_key = file_info["file_path"]
+    max_tries, job_timeout = _worker_limits()
+
+    try:
+        entry, finished = await asyncio.wait_for(
+            _extract_file(job_id, run_id, file_info, status_key),
+            job_timeout - FILE_JOB_TIMEOUT_MARGIN_SECONDS,
+        )
+    except (Exception, asyncio.CancelledError) as exc:
+        # ARQ only retries cancelled jobs; anything else is the last attempt
+        cancelled = isinstance(exc, asyncio.CancelledError)
+        if cancelled and ctx.get("job_try", 1) < max_tries:
+            raise
+        logger.error(f"[task:{job_id}] Extraction failed for {status_key}: {exc!r}")
+        entry = {"status": "failed", "error": str(exc) or type(exc).__name__}
+        if file_info.get("deal_stage"):
+            entry["deal_stage"] = file_info["deal_stage"]
+        # Record the failure so the run's fan-in still completes
+        recorded, finished = await asyncio.to_thread(
+            _record_file_failure, UUID(run_id), status_key, entry
+        )
+        if cancelled:
+            if finished:
+                await _enqueue_finalize(ctx, run_id)
+            raise
+        entry = recorded
+
+    if entry is None:
+        logger.info(f"[task:{job_id}] Run {run_id} no longer running, skipped file")
+        return {"run_id": run_id, "file": status_key, "status": "skipped_run_closed"}
+
+    if finished:
+        await _enqueue_finalize(ctx, run_id)
+
+    return {
+        "run_id": run_id,
+        "file": status_key,
+        "status": entry["status"],
+        "run_finished": finished,
+    }
+
+
+def _finalize_run(run_id: UUID) -> bool:
+    """Fan-in: sync/hydrate properties and complete a fan-out run."""
+    from app.api.v1.endpoints.extraction import common
+    from app.crud.extraction import ExtractionRunCRUD
+    from app.db.session import SessionLocal
+    from app.services.extraction.metrics import FileMetrics, RunMetrics
+
+    db = SessionLocal()
+    try:
+        run = ExtractionRunCRUD.get(db, run_id)
+        if run is None or run.status != "running":
+            return False
+
+        per_file_status: dict[str, dict] = dict(run.per_file_status or {})
+        run_metrics = RunMetrics(files_total=run.jobs_total or len(per_file_status))
+        property_stages: dict[str, str] = {}
+        file_errors: list[dict] = []
+        for file_path, entry in per_file_status.items():
+            run_metrics.record_file(
+                FileMetrics(
+                    file_path=file_path,
+                    deal_name="",
+                    status=entry["status"],
+                    values_count=entry.get("values_count", 0),
+                )
+            )
+            if entry["status"] == "failed":
+                file_errors.append(
+                    {"file": Path(file_path).name, "error": entry.get("error")}
+                )
+            if entry.get("property_name") and entry.get("deal_stage"):
+                property_stages[entry["property_name"]] = entry["deal_stage"]
+
+        file_metadata = run_metrics.to_metadata()
+        # Metrics were rebuilt here; report the run's wall-clock duration
+        started_at = run.started_at
+        if started_at.tzinfo is None:
+            started_at = started_at.replace(tzinfo=UTC)
+        elapsed = (datetime.now(UTC) - started_at).total_seconds()
+        files_done = run.files_processed + run.files_failed
+        file_metadata["duration_seconds"] = round(elapsed, 2)
+        file_metadata["throughput_fpm"] = (
+            round(files_done / elapsed * 60, 1) if elapsed > 0 else 0.0
+        )
+        file_metadata["jobs_total"] = run.jobs_total
+
+        common.finalize_extraction_run(
+            db,
+            run_id,
+            ExtractionRunCRUD,
+            files_processed=run.files_processed,
+            files_failed=run.files_failed,
+            property_stages=property_stages,
+            error_summary=common.build_error_summary(file_errors),
+            per_file_status=per_file_status,
+            file_metadata=file_metadata,
+        )
+        return True
+    finally:
+        db.close()
+
+
+async def finalize_extraction_task(
+    ctx: dict[str, Any],
+    run_id: str,
+) -> dict[str, Any]:
+    """ARQ task: Fan-in for a fan-out extraction run.
+
+    Args:
+        ctx: ARQ job context (contains job_id, etc.).
+        run_id: UUID of the ExtractionRun record (as string).
+
+    Returns:
+        Dictionary with the run ID and whether the run was finalized by
+        this job ("completed") or had already been closed ("noop").
+    """
+    job_id = ctx.get("job_id", "unknown")
+    finalized = await asyncio.to_thread(_finalize_run, UUID(run_id))
+    logger.info(
+        f"[task:{job_id}] Extraction run {run_id} "
+        f"{'finalized' if finalized else 'already closed'}"
+    )
+    return {"run_id": run_id, "status": "completed" if finalized else "noop"}
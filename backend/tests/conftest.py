@@ -174,6 +174,23 @@ def _clear_token_blacklist_state():
     token_blacklist._redis = None
 
 
+@pytest.fixture(autouse=True)
+def _clear_principal_cache():
+    """
+    Clear cached principals between tests.
+
+    User IDs repeat across tests (each test gets a fresh database), so a
+    principal cached in one test would otherwise be served in the next.
+    """
+    from app.core.principal_cache import principal_cache
+
+    principal_cache.clear()
+
+    yield
+
+    principal_cache.clear()
+
+
 @pytest_asyncio.fixture(scope="function")
 async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     """
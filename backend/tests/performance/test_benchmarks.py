@@ -384,3 +384,110 @@ class TestUUIDGeneration:
 
         result = benchmark(generate)
         assert len(result) == 36  # standard UUID string length
+
+
+# ============================================================================
+# 6. Bulk enrichment row matching (dashboard property load)
+# ============================================================================
+
+
+class TestEnrichmentRowMatching:
+    """Benchmark partitioning bulk extracted rows across 500 properties."""
+
+    PROPERTY_COUNT = 500
+    FIELDS_PER_PROPERTY = 1_200
+
+    @pytest.fixture(scope="class")
+    def portfolio(self):
+        from app.models.property import normalize_property_key
+
+        keys = [
+            normalize_property_key(f"Property {i:03d} (Phoenix, AZ)")
+            for i in range(self.PROPERTY_COUNT)
+        ]
+        rows = [
+            (key, f"FIELD_{f:04d}", float(f), None)
+            for key in keys
+            for f in range(self.FIELDS_PER_PROPERTY)
+        ]
+        return keys, rows
+
+    def test_grouped_row_matching(self, benchmark, portfolio) -> None:
+        """Measure grouping + per-property lookup over 600k rows."""
+        from app.services.enrichment import group_rows_by_property_key
+
+        keys, rows = portfolio
+
+        def partition():
+            grouped = group_rows_by_property_key(rows)
+            return sum(len(grouped.get(key, ())) for key in keys)
+
+        result = benchmark(partition)
+        assert result == self.PROPERTY_COUNT * self.FIELDS_PER_PROPERTY
+
+
+# ============================================================================
+# 7. Dashboard property projection (500-property list)
+# ============================================================================
+
+
+class TestPropertyProjection:
+    """Benchmark building vs. serving stored frontend projections."""
+
+    PROPERTY_COUNT = 500
+
+    @pytest.fixture(scope="class")
+    def portfolio(self):
+        from app.api.v1.endpoints._property_transforms import (
+            refresh_frontend_projection,
+        )
+        from app.models import Property
+
+        ops_by_year = {
+            str(yr): {
+                "noi": 500_000 + yr * 10_000,
+                "expenses": {"realEstateTaxes": 120_000, "utilities": 80_000},
+            }
+            for yr in range(1, 11)
+        }
+        properties = []
+        for i in range(self.PROPERTY_COUNT):
+            prop = Property(
+                id=i + 1,
+                name=f"Property {i:03d} (Tempe, AZ)",
+                address=f"{i} Main St",
+                city="Tempe",
+                state="AZ",
+                zip_code="85281",
+                total_units=200,
+                total_sf=180_000,
+                year_built=2005,
+                purchase_price=Decimal("30000000"),
+                noi=Decimal("9000"),
+                updated_at=datetime.now(UTC),
+                financial_data={
+                    "acquisition": {"purchasePrice": 30_000_000},
+                    "financing": {"loanAmount": 18_000_000, "interestRate": 0.055},
+                    "returns": {"leveredIrr": 0.15, "leveredMoic": 1.9},
+                    "operationsByYear": ops_by_year,
+                },
+            )
+            refresh_frontend_projection(prop)
+            properties.append(prop)
+        return properties
+
+    def test_build_projections(self, benchmark, portfolio) -> None:
+        """Measure to_frontend_property over 500 properties (pre-change path)."""
+        from app.api.v1.endpoints._property_transforms import to_frontend_property
+
+        result = benchmark(lambda: [to_frontend_property(p) for p in portfolio])
+        assert len(result) == self.PROPERTY_COUNT
+
+    def test_serve_stored_projections(self, benchmark, portfolio) -> None:
+        """Measure serving current stored projections for 500 properties."""
+        from app.api.v1.endpoints._property_transforms import (
+            stored_frontend_property,
+        )
+
+        result = benchmark(lambda: [stored_frontend_property(p) for p in portfolio])
+        assert all(result)
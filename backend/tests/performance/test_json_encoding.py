@@ -0,0 +1,144 @@
+"""
+Response encoding latency for the heaviest dict-returning endpoints.
+
+Serves the same payloads through:
+- FastAPI's default path (``jsonable_encoder`` + stdlib ``json``), which the
+  dashboard and analytics endpoints used before
+- ``FastJSONResponse`` encoding the dict (cache miss)
+- ``FastJSONResponse`` with the cached bytes (cache hit)
+
+Payloads: ``/properties/dashboard`` with 500 properties and
+``/analytics/deal-pipeline``. Reports p50/p99 per path.
+
+Usage:
+    cd backend && python -m pytest tests/performance/test_json_encoding.py -v -s
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.api.v1.endpoints._property_transforms import to_frontend_property
+from app.core.serialization import FastJSONResponse, dumps
+from app.models import Property
+
+pytestmark = pytest.mark.performance
+
+PROPERTY_COUNT = 500
+WARMUP_REQUESTS = 10
+MEASURED_REQUESTS = 200
+
+
+def _dashboard_payload() -> dict:
+    ops_by_year = {
+        str(yr): {
+            "noi": 500_000 + yr * 10_000,
+            "expenses": {"realEstateTaxes": 120_000, "utilities": 80_000},
+        }
+        for yr in range(1, 11)
+    }
+    properties = [
+        to_frontend_property(
+            Property(
+                id=i + 1,
+                name=f"Property {i:03d} (Tempe, AZ)",
+                address=f"{i} Main St",
+                city="Tempe",
+                state="AZ",
+                zip_code="85281",
+                total_units=200,
+                total_sf=180_000,
+                year_built=2005,
+                purchase_price=Decimal("30000000"),
+                noi=Decimal("9000"),
+                updated_at=datetime.now(UTC),
+                financial_data={
+                    "acquisition": {"purchasePrice": 30_000_000},
+                    "financing": {"loanAmount": 18_000_000, "interestRate": 0.055},
+                    "operationsByYear": ops_by_year,
+                },
+            )
+        )
+        for i in range(PROPERTY_COUNT)
+    ]
+    return {"properties": properties, "total": PROPERTY_COUNT}
+
+
+def _pipeline_payload() -> dict:
+    stages = ["initial_review", "active_review", "under_contract", "closed"]
+    return {
+        "time_period": "ytd",
+        "funnel": {s: 40 + i for i, s in enumerate(stages)},
+        "conversion_rates": {s: Decimal("0.35") for s in stages},
+        "by_market": [
+            {"market": f"Market {i}", "count": i, "value": Decimal(i * 1_000_000)}
+            for i in range(50)
+        ],
+        "generated_at": datetime.now(UTC),
+    }
+
+
+PAYLOADS = {"dashboard": _dashboard_payload, "deal_pipeline": _pipeline_payload}
+
+
+def _app(payloads: dict[str, dict]) -> FastAPI:
+    app = FastAPI()
+    cached = {name: dumps(payload) for name, payload in payloads.items()}
+
+    @app.get("/default/{name}")
+    async def default_path(name: str):
+        return payloads[name]
+
+    @app.get("/miss/{name}", response_class=FastJSONResponse)
+    async def miss(name: str):
+        return FastJSONResponse(payloads[name])
+
+    @app.get("/hit/{name}", response_class=FastJSONResponse)
+    async def hit(name: str):
+        return FastJSONResponse(cached[name])
+
+    return app
+
+
+async def _latencies(client: AsyncClient, path: str) -> dict[str, float]:
+    for _ in range(WARMUP_REQUESTS):
+        await client.get(path)
+    samples = []
+    for _ in range(MEASURED_REQUESTS):
+        start = time.perf_counter()
+        response = await client.get(path)
+        samples.append(time.perf_counter() - start)
+    assert response.status_code == 200
+    quantiles = statistics.quantiles(samples, n=100)
+    return {"p50": quantiles[49], "p99": quantiles[98]}
+
+
+async def test_fast_encoding_latency() -> None:
+    """Cache hits and misses beat the default encoder on every payload."""
+    payloads = {name: build() for name, build in PAYLOADS.items()}
+    transport = ASGITransport(app=_app(payloads))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        for name in payloads:
+            default = await client.get(f"/default/{name}")
+            assert (await client.get(f"/hit/{name}")).json() == default.json()
+
+            results = {
+                path: await _latencies(client, f"/{path}/{name}")
+                for path in ("default", "miss", "hit")
+            }
+            print(f"\n{name}:")
+            for path, stats in results.items():
+                print(
+                    f"  {path:<8} p50 {stats['p50'] * 1000:7.2f} ms"
+                    f"  p99 {stats['p99'] * 1000:7.2f} ms"
+                )
+
+            assert results["miss"]["p50"] < results["default"]["p50"]
+            assert results["hit"]["p50"] < results["miss"]["p50"]
@@ -0,0 +1,86 @@
+"""
+Construction map payloads: ``/all`` against the viewport-bounded ``/map``.
+
+Seeds 5,000 projects scattered over the Phoenix metro and serves the map
+view three ways:
+- ``/construction-pipeline/all`` (every project as a full record)
+- ``/construction-pipeline/map`` for the whole metro at zoom 10 (clusters)
+- ``/construction-pipeline/map`` for a ~2 km viewport at zoom 16 (points)
+
+Reports p50 latency and response size per request.
+
+Usage:
+    cd backend && python -m pytest tests/performance/test_map_viewport.py -v -s
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import time
+from datetime import UTC, datetime
+
+import pytest
+
+from app.models.construction import ConstructionProject
+
+pytestmark = pytest.mark.performance
+
+PROJECT_COUNT = 5_000
+MEASURED_REQUESTS = 20
+BASE_URL = "/api/v1/construction-pipeline"
+
+REQUESTS = {
+    "all": f"{BASE_URL}/all",
+    "map zoom 10": f"{BASE_URL}/map?west=-112.5&south=33.2&east=-111.6&north=33.8&zoom=10",
+    "map zoom 16": f"{BASE_URL}/map?west=-112.08&south=33.44&east=-112.06&north=33.46&zoom=16",
+}
+
+
+async def _seed(db_session) -> None:
+    rng = random.Random(46)
+    now = datetime.now(UTC)
+    db_session.add_all(
+        ConstructionProject(
+            costar_property_id=f"CP-{i:05d}",
+            project_name=f"Project {i}",
+            city="Phoenix",
+            pipeline_status="under_construction",
+            primary_classification="CONV_MR",
+            number_of_units=rng.randint(50, 400),
+            latitude=rng.uniform(33.25, 33.75),
+            longitude=rng.uniform(-112.45, -111.65),
+            source_file="perf.xlsx",
+            imported_at=now,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(PROJECT_COUNT)
+    )
+    await db_session.commit()
+
+
+async def test_map_viewport_payloads(client, db_session, auth_headers) -> None:
+    """The clustered and zoomed-in map responses beat ``/all`` on size and time."""
+    await _seed(db_session)
+
+    results = {}
+    for name, path in REQUESTS.items():
+        response = await client.get(path, headers=auth_headers)
+        assert response.status_code == 200
+        samples = []
+        for _ in range(MEASURED_REQUESTS):
+            start = time.perf_counter()
+            await client.get(path, headers=auth_headers)
+            samples.append(time.perf_counter() - start)
+        results[name] = (statistics.median(samples), len(response.content))
+
+    print()
+    for name, (p50, size) in results.items():
+        print(f"  {name:<12} p50 {p50 * 1000:8.2f} ms  {size / 1024:8.1f} KiB")
+
+    all_p50, all_size = results["all"]
+    for name in ("map zoom 10", "map zoom 16"):
+        p50, size = results[name]
+        assert p50 < all_p50
+        assert size * 20 < all_size
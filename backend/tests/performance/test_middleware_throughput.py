@@ -0,0 +1,90 @@
+"""
+Middleware stack throughput: overhead of the production stack.
+
+Measures requests/sec for a trivial endpoint with and without the
+production middleware stack (pure ASGI, same order as ``app.main``) and
+asserts the stack keeps a loose fraction of the bare app's throughput. A
+layer that goes back to ``BaseHTTPMiddleware``, buffers every response or
+does blocking work per request drops well below that floor.
+
+Not marked ``performance`` so it runs with the default suite and in CI.
+
+Usage:
+    cd backend && python -m pytest tests/performance/test_middleware_throughput.py -v -s
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.main import OriginValidationMiddleware, SecurityHeadersMiddleware
+from app.middleware.error_handler import ErrorHandlerMiddleware
+from app.middleware.etag import ETagMiddleware
+from app.middleware.rate_limiter import RateLimiter, RateLimitMiddleware
+from app.middleware.request_id import RequestIDMiddleware
+from app.services.monitoring import MetricsMiddleware
+
+WARMUP_REQUESTS = 50
+MEASURED_REQUESTS = 300
+# The stack must keep at least this fraction of the bare app's req/s
+MIN_THROUGHPUT_RATIO = 0.3
+
+
+def _trivial_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+def _asgi_stack() -> FastAPI:
+    app = _trivial_app()
+    limiter = RateLimiter(backend="memory")
+    limiter.add_rule("/api/", requests=1_000_000, window=60)
+    app.add_middleware(MetricsMiddleware)
+    app.add_middleware(RateLimitMiddleware, limiter=limiter)
+    app.add_middleware(ETagMiddleware)
+    app.add_middleware(SecurityHeadersMiddleware)
+    app.add_middleware(ErrorHandlerMiddleware)
+    app.add_middleware(OriginValidationMiddleware)
+    app.add_middleware(RequestIDMiddleware)
+    return app
+
+
+async def _requests_per_second(app: FastAPI) -> float:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        for _ in range(WARMUP_REQUESTS):
+            await ac.get("/api/ping")
+
+        start = time.perf_counter()
+        for _ in range(MEASURED_REQUESTS):
+            response = await ac.get("/api/ping")
+        elapsed = time.perf_counter() - start
+
+    assert response.status_code == 200
+    return MEASURED_REQUESTS / elapsed
+
+
+async def test_middleware_stack_overhead_is_bounded() -> None:
+    """The production stack keeps a loose fraction of the bare app's throughput."""
+    bare_rps = await _requests_per_second(_trivial_app())
+    stack_rps = await _requests_per_second(_asgi_stack())
+    ratio = stack_rps / bare_rps
+
+    print(
+        f"\nBare app:         {bare_rps:,.0f} req/s"
+        f"\nMiddleware stack: {stack_rps:,.0f} req/s"
+        f"\nRatio:            {ratio:.2f}"
+    )
+    assert ratio >= MIN_THROUGHPUT_RATIO, (
+        f"Middleware stack ({stack_rps:,.0f} req/s) keeps only {ratio:.0%} of "
+        f"the bare app's throughput ({bare_rps:,.0f} req/s)"
+    )
@@ -0,0 +1,97 @@
+"""
+Sales analytics: raw ``sales_data`` scans against the ``sales_rollup`` cube.
+
+Seeds 20,000 sales over ten years and 8 submarkets and calls the analytics
+endpoints twice: before the rollup exists (raw scan) and after
+``refresh_sales_rollup`` (rollup). Reports p50 latency per endpoint and
+checks both paths return the same payload.
+
+Usage:
+    cd backend && python -m pytest tests/performance/test_sales_rollup.py -v -s
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import time
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+
+from app.models.sales_data import SalesData
+from app.services.sales_rollup import refresh_sales_rollup
+
+pytestmark = pytest.mark.performance
+
+SALE_COUNT = 20_000
+MEASURED_REQUESTS = 20
+BASE_URL = "/api/v1/sales-analysis/analytics"
+
+# Endpoints whose raw path also runs on SQLite
+REQUESTS = {
+    "distributions": f"{BASE_URL}/distributions?group_by=unit_count",
+    "distributions filtered": (
+        f"{BASE_URL}/distributions?group_by=vintage&min_units=101"
+        "&date_from=2020-01-01&date_to=2023-12-31"
+    ),
+    "data-quality": f"{BASE_URL}/data-quality",
+}
+
+
+async def _seed(db_session) -> None:
+    rng = random.Random(48)
+    now = datetime.now(UTC)
+    submarkets = [f"Submarket {i}" for i in range(8)]
+    db_session.add_all(
+        SalesData(
+            comp_id=f"C-{i:06d}",
+            source_file="perf.xlsx",
+            submarket_cluster=rng.choice(submarkets),
+            star_rating=rng.choice(["2 Star", "3 Star", "4 Star", "5 Star"]),
+            year_built=rng.randint(1960, 2024),
+            number_of_units=rng.randint(10, 700),
+            sale_date=date(2015, 1, 1) + timedelta(days=rng.randint(0, 3650)),
+            sale_price=rng.randint(1_000_000, 90_000_000),
+            price_per_unit=rng.randint(50_000, 400_000),
+            imported_at=now,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(SALE_COUNT)
+    )
+    await db_session.commit()
+
+
+async def _measure(client, auth_headers) -> dict[str, tuple[float, object]]:
+    results = {}
+    for name, path in REQUESTS.items():
+        response = await client.get(path, headers=auth_headers)
+        assert response.status_code == 200
+        samples = []
+        for _ in range(MEASURED_REQUESTS):
+            start = time.perf_counter()
+            await client.get(path, headers=auth_headers)
+            samples.append(time.perf_counter() - start)
+        results[name] = (statistics.median(samples), response.json())
+    return results
+
+
+async def test_sales_rollup_latency(client, db_session, auth_headers) -> None:
+    """Rollup-backed analytics match the raw scan and answer faster."""
+    await _seed(db_session)
+
+    raw = await _measure(client, auth_headers)
+    await db_session.run_sync(refresh_sales_rollup)
+    rolled_up = await _measure(client, auth_headers)
+
+    print()
+    for name in REQUESTS:
+        print(
+            f"  {name:<24} raw p50 {raw[name][0] * 1000:8.2f} ms"
+            f"  rollup p50 {rolled_up[name][0] * 1000:8.2f} ms"
+        )
+
+    for name in REQUESTS:
+        assert rolled_up[name][1] == raw[name][1]
+        assert rolled_up[name][0] < raw[name][0]
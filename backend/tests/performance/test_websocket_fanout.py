@@ -0,0 +1,142 @@
+"""
+WebSocket fan-out latency to 1,000 local connections.
+
+Broadcasts deal updates on one channel to 1,000 connected clients, 1% of
+which are slow (each send takes ``SLOW_SEND_SECONDS``), and measures the
+time from ``send_to_channel`` until each healthy client's send starts:
+- through ``ConnectionManager`` (encoded once, per-connection writers)
+- against a baseline of the previous path: ``send_json`` (one encode per
+  client) awaited for one connection after another
+
+Usage:
+    cd backend && python -m pytest tests/performance/test_websocket_fanout.py -v -s
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import statistics
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.websocket_manager import Channel, ConnectionManager
+
+pytestmark = pytest.mark.performance
+
+CONNECTIONS = 1_000
+SLOW_EVERY = 100  # one slow client in a hundred
+SLOW_SEND_SECONDS = 0.05
+MESSAGES = 5
+
+
+class _Client:
+    """Fake WebSocket recording when each message reached the socket."""
+
+    def __init__(self, slow: bool) -> None:
+        self.slow = slow
+        self.received: list[float] = []
+        self.accept = AsyncMock()
+        self.close = AsyncMock()
+
+    async def _send(self) -> None:
+        self.received.append(asyncio.get_running_loop().time())
+        if self.slow:
+            await asyncio.sleep(SLOW_SEND_SECONDS)
+
+    async def send_text(self, text: str) -> None:
+        await self._send()
+
+    async def send_json(self, data: dict) -> None:
+        json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        await self._send()
+
+
+def _clients() -> list[_Client]:
+    return [_Client(slow=i % SLOW_EVERY == 0) for i in range(CONNECTIONS)]
+
+
+def _message(i: int) -> dict:
+    return {
+        "type": "deal_update",
+        "action": "updated",
+        "deal_id": i,
+        "data": {"stage": "active_review", "name": f"Deal {i}", "units": 240},
+    }
+
+
+def _latencies(clients: list[_Client], sent_at: list[float]) -> list[float]:
+    """Per-message latency for healthy clients (welcome message excluded)."""
+    return [
+        received - sent
+        for client in clients
+        if not client.slow
+        for received, sent in zip(client.received[-MESSAGES:], sent_at, strict=True)
+    ]
+
+
+def _report(name: str, latencies: list[float]) -> dict[str, float]:
+    quantiles = statistics.quantiles(latencies, n=100)
+    stats = {"p50": quantiles[49], "p99": quantiles[98], "max": max(latencies)}
+    print(
+        f"\n{name}: p50 {stats['p50'] * 1000:.1f} ms, "
+        f"p99 {stats['p99'] * 1000:.1f} ms, max {stats['max'] * 1000:.1f} ms"
+    )
+    return stats
+
+
+async def _manager_fanout() -> list[float]:
+    clients = _clients()
+    manager = ConnectionManager(send_queue_size=MESSAGES * 2)
+    with (
+        patch(
+            "app.services.websocket_manager.settings.WS_MAX_CONNECTIONS", CONNECTIONS
+        ),
+        patch.object(ConnectionManager, "_heartbeat_loop", new=AsyncMock()),
+    ):
+        for client in clients:
+            await manager.connect(client, channels=[Channel.DEALS])
+        await asyncio.sleep(SLOW_SEND_SECONDS * 2)  # welcome messages drained
+
+        loop = asyncio.get_running_loop()
+        sent_at = []
+        for i in range(MESSAGES):
+            sent_at.append(loop.time())
+            assert await manager.send_to_channel(Channel.DEALS, _message(i)) == (
+                CONNECTIONS
+            )
+        while any(len(c.received) < MESSAGES + 1 for c in clients):
+            await asyncio.sleep(0.01)
+
+        for cid in list(manager._connections):
+            await manager.disconnect(cid)
+    return _latencies(clients, sent_at)
+
+
+async def _sequential_fanout() -> list[float]:
+    clients = _clients()
+    for client in clients:
+        await client.send_json({"type": "connected"})
+
+    loop = asyncio.get_running_loop()
+    sent_at = []
+    for i in range(MESSAGES):
+        sent_at.append(loop.time())
+        for client in clients:
+            await client.send_json(_message(i))
+    return _latencies(clients, sent_at)
+
+
+async def test_fanout_to_1000_connections() -> None:
+    """Healthy clients get broadcasts without waiting behind slow ones."""
+    baseline = _report("Sequential send_json", await _sequential_fanout())
+    fanout = _report("ConnectionManager   ", await _manager_fanout())
+
+    # Sequentially, a message waits behind every slow client ahead in line
+    slow_clients = CONNECTIONS // SLOW_EVERY
+    assert baseline["p50"] > slow_clients * SLOW_SEND_SECONDS / 4
+    assert fanout["max"] < baseline["p50"], (
+        f"fan-out max latency {fanout['max'] * 1000:.1f} ms: healthy clients "
+        f"are waiting on slow ones"
+    )
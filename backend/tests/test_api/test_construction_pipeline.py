@@ -3,6 +3,7 @@
 Covers the 12 REST endpoints mounted at /api/v1/construction-pipeline:
  0. GET /filter-options               -- Distinct values for dropdowns
  1. GET /                             -- Paginated project list
+ 1c. GET /map                         -- Viewport clusters or points
  2. GET /analytics/pipeline-summary   -- Counts by status
  3. GET /analytics/pipeline-funnel    -- Funnel view
  4. GET /analytics/permit-trends      -- Census BPS + FRED time-series
@@ -31,6 +32,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from app.core.config import settings
 from app.core.permissions import CurrentUser, Role, get_current_user
 from app.db.base import Base
 from app.db.session import get_db, get_sync_db
@@ -317,6 +319,46 @@ class TestFilterOptions:
         assert "CONV_MR" in data["classifications"]
         assert "Market" in data["rent_types"]
 
+    @pytest.mark.asyncio
+    async def test_counts_and_ranges(
+        self, cp_client: AsyncClient, db_session: AsyncSession
+    ):
+        await _seed_projects(db_session)
+        resp = await cp_client.get(f"{BASE_URL}/filter-options")
+        data = resp.json()
+        assert data["counts"]["classifications"]["CONV_MR"] == 2
+        assert data["counts"]["statuses"]["proposed"] == 1
+        assert data["ranges"]["units"] == {"min": 80.0, "max": 300.0}
+
+    @pytest.mark.asyncio
+    async def test_cached_until_import(
+        self, cp_client: AsyncClient, db_session: AsyncSession
+    ):
+        from app.services.construction_import import FileImportResult
+
+        await _seed_projects(db_session)
+        await cp_client.get(f"{BASE_URL}/filter-options")
+        db_session.add(_make_project(costar_property_id="CP-NEW", city="Buckeye"))
+        await db_session.commit()
+
+        resp = await cp_client.get(f"{BASE_URL}/filter-options")
+        assert "Buckeye" not in resp.json()["cities"]
+
+        with (
+            patch(
+                "app.services.construction_import.get_unimported_files",
+                return_value=["/data/construction/new.xlsx"],
+            ),
+            patch(
+                "app.services.construction_import.import_construction_file",
+                return_value=FileImportResult(filename="new.xlsx"),
+            ),
+        ):
+            await cp_client.post(f"{BASE_URL}/import")
+
+        resp = await cp_client.get(f"{BASE_URL}/filter-options")
+        assert "Buckeye" in resp.json()["cities"]
+
     @pytest.mark.asyncio
     async def test_empty_db(self, cp_client: AsyncClient):
         resp = await cp_client.get(f"{BASE_URL}/filter-options")
@@ -415,6 +457,25 @@ class TestListProjects:
         units = [r["number_of_units"] for r in data["data"]]
         assert units == sorted(units)
 
+    @pytest.mark.asyncio
+    async def test_cursor_pagination(
+        self, cp_client: AsyncClient, db_session: AsyncSession
+    ):
+        await _seed_projects(db_session)
+        url = f"{BASE_URL}/?sort_by=number_of_units&sort_dir=asc&page_size=2"
+        first = (await cp_client.get(url)).json()
+        assert first["has_more"] is True
+
+        units = [r["number_of_units"] for r in first["data"]]
+        cursor = first["next_cursor"]
+        while cursor:
+            page = (await cp_client.get(f"{url}&cursor={cursor}")).json()
+            assert page["total"] == 5
+            units += [r["number_of_units"] for r in page["data"]]
+            cursor = page["next_cursor"]
+
+        assert units == [80, 120, 150, 250, 300]
+
     @pytest.mark.asyncio
     async def test_empty_db(self, cp_client: AsyncClient):
         resp = await cp_client.get(f"{BASE_URL}/")
@@ -424,6 +485,128 @@ class TestListProjects:
         assert data["data"] == []
 
 
+# =============================================================================
+# Tests: GET /map (viewport clusters / points)
+# =============================================================================
+
+# Covers the Phoenix metro; Flagstaff is outside it
+PHOENIX_BBOX = "west=-112.5&south=33.2&east=-111.6&north=33.8"
+
+
+async def _seed_map_projects(db: AsyncSession) -> None:
+    projects = [
+        # Downtown Phoenix, within a few hundred metres of each other
+        _make_project("CP-101", "Roosevelt Row", latitude=33.4580, longitude=-112.0710),
+        _make_project(
+            "CP-102", "Garfield Lofts", latitude=33.4575, longitude=-112.0690
+        ),
+        _make_project(
+            "CP-103", "Evans Churchill", latitude=33.4590, longitude=-112.0700
+        ),
+        # Tempe, ~15 km away
+        _make_project("CP-104", "Mill Avenue", latitude=33.4255, longitude=-111.9400),
+        _make_project(
+            "CP-105", "Flagstaff Pines", latitude=35.1983, longitude=-111.6513
+        ),
+    ]
+    projects.append(_make_project("CP-106", "No Coordinates"))
+    projects[-1].latitude = projects[-1].longitude = None
+    db.add_all(projects)
+    await db.commit()
+
+
+class TestProjectMap:
+    @pytest.mark.asyncio
+    async def test_low_zoom_returns_clusters(
+        self, cp_client: AsyncClient, db_session: AsyncSession
+    ):
+        await _seed_map_projects(db_session)
+        resp = await cp_client.get(f"{BASE_URL}/map?{PHOENIX_BBOX}&zoom=10")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["clustered"] is True
+        assert data["total"] == 4
+        assert data["points"] == []
+        by_count = sorted(data["clusters"], key=lambda c: c["count"])
+        assert [c["count"] for c in by_count] == [1, 3]
+        downtown = by_count[1]
+        assert downtown["total_units"] == 600
+        assert downtown["key"].startswith("10/")
+        assert downtown["south"] == pytest.approx(33.4575)
+        assert downtown["north"] == pytest.approx(33.4590)
+        assert downtown["latitude"] == pytest.approx(33.4581667)
+
+    @pytest.mark.asyncio
+    async def test_high_zoom_returns_points_in_viewport(
+        self, cp_client: AsyncClient, db_session: AsyncSession
+    ):
+        await _seed_map_projects(db_session)
+        resp = await cp_client.get(
+            f"{BASE_URL}/map?west=-112.08&south=33.45&east=-112.06&north=33.46&zoom=16"
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["clustered"] is False
+        assert data["clusters"] == []
+        assert [p["project_name"] for p in data["points"]] == [
+            "Roosevelt Row",
+            "Garfield Lofts",
+            "Evans Churchill",
+        ]
+        assert set(data["points"][0]) == {
+            "id",
+            "latitude",
+            "longitude",
+            "project_name",
+            "pipeline_status",
+            "primary_classification",
+            "number_of_units",
+        }
+
+    @pytest.mark.asyncio
+    async def test_points_capped(
+        self, cp_client: AsyncClient, db_session: AsyncSession, monkeypatch
+    ):
+        await _seed_map_projects(db_session)
+        monkeypatch.setattr(settings, "MAP_MAX_POINTS", 2)
+        resp = await cp_client.get(f"{BASE_URL}/map?{PHOENIX_BBOX}&zoom=16")
+        data = resp.json()
+        assert [p["project_name"] for p in data["points"]] == [
+            "Roosevelt Row",
+            "Garfield Lofts",
+        ]
+        assert data["total"] == 4
+        assert data["truncated"] is True
+
+    @pytest.mark.asyncio
+    async def test_filters_apply(
+        self, cp_client: AsyncClient, db_session: AsyncSession
+    ):
+        await _seed_map_projects(db_session)
+        resp = await cp_client.get(f"{BASE_URL}/map?{PHOENIX_BBOX}&zoom=16&search=Mill")
+        assert [p["project_name"] for p in resp.json()["points"]] == ["Mill Avenue"]
+
+    @pytest.mark.asyncio
+    async def test_grid_follows_coordinate_updates(
+        self, cp_client: AsyncClient, db_session: AsyncSession
+    ):
+        project = _make_project("CP-201", "Relocated", latitude=35.2, longitude=-111.65)
+        db_session.add(project)
+        await db_session.commit()
+        project.latitude, project.longitude = 33.45, -112.07
+        await db_session.commit()
+
+        resp = await cp_client.get(f"{BASE_URL}/map?{PHOENIX_BBOX}&zoom=16")
+        assert [p["project_name"] for p in resp.json()["points"]] == ["Relocated"]
+
+    @pytest.mark.asyncio
+    async def test_inverted_bbox_rejected(self, cp_client: AsyncClient):
+        resp = await cp_client.get(
+            f"{BASE_URL}/map?west=-111.6&south=33.2&east=-112.5&north=33.8&zoom=10"
+        )
+        assert resp.status_code == 400
+
+
 # =============================================================================
 # Tests: GET /analytics/pipeline-summary
 # =============================================================================
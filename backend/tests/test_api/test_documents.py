@@ -5,6 +5,7 @@ F-035: Tests the Documents API at /api/v1/documents/ including:
 - Get document by ID (GET /{id})
 - Create document (POST /)
 - Upload requires auth (POST /upload)
+- Upload to storage and Range-capable download (GET /{id}/download)
 - Get by property (GET /property/{property_id})
 - Delete (DELETE /{id})
 - Auth guards (401 without auth)
@@ -214,6 +215,130 @@ async def test_upload_requires_auth(client, db_session):
     assert response.status_code == 401
 
 
+@pytest.fixture
+def document_storage(tmp_path, monkeypatch):
+    """Point document storage at a temporary directory."""
+    from app.services import document_storage as storage_module
+
+    storage = storage_module.DocumentStorage(tmp_path)
+    monkeypatch.setattr(storage_module, "_document_storage", storage)
+    return storage
+
+
+PDF_CONTENT = b"%PDF-1.7\n" + bytes(range(256)) * 40
+
+
+async def _upload_pdf(client, headers) -> dict:
+    response = await client.post(
+        "/api/v1/documents/upload",
+        files={"file": ("memo.pdf", PDF_CONTENT, "application/pdf")},
+        headers=headers,
+        follow_redirects=True,
+    )
+    assert response.status_code == 200
+    return response.json()["document"]
+
+
+@pytest.mark.asyncio
+async def test_upload_stores_file(client, db_session, auth_headers, document_storage):
+    """POST /documents/upload streams the file to storage and records its path."""
+    doc = await _upload_pdf(client, auth_headers)
+
+    assert doc["size"] == len(PDF_CONTENT)
+    assert doc["file_path"].startswith("objects/")
+    assert document_storage.resolve(doc["file_path"]).read_bytes() == PDF_CONTENT
+
+
+@pytest.mark.asyncio
+async def test_upload_rejects_invalid_content(
+    client, db_session, auth_headers, document_storage
+):
+    """Mislabeled files are rejected with 422 and nothing is stored."""
+    response = await client.post(
+        "/api/v1/documents/upload",
+        files={"file": ("memo.pdf", b"not a pdf", "application/pdf")},
+        headers=auth_headers,
+        follow_redirects=True,
+    )
+    assert response.status_code == 422
+    assert not (document_storage.root / "objects").exists()
+
+
+# =============================================================================
+# Download (GET /{id}/download)
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_download_returns_file(
+    client, db_session, auth_headers, document_storage
+):
+    """GET /documents/{id}/download streams the stored file."""
+    doc = await _upload_pdf(client, auth_headers)
+
+    response = await client.get(
+        f"/api/v1/documents/{doc['id']}/download", headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    assert response.content == PDF_CONTENT
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.headers["accept-ranges"] == "bytes"
+    assert 'filename="memo.pdf"' in response.headers["content-disposition"]
+
+
+@pytest.mark.asyncio
+async def test_download_range(client, db_session, auth_headers, document_storage):
+    """A Range request returns 206 with just the requested bytes."""
+    doc = await _upload_pdf(client, auth_headers)
+    url = f"/api/v1/documents/{doc['id']}/download"
+
+    response = await client.get(url, headers={**auth_headers, "Range": "bytes=100-199"})
+
+    assert response.status_code == 206
+    assert response.content == PDF_CONTENT[100:200]
+    assert response.headers["content-range"] == f"bytes 100-199/{len(PDF_CONTENT)}"
+
+    # If-Range with the current ETag keeps the range; a stale one gets the full file
+    etag = response.headers["etag"]
+    resumed = await client.get(
+        url, headers={**auth_headers, "Range": "bytes=-10", "If-Range": etag}
+    )
+    stale = await client.get(
+        url, headers={**auth_headers, "Range": "bytes=-10", "If-Range": '"old"'}
+    )
+    assert resumed.status_code == 206
+    assert resumed.content == PDF_CONTENT[-10:]
+    assert stale.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_download_unsatisfiable_range(
+    client, db_session, auth_headers, document_storage
+):
+    """A range past the end of the file returns 416."""
+    doc = await _upload_pdf(client, auth_headers)
+
+    response = await client.get(
+        f"/api/v1/documents/{doc['id']}/download",
+        headers={**auth_headers, "Range": f"bytes={len(PDF_CONTENT) + 10}-"},
+    )
+    assert response.status_code == 416
+
+
+@pytest.mark.asyncio
+async def test_download_without_stored_file(
+    client, db_session, auth_headers, document_storage
+):
+    """Metadata-only documents have nothing to download."""
+    doc = await _create_document(db_session)
+
+    response = await client.get(
+        f"/api/v1/documents/{doc.id}/download", headers=auth_headers
+    )
+    assert response.status_code == 404
+
+
 # =============================================================================
 # Get by Property (GET /property/{property_id})
 # =============================================================================
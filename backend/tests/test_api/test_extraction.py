@@ -363,6 +363,37 @@ class TestExtractionStart:
             assert data["files_discovered"] == 2
             assert "run_id" in data
 
+    @pytest.mark.asyncio
+    async def test_start_extraction_distributed_enqueues_fan_out(
+        self, extraction_client
+    ) -> None:
+        """With EXTRACTION_DISTRIBUTED the run is handed to the ARQ workers."""
+        with (
+            patch(
+                "app.api.v1.endpoints.extraction.extract.settings.EXTRACTION_DISTRIBUTED",
+                True,
+            ),
+            patch("app.tasks.enqueue_task", new_callable=AsyncMock) as mock_enqueue,
+            patch(
+                "app.api.v1.endpoints.extraction.common.run_extraction_task"
+            ) as mock_task,
+        ):
+            response = await extraction_client.post(
+                "/api/v1/extraction/start",
+                json={"source": "local", "file_paths": ["/path/to/file1.xlsb"]},
+            )
+
+            assert response.status_code == 200
+            run_id = response.json()["run_id"]
+            mock_enqueue.assert_awaited_once_with(
+                "run_extraction_task",
+                run_id,
+                "local",
+                ["/path/to/file1.xlsb"],
+                _job_id=f"extraction-run:{run_id}",
+            )
+            mock_task.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_start_extraction_fixture_source(self, extraction_client) -> None:
         """Starts extraction with fixture files (fallback source)."""
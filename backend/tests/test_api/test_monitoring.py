@@ -10,6 +10,8 @@ Tests the Monitoring API endpoints including:
 
 import pytest
 
+from app.core.config import settings
+
 # All monitoring endpoints now require admin authentication
 pytestmark = pytest.mark.usefixtures("auto_auth")
 
@@ -199,6 +201,30 @@ async def test_performance_stats_system_metrics(client, db_session):
     assert "system" in data or "note" in data
 
 
+@pytest.mark.asyncio
+async def test_performance_stats_window_summary(client, db_session):
+    """Test performance stats include a system summary for the window."""
+    response = await client.get(
+        "/api/v1/monitoring/stats?window_minutes=1", follow_redirects=True
+    )
+
+    assert response.status_code == 200
+    summary = response.json()["system_summary"]
+    assert summary["minutes"] == 1
+    assert summary["samples"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_performance_stats_window_bounded_by_buffer(client, db_session):
+    """Windows longer than the sample buffer are rejected."""
+    window = settings.METRICS_SAMPLE_WINDOW_MINUTES + 1
+    response = await client.get(
+        f"/api/v1/monitoring/stats?window_minutes={window}", follow_redirects=True
+    )
+
+    assert response.status_code == 422
+
+
 # =============================================================================
 # Application Info Tests
 # =============================================================================
@@ -347,6 +347,65 @@ async def test_dashboard_list_enriches_missing_financial_data(
     assert acq.get("purchasePrice") == 8_000_000.0
 
 
+@pytest.mark.asyncio
+async def test_dashboard_list_matches_extracted_values_by_property_key(
+    client, db_session: AsyncSession, auth_headers
+):
+    """
+    Extracted values stored under the bare deal name (any case) enrich a
+    property whose name carries a "(City, ST)" suffix.
+    """
+    prop = Property(
+        name="Key Match Property (Tempe, AZ)",
+        property_type="multifamily",
+        address="450 Key St",
+        city="Tempe",
+        state="AZ",
+        zip_code="85281",
+        total_units=90,
+        financial_data=None,
+    )
+    db_session.add(prop)
+    await db_session.commit()
+    await db_session.refresh(prop)
+    assert prop.property_key == "key match property"
+
+    run = ExtractionRun(
+        id=uuid4(),
+        status="completed",
+        trigger_type="manual",
+        files_discovered=1,
+        files_processed=1,
+        files_failed=0,
+    )
+    db_session.add(run)
+    await db_session.flush()
+
+    db_session.add(
+        ExtractedValue(
+            **_make_extracted_value(
+                run.id,
+                "KEY MATCH PROPERTY",
+                "PURCHASE_PRICE",
+                value_numeric=6_500_000.0,
+            )
+        )
+    )
+    await db_session.commit()
+
+    response = await client.get(
+        "/api/v1/properties/dashboard",
+        headers=auth_headers,
+        follow_redirects=True,
+    )
+
+    assert response.status_code == 200
+    props = response.json().get("properties", [])
+    target = next((p for p in props if p["id"] == str(prop.id)), None)
+    assert target is not None
+    assert target.get("acquisition", {}).get("purchasePrice") == 6_500_000.0
+
+
 # =============================================================================
 # Test: Enrichment caches — second call uses financial_data column
 # =============================================================================
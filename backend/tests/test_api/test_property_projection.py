@@ -0,0 +1,142 @@
+"""
+Tests for the materialized frontend property projection.
+
+Covers:
+- Projection rebuilt and versioned when a property is updated via the ORM
+- Current projections served without calling to_frontend_property
+- Stale rows (Core UPDATEs, PROJECTION_VERSION bumps) rebuilt on read and
+  written back without touching updated_at
+- A failing transform not blocking the property write
+"""
+
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.endpoints import _property_transforms
+from app.api.v1.endpoints._property_transforms import (
+    projection_version,
+    stored_frontend_property,
+    to_frontend_property,
+)
+from app.crud import property as property_crud
+from app.models import Property
+
+_TRANSFORM = "app.api.v1.endpoints._property_transforms.to_frontend_property"
+
+
+async def _reload(db: AsyncSession, prop: Property) -> Property:
+    db.expunge(prop)
+    return (
+        await db.execute(select(Property).where(Property.id == prop.id))
+    ).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_update_materializes_projection(db_session: AsyncSession, test_property):
+    test_property.financial_data = {"financing": {"loanAmount": 6_000_000}}
+    await db_session.commit()
+
+    prop = await _reload(db_session, test_property)
+
+    assert prop.frontend_projection_version == projection_version(prop)
+    # SQLite drops the UTC offset from the reloaded updated_at
+    fresh = {**to_frontend_property(prop), "lastAnalyzed": None}
+    assert {**prop.frontend_projection, "lastAnalyzed": None} == fresh
+    assert prop.frontend_projection["financing"]["loanAmount"] == 6_000_000
+
+
+@pytest.mark.asyncio
+async def test_current_projection_served_without_recompute(
+    db_session: AsyncSession, test_property
+):
+    test_property.occupancy_rate = Decimal("93.00")
+    await db_session.commit()
+    prop = await _reload(db_session, test_property)
+
+    with patch(_TRANSFORM, wraps=to_frontend_property) as transform:
+        (projection,) = await property_crud.get_frontend_projections(db_session, [prop])
+
+    transform.assert_not_called()
+    assert projection["operations"]["occupancy"] == pytest.approx(0.93)
+
+
+@pytest.mark.asyncio
+async def test_stale_projection_rebuilt_once(db_session: AsyncSession, test_property):
+    test_property.total_units = 60
+    await db_session.commit()
+    # Core UPDATEs bypass the ORM hook: updated_at moves, the projection does not
+    await db_session.execute(
+        update(Property).where(Property.id == test_property.id).values(total_units=75)
+    )
+    await db_session.commit()
+    prop = await _reload(db_session, test_property)
+    assert stored_frontend_property(prop) is None
+    updated_at = prop.updated_at
+
+    with patch(_TRANSFORM, wraps=to_frontend_property) as transform:
+        (projection,) = await property_crud.get_frontend_projections(db_session, [prop])
+        await db_session.commit()
+        prop = await _reload(db_session, prop)
+        await property_crud.get_frontend_projections(db_session, [prop])
+
+    assert transform.call_count == 1
+    assert projection["propertyDetails"]["units"] == 75
+    assert prop.updated_at == updated_at
+    assert stored_frontend_property(prop) == projection
+
+
+@pytest.mark.asyncio
+async def test_version_bump_invalidates_stored_projection(
+    db_session: AsyncSession, test_property
+):
+    test_property.year_built = 2018
+    await db_session.commit()
+    prop = await _reload(db_session, test_property)
+    assert stored_frontend_property(prop) is not None
+
+    with patch.object(
+        _property_transforms,
+        "PROJECTION_VERSION",
+        _property_transforms.PROJECTION_VERSION + 1,
+    ):
+        assert stored_frontend_property(prop) is None
+
+
+@pytest.mark.asyncio
+async def test_transform_failure_does_not_block_update(
+    db_session: AsyncSession, test_property
+):
+    with patch(_TRANSFORM, side_effect=ValueError("bad operationsByYear key")):
+        test_property.total_units = 90
+        await db_session.commit()
+
+    prop = await _reload(db_session, test_property)
+    assert prop.total_units == 90
+    assert prop.frontend_projection is None
+
+
+@pytest.mark.asyncio
+async def test_dashboard_detail_serves_projection(
+    client, db_session: AsyncSession, auth_headers, test_property
+):
+    test_property.financial_data = {
+        "acquisition": {"purchasePrice": 10_000_000},
+        "expenses": {"realEstateTaxes": 120_000},
+        "operationsByYear": {"1": {"noi": 550_000}},
+    }
+    await db_session.commit()
+
+    with patch(_TRANSFORM, wraps=to_frontend_property) as transform:
+        response = await client.get(
+            f"/api/v1/properties/dashboard/{test_property.id}", headers=auth_headers
+        )
+
+    assert response.status_code == 200
+    transform.assert_not_called()
+    body = response.json()
+    assert body["id"] == str(test_property.id)
+    assert body["operationsByYear"][0]["noi"] == 550_000
@@ -2,6 +2,7 @@
 
 Covers the 10 REST endpoints mounted at /api/v1/sales-analysis:
 1. GET /                         -- Paginated table data
+1b. GET /map                     -- Viewport clusters or points
 2. GET /analytics/time-series    -- (PostgreSQL-only, skipped in SQLite)
 3. GET /analytics/submarket-comparison -- (PostgreSQL-only, skipped)
 4. GET /analytics/buyer-activity -- (PostgreSQL-only, skipped)
@@ -30,11 +31,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from app.core.config import settings
 from app.core.permissions import CurrentUser, Role, get_current_user
 from app.db.base import Base
 from app.db.session import get_db, get_sync_db
 from app.main import app
 from app.models.sales_data import SalesData
+from app.services.sales_rollup import refresh_sales_rollup
 
 # =============================================================================
 # Sync + Async DB fixtures for sales-analysis endpoints
@@ -436,6 +439,50 @@ async def test_filter_options(sales_client, sample_sales_data):
     assert data["submarkets"] == sorted(data["submarkets"])
 
 
+@pytest.mark.asyncio
+async def test_filter_options_counts_and_ranges(sales_client, sample_sales_data):
+    """Filter options carry per-value counts and range bounds."""
+    response = await sales_client.get(f"{BASE_URL}/filter-options")
+    data = response.json()
+    assert data["counts"]["submarkets"] == {
+        "Central Phoenix": 2,
+        "East Valley": 2,
+        "West Valley": 1,
+    }
+    assert data["star_ratings"] == ["3 Star", "4 Star", "5 Star"]
+    assert data["ranges"]["units"] == {"min": 40.0, "max": 250.0}
+    assert data["ranges"]["sale_date"] == {"min": "2022-05-01", "max": "2024-07-20"}
+
+
+@pytest.mark.asyncio
+async def test_filter_options_cached_until_import(
+    sales_client, db_session, sample_sales_data
+):
+    """Filter options are served from the cache until an import runs."""
+    from app.services.sales_import import FileImportResult
+
+    url = f"{BASE_URL}/filter-options"
+    await sales_client.get(url)
+    db_session.add(_make_sales_record(comp_id="C-NEW", submarket_cluster="Tucson"))
+    await db_session.commit()
+
+    assert "Tucson" not in (await sales_client.get(url)).json()["submarkets"]
+
+    with (
+        patch(
+            "app.services.sales_import.get_unimported_files",
+            return_value=["/data/sales/Phoenix/new_data.xlsx"],
+        ),
+        patch(
+            "app.services.sales_import.import_sales_file",
+            return_value=FileImportResult(filename="new_data.xlsx"),
+        ),
+    ):
+        await sales_client.post(f"{BASE_URL}/import")
+
+    assert "Tucson" in (await sales_client.get(url)).json()["submarkets"]
+
+
 @pytest.mark.asyncio
 async def test_list_sales_search_by_buyer(sales_client, sample_sales_data):
     """Test search filter matches buyer company name."""
@@ -457,6 +504,135 @@ async def test_list_sales_max_units_filter(sales_client, sample_sales_data):
         assert rec["number_of_units"] <= 100
 
 
+@pytest.mark.asyncio
+async def test_list_sales_cursor_pages_through_nulls(
+    sales_client, sample_sales_data, db_session
+):
+    """Keyset pages cover every row once, NULL sort values last."""
+    db_session.add(_make_sales_record(comp_id="C-006", sale_price=None))
+    await db_session.commit()
+    url = f"{BASE_URL}/?sort_by=sale_price&sort_dir=desc&page_size=2"
+
+    first = (await sales_client.get(url)).json()
+    names = [r["property_name"] for r in first["data"]]
+    cursor = first["next_cursor"]
+    while cursor:
+        page = (await sales_client.get(f"{url}&cursor={cursor}")).json()
+        names += [r["property_name"] for r in page["data"]]
+        cursor = page["next_cursor"]
+
+    offset = (
+        await sales_client.get(
+            f"{BASE_URL}/?sort_by=sale_price&sort_dir=desc&page_size=10"
+        )
+    ).json()
+    assert names == [r["property_name"] for r in offset["data"]]
+    assert len(names) == 6
+    assert names[-1] == "Test Apartments"  # NULL sale_price
+
+
+@pytest.mark.asyncio
+async def test_list_sales_cursor_prev_returns_previous_page(
+    sales_client, sample_sales_data
+):
+    """prev_cursor from a keyset page returns the page before it."""
+    url = f"{BASE_URL}/?sort_by=sale_date&page_size=2"
+    page1 = (await sales_client.get(url)).json()
+    page2 = (await sales_client.get(f"{url}&cursor={page1['next_cursor']}")).json()
+
+    back = (
+        await sales_client.get(f"{url}&cursor={page2['prev_cursor']}&direction=prev")
+    ).json()
+
+    assert [r["id"] for r in back["data"]] == [r["id"] for r in page1["data"]]
+
+
+@pytest.mark.asyncio
+async def test_list_sales_invalid_cursor(sales_client):
+    """A malformed cursor is rejected with 400."""
+    response = await sales_client.get(f"{BASE_URL}/?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_sales_total_cached_per_filter(
+    sales_client, sample_sales_data, db_session
+):
+    """Totals come from the count cache until exact_total is requested."""
+    url = f"{BASE_URL}/?submarkets=Central Phoenix"
+    first = (await sales_client.get(url)).json()
+    assert (first["total"], first["total_estimated"]) == (2, False)
+
+    db_session.add(_make_sales_record(comp_id="C-007"))
+    await db_session.commit()
+
+    cached = (await sales_client.get(f"{url}&page=2")).json()
+    assert (cached["total"], cached["total_estimated"]) == (2, True)
+    other_filter = (await sales_client.get(f"{BASE_URL}/")).json()
+    assert other_filter["total"] == 6
+    exact = (await sales_client.get(f"{url}&exact_total=true")).json()
+    assert (exact["total"], exact["total_estimated"]) == (3, False)
+
+
+# =============================================================================
+# 1b. GET /map -- Viewport clusters or points (works with SQLite)
+# =============================================================================
+
+MAP_BBOX = "west=-112.5&south=33.2&east=-111.6&north=33.8"
+
+
+@pytest.mark.asyncio
+async def test_sales_map_clusters_at_low_zoom(sales_client, sample_sales_data):
+    """All sample comps share a location and fall into one cluster."""
+    response = await sales_client.get(f"{BASE_URL}/map?{MAP_BBOX}&zoom=9")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["clustered"] is True
+    (cluster,) = data["clusters"]
+    assert cluster["count"] == 5
+    assert cluster["total_units"] == 650
+    assert cluster["latitude"] == pytest.approx(33.45)
+
+
+@pytest.mark.asyncio
+async def test_sales_map_points_at_high_zoom(sales_client, sample_sales_data):
+    """High zoom returns compact points, with the table filters applied."""
+    response = await sales_client.get(
+        f"{BASE_URL}/map?{MAP_BBOX}&zoom=15&min_price=20000000"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["clustered"] is False
+    assert data["total"] == 2
+    assert {p["property_name"] for p in data["points"]} == {
+        "Desert Vista",
+        "Oasis Gardens",
+    }
+    assert "buyer_true_company" not in data["points"][0]
+
+
+@pytest.mark.asyncio
+async def test_sales_map_points_capped(sales_client, sample_sales_data, monkeypatch):
+    """Point mode returns at most MAP_MAX_POINTS and flags the cut-off."""
+    monkeypatch.setattr(settings, "MAP_MAX_POINTS", 3)
+    response = await sales_client.get(f"{BASE_URL}/map?{MAP_BBOX}&zoom=15")
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["points"]) == 3
+    assert data["total"] == 5
+    assert data["truncated"] is True
+
+
+@pytest.mark.asyncio
+async def test_sales_map_excludes_outside_viewport(sales_client, sample_sales_data):
+    """Comps outside the bounding box are not returned."""
+    response = await sales_client.get(
+        f"{BASE_URL}/map?west=-111.0&south=34.0&east=-110.0&north=35.0&zoom=9"
+    )
+    assert response.status_code == 200
+    assert response.json()["total"] == 0
+
+
 # =============================================================================
 # 6. GET /analytics/data-quality (works with SQLite)
 # =============================================================================
@@ -788,6 +964,135 @@ async def test_distributions_mocked(sales_client, db_session):
     assert data[0]["count"] == 20
 
 
+# =============================================================================
+# Analytics answered from sales_rollup (works with SQLite)
+# =============================================================================
+
+
+@pytest_asyncio.fixture
+async def rolled_up_sales(db_session, sample_sales_data) -> list[SalesData]:
+    """``sample_sales_data`` with ``sales_rollup`` built, as after an import."""
+    await db_session.run_sync(refresh_sales_rollup)
+    return sample_sales_data
+
+
+@pytest.mark.asyncio
+async def test_time_series_from_rollup(sales_client, rolled_up_sales):
+    """Whole-month filters are answered from the rollup."""
+    response = await sales_client.get(
+        f"{BASE_URL}/analytics/time-series",
+        params={
+            "granularity": "quarter",
+            "min_units": 51,
+            "date_from": "2023-01-01",
+            "date_to": "2024-06-30",
+        },
+    )
+    assert response.status_code == 200
+    assert response.json() == [
+        {
+            "period": "2023-Q4",
+            "count": 1,
+            "total_volume": 8000000.0,
+            "avg_price_per_unit": 100000.0,
+        },
+        {
+            "period": "2024-Q1",
+            "count": 2,
+            "total_volume": 42000000.0,
+            "avg_price_per_unit": 150000.0,
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_submarket_comparison_from_rollup(sales_client, rolled_up_sales):
+    """Submarket/year aggregates fold the rollup's months into years."""
+    response = await sales_client.get(f"{BASE_URL}/analytics/submarket-comparison")
+    assert response.status_code == 200
+    data = response.json()
+    assert [(d["submarket"], d["year"], d["sales_count"]) for d in data] == [
+        ("Central Phoenix", 2024, 2),
+        ("East Valley", 2022, 1),
+        ("East Valley", 2023, 1),
+        ("West Valley", 2024, 1),
+    ]
+    assert data[0]["avg_price_per_unit"] == 200000.0
+    assert data[0]["total_volume"] == 80500000.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"group_by": "vintage"},
+        {"group_by": "unit_count", "submarkets": "East Valley,West Valley"},
+        {"group_by": "star_rating", "max_year_built": 2004},
+    ],
+)
+async def test_distributions_rollup_matches_raw_scan(
+    sales_client, db_session, sample_sales_data, params
+):
+    """The rollup answers aligned filters exactly like the raw scan."""
+    url = f"{BASE_URL}/analytics/distributions"
+    raw = await sales_client.get(url, params=params)
+
+    await db_session.run_sync(refresh_sales_rollup)
+    rolled_up = await sales_client.get(url, params=params)
+
+    assert raw.status_code == rolled_up.status_code == 200
+    assert rolled_up.json() == raw.json()
+
+
+@pytest.mark.asyncio
+async def test_distributions_unaligned_filter_scans_sales_data(
+    sales_client, db_session, rolled_up_sales
+):
+    """Filters inside a bucket fall back to sales_data, which sees later rows."""
+    db_session.add(_make_sales_record(comp_id="C-NEW", number_of_units=90))
+    await db_session.commit()
+    url = f"{BASE_URL}/analytics/distributions"
+
+    aligned = await sales_client.get(
+        url, params={"group_by": "unit_count", "min_units": 51, "max_units": 100}
+    )
+    unaligned = await sales_client.get(
+        url, params={"group_by": "unit_count", "min_units": 60, "max_units": 100}
+    )
+
+    # The rollup was built before C-NEW was added
+    assert aligned.json()[0]["count"] == 1
+    assert unaligned.json()[0]["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_data_quality_rollup_matches_raw_scan(
+    sales_client, db_session, sample_sales_data
+):
+    """Data quality totals from the rollup equal the raw counts."""
+    db_session.add(
+        _make_sales_record(
+            comp_id="C-Q",
+            sale_price=1.0,
+            price_per_unit=None,
+            actual_cap_rate=None,
+            number_of_units=900,
+        )
+    )
+    await db_session.commit()
+    url = f"{BASE_URL}/analytics/data-quality"
+    raw = await sales_client.get(url)
+
+    await db_session.run_sync(refresh_sales_rollup)
+    rolled_up = await sales_client.get(url)
+
+    assert rolled_up.json() == raw.json()
+    assert rolled_up.json()["flagged_outliers"] == {
+        "dollar_one_sales": 1,
+        "high_unit_count_over_800": 1,
+    }
+
+
 # =============================================================================
 # 7. POST /import -- mock the import service
 # =============================================================================
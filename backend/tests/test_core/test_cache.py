@@ -8,6 +8,7 @@ F-033: Tests the CacheService from app.core.cache including:
 """
 
 import time
+from decimal import Decimal
 from unittest.mock import patch
 
 import pytest
@@ -266,3 +267,25 @@ def test_make_cache_key_from_params_all_none():
     """make_cache_key_from_params with all None values returns just the prefix."""
     key = make_cache_key_from_params("prefix", a=None, b=None)
     assert key == "prefix"
+
+
+# =============================================================================
+# Pre-encoded entries
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_set_returns_stored_bytes():
+    svc = _make_service()
+
+    raw = await svc.set("encoded", {"price": Decimal("12.50"), "units": 200})
+
+    assert raw == b'{"price":12.5,"units":200}'
+    assert await svc.get_raw("encoded") == raw
+    assert await svc.get("encoded") == {"price": 12.5, "units": 200}
+
+
+@pytest.mark.asyncio
+async def test_get_raw_miss_returns_none():
+    svc = _make_service()
+    assert await svc.get_raw("missing") is None
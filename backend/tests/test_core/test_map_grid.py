@@ -0,0 +1,27 @@
+"""Tests for the integer map grid used by the map endpoints."""
+
+from app.core.map_grid import GRID_ZOOM, TILE_PX, cell_size, to_grid
+
+WORLD_PX = TILE_PX << GRID_ZOOM
+
+
+def test_to_grid_known_positions():
+    assert to_grid(0.0, 0.0) == (WORLD_PX // 2, WORLD_PX // 2)
+    assert to_grid(90.0, -180.0) == (0, 0)
+    assert to_grid(-90.0, 180.0) == (WORLD_PX - 1, WORLD_PX - 1)
+
+
+def test_to_grid_missing_coordinate():
+    assert to_grid(None, -112.07) is None
+    assert to_grid(33.45, None) is None
+
+
+def test_north_is_smaller_y():
+    _, phoenix_y = to_grid(33.45, -112.07)
+    _, flagstaff_y = to_grid(35.2, -111.65)
+    assert flagstaff_y < phoenix_y
+
+
+def test_cell_size_halves_per_zoom_level():
+    assert cell_size(10) == 2 * cell_size(11)
+    assert cell_size(GRID_ZOOM) == cell_size(GRID_ZOOM + 2)
@@ -0,0 +1,187 @@
+"""Tests for the per-process principal cache used by get_current_user.
+
+Covers:
+- TTL expiry, LRU bound and per-user eviction
+- get_current_user serving repeat requests without a DB lookup
+- Invalidation on user update/deactivation and token revocation
+- Cross-replica invalidation via Redis pub/sub (fakeredis)
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.permissions import CurrentUser, Role, get_current_user
+from app.core.principal_cache import PrincipalCache, principal_cache
+from app.core.security import create_access_token, decode_token
+from app.core.token_blacklist import TokenBlacklist
+from app.crud import user as user_crud
+
+
+def _principal(user_id: int = 1) -> CurrentUser:
+    return CurrentUser(id=user_id, email=f"u{user_id}@test.com", role=Role.ANALYST)
+
+
+@pytest.fixture
+def no_redis(monkeypatch):
+    """Keep invalidation process-local."""
+    monkeypatch.setattr(principal_cache, "_redis", None)
+    monkeypatch.setattr(principal_cache, "_init_attempted", True)
+
+
+# =============================================================================
+# Cache mechanics
+# =============================================================================
+
+
+class TestPrincipalCache:
+    def test_hit_after_set(self):
+        cache = PrincipalCache(ttl_seconds=30, max_entries=10)
+        principal = _principal()
+
+        cache.set("1", 1000, principal)
+
+        assert cache.get(1, 1000) is principal
+        assert cache.get("1", 1001) is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_entry_expires(self):
+        cache = PrincipalCache(ttl_seconds=30, max_entries=10)
+        with patch("app.core.principal_cache.time.monotonic", return_value=100.0):
+            cache.set("1", 1000, _principal())
+        with patch("app.core.principal_cache.time.monotonic", return_value=131.0):
+            assert cache.get("1", 1000) is None
+        assert len(cache) == 0
+
+    def test_lru_bound(self):
+        cache = PrincipalCache(ttl_seconds=30, max_entries=2)
+        cache.set("1", 1, _principal(1))
+        cache.set("2", 1, _principal(2))
+        cache.get("1", 1)  # promote user 1
+
+        cache.set("3", 1, _principal(3))
+
+        assert cache.get("1", 1) is not None
+        assert cache.get("2", 1) is None
+        assert cache.get("3", 1) is not None
+
+    def test_evict_user_drops_all_tokens(self):
+        cache = PrincipalCache(ttl_seconds=30, max_entries=10)
+        cache.set("1", 1000, _principal(1))
+        cache.set("1", 2000, _principal(1))
+        cache.set("2", 1000, _principal(2))
+
+        assert cache.evict_user(1) == 2
+        assert cache.get("1", 1000) is None
+        assert cache.get("2", 1000) is not None
+
+    def test_disabled_with_zero_ttl(self):
+        cache = PrincipalCache(ttl_seconds=0, max_entries=10)
+        cache.set("1", 1000, _principal())
+        assert cache.get("1", 1000) is None
+        assert len(cache) == 0
+
+
+# =============================================================================
+# get_current_user integration
+# =============================================================================
+
+
+class TestGetCurrentUserCaching:
+    @pytest.mark.asyncio
+    async def test_repeat_requests_skip_db(self, db_session, test_user):
+        token = create_access_token(subject=str(test_user.id))
+
+        with patch.object(user_crud, "get", wraps=user_crud.get) as get:
+            first = await get_current_user(token=token, db=db_session)
+            second = await get_current_user(token=token, db=db_session)
+
+        assert first.id == test_user.id
+        assert second is first
+        get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cache_keyed_by_token_iat(self, db_session, test_user):
+        token = create_access_token(subject=str(test_user.id))
+        await get_current_user(token=token, db=db_session)
+
+        iat = decode_token(token)["iat"]
+        assert principal_cache.get(str(test_user.id), iat) is not None
+
+    @pytest.mark.asyncio
+    async def test_deactivation_invalidates(self, db_session, test_user, no_redis):
+        token = create_access_token(subject=str(test_user.id))
+        await get_current_user(token=token, db=db_session)
+
+        await user_crud.update(
+            db_session, db_obj=test_user, obj_in={"is_active": False}
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(token=token, db=db_session)
+        assert exc_info.value.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_role_change_visible_immediately(
+        self, db_session, test_user, no_redis
+    ):
+        token = create_access_token(subject=str(test_user.id))
+        before = await get_current_user(token=token, db=db_session)
+
+        await user_crud.update(db_session, db_obj=test_user, obj_in={"role": "admin"})
+        after = await get_current_user(token=token, db=db_session)
+
+        assert before.role == Role.ANALYST
+        assert after.role == Role.ADMIN
+
+    @pytest.mark.asyncio
+    async def test_revoke_user_tokens_invalidates(self, monkeypatch, no_redis):
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "REDIS_URL", "")
+        principal_cache.set("7", 1000, _principal(7))
+
+        await TokenBlacklist().revoke_user_tokens("7")
+
+        assert principal_cache.get("7", 1000) is None
+
+
+# =============================================================================
+# Cross-replica invalidation
+# =============================================================================
+
+
+class TestPubSubInvalidation:
+    @pytest.mark.asyncio
+    async def test_invalidation_reaches_other_replica(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        server = fakeredis.FakeServer()
+
+        def _replica() -> PrincipalCache:
+            cache = PrincipalCache(ttl_seconds=30, max_entries=10)
+            cache._redis = fakeredis.aioredis.FakeRedis(
+                server=server, decode_responses=True
+            )
+            cache._init_attempted = True
+            return cache
+
+        publisher, subscriber = _replica(), _replica()
+        await subscriber.start_listener()
+        try:
+            # Let the listener subscribe (it clears the cache on subscribe)
+            await asyncio.sleep(0.05)
+            subscriber.set("5", 1000, _principal(5))
+            subscriber.set("6", 1000, _principal(6))
+
+            await publisher.invalidate_user(5)
+            for _ in range(50):
+                if subscriber.get("5", 1000) is None:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert subscriber.get("5", 1000) is None
+            assert subscriber.get("6", 1000) is not None
+        finally:
+            await subscriber.stop_listener()
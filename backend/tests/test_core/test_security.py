@@ -1,9 +1,14 @@
 """Tests for core security module."""
 
+import asyncio
+import gc
+import time
 from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
 
 import jwt
 import pytest
+from httpx import ASGITransport, AsyncClient
 
 from app.core.config import settings
 from app.core.security import (
@@ -11,8 +16,11 @@ from app.core.security import (
     create_refresh_token,
     decode_token,
     get_password_hash,
+    get_password_hash_async,
     verify_password,
+    verify_password_async,
 )
+from app.services.monitoring.metrics import PASSWORD_HASH_QUEUE_DEPTH
 
 # =============================================================================
 # Password Hashing Tests
@@ -78,6 +86,90 @@ class TestPasswordHashing:
         assert verify_password(password, hashed) is True
 
 
+# =============================================================================
+# Async (off-loop) Password Hashing Tests
+# =============================================================================
+
+
+class TestAsyncPasswordHashing:
+    """Tests for hashing on the dedicated bcrypt pool."""
+
+    @pytest.mark.asyncio
+    async def test_async_round_trip(self):
+        hashed = await get_password_hash_async("testpassword123")
+
+        assert await verify_password_async("testpassword123", hashed) is True
+        assert await verify_password_async("wrongpassword", hashed) is False
+        assert verify_password("testpassword123", hashed) is True
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_tracks_pending_jobs(self):
+        hashed = get_password_hash("pw")
+        baseline = PASSWORD_HASH_QUEUE_DEPTH._value.get()
+
+        jobs = [
+            asyncio.create_task(verify_password_async("pw", hashed)) for _ in range(6)
+        ]
+        await asyncio.sleep(0)
+        in_flight = PASSWORD_HASH_QUEUE_DEPTH._value.get() - baseline
+        await asyncio.gather(*jobs)
+
+        assert in_flight == 6
+        assert PASSWORD_HASH_QUEUE_DEPTH._value.get() == baseline
+
+    @pytest.mark.asyncio
+    async def test_authenticate_verifies_off_loop(self, db_session, test_user):
+        from app.crud import crud_user
+
+        with patch.object(
+            crud_user, "verify_password_async", AsyncMock(return_value=True)
+        ) as verify:
+            user = await crud_user.user.authenticate(
+                db_session, email=test_user.email, password="testpassword123"
+            )
+
+        assert user is not None
+        verify.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_other_endpoints_served_during_login_storm(self):
+        """A burst of password checks must not stall unrelated requests."""
+        from app.main import app
+
+        hashed = get_password_hash("pw")
+        start = time.perf_counter()
+        verify_password("pw", hashed)
+        single_hash = time.perf_counter() - start
+
+        latencies = []
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            await ac.get("/")  # warm up
+            # A full GC pass over the test session's heap would dwarf the
+            # request latency being measured
+            gc.collect()
+            gc.disable()
+            try:
+                storm = [
+                    asyncio.create_task(verify_password_async("pw", hashed))
+                    for _ in range(3 * settings.PASSWORD_HASH_WORKERS)
+                ]
+                while not all(job.done() for job in storm):
+                    start = time.perf_counter()
+                    response = await ac.get("/")
+                    latencies.append(time.perf_counter() - start)
+                    assert response.status_code == 200
+                    # In-process requests may never suspend; let the jobs start
+                    await asyncio.sleep(0.01)
+            finally:
+                gc.enable()
+        assert all(await asyncio.gather(*storm))
+
+        # Blocking bcrypt would hold each request for at least one full hash
+        assert len(latencies) > 3
+        assert max(latencies) < single_hash
+
+
 # =============================================================================
 # Access Token Tests
 # =============================================================================
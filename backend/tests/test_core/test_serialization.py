@@ -0,0 +1,92 @@
+"""Tests for the shared JSON codec and FastJSONResponse.
+
+Covers:
+- Encoding of Decimal, datetime, UUID, set, Pydantic and non-string keys
+- FastJSONResponse passing pre-encoded bytes through unchanged
+- Cached dashboard responses served as the stored bytes
+"""
+
+import json
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from unittest.mock import patch
+from uuid import UUID
+
+import pytest
+from pydantic import BaseModel
+
+from app.core.cache import _memory_cache
+from app.core.serialization import FastJSONResponse, dumps, loads
+
+
+class _Point(BaseModel):
+    x: int
+    at: date
+
+
+def test_dumps_extended_types():
+    value = {
+        "price": Decimal("1500000.25"),
+        "units": Decimal("200"),
+        "ts": datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC),
+        "id": UUID("12345678-1234-5678-1234-567812345678"),
+        "tags": {"a"},
+        "point": _Point(x=1, at=date(2026, 1, 2)),
+        7: "int key",
+    }
+
+    assert loads(dumps(value)) == {
+        "price": 1500000.25,
+        "units": 200,
+        "ts": "2026-01-02T03:04:05+00:00",
+        "id": "12345678-1234-5678-1234-567812345678",
+        "tags": ["a"],
+        "point": {"x": 1, "at": "2026-01-02"},
+        "7": "int key",
+    }
+
+
+def test_dumps_non_finite_decimals():
+    value = {
+        "nan": Decimal("NaN"),
+        "snan": Decimal("sNaN"),
+        "inf": Decimal("Infinity"),
+        "neg": Decimal("-Infinity"),
+    }
+    assert loads(dumps(value)) == dict.fromkeys(value)
+
+
+def test_dumps_matches_stdlib_json():
+    value = {"name": "Hayden Park", "noi": 550000.5, "years": [1, 2], "x": None}
+    assert loads(dumps(value)) == json.loads(json.dumps(value))
+
+
+def test_response_passes_bytes_through():
+    raw = b'{"cached":true}'
+    response = FastJSONResponse(raw)
+
+    assert response.body is raw
+    assert response.media_type == "application/json"
+    assert FastJSONResponse({"cached": True}).body == raw
+
+
+@pytest.fixture
+def clean_cache():
+    _memory_cache.clear()
+    yield
+    _memory_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_cached_dashboard_served_as_stored_bytes(
+    client, auth_headers, test_property, clean_cache
+):
+    first = await client.get("/api/v1/properties/dashboard", headers=auth_headers)
+    (raw, _expires) = _memory_cache["dashboard:property_dashboard_list:0:50"]
+
+    with patch("app.core.serialization.orjson.dumps") as encode:
+        second = await client.get("/api/v1/properties/dashboard", headers=auth_headers)
+
+    encode.assert_not_called()
+    assert first.content == second.content == raw
+    assert second.json()["properties"][0]["name"] == test_property.name
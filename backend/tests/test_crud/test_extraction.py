@@ -16,6 +16,7 @@ Tests cover:
 - ExtractedValueCRUD.get_property_summary() - Get property data as dict
 - ExtractedValueCRUD.get_extraction_stats() - Get extraction statistics
 - ExtractedValueCRUD.list_properties() - List properties
+- property_key matching in bulk_insert / sync / hydration
 
 Run with: pytest tests/test_crud/test_extraction.py -v
 """
@@ -30,9 +31,15 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from app.crud.extraction import ExtractedValueCRUD, ExtractionRunCRUD
+from app.crud.extraction import (
+    ExtractedValueCRUD,
+    ExtractionRunCRUD,
+    hydrate_properties_from_extracted,
+    sync_extracted_to_properties,
+)
 from app.db.base import Base
 from app.models.extraction import ExtractedValue, ExtractionRun
+from app.models.property import Property
 
 # ============================================================================
 # Sync Database Setup
@@ -875,5 +882,115 @@ class TestExtractionRunProperties:
         assert run.success_rate is None
 
 
+# ============================================================================
+# Test: property_key matching
+# ============================================================================
+
+
+def _add_property(db: Session, name: str) -> Property:
+    prop = Property(
+        name=name,
+        property_type="multifamily",
+        address="1 Test St",
+        city="Phoenix",
+        state="AZ",
+        zip_code="85001",
+    )
+    db.add(prop)
+    db.commit()
+    return prop
+
+
+class TestPropertyKeyMatching:
+    """Properties and extracted values are joined on normalized property_key."""
+
+    def test_keys_maintained_on_write(self, sync_db_session: Session) -> None:
+        """property_key follows the name on insert and rename."""
+        prop = _add_property(sync_db_session, "Hayden Park (Phoenix, AZ)")
+        assert prop.property_key == "hayden park"
+
+        prop.name = "Hayden Park II (Phoenix, AZ)"
+        sync_db_session.commit()
+        assert prop.property_key == "hayden park ii"
+
+    def test_bulk_insert_links_by_key(
+        self, sync_db_session: Session, extraction_run: ExtractionRun
+    ) -> None:
+        """A bare extracted name links to the suffixed property."""
+        prop = _add_property(sync_db_session, "Hayden Park (Phoenix, AZ)")
+
+        ExtractedValueCRUD.bulk_insert(
+            sync_db_session,
+            extraction_run_id=extraction_run.id,
+            extracted_data={"TOTAL_UNITS": 120},
+            mappings={},
+            property_name="Hayden Park",
+        )
+
+        value = ExtractedValueCRUD.get_by_property(sync_db_session, "Hayden Park")[0]
+        assert value.property_key == "hayden park"
+        assert value.property_id == prop.id
+
+    def test_sync_links_existing_property(
+        self, sync_db_session: Session, extraction_run: ExtractionRun
+    ) -> None:
+        """Unlinked values are attached to a case-insensitive key match."""
+        prop = _add_property(sync_db_session, "Hayden Park (Phoenix, AZ)")
+        sync_db_session.add(
+            ExtractedValue(
+                extraction_run_id=extraction_run.id,
+                property_name="HAYDEN PARK",
+                field_name="TOTAL_UNITS",
+                value_numeric=120,
+            )
+        )
+        sync_db_session.commit()
+
+        result = sync_extracted_to_properties(sync_db_session, extraction_run.id)
+
+        assert result["properties_created"] == 0
+        assert result["properties_linked"] == 1
+        value = ExtractedValueCRUD.get_by_property(sync_db_session, "HAYDEN PARK")[0]
+        assert value.property_id == prop.id
+
+    def test_hydration_uses_latest_value_per_key(
+        self, sync_db_session: Session, extraction_run: ExtractionRun
+    ) -> None:
+        """Hydration reads values stored under any name sharing the key."""
+        prop = _add_property(sync_db_session, "Hayden Park (Phoenix, AZ)")
+        sync_db_session.add_all(
+            [
+                ExtractedValue(
+                    extraction_run_id=extraction_run.id,
+                    property_name="Hayden Park",
+                    field_name="PURCHASE_PRICE",
+                    value_numeric=9_000_000,
+                    created_at=datetime(2024, 1, 1, tzinfo=UTC),
+                ),
+                ExtractedValue(
+                    extraction_run_id=extraction_run.id,
+                    property_name="Hayden Park (Run 2)",
+                    field_name="PURCHASE_PRICE",
+                    value_numeric=9_500_000,
+                    created_at=datetime(2024, 6, 1, tzinfo=UTC),
+                ),
+                ExtractedValue(
+                    extraction_run_id=extraction_run.id,
+                    property_name="Hayden Parkway",
+                    field_name="YEAR_BUILT",
+                    value_numeric=1999,
+                ),
+            ]
+        )
+        sync_db_session.commit()
+
+        result = hydrate_properties_from_extracted(sync_db_session)
+
+        assert result["properties_updated"] == 1
+        sync_db_session.refresh(prop)
+        assert float(prop.purchase_price) == 9_500_000
+        assert prop.year_built is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,226 @@
+"""
+Tests for the buffered audit/activity log writer.
+
+Covers:
+- Sync durability leaves writes in the request transaction
+- Buffered writes are queued, then inserted in one multi-row INSERT per table
+- Size- and time-triggered flushes from the background task
+- Failed flushes keep entries (bounded by max_pending)
+- Shutdown flushes remaining entries
+"""
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.permissions import CurrentUser, Role
+from app.crud import activity_log as activity_log_crud
+from app.db.audit_sink import AuditSink
+from app.db.base import Base
+from app.models.activity_log import ActivityAction, ActivityLog
+from app.models.audit_log import AuditLog
+from app.services.audit_service import log_action
+
+ADMIN = CurrentUser(id=1, email="admin@test.com", role=Role.ADMIN)
+
+
+@pytest_asyncio.fixture
+async def db_session(tmp_path):
+    """A session on a file-backed database of its own.
+
+    The sink flushes from a background task through its own sessions; the
+    shared in-memory test engine has a single StaticPool connection, so the
+    sink and the test would interleave on it.
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'audit.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            yield session
+    finally:
+        await engine.dispose()
+
+
+def _sink(db_session: AsyncSession, **overrides) -> AuditSink:
+    options = {
+        "durability": "buffered",
+        "batch_size": 100,
+        "flush_interval": 60.0,
+        "max_pending": 1000,
+        "session_factory": async_sessionmaker(db_session.bind, expire_on_commit=False),
+    }
+    options.update(overrides)
+    return AuditSink(**options)
+
+
+def _row(i: int = 0) -> dict:
+    now = datetime.now(UTC)
+    return {
+        "timestamp": now,
+        "user_id": 1,
+        "user_email": "admin@test.com",
+        "action": f"test.{i}",
+        "resource_type": "test",
+        "created_at": now,
+    }
+
+
+async def _count(db_session: AsyncSession, model) -> int:
+    return await db_session.scalar(select(func.count()).select_from(model))
+
+
+async def _wait_for(predicate, timeout: float = 2.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not await predicate():
+        assert loop.time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+class TestDurabilityModes:
+    @pytest.mark.asyncio
+    async def test_sync_mode_never_starts(self, db_session):
+        sink = _sink(db_session, durability="sync")
+        await sink.start()
+        assert sink.buffered is False
+
+    @pytest.mark.asyncio
+    async def test_log_action_queues_when_buffered(self, db_session):
+        sink = _sink(db_session)
+        await sink.start()
+        try:
+            with patch("app.services.audit_service.audit_sink", sink):
+                for i in range(3):
+                    await log_action(
+                        db=db_session, user=ADMIN, action=f"a.{i}", resource_type="x"
+                    )
+
+            # Nothing added to the request session
+            assert not db_session.new
+            assert len(sink) == 3
+            assert await _count(db_session, AuditLog) == 0
+
+            assert await sink.flush() == 3
+            assert await _count(db_session, AuditLog) == 3
+        finally:
+            await sink.stop()
+
+    @pytest.mark.asyncio
+    async def test_activity_log_queued_when_buffered(self, db_session, test_deal):
+        sink = _sink(db_session)
+        await sink.start()
+        try:
+            with patch("app.crud.crud_activity_log.audit_sink", sink):
+                entry = await activity_log_crud.log_stage_change(
+                    db_session,
+                    deal_id=test_deal.id,
+                    old_stage="initial_review",
+                    new_stage="active_review",
+                )
+
+            assert entry.action == ActivityAction.STAGE_CHANGED
+            assert entry.created_at is not None
+            await db_session.commit()
+            await sink.flush()
+
+            stored = await db_session.get(ActivityLog, entry.id)
+            assert stored.meta == {
+                "old_stage": "initial_review",
+                "new_stage": "active_review",
+            }
+        finally:
+            await sink.stop()
+
+
+class TestBatching:
+    @pytest.mark.asyncio
+    async def test_one_insert_per_table(self, db_session):
+        sink = _sink(db_session)
+        for i in range(50):
+            await sink.write(AuditLog, _row(i))
+
+        inserts = []
+
+        def _record(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("INSERT"):
+                inserts.append(statement)
+
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            assert await sink.flush() == 50
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+        assert len(inserts) == 1
+        assert await _count(db_session, AuditLog) == 50
+
+    @pytest.mark.asyncio
+    async def test_flush_when_batch_full(self, db_session):
+        sink = _sink(db_session, batch_size=5)
+        await sink.start()
+        try:
+            for i in range(5):
+                await sink.write(AuditLog, _row(i))
+
+            async def _written():
+                return await _count(db_session, AuditLog) == 5
+
+            await _wait_for(_written)
+        finally:
+            await sink.stop()
+
+    @pytest.mark.asyncio
+    async def test_flush_on_interval(self, db_session):
+        sink = _sink(db_session, flush_interval=0.05)
+        await sink.start()
+        try:
+            await sink.write(AuditLog, _row())
+
+            async def _written():
+                return await _count(db_session, AuditLog) == 1
+
+            await _wait_for(_written)
+        finally:
+            await sink.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_pending(self, db_session):
+        sink = _sink(db_session)
+        await sink.start()
+        await sink.write(AuditLog, _row())
+
+        await sink.stop()
+
+        assert len(sink) == 0
+        assert await _count(db_session, AuditLog) == 1
+
+
+class TestFailures:
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_entries(self, db_session):
+        def _broken_session():
+            raise ConnectionError("db down")
+
+        sink = _sink(db_session, session_factory=_broken_session)
+        await sink.write(AuditLog, _row())
+
+        assert await sink.flush() == 0
+        assert len(sink) == 1
+
+    @pytest.mark.asyncio
+    async def test_pending_bounded_when_db_down(self, db_session):
+        def _broken_session():
+            raise ConnectionError("db down")
+
+        sink = _sink(db_session, session_factory=_broken_session, max_pending=3)
+        for i in range(5):
+            await sink.write(AuditLog, _row(i))
+
+        assert len(sink) == 3
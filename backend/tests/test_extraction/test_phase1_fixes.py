@@ -5,6 +5,7 @@ Tests cover:
 - 1.1: Non-deterministic deal enrichment → latest completed run filtering
 - 1.2: Hash normalization mismatch → consistent float hashing
 - 1.3: Status endpoint returns any-status runs → get_latest_completed()
+- Persisted per-run extraction digests for batched change detection
 
 Run with: pytest tests/test_extraction/test_phase1_fixes.py -v
 """
@@ -14,16 +15,20 @@ from datetime import UTC, datetime, timedelta
 
 import numpy as np
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, delete, event
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.crud.extraction import ExtractedValueCRUD, ExtractionRunCRUD
 from app.db.base import Base
+from app.models.extraction import ExtractionDigest
 from app.services.extraction.change_detector import (
+    RunDigests,
     _normalize_value_from_text,
     compute_extraction_hash,
     get_db_values_hash,
+    get_latest_digests,
+    should_extract_deal,
 )
 
 # ============================================================================
@@ -148,6 +153,121 @@ class TestHashNormalization:
         assert db_hash is not None
 
 
+# ============================================================================
+# Persisted Extraction Digests
+# ============================================================================
+
+
+def _completed_run_with(db: Session, data_by_property: dict[str, dict]):
+    run = ExtractionRunCRUD.create(db, trigger_type="manual")
+    for property_name, data in data_by_property.items():
+        ExtractedValueCRUD.bulk_insert(db, run.id, data, {}, property_name)
+    ExtractionRunCRUD.complete(db, run.id, len(data_by_property), 0)
+    return run
+
+
+class TestExtractionDigests:
+    """Tests for digest-based change detection."""
+
+    def test_bulk_insert_records_digest(self, sync_db_session: Session):
+        """bulk_insert should persist compute_extraction_hash() for the run."""
+        data = {"FIELD_A": 1.5, "FIELD_B": "x", "_meta": "ignored"}
+        _completed_run_with(sync_db_session, {"Prop A": data})
+
+        digests = get_latest_digests(sync_db_session)
+        assert digests == {"Prop A": compute_extraction_hash(data)}
+
+    def test_latest_completed_run_wins(self, sync_db_session: Session):
+        """Only the most recent completed run's digest should be returned."""
+        _completed_run_with(sync_db_session, {"Prop A": {"F": 1.0}})
+        _completed_run_with(
+            sync_db_session, {"Prop A": {"F": 2.0}, "Prop B": {"F": 3.0}}
+        )
+        running = ExtractionRunCRUD.create(sync_db_session, trigger_type="manual")
+        ExtractedValueCRUD.bulk_insert(
+            sync_db_session, running.id, {"F": 9.0}, {}, "Prop A"
+        )
+
+        digests = get_latest_digests(sync_db_session)
+        assert digests["Prop A"] == compute_extraction_hash({"F": 2.0})
+        assert digests["Prop B"] == compute_extraction_hash({"F": 3.0})
+        assert get_latest_digests(sync_db_session, ["Prop B"]).keys() == {"Prop B"}
+
+    def test_batched_lookup_is_single_query(self, sync_db_session: Session):
+        """Preloaded digests should make per-deal checks query-free."""
+        data = {f"Prop {i}": {"F": float(i)} for i in range(20)}
+        _completed_run_with(sync_db_session, data)
+
+        statements: list[str] = []
+
+        def _count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(sync_test_engine, "before_cursor_execute", _count)
+        try:
+            digests = get_latest_digests(sync_db_session)
+            results = [
+                should_extract_deal(sync_db_session, name, values, digests)
+                for name, values in data.items()
+            ]
+        finally:
+            event.remove(sync_test_engine, "before_cursor_execute", _count)
+
+        assert len(statements) == 1
+        assert results == [(False, "unchanged")] * 20
+
+    def test_run_digests_load_only_run_properties(self, sync_db_session: Session):
+        """RunDigests preloads the run's names and looks up others on demand."""
+        data = {f"Prop {i}": {"F": float(i)} for i in range(5)}
+        _completed_run_with(sync_db_session, data)
+
+        digests = RunDigests(sync_db_session, ["Prop 1", "Prop 2"])
+        assert dict(digests) == {
+            "Prop 1": compute_extraction_hash({"F": 1.0}),
+            "Prop 2": compute_extraction_hash({"F": 2.0}),
+        }
+
+        assert should_extract_deal(sync_db_session, "Prop 4", {"F": 4.0}, digests) == (
+            False,
+            "unchanged",
+        )
+        assert should_extract_deal(
+            sync_db_session, "Prop New", {"F": 1.0}, digests
+        ) == (True, "new_deal")
+        assert set(digests) == {"Prop 1", "Prop 2", "Prop 4"}
+
+    def test_changed_and_new_deals(self, sync_db_session: Session):
+        """Differing digests and unknown properties should both extract."""
+        _completed_run_with(sync_db_session, {"Prop A": {"F": 1.0}})
+        digests = get_latest_digests(sync_db_session)
+
+        assert should_extract_deal(sync_db_session, "Prop A", {"F": 2.0}, digests) == (
+            True,
+            "data_changed",
+        )
+        assert should_extract_deal(
+            sync_db_session, "Prop New", {"F": 1.0}, digests
+        ) == (True, "new_deal")
+
+    def test_legacy_run_without_digest_is_backfilled(self, sync_db_session: Session):
+        """Runs that predate digests fall back to hashing stored values once."""
+        data = {"FIELD_A": 1234.5, "FIELD_B": "text"}
+        run = _completed_run_with(sync_db_session, {"Legacy": data})
+        sync_db_session.execute(delete(ExtractionDigest))
+        sync_db_session.commit()
+
+        assert should_extract_deal(
+            sync_db_session, "Legacy", data, get_latest_digests(sync_db_session)
+        ) == (False, "unchanged")
+        sync_db_session.commit()
+
+        backfilled = sync_db_session.query(ExtractionDigest).one()
+        assert backfilled.extraction_run_id == run.id
+        assert get_latest_digests(sync_db_session) == {
+            "Legacy": compute_extraction_hash(data)
+        }
+
+
 # ============================================================================
 # Issue 1.3: get_latest_completed() Tests
 # ============================================================================
@@ -4,12 +4,14 @@ Phase 3 tests: Performance improvements.
 Tests cover:
 - 3.1: Parallel extraction produces same results as sequential
 - 3.1: Parallel extraction handles individual file failures
+- 3.1: Extract and persist stages are pipelined through a bounded queue
 - 3.2: Concurrent downloads use semaphore to limit concurrency
 - 3.3: SharePointClient session reuse and cleanup
 
 Run with: pytest tests/test_extraction/test_phase3_performance.py -v
 """
 
+import time
 from collections.abc import Generator
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -20,6 +22,7 @@ from sqlalchemy import create_engine, select
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from app.api.v1.endpoints.extraction import common
 from app.api.v1.endpoints.extraction.common import (
     _extract_single_file,
     process_files,
@@ -175,6 +178,153 @@ class TestParallelExtraction:
         assert updated_run.error_summary["total_failures"] == 1
 
 
+class TestExtractPersistPipeline:
+    """Tests for streaming extraction results into the persist stage."""
+
+    def test_persist_overlaps_extraction(self, sync_db_session: Session):
+        """The first file should be persisted before the last one is extracted."""
+        run = ExtractionRunCRUD.create(sync_db_session, trigger_type="manual")
+        events: list[str] = []
+
+        def mock_extract(path, **kw):
+            time.sleep(0.05)
+            events.append("extract")
+            return {"PROPERTY_NAME": f"Prop_{path}", "FIELD_A": 1.0}
+
+        def mock_should_extract(db, property_name, result, **kw):
+            events.append("persist")
+            return True, "new_deal"
+
+        mock_extractor = MagicMock()
+        mock_extractor.extract_from_file.side_effect = mock_extract
+
+        files_to_process = [
+            {"file_path": f"/tmp/file_{i}.xlsb", "deal_name": f"Deal {i}"}
+            for i in range(4)
+        ]
+
+        with (
+            patch(
+                "app.extraction.ExcelDataExtractor",
+                return_value=mock_extractor,
+            ),
+            patch(
+                "app.services.extraction.change_detector.should_extract_deal",
+                side_effect=mock_should_extract,
+            ),
+        ):
+            process_files(
+                sync_db_session,
+                run.id,
+                files_to_process,
+                {},
+                ExtractionRunCRUD,
+                ExtractedValueCRUD,
+                max_workers=1,
+            )
+
+        last_extract = max(i for i, e in enumerate(events) if e == "extract")
+        assert events.index("persist") < last_extract
+        assert events.count("persist") == 4
+
+    def test_queue_bounded_and_stage_metrics_recorded(self, sync_db_session: Session):
+        """A slow persist stage should never see more than queue_size waiting."""
+        run = ExtractionRunCRUD.create(sync_db_session, trigger_type="manual")
+
+        mock_extractor = MagicMock()
+        mock_extractor.extract_from_file.side_effect = lambda path, **kw: {
+            "PROPERTY_NAME": f"Prop_{path}",
+            "FIELD_A": 1.0,
+        }
+
+        def slow_should_extract(db, property_name, result, **kw):
+            time.sleep(0.02)
+            return True, "new_deal"
+
+        files_to_process = [
+            {"file_path": f"/tmp/file_{i}.xlsb", "deal_name": f"Deal {i}"}
+            for i in range(6)
+        ]
+
+        with (
+            patch(
+                "app.extraction.ExcelDataExtractor",
+                return_value=mock_extractor,
+            ),
+            patch(
+                "app.services.extraction.change_detector.should_extract_deal",
+                side_effect=slow_should_extract,
+            ),
+        ):
+            process_files(
+                sync_db_session,
+                run.id,
+                files_to_process,
+                {},
+                ExtractionRunCRUD,
+                ExtractedValueCRUD,
+                max_workers=3,
+                queue_size=1,
+            )
+
+        updated_run = ExtractionRunCRUD.get(sync_db_session, run.id)
+        assert updated_run.files_processed == 6
+        md = updated_run.file_metadata
+        assert md["queue_depth"]["capacity"] == 1
+        assert md["queue_depth"]["max"] <= 1
+        assert md["stages"]["extract"]["items"] == 6
+        assert md["stages"]["persist"]["items"] == 6
+
+    def test_producer_error_reaches_persist_stage(self, sync_db_session: Session):
+        """An error outside the per-file try still yields a failed outcome."""
+        run = ExtractionRunCRUD.create(sync_db_session, trigger_type="manual")
+        mock_extractor = MagicMock()
+        mock_extractor.extract_from_file.side_effect = lambda path, **kw: {
+            "PROPERTY_NAME": f"Prop_{path}",
+            "FIELD_A": 1.0,
+        }
+        real_extract = common._extract_single_file
+
+        def extract(extractor, file_path, *args, **kwargs):
+            if "bad" in file_path:
+                raise RuntimeError("worker crashed")
+            return real_extract(extractor, file_path, *args, **kwargs)
+
+        files_to_process = [
+            {"file_path": "/tmp/good.xlsb", "deal_name": "Good"},
+            {"file_path": "/tmp/bad.xlsb", "deal_name": "Bad"},
+        ]
+
+        with (
+            patch(
+                "app.extraction.ExcelDataExtractor",
+                return_value=mock_extractor,
+            ),
+            patch(
+                "app.services.extraction.change_detector.should_extract_deal",
+                return_value=(True, "new_deal"),
+            ),
+            patch.object(common, "_extract_single_file", side_effect=extract),
+        ):
+            process_files(
+                sync_db_session,
+                run.id,
+                files_to_process,
+                {},
+                ExtractionRunCRUD,
+                ExtractedValueCRUD,
+                max_workers=2,
+            )
+
+        updated_run = ExtractionRunCRUD.get(sync_db_session, run.id)
+        assert updated_run.status == "completed"
+        assert updated_run.files_processed == 1
+        assert updated_run.files_failed == 1
+        assert updated_run.per_file_status["/tmp/bad.xlsb"]["error"] == (
+            "worker crashed"
+        )
+
+
 class TestExtractSingleFile:
     """Tests for the _extract_single_file helper."""
 
@@ -159,6 +159,27 @@ class TestRunMetrics:
         )
         assert metrics.error_categories == {"parse_error": 3, "type_error": 3}
 
+    def test_stage_and_queue_metrics(self):
+        """Stage timings and queue depth samples should appear in metadata."""
+        metrics = RunMetrics(files_total=2, queue_capacity=4)
+        metrics.record_stage("extract", 0.2)
+        metrics.record_stage("extract", 0.4)
+        metrics.record_stage("persist", 0.1)
+        metrics.record_queue_depth(0)
+        metrics.record_queue_depth(3)
+
+        md = metrics.to_metadata()
+        assert md["stages"]["extract"]["items"] == 2
+        assert md["stages"]["extract"]["avg_ms"] == 300.0
+        assert md["stages"]["persist"]["items"] == 1
+        assert md["queue_depth"] == {"capacity": 4, "max": 3, "avg": 1.5}
+
+    def test_stage_metrics_absent_when_unused(self):
+        """Runs without pipeline samples should report no stage data."""
+        md = RunMetrics(files_total=0).to_metadata()
+        assert md["stages"] is None
+        assert md["queue_depth"] is None
+
 
 # ============================================================================
 # Issue 5.2: File Metadata Persisted
@@ -80,7 +80,7 @@ class TestExtractSingleFileValidateParam:
         _extract_single_file(mock_ext, "/tmp/test.xlsb", "Deal A")
 
         mock_ext.extract_from_file.assert_called_once_with(
-            "/tmp/test.xlsb", validate=True
+            "/tmp/test.xlsb", validate=True, progress_callback=None
         )
 
     def test_validate_false_passed_through(self):
@@ -91,7 +91,7 @@ class TestExtractSingleFileValidateParam:
         _extract_single_file(mock_ext, "/tmp/test.xlsb", "Deal A", validate=False)
 
         mock_ext.extract_from_file.assert_called_once_with(
-            "/tmp/test.xlsb", validate=False
+            "/tmp/test.xlsb", validate=False, progress_callback=None
         )
 
     def test_extraction_error_returns_none_result(self):
@@ -0,0 +1,216 @@
+"""
+Tests for the content-addressed SharePoint workbook store.
+
+Covers:
+- Content addressing (refs per SharePoint path, shared blobs)
+- ETag-based download skipping via SharePointClient.should_download
+- Byte-budgeted LRU eviction and pinning
+- Background prefetch
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.extraction.sharepoint import (
+    SharePointClient,
+    SharePointFile,
+    compute_content_hash_bytes,
+)
+from app.extraction.workbook_store import WorkbookStore
+
+
+def _client() -> SharePointClient:
+    return SharePointClient(
+        tenant_id="t",
+        client_id="c",
+        client_secret="s",
+        site_url="https://example.sharepoint.com/sites/Test",
+    )
+
+
+def _file(path: str, etag: str | None = None) -> SharePointFile:
+    return SharePointFile(
+        name=path.rsplit("/", 1)[-1],
+        path=path,
+        download_url="https://download/x",
+        size=0,
+        modified_date=datetime.now(UTC),
+        deal_name="Deal A",
+        etag=etag,
+    )
+
+
+def _age(path: Path, seconds: float) -> None:
+    stat = path.stat()
+    os.utime(path, (stat.st_atime - seconds, stat.st_mtime - seconds))
+
+
+class TestContentAddressing:
+    """Blobs are keyed by content hash, refs by SharePoint path."""
+
+    def test_put_then_lookup(self, tmp_path: Path) -> None:
+        store = WorkbookStore(tmp_path, max_bytes=1_000)
+        content = b"workbook bytes"
+
+        stored = store.put("Deals/A/UW Model.xlsb", content, '"{e1},1"')
+
+        assert stored.content_hash == compute_content_hash_bytes(content)
+        assert stored.local_path.suffix == ".xlsb"
+        assert stored.local_path.read_bytes() == content
+        assert store.lookup("Deals/A/UW Model.xlsb") == stored
+        assert store.lookup("Deals/B/UW Model.xlsb") is None
+
+    def test_identical_content_shares_blob(self, tmp_path: Path) -> None:
+        store = WorkbookStore(tmp_path, max_bytes=1_000)
+
+        a = store.put("Deals/A/UW.xlsb", b"same", None)
+        b = store.put("Deals/B/UW.xlsb", b"same", None)
+
+        assert a.local_path == b.local_path
+        assert store.total_bytes() == 4
+
+
+class TestFetch:
+    """fetch() downloads only when the ETag changed."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_etag_served_from_store(self, tmp_path: Path) -> None:
+        store = WorkbookStore(tmp_path, max_bytes=1_000)
+        client = _client()
+
+        with patch.object(
+            client, "download_file", new_callable=AsyncMock, return_value=b"v1"
+        ) as download:
+            first, downloaded_first = await store.fetch(
+                client, _file("Deals/A/UW.xlsb", '"{e1},1"')
+            )
+            second, downloaded_second = await store.fetch(
+                client, _file("Deals/A/UW.xlsb", '"{e1},1"')
+            )
+
+        assert downloaded_first is True
+        assert downloaded_second is False
+        assert second.local_path == first.local_path
+        download.assert_awaited_once()
+        assert (store.hits, store.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_changed_etag_downloads_again(self, tmp_path: Path) -> None:
+        store = WorkbookStore(tmp_path, max_bytes=1_000)
+        client = _client()
+        store.put("Deals/A/UW.xlsb", b"v1", '"{e1},1"')
+
+        with patch.object(
+            client, "download_file", new_callable=AsyncMock, return_value=b"v2"
+        ):
+            stored, downloaded = await store.fetch(
+                client, _file("Deals/A/UW.xlsb", '"{e1},2"')
+            )
+
+        assert downloaded is True
+        assert stored.local_path.read_bytes() == b"v2"
+        assert store.lookup("Deals/A/UW.xlsb").etag == '"{e1},2"'
+
+    @pytest.mark.asyncio
+    async def test_unknown_etag_checked_remotely(self, tmp_path: Path) -> None:
+        store = WorkbookStore(tmp_path, max_bytes=1_000)
+        client = _client()
+        store.put("Deals/A/UW.xlsb", b"v1", '"{e1},1"')
+
+        with (
+            patch.object(
+                client,
+                "get_file_etag",
+                new_callable=AsyncMock,
+                return_value='"{e1},1"',
+            ) as get_etag,
+            patch.object(client, "download_file", new_callable=AsyncMock) as download,
+        ):
+            _, downloaded = await store.fetch(client, _file("Deals/A/UW.xlsb"))
+
+        assert downloaded is False
+        get_etag.assert_awaited_once()
+        download.assert_not_awaited()
+
+
+class TestEviction:
+    """The store stays under its byte budget, evicting LRU blobs."""
+
+    def test_least_recently_used_evicted(self, tmp_path: Path) -> None:
+        store = WorkbookStore(tmp_path, max_bytes=25)
+        a = store.put("Deals/A/UW.xlsb", b"a" * 10, None)
+        b = store.put("Deals/B/UW.xlsb", b"b" * 10, None)
+        _age(a.local_path, 20)
+        _age(b.local_path, 10)
+
+        store.put("Deals/C/UW.xlsb", b"c" * 10, None)
+
+        assert store.lookup("Deals/A/UW.xlsb") is None
+        assert store.lookup("Deals/B/UW.xlsb") is not None
+        assert store.lookup("Deals/C/UW.xlsb") is not None
+        assert store.total_bytes() == 20
+        assert store.evictions == 1
+
+    def test_pinned_blob_not_evicted(self, tmp_path: Path) -> None:
+        store = WorkbookStore(tmp_path, max_bytes=25)
+        a = store.put("Deals/A/UW.xlsb", b"a" * 10, None)
+        b = store.put("Deals/B/UW.xlsb", b"b" * 10, None)
+        _age(a.local_path, 20)
+        _age(b.local_path, 10)
+
+        with store.pinned([a.local_path]):
+            store.put("Deals/C/UW.xlsb", b"c" * 10, None)
+
+        assert store.lookup("Deals/A/UW.xlsb") is not None
+        assert store.lookup("Deals/B/UW.xlsb") is None
+
+    def test_blob_pinned_by_another_store_not_evicted(self, tmp_path: Path) -> None:
+        """Pins are file locks, so a second worker's store respects them."""
+        reader = WorkbookStore(tmp_path, max_bytes=25)
+        writer = WorkbookStore(tmp_path, max_bytes=25)
+        a = writer.put("Deals/A/UW.xlsb", b"a" * 10, None)
+        b = writer.put("Deals/B/UW.xlsb", b"b" * 10, None)
+        _age(a.local_path, 20)
+        _age(b.local_path, 10)
+
+        with reader.pinned([a.local_path]):
+            writer.put("Deals/C/UW.xlsb", b"c" * 10, None)
+            assert a.local_path.exists()
+
+        assert not b.local_path.exists()
+        writer.put("Deals/D/UW.xlsb", b"d" * 10, None)
+        assert not a.local_path.exists()
+
+
+class TestPrefetch:
+    """prefetch() fills the store and tolerates individual failures."""
+
+    @pytest.mark.asyncio
+    async def test_prefetch_counts_downloads(self, tmp_path: Path) -> None:
+        store = WorkbookStore(tmp_path, max_bytes=1_000)
+        client = _client()
+
+        async def _download(file: SharePointFile) -> bytes:
+            if file.path.endswith("bad.xlsb"):
+                raise ValueError("boom")
+            return file.path.encode()
+
+        with patch.object(client, "download_file", side_effect=_download):
+            downloaded = await store.prefetch(
+                client,
+                [
+                    _file("Deals/A/UW.xlsb", '"a"'),
+                    _file("Deals/B/UW.xlsb", '"b"'),
+                    _file("Deals/C/bad.xlsb", '"c"'),
+                ],
+            )
+
+        assert downloaded == 2
+        assert store.lookup("Deals/A/UW.xlsb") is not None
+        assert store.lookup("Deals/C/bad.xlsb") is None
@@ -12,7 +12,6 @@ import pytest
 from fastapi import FastAPI, Request
 from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
-from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.middleware.rate_limiter import (
     MemoryRateLimitBackend,
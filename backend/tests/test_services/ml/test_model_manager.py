@@ -80,6 +80,51 @@ class TestModelManagerInit:
         assert model_manager._metadata == {}
 
 
+# =============================================================================
+# Publish Listener Tests
+# =============================================================================
+
+
+class TestPublishListeners:
+    """Tests for new-version publish notifications."""
+
+    def test_save_model_notifies_listeners(self, model_manager, mock_model):
+        """Test listeners receive the model name and published version."""
+        listener = MagicMock()
+        model_manager.add_publish_listener(listener)
+
+        model_manager.save_model(mock_model, "test_model", version="v2")
+
+        listener.assert_called_once_with("test_model", "v2")
+
+    def test_save_model_drops_stale_latest_cache(self, model_manager):
+        """Test loading the latest version after a save returns the new model."""
+        model_manager.save_model(SimpleModel(1.0), "test_model", version="v1")
+        assert model_manager.load_model("test_model").value == 1.0
+
+        model_manager.save_model(SimpleModel(2.0), "test_model", version="v2")
+
+        assert model_manager.load_model("test_model").value == 2.0
+
+    def test_listener_errors_do_not_fail_save(self, model_manager, mock_model):
+        """Test a failing listener does not break saving."""
+        model_manager.add_publish_listener(MagicMock(side_effect=RuntimeError("x")))
+
+        result = model_manager.save_model(mock_model, "test_model", version="v1")
+
+        assert Path(result).exists()
+
+    def test_remove_publish_listener(self, model_manager, mock_model):
+        """Test removed listeners are no longer notified."""
+        listener = MagicMock()
+        model_manager.add_publish_listener(listener)
+        model_manager.remove_publish_listener(listener)
+
+        model_manager.save_model(mock_model, "test_model", version="v1")
+
+        listener.assert_not_called()
+
+
 # =============================================================================
 # Path Generation Tests
 # =============================================================================
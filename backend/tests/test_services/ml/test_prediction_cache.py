@@ -0,0 +1,291 @@
+"""Tests for the rent growth prediction cache and portfolio prescorer."""
+
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from app.services.ml.prediction_cache import PredictionCache
+from app.services.ml.prescoring import (
+    PortfolioPrescorer,
+    property_to_prediction_input,
+)
+from app.services.ml.rent_growth_predictor import RentGrowthPredictor, RentPrediction
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+def _make_prediction(property_id: int = 1, version: str = "v1") -> RentPrediction:
+    return RentPrediction(
+        property_id=property_id,
+        current_rent=1500.0,
+        predicted_rent=1552.5,
+        predicted_growth_rate=3.5,
+        confidence_interval=(1.5, 5.5),
+        prediction_period_months=12,
+        model_version=version,
+        prediction_date="2026-01-01T00:00:00",
+        features_used={},
+    )
+
+
+@pytest.fixture
+def cache():
+    """Create a PredictionCache with explicit limits."""
+    return PredictionCache(ttl=300, max_entries=3)
+
+
+@pytest.fixture
+def predictor_with_model():
+    """Create a predictor backed by a mock model and mock manager."""
+    with patch("app.services.ml.rent_growth_predictor.get_model_manager") as mock_mgr:
+        mock_model = MagicMock()
+        mock_model.predict.return_value = np.array([3.5])
+        mock_manager = MagicMock()
+        mock_mgr.return_value = mock_manager
+
+        pred = RentGrowthPredictor()
+        pred._model = mock_model
+        pred._model_version = "v1"
+        return pred
+
+
+# =============================================================================
+# PredictionCache Tests
+# =============================================================================
+
+
+class TestPredictionCache:
+    """Tests for PredictionCache."""
+
+    def test_hash_features_is_stable(self):
+        """Equal feature vectors hash identically regardless of dtype."""
+        a = np.array([1, 2, 3]).reshape(1, -1)
+        b = np.array([1.0, 2.0, 3.0]).reshape(1, -1)
+
+        assert PredictionCache.hash_features(a) == PredictionCache.hash_features(b)
+        assert PredictionCache.hash_features(a) != PredictionCache.hash_features(
+            np.array([1, 2, 4]).reshape(1, -1)
+        )
+
+    def test_get_miss_then_hit(self, cache):
+        """A stored prediction is returned for the same key."""
+        assert cache.get("v1", "abc", 12) is None
+
+        cache.set("v1", "abc", 12, _make_prediction())
+
+        assert cache.get("v1", "abc", 12) is not None
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_key_includes_version_and_horizon(self, cache):
+        """Different model versions or horizons do not share entries."""
+        cache.set("v1", "abc", 12, _make_prediction())
+
+        assert cache.get("v2", "abc", 12) is None
+        assert cache.get("v1", "abc", 24) is None
+
+    def test_expired_entries_are_dropped(self):
+        """Entries past their TTL are treated as misses."""
+        cache = PredictionCache(ttl=0, max_entries=10)
+        cache.set("v1", "abc", 12, _make_prediction())
+
+        with patch("app.services.ml.prediction_cache.time.monotonic") as mono:
+            mono.return_value = 1e12
+            assert cache.get("v1", "abc", 12) is None
+
+    def test_lru_eviction(self, cache):
+        """The least recently used entry is evicted at capacity."""
+        for i in range(3):
+            cache.set("v1", f"h{i}", 12, _make_prediction(property_id=i + 1))
+        cache.get("v1", "h0", 12)  # touch h0 so h1 is oldest
+
+        cache.set("v1", "h3", 12, _make_prediction(property_id=4))
+
+        assert cache.get("v1", "h0", 12) is not None
+        assert cache.get("v1", "h1", 12) is None
+
+    def test_eviction_prunes_property_index(self, cache):
+        """Evicted entries leave no property index entries behind."""
+        for i in range(10):
+            cache.set("v1", f"h{i}", 12, _make_prediction(property_id=i + 1))
+
+        assert cache.get_stats()["indexed_properties"] == 3
+        assert cache.get_for_property(1, 12) is None
+        assert cache.get_for_property(10, 12) is not None
+
+    def test_get_for_property(self, cache):
+        """Predictions are indexed by property id and horizon."""
+        cache.set("v1", "abc", 12, _make_prediction(property_id=7))
+
+        result = cache.get_for_property(7, 12)
+
+        assert result is not None
+        assert result.property_id == 7
+        assert cache.get_for_property(7, 24) is None
+        assert cache.get_for_property(7, 12, model_version="v2") is None
+
+    def test_invalidate_by_version(self, cache):
+        """Invalidating a version drops only its entries and index."""
+        cache.set("v1", "a", 12, _make_prediction(property_id=1))
+        cache.set("v2", "b", 12, _make_prediction(property_id=2, version="v2"))
+
+        removed = cache.invalidate("v1")
+
+        assert removed == 1
+        assert cache.get_for_property(1, 12) is None
+        assert cache.get_for_property(2, 12) is not None
+
+    def test_invalidate_all(self, cache):
+        """Invalidating without a version clears everything."""
+        cache.set("v1", "a", 12, _make_prediction())
+
+        assert cache.invalidate() == 1
+        assert cache.get_stats()["entries"] == 0
+
+
+# =============================================================================
+# Predictor Caching Tests
+# =============================================================================
+
+
+class TestPredictorCaching:
+    """Tests for cache integration in RentGrowthPredictor."""
+
+    def test_predict_uses_cache(self, predictor_with_model):
+        """Repeated predictions for the same features call the model once."""
+        data = {"id": 1, "total_units": 200}
+
+        first = predictor_with_model.predict(data)
+        second = predictor_with_model.predict(data)
+
+        assert first == second
+        assert predictor_with_model._model.predict.call_count == 1
+
+    def test_predict_relabels_shared_entry(self, predictor_with_model):
+        """Identical features for a different property reuse the entry."""
+        predictor_with_model.predict({"id": 1, "total_units": 200})
+        result = predictor_with_model.predict({"id": 2, "total_units": 200})
+
+        assert result.property_id == 2
+        assert predictor_with_model._model.predict.call_count == 1
+        assert predictor_with_model.get_cached_prediction(2).property_id == 2
+
+    def test_failed_predictions_are_not_cached(self, predictor_with_model):
+        """A model error is not stored in the cache."""
+        predictor_with_model._model.predict.side_effect = Exception("boom")
+
+        assert predictor_with_model.predict({"id": 1}) is None
+        assert predictor_with_model.get_cache_stats()["entries"] == 0
+
+    def test_model_publish_invalidates_cache(self, predictor_with_model):
+        """Publishing a new version swaps the model and drops cached results."""
+        predictor_with_model.predict({"id": 1, "total_units": 200})
+        new_model = MagicMock()
+        new_model.predict.return_value = np.array([5.0])
+        predictor_with_model._model_manager.load_model.return_value = new_model
+
+        predictor_with_model._on_model_published("rent_growth", "v2")
+
+        assert predictor_with_model.model_version == "v2"
+        assert predictor_with_model.get_cached_prediction(1) is None
+        result = predictor_with_model.predict({"id": 1, "total_units": 200})
+        assert result.model_version == "v2"
+        assert result.predicted_growth_rate == 5.0
+
+    def test_other_model_publish_is_ignored(self, predictor_with_model):
+        """Publishing an unrelated model leaves the cache intact."""
+        predictor_with_model.predict({"id": 1})
+
+        predictor_with_model._on_model_published("vacancy", "v9")
+
+        assert predictor_with_model.model_version == "v1"
+        assert predictor_with_model.get_cached_prediction(1) is not None
+
+
+# =============================================================================
+# Prescorer Tests
+# =============================================================================
+
+
+class TestPortfolioPrescorer:
+    """Tests for PortfolioPrescorer."""
+
+    def test_property_to_prediction_input(self):
+        """Decimal columns are converted and missing values omitted."""
+        prop = MagicMock(
+            id=5,
+            property_type="multifamily",
+            market=None,
+            total_units=120,
+            year_built=None,
+            occupancy_rate=Decimal("94.50"),
+            avg_rent_per_unit=Decimal("1650.00"),
+            avg_rent_per_sf=None,
+            cap_rate=Decimal("5.250"),
+            latitude=None,
+            longitude=None,
+        )
+
+        data = property_to_prediction_input(prop)
+
+        assert data["id"] == 5
+        assert data["market"] == "unknown"
+        assert data["occupancy_rate"] == 94.5
+        assert isinstance(data["avg_rent_per_unit"], float)
+        assert "year_built" not in data
+
+    def test_request_refresh_noop_when_stopped(self):
+        """Refresh requests are ignored when the prescorer is not running."""
+        prescorer = PortfolioPrescorer()
+        prescorer.request_refresh("test")  # must not raise
+
+    @pytest.mark.asyncio
+    async def test_prescore_all_fills_cache(self, db_session, test_property):
+        """Every property is scored into the predictor's cache."""
+        with patch("app.services.ml.rent_growth_predictor.get_model_manager") as mgr:
+            mgr.return_value = MagicMock()
+            predictor = RentGrowthPredictor()
+
+        prescorer = PortfolioPrescorer(horizons=(12, 24))
+        session_cm = MagicMock()
+        session_cm.__aenter__ = AsyncMock(return_value=db_session)
+        session_cm.__aexit__ = AsyncMock(return_value=False)
+
+        with (
+            patch(
+                "app.services.ml.prescoring.get_rent_growth_predictor",
+                AsyncMock(return_value=predictor),
+            ),
+            patch(
+                "app.services.ml.prescoring.AsyncSessionLocal",
+                return_value=session_cm,
+            ),
+        ):
+            scored = await prescorer.prescore_all()
+
+        assert scored == 2
+        assert prescorer.last_run_at is not None
+        cached = predictor.get_cached_prediction(test_property.id, 24)
+        assert cached is not None
+        assert cached.property_id == test_property.id
+
+    @pytest.mark.asyncio
+    async def test_start_stop_and_refresh(self):
+        """A refresh request wakes the background loop."""
+        prescorer = PortfolioPrescorer()
+        prescorer.prescore_all = AsyncMock(return_value=0)  # type: ignore[method-assign]
+
+        await prescorer.start()
+        prescorer.request_refresh("test")
+        for _ in range(10):
+            if prescorer.prescore_all.await_count:
+                break
+            await asyncio.sleep(0.01)
+        await prescorer.stop()
+
+        assert prescorer.prescore_all.await_count >= 1
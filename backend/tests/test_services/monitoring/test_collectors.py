@@ -1,5 +1,7 @@
 """Tests for monitoring collectors."""
 
+import asyncio
+import threading
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -87,6 +89,53 @@ class TestSystemMetricsCollector:
             metrics = await collector.collect()
             assert "platform" in metrics
 
+    @pytest.mark.asyncio
+    async def test_collect_probes_off_the_event_loop(self):
+        """psutil probes run in a worker thread, not on the event loop."""
+        collector = SystemMetricsCollector()
+        loop_thread = threading.get_ident()
+        probe_threads: list[int] = []
+        original = collector._sample
+
+        def _sample(now):
+            probe_threads.append(threading.get_ident())
+            return original(now)
+
+        collector._sample = _sample
+        await collector.collect()
+
+        assert probe_threads and probe_threads[0] != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_refresh_appends_to_bounded_ring_buffer(self):
+        """Each sample lands in a ring buffer capped at max_samples."""
+        collector = SystemMetricsCollector(max_samples=3)
+
+        for _ in range(5):
+            await collector.collect(refresh=True)
+
+        assert collector.capacity == 3
+        assert len(collector._samples) == 3
+        assert collector._samples[-1][1] is collector._cached_metrics
+
+    def test_summary_over_window(self):
+        """summary() aggregates only samples inside the window."""
+        collector = SystemMetricsCollector()
+        now = datetime.now(UTC)
+        for minutes_ago, cpu in [(30, 99.0), (4, 10.0), (2, 30.0), (0, 20.0)]:
+            collector._samples.append(
+                (
+                    now - timedelta(minutes=minutes_ago),
+                    {"cpu": {"percent": cpu}, "memory": {"available": False}},
+                )
+            )
+
+        summary = collector.summary(minutes=5)
+
+        assert summary["samples"] == 3
+        assert summary["cpu_percent"] == {"min": 10.0, "max": 30.0, "avg": 20.0}
+        assert "memory_percent" not in summary
+
 
 # =============================================================================
 # DatabaseMetricsCollector Tests
@@ -477,6 +526,28 @@ class TestCollectorRegistry:
         assert "error" in metrics["system"]
         assert "System error" in metrics["system"]["error"]
 
+    @pytest.mark.asyncio
+    async def test_collect_all_reads_background_snapshot(self):
+        """With the sampler running, collect_all does not probe collectors."""
+        registry = CollectorRegistry()
+        await registry.start_sampling(interval_seconds=3600)
+        try:
+            # Let the first background sample complete
+            for _ in range(50):
+                if registry._latest is not None:
+                    break
+                await asyncio.sleep(0.01)
+            snapshot = registry._latest
+
+            registry.system.collect = AsyncMock(side_effect=AssertionError)
+            metrics = await registry.collect_all()
+        finally:
+            await registry.stop_sampling()
+
+        assert metrics is snapshot
+        assert "cpu" in metrics["system"] or "platform" in metrics["system"]
+        assert registry._sampler_task is None
+
 
 # =============================================================================
 # Singleton Tests
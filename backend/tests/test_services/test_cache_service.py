@@ -160,6 +160,20 @@ async def test_invalidate_deals():
     assert await svc.get("property_list") == "d"
 
 
+async def test_invalidate_filter_options():
+    """invalidate_filter_options() clears one dataset, or all when empty."""
+    svc = _make_service()
+    await svc.set("filter_options:sales", "a", ttl=60)
+    await svc.set("filter_options:construction", "b", ttl=60)
+
+    assert await svc.invalidate_filter_options("sales") == 1
+    assert await svc.get("filter_options:sales") is None
+    assert await svc.get("filter_options:construction") == "b"
+
+    assert await svc.invalidate_filter_options() == 1
+    assert await svc.get("filter_options:construction") is None
+
+
 # ---------------------------------------------------------------------------
 # cleanup_memory() — expired entry eviction
 # ---------------------------------------------------------------------------
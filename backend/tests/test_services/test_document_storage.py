@@ -0,0 +1,141 @@
+"""
+Tests for content-addressed document storage.
+
+Covers:
+- Chunked streaming writes and content addressing (dedup)
+- Validation while streaming (size limit, magic bytes, empty files)
+- Temp-file cleanup on rejection
+- Path resolution guards
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from app.services.document_storage import DocumentStorage, DocumentValidationError
+
+PDF = b"%PDF-1.7\n" + b"x" * 10_000
+
+
+def _upload(content: bytes, filename: str = "memo.pdf") -> UploadFile:
+    return UploadFile(
+        io.BytesIO(content),
+        filename=filename,
+        headers=Headers({"content-type": "application/pdf"}),
+    )
+
+
+def _leftover_temp_files(root: Path) -> list[Path]:
+    return list((root / "tmp").glob("*"))
+
+
+class TestSaveUpload:
+    """Uploads are streamed to disk under their content hash."""
+
+    @pytest.mark.asyncio
+    async def test_streams_in_chunks(self, tmp_path: Path) -> None:
+        storage = DocumentStorage(tmp_path, chunk_size=1024)
+        upload = _upload(PDF)
+
+        with patch.object(upload, "read", wraps=upload.read) as read:
+            stored = await storage.save_upload(upload)
+
+        assert all(call.args == (1024,) for call in read.call_args_list)
+        assert read.call_count > len(PDF) // 1024
+        assert stored.size == len(PDF)
+        assert stored.content_hash == hashlib.sha256(PDF).hexdigest()
+        assert stored.file_path.endswith(".pdf")
+        assert storage.resolve(stored.file_path).read_bytes() == PDF
+        assert _leftover_temp_files(tmp_path) == []
+
+    @pytest.mark.asyncio
+    async def test_identical_uploads_share_file(self, tmp_path: Path) -> None:
+        storage = DocumentStorage(tmp_path)
+
+        first = await storage.save_upload(_upload(PDF, "a.pdf"))
+        second = await storage.save_upload(_upload(PDF, "b.pdf"))
+
+        assert first.file_path == second.file_path
+        assert len(list((tmp_path / "objects").rglob("*.pdf"))) == 1
+        assert _leftover_temp_files(tmp_path) == []
+
+
+class TestValidationWhileStreaming:
+    """Invalid uploads are rejected and leave nothing behind."""
+
+    @pytest.mark.asyncio
+    async def test_oversized_upload_stops_early(self, tmp_path: Path) -> None:
+        storage = DocumentStorage(tmp_path, chunk_size=1024)
+        upload = _upload(PDF)
+
+        with (
+            patch.dict("app.core.file_validation.MAX_FILE_SIZES", {".pdf": 4096}),
+            patch.object(upload, "read", wraps=upload.read) as read,
+            pytest.raises(DocumentValidationError, match="exceeds"),
+        ):
+            await storage.save_upload(upload)
+
+        # Stopped at the first chunk past the limit, not at end of file
+        assert read.call_count == 5
+        assert _leftover_temp_files(tmp_path) == []
+        assert not (tmp_path / "objects").exists()
+
+    @pytest.mark.asyncio
+    async def test_wrong_magic_bytes_rejected(self, tmp_path: Path) -> None:
+        storage = DocumentStorage(tmp_path)
+
+        with pytest.raises(DocumentValidationError, match="does not match"):
+            await storage.save_upload(_upload(b"PK\x03\x04" + b"x" * 100))
+
+        assert _leftover_temp_files(tmp_path) == []
+
+    @pytest.mark.asyncio
+    async def test_short_file_checked_at_end(self, tmp_path: Path) -> None:
+        storage = DocumentStorage(tmp_path)
+
+        with pytest.raises(DocumentValidationError, match="does not match"):
+            await storage.save_upload(_upload(b"%P"))
+
+    @pytest.mark.asyncio
+    async def test_empty_upload_rejected(self, tmp_path: Path) -> None:
+        storage = DocumentStorage(tmp_path)
+
+        with pytest.raises(DocumentValidationError, match="empty"):
+            await storage.save_upload(_upload(b""))
+
+    @pytest.mark.asyncio
+    async def test_disallowed_extension_rejected_before_reading(
+        self, tmp_path: Path
+    ) -> None:
+        storage = DocumentStorage(tmp_path)
+        upload = _upload(PDF, "payload.exe")
+
+        with (
+            patch.object(upload, "read", wraps=upload.read) as read,
+            pytest.raises(DocumentValidationError, match="not allowed"),
+        ):
+            await storage.save_upload(upload)
+
+        read.assert_not_called()
+
+
+class TestResolve:
+    """resolve() only returns existing files inside the storage root."""
+
+    @pytest.mark.asyncio
+    async def test_rejects_missing_and_escaping_paths(self, tmp_path: Path) -> None:
+        storage = DocumentStorage(tmp_path / "docs")
+        (tmp_path / "secret.txt").write_text("x")
+        stored = await storage.save_upload(_upload(PDF))
+
+        assert storage.resolve(stored.file_path).is_file()
+        for bad in ("", "objects/00/missing.pdf", "../secret.txt", "objects"):
+            with pytest.raises(FileNotFoundError):
+                storage.resolve(bad)
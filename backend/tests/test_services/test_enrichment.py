@@ -9,6 +9,7 @@ from types import SimpleNamespace
 
 import pytest
 
+from app.models.property import normalize_property_key
 from app.services.enrichment import (
     ALL_HYDRATION_FIELDS,
     BASE_EXPENSE_FIELD_MAP,
@@ -19,6 +20,7 @@ from app.services.enrichment import (
     build_financial_data_json,
     build_ops_by_year,
     get_property_name_variants,
+    group_rows_by_property_key,
     match_prop_name,
     resolve_field_aliases,
     safe_float,
@@ -216,6 +218,47 @@ class TestMatchPropName:
         assert match_prop_name("Anything", prop) is False
 
 
+class TestPropertyKey:
+    """normalize_property_key and key-based row grouping."""
+
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("Sunrise Apartments", "sunrise apartments"),
+            ("Sunrise Apartments (Phoenix, AZ)", "sunrise apartments"),
+            ("SUNRISE APARTMENTS  (Run 42)", "sunrise apartments"),
+            ("Sunrise (Bldg A) (Mesa, AZ)", "sunrise"),
+            ("(Phoenix, AZ)", None),
+            ("", None),
+            (None, None),
+        ],
+    )
+    def test_normalize_property_key(self, name, expected):
+        assert normalize_property_key(name) == expected
+
+    def test_key_covers_match_prop_name_variants(self):
+        """Every row match_prop_name accepts shares the property's key."""
+        prop = _make_prop(name="Sunrise Apartments (Phoenix, AZ)")
+        for row_name in (
+            "Sunrise Apartments",
+            "Sunrise Apartments (Phoenix, AZ)",
+            "Sunrise Apartments (Run 42)",
+        ):
+            assert match_prop_name(row_name, prop)
+            assert normalize_property_key(row_name) == normalize_property_key(prop.name)
+
+    def test_group_rows_preserves_order(self):
+        rows = [
+            ("a", "NOI", 1.0, None),
+            ("b", "NOI", 2.0, None),
+            ("a", "NOI", 3.0, None),
+        ]
+        grouped = group_rows_by_property_key(rows)
+        assert [r[2] for r in grouped["a"]] == [1.0, 3.0]
+        assert [r[2] for r in grouped["b"]] == [2.0]
+        assert grouped.get("c", []) == []
+
+
 # ===================================================================
 # 5. update_property_columns
 # ===================================================================
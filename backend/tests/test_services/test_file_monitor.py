@@ -17,6 +17,7 @@ Tests cover:
 Run with: pytest tests/test_services/test_file_monitor.py -v
 """
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
@@ -30,6 +31,7 @@ from app.services.extraction.file_monitor import (
     FileChange,
     MonitorCheckResult,
     SharePointFileMonitor,
+    _prefetch_tasks,
     get_file_monitor,
 )
 
@@ -870,6 +872,7 @@ class TestCheckForChangesIntegration:
         mock_file.deal_stage = "active_review"
         mock_file.modified_date = datetime.now(UTC)
         mock_file.size = 1500000
+        mock_file.etag = '"{etag-1},1"'
 
         mock_result = MagicMock()
         mock_result.files = [mock_file]
@@ -881,6 +884,7 @@ class TestCheckForChangesIntegration:
         # Mock settings to disable auto-extraction
         with patch("app.services.extraction.file_monitor.settings") as mock_settings:
             mock_settings.AUTO_EXTRACT_ON_CHANGE = False
+            mock_settings.FILE_MONITOR_PREFETCH = False
 
             result = await file_monitor.check_for_changes(auto_trigger_extraction=False)
 
@@ -891,6 +895,67 @@ class TestCheckForChangesIntegration:
         assert result.files_added == 1
 
 
+# ============================================================================
+# Test: SharePointFileMonitor._schedule_prefetch()
+# ============================================================================
+
+
+class TestSchedulePrefetch:
+    """Tests for background prefetch of changed files into the workbook store."""
+
+    @staticmethod
+    def _change(change_type: str, path: str) -> FileChange:
+        return FileChange(
+            file_path=path,
+            file_name=path.rsplit("/", 1)[-1],
+            change_type=change_type,
+            deal_name="Deal A",
+            old_modified_date=None,
+            new_modified_date=datetime.now(UTC),
+            new_size_bytes=10,
+            etag='"{abc},2"',
+        )
+
+    @pytest.mark.asyncio
+    async def test_prefetches_added_and_modified_files(
+        self, file_monitor: SharePointFileMonitor, mock_sharepoint_client
+    ) -> None:
+        store = MagicMock()
+        store.prefetch = AsyncMock(return_value=2)
+        changes = [
+            self._change("added", "Deals/A/new.xlsb"),
+            self._change("modified", "Deals/A/changed.xlsb"),
+            self._change("deleted", "Deals/A/gone.xlsb"),
+        ]
+
+        with (
+            patch(
+                "app.services.extraction.file_monitor.settings.FILE_MONITOR_PREFETCH",
+                True,
+            ),
+            patch(
+                "app.extraction.workbook_store.get_workbook_store",
+                return_value=store,
+            ),
+        ):
+            file_monitor._schedule_prefetch(changes)
+            await asyncio.gather(*_prefetch_tasks)
+
+        client, files = store.prefetch.await_args.args
+        assert client is mock_sharepoint_client
+        assert [f.path for f in files] == ["Deals/A/new.xlsb", "Deals/A/changed.xlsb"]
+        assert all(f.etag == '"{abc},2"' for f in files)
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(
+        self, file_monitor: SharePointFileMonitor
+    ) -> None:
+        with patch("app.extraction.workbook_store.get_workbook_store") as get_store:
+            file_monitor._schedule_prefetch([self._change("added", "Deals/A/x.xlsb")])
+
+        get_store.assert_not_called()
+
+
 # ============================================================================
 # Test: SharePointFileMonitor._trigger_extraction()
 # ============================================================================
@@ -0,0 +1,188 @@
+"""Tests for MarketDataCache: TTL, keys, shared level, refresh-ahead."""
+
+import asyncio
+from datetime import UTC, datetime
+
+from app.core.cache import _memory_cache
+from app.schemas.market_data import MarketTrend, MarketTrendsResponse
+from app.services.interest_rates import InterestRatesService
+from app.services.market_cache import MarketDataCache
+
+
+class FakeSource:
+    """Loader and version probe backed by plain attributes."""
+
+    def __init__(self) -> None:
+        self.version: str | None = "v1"
+        self.value = "a"
+        self.calls: list[tuple] = []
+
+    async def load(self, *params):
+        self.calls.append(params)
+        await asyncio.sleep(0)
+        return f"{self.value}:{':'.join(map(str, params))}"
+
+    async def probe(self) -> str | None:
+        return self.version
+
+
+def _cache(source: FakeSource, **kwargs) -> MarketDataCache:
+    options = {"ttl": 60, "check_interval": 0} | kwargs
+    return MarketDataCache("test", probe=source.probe, **options)
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_hit_within_ttl_and_keyed_by_params():
+    source = FakeSource()
+    cache = _cache(source)
+
+    assert await cache.get("trends", source.load, 12) == "a:12"
+    source.value = "b"
+    assert await cache.get("trends", source.load, 12) == "a:12"
+    assert await cache.get("trends", source.load, 24) == "b:24"
+    assert source.calls == [(12,), (24,)]
+
+
+async def test_expired_entry_is_reloaded():
+    source = FakeSource()
+    cache = _cache(source, ttl=0)
+
+    await cache.get("overview", source.load)
+    source.value = "b"
+    _memory_cache.clear()
+    assert await cache.get("overview", source.load) == "b:"
+    assert len(source.calls) == 2
+
+
+async def test_shared_level_serves_other_instances():
+    source = FakeSource()
+    await _cache(source).get("trends", source.load, 12)
+
+    other = _cache(source)
+    assert await other.get("trends", source.load, 12) == "a:12"
+    assert source.calls == [(12,)]
+
+
+async def test_shared_level_decodes_models():
+    response = MarketTrendsResponse(
+        trends=[
+            MarketTrend(month="Jan", rent_growth=0.03, occupancy=0.95, cap_rate=0.055)
+        ],
+        monthly_data=[],
+        last_updated=datetime(2026, 10, 1, tzinfo=UTC),
+    )
+
+    async def load():
+        return response
+
+    await _cache(FakeSource()).get("trends", load)
+    cached = await _cache(FakeSource()).get(
+        "trends", load, decode=MarketTrendsResponse.model_validate
+    )
+    assert cached == response
+
+
+async def test_new_data_version_refreshes_ahead():
+    source = FakeSource()
+    cache = _cache(source)
+    assert await cache.get("overview", source.load) == "a:"
+
+    source.version = "v2"
+    source.value = "b"
+    # The probe runs in the background; the current value is served meanwhile
+    assert await cache.get("overview", source.load) == "a:"
+    await _settle()
+    assert await cache.get("overview", source.load) == "b:"
+    assert len(source.calls) == 2
+
+
+async def test_unchanged_version_does_not_reload():
+    source = FakeSource()
+    cache = _cache(source)
+    await cache.get("overview", source.load)
+    await _settle()
+    await cache.get("overview", source.load)
+    await _settle()
+    assert len(source.calls) == 1
+
+
+async def test_force_load_bypasses_and_updates_cache():
+    source = FakeSource()
+    cache = _cache(source)
+    await cache.get("rates", source.load)
+
+    async def fresh():
+        return "forced"
+
+    assert await cache.get("rates", source.load, force_load=fresh) == "forced"
+    assert await cache.get("rates", source.load) == "forced"
+
+
+async def test_cache_if_skips_values():
+    source = FakeSource()
+    cache = _cache(source)
+    kwargs = {"cache_if": lambda value: not value.startswith("a")}
+
+    await cache.get("rates", source.load, **kwargs)
+    source.value = "b"
+    await cache.get("rates", source.load, **kwargs)
+    await cache.get("rates", source.load, **kwargs)
+    assert len(source.calls) == 2
+
+
+async def test_clear_drops_shared_level():
+    source = FakeSource()
+    await _cache(source).get("overview", source.load)
+
+    cache = _cache(source)
+    await cache.clear()
+    source.value = "b"
+    assert await cache.get("overview", source.load) == "b:"
+    assert len(source.calls) == 2
+
+
+async def test_concurrent_misses_share_one_load():
+    source = FakeSource()
+    cache = _cache(source)
+
+    results = await asyncio.gather(
+        *(cache.get("submarkets", source.load) for _ in range(10))
+    )
+    assert results == ["a:"] * 10
+    assert len(source.calls) == 1
+
+
+async def test_failed_probe_keeps_serving():
+    source = FakeSource()
+    cache = _cache(source)
+    await cache.get("overview", source.load)
+
+    async def broken():
+        raise ConnectionError("db down")
+
+    cache._probe = broken
+    await cache.get("overview", source.load)
+    await _settle()
+    assert await cache.get("overview", source.load) == "a:"
+    assert len(source.calls) == 1
+
+
+async def test_interest_rates_unavailable_is_not_cached(monkeypatch):
+    service = InterestRatesService()
+    service._fred_api_key = None
+    calls = []
+
+    async def no_db():
+        calls.append(1)
+        return None
+
+    monkeypatch.setattr(service, "_get_db_engine", no_db)
+
+    first = await service.get_key_rates()
+    await service.get_key_rates()
+    assert first["data_source"] == "unavailable"
+    assert len(calls) >= 2
@@ -0,0 +1,231 @@
+"""
+Tests for coalesced, resumable progress streams.
+
+Covers:
+- Latest-state-per-key coalescing between flushes
+- Sequence numbers and resuming from the last one seen
+- Fixed-rate publishing by the background task
+- Retention of finished streams
+- WebSocket "resume" requests
+- Extraction field progress reaching the run's stream
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.api.v1.endpoints.extraction.common import _timed_extract, extraction_progress
+from app.api.v1.endpoints.ws import _resume_stream
+from app.services.progress_stream import (
+    ProgressEvent,
+    ProgressStream,
+    ProgressStreams,
+    progress_streams,
+)
+
+
+def _render(stream: ProgressStream, events: list[ProgressEvent]) -> list[dict]:
+    return [
+        {
+            "type": "progress",
+            "stream": stream.stream_id,
+            "seq": events[-1].seq,
+            "events": [e.to_dict() for e in events],
+        }
+    ]
+
+
+@pytest.fixture
+def manager():
+    mock = AsyncMock()
+    with patch(
+        "app.services.websocket_manager.get_connection_manager", return_value=mock
+    ):
+        yield mock
+
+
+def _messages(manager: AsyncMock) -> list[dict]:
+    return [c.args[1] for c in manager.send_to_channel.call_args_list]
+
+
+class TestCoalescing:
+    @pytest.mark.asyncio
+    async def test_latest_state_per_key_published_once(self, manager):
+        streams = ProgressStreams(flush_interval=60, retention_seconds=60)
+        stream = streams.open("run-1", "extraction", _render)
+
+        for done in range(100, 1100, 100):
+            stream.update("file:a.xlsb", {"fields_done": done})
+        stream.update("run", {"files_processed": 0})
+
+        assert await streams.flush() == 2
+        (message,) = _messages(manager)
+        assert manager.send_to_channel.call_args.args[0] == "extraction"
+        assert message["events"] == [
+            {"seq": 1, "key": "file:a.xlsb", "fields_done": 1000},
+            {"seq": 2, "key": "run", "files_processed": 0},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_nothing_published_without_changes(self, manager):
+        streams = ProgressStreams(flush_interval=60, retention_seconds=60)
+        stream = streams.open("run-1", "extraction", _render)
+        stream.update("run", {"status": "running"})
+        await streams.flush()
+
+        assert await streams.flush() == 0
+        assert manager.send_to_channel.await_count == 1
+
+    def test_updates_from_many_threads(self):
+        stream = ProgressStream("run-1", "extraction", _render)
+
+        def _work(n: int) -> None:
+            for i in range(500):
+                stream.update(f"file:{n}", {"fields_done": i})
+
+        threads = [threading.Thread(target=_work, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        events = stream.drain()
+        assert len(events) == 8
+        assert {e.data["fields_done"] for e in events} == {499}
+        assert [e.seq for e in events] == list(range(1, 9))
+
+
+class TestResume:
+    def test_events_since_returns_only_changed_keys(self):
+        stream = ProgressStream("run-1", "extraction", _render)
+        stream.update("file:a", {"status": "extracting"})
+        stream.update("file:b", {"status": "extracting"})
+        stream.drain()  # seq 1-2
+        last_seen = stream.last_seq
+        stream.update("file:a", {"status": "completed"})
+        stream.update("run", {"files_processed": 1})
+        stream.drain()  # seq 3-4
+
+        missed = stream.events_since(last_seen)
+
+        assert [(e.seq, e.key, e.data.get("status")) for e in missed] == [
+            (3, "file:a", "completed"),
+            (4, "run", None),
+        ]
+        assert stream.events_since(stream.last_seq) == []
+        # A client that saw nothing gets the latest state of every key
+        assert [e.key for e in stream.events_since(0)] == ["file:b", "file:a", "run"]
+
+    @pytest.mark.asyncio
+    async def test_resume_message_replays_missed_events(self):
+        stream = progress_streams.open(f"test:{uuid4()}", "extraction", _render)
+        stream.update("run", {"files_processed": 1})
+        stream.drain()
+        stream.update("run", {"files_processed": 2})
+        stream.drain()
+        manager = AsyncMock()
+        try:
+            await _resume_stream(
+                manager, "conn-1", {"stream": stream.stream_id, "after": 1}
+            )
+        finally:
+            progress_streams.close(stream.stream_id)
+
+        replay, done = [c.args[1] for c in manager.send_to_connection.call_args_list]
+        assert replay["events"] == [{"seq": 2, "key": "run", "files_processed": 2}]
+        assert done == {
+            "type": "resumed",
+            "stream": stream.stream_id,
+            "seq": 2,
+            "count": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_resume_unknown_stream(self):
+        manager = AsyncMock()
+
+        await _resume_stream(manager, "conn-1", {"stream": "nope", "after": 0})
+
+        message = manager.send_to_connection.call_args.args[1]
+        assert message["type"] == "error"
+
+
+class TestPublisher:
+    @pytest.mark.asyncio
+    async def test_bursts_published_at_fixed_rate(self, manager):
+        streams = ProgressStreams(flush_interval=0.05, retention_seconds=60)
+        stream = streams.open("run-1", "extraction", _render)
+        await streams.start()
+        try:
+            for i in range(200):
+                stream.update("run", {"files_processed": i})
+                await asyncio.sleep(0.001)
+            await asyncio.sleep(0.06)
+        finally:
+            await streams.stop()
+
+        messages = _messages(manager)
+        assert len(messages) < 20
+        assert messages[-1]["events"][-1]["files_processed"] == 199
+
+    @pytest.mark.asyncio
+    async def test_closed_stream_retained_then_expired(self, manager):
+        streams = ProgressStreams(flush_interval=60, retention_seconds=0.05)
+        await streams.start()
+        try:
+            stream = streams.open("run-1", "extraction", _render)
+            stream.update("run", {"status": "completed"})
+            streams.close("run-1")
+            await streams.flush()
+            assert streams.get("run-1") is stream
+
+            await asyncio.sleep(0.06)
+            await streams.flush()
+            assert streams.get("run-1") is None
+        finally:
+            await streams.stop()
+
+    def test_close_without_publisher_drops_stream(self):
+        streams = ProgressStreams(flush_interval=60, retention_seconds=60)
+        streams.open("run-1", "extraction", _render)
+
+        streams.close("run-1")
+
+        assert streams.get("run-1") is None
+
+
+class TestExtractionProgress:
+    def test_field_progress_reaches_run_stream(self):
+        run_id = uuid4()
+        stream = extraction_progress(run_id)
+
+        def _extract(path, validate=True, progress_callback=None):
+            for done in (100, 200):
+                progress_callback(done, 250)
+            return {"PROPERTY_NAME": "Test"}
+
+        extractor = MagicMock()
+        extractor.extract_from_file.side_effect = _extract
+        try:
+            (_, _, data, error), _ = _timed_extract(
+                extractor, {"file_path": "a.xlsb", "deal_name": "A"}, None, stream
+            )
+            events = stream.drain()
+        finally:
+            progress_streams.close(stream.stream_id)
+
+        assert error is None and data == {"PROPERTY_NAME": "Test"}
+        assert [e.to_dict() for e in events] == [
+            {
+                "seq": 1,
+                "key": "file:a.xlsb",
+                "status": "extracting",
+                "fields_done": 200,
+                "fields_total": 250,
+            }
+        ]
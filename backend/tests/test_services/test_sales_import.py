@@ -18,7 +18,7 @@ from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.db.base import Base
-from app.models.sales_data import SalesData
+from app.models.sales_data import SalesData, SalesRollup
 from app.services.sales_import import (
     COSTAR_COLUMN_MAP,
     FileImportResult,
@@ -415,6 +415,32 @@ class TestImportSalesFile:
         all_records = sync_db.query(SalesData).all()
         assert len(all_records) == 2
 
+    def test_refreshes_sales_rollup(self, sync_db, tmp_path):
+        """The rollup reflects the file once the import commits."""
+        filepath = str(tmp_path / "rollup.xlsx")
+        _make_test_excel(
+            filepath,
+            [
+                {"Comp ID": "C-001", "Number Of Units": 50, "Sale Date": "2024-01-15"},
+                {"Comp ID": "C-002", "Number Of Units": 40, "Sale Date": "2024-01-20"},
+                {"Comp ID": "C-003", "Number Of Units": 80, "Sale Date": "2024-02-20"},
+            ],
+        )
+
+        import_sales_file(sync_db, filepath, market="Phoenix")
+
+        rows = sync_db.execute(
+            select(
+                SalesRollup.sale_month,
+                SalesRollup.unit_bucket,
+                SalesRollup.sales_count,
+            ).order_by(SalesRollup.sale_month)
+        ).all()
+        assert [tuple(r) for r in rows] == [
+            (date(2024, 1, 1), "1-50", 2),
+            (date(2024, 2, 1), "51-100", 1),
+        ]
+
     def test_handles_null_comp_id(self, sync_db, tmp_path):
         """Rows with null Comp ID get a placeholder."""
         filepath = str(tmp_path / "null_comp.xlsx")
@@ -0,0 +1,154 @@
+"""Tests for the sales_rollup service: refresh and bucket alignment."""
+
+from collections.abc import Generator
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.base import Base
+from app.models.sales_data import SalesData, SalesRollup
+from app.services.sales_rollup import (
+    UNIT_BUCKETS,
+    VINTAGE_BUCKETS,
+    bucket_labels,
+    refresh_sales_rollup,
+)
+
+sync_engine = create_engine(
+    "sqlite:///:memory:",
+    echo=False,
+    poolclass=StaticPool,
+    connect_args={"check_same_thread": False},
+)
+SyncTestSession = sessionmaker(
+    bind=sync_engine, class_=Session, expire_on_commit=False, autoflush=False
+)
+
+
+@pytest.fixture()
+def sync_db() -> Generator[Session, None, None]:
+    Base.metadata.create_all(bind=sync_engine)
+    session = SyncTestSession()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=sync_engine)
+
+
+def _sale(comp_id: str, **overrides) -> SalesData:
+    now = datetime.now(UTC)
+    values = {
+        "comp_id": comp_id,
+        "source_file": "test.xlsx",
+        "submarket_cluster": "Central Phoenix",
+        "star_rating": "4 Star",
+        "year_built": 2010,
+        "number_of_units": 100,
+        "sale_date": date(2024, 3, 10),
+        "sale_price": Decimal("10000000"),
+        "price_per_unit": Decimal("100000"),
+        "imported_at": now,
+        "created_at": now,
+        "updated_at": now,
+    }
+    values.update(overrides)
+    return SalesData(**values)
+
+
+class TestRefreshSalesRollup:
+    def test_groups_by_dimensions(self, sync_db):
+        sync_db.add_all(
+            [
+                _sale("C-1", sale_date=date(2024, 3, 1)),
+                _sale("C-2", sale_date=date(2024, 3, 31), price_per_unit=None),
+                _sale("C-3", sale_date=date(2024, 4, 2)),
+                _sale("C-4", number_of_units=900, year_built=1985, sale_price=1),
+            ]
+        )
+        sync_db.commit()
+
+        assert refresh_sales_rollup(sync_db) == 3
+
+        rows = {
+            (r.sale_month, r.unit_bucket, r.vintage_bucket): r
+            for r in sync_db.scalars(select(SalesRollup))
+        }
+        march = rows[(date(2024, 3, 1), "51-100", "2005-2020")]
+        assert march.sales_count == 2
+        assert march.total_volume == Decimal("20000000")
+        assert march.price_per_unit_sum == Decimal("100000")
+        assert march.price_per_unit_count == 1
+        outlier = rows[(date(2024, 3, 1), "500+", "Pre-1990")]
+        assert outlier.dollar_one_sales == 1
+        assert outlier.high_unit_sales == 1
+
+    def test_keeps_missing_values_as_unknown_or_null(self, sync_db):
+        sync_db.add(
+            _sale(
+                "C-1",
+                submarket_cluster=None,
+                star_rating=None,
+                year_built=None,
+                number_of_units=None,
+                sale_date=None,
+            )
+        )
+        sync_db.commit()
+
+        refresh_sales_rollup(sync_db)
+
+        row = sync_db.scalars(select(SalesRollup)).one()
+        assert row.submarket_cluster is None
+        assert row.sale_month is None
+        assert row.star_rating is None
+        assert (row.unit_bucket, row.vintage_bucket) == ("Unknown", "Unknown")
+
+    def test_replaces_previous_rollup(self, sync_db):
+        sync_db.add(_sale("C-1"))
+        sync_db.commit()
+        refresh_sales_rollup(sync_db)
+
+        sync_db.add(_sale("C-2", submarket_cluster="East Valley"))
+        sync_db.commit()
+        refresh_sales_rollup(sync_db)
+
+        counts = sync_db.execute(
+            select(SalesRollup.submarket_cluster, SalesRollup.sales_count).order_by(
+                SalesRollup.submarket_cluster
+            )
+        ).all()
+        assert [tuple(r) for r in counts] == [
+            ("Central Phoenix", 1),
+            ("East Valley", 1),
+        ]
+
+
+class TestBucketLabels:
+    def test_unbounded_covers_every_bucket(self):
+        assert bucket_labels(UNIT_BUCKETS, None, None) == [
+            label for label, _, _ in UNIT_BUCKETS
+        ]
+
+    def test_bounds_on_bucket_edges(self):
+        assert bucket_labels(UNIT_BUCKETS, 51, 200) == ["51-100", "101-200"]
+        assert bucket_labels(UNIT_BUCKETS, 201, None) == ["201-500", "500+"]
+        assert bucket_labels(VINTAGE_BUCKETS, None, 2004) == [
+            "Pre-1990",
+            "1990-2005",
+        ]
+
+    def test_bound_inside_bucket_is_not_aligned(self):
+        assert bucket_labels(UNIT_BUCKETS, 60, None) is None
+        assert bucket_labels(UNIT_BUCKETS, None, 600) is None
+        assert bucket_labels(VINTAGE_BUCKETS, 2000, None) is None
+
+    def test_bound_below_first_bucket_is_not_aligned(self):
+        # Values below 1 would be Unknown in the rollup but match the raw scan
+        assert bucket_labels(UNIT_BUCKETS, 0, None) is None
+        assert bucket_labels(UNIT_BUCKETS, -5, 100) is None
+        assert bucket_labels(UNIT_BUCKETS, None, 0) is None
@@ -0,0 +1,190 @@
+"""
+Tests for cross-process WebSocket fan-out over Redis pub/sub.
+
+Two ConnectionManager instances sharing one fakeredis server stand in for
+two uvicorn workers.
+
+Covers:
+- Channel, user and broadcast messages reaching the other process
+- Each process delivering only to its own subscribers (no echo/duplicates)
+- Redis subscriptions tracking local channels/users, not connections
+- Process-local delivery when fan-out is not running
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.websocket_manager import Channel, ConnectionManager
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def _websocket() -> AsyncMock:
+    ws = AsyncMock()
+    ws.accept = AsyncMock()
+    ws.send_text = AsyncMock()
+    ws.close = AsyncMock()
+    return ws
+
+
+def _received(ws: AsyncMock, msg_type: str) -> list[dict]:
+    messages = [json.loads(call.args[0]) for call in ws.send_text.await_args_list]
+    return [m for m in messages if m.get("type") == msg_type]
+
+
+async def _eventually(predicate, timeout: float = 2.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        assert loop.time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+async def _settle() -> None:
+    """Give in-flight pub/sub messages time to arrive."""
+    await asyncio.sleep(0.1)
+
+
+@pytest.fixture
+async def workers():
+    """Two managers ("workers") fanned out through one Redis server."""
+    server = fakeredis.FakeServer()
+    managers = []
+    for _ in range(2):
+        manager = ConnectionManager()
+        manager.broker._redis = fakeredis.aioredis.FakeRedis(
+            server=server, decode_responses=True
+        )
+        await manager.broker.start()
+        assert manager.broker.active
+        managers.append(manager)
+
+    with patch.object(ConnectionManager, "_heartbeat_loop", new=AsyncMock()):
+        yield managers
+
+    for manager in managers:
+        for cid in list(manager._connections):
+            await manager.disconnect(cid)
+        await manager.broker.stop()
+
+
+class TestFanOut:
+    @pytest.mark.asyncio
+    async def test_channel_message_reaches_other_worker(self, workers):
+        a, b = workers
+        ws_a, ws_b = _websocket(), _websocket()
+        await a.connect(ws_a, channels=[Channel.EXTRACTION])
+        await b.connect(ws_b, channels=[Channel.EXTRACTION])
+
+        await a.notify_extraction_progress("run-1", "running", 0.5)
+
+        await _eventually(lambda: _received(ws_b, "extraction_progress"))
+        await _settle()
+        # Each worker delivers exactly once to its own connection
+        assert len(_received(ws_a, "extraction_progress")) == 1
+        assert len(_received(ws_b, "extraction_progress")) == 1
+        assert _received(ws_b, "extraction_progress")[0]["extraction_id"] == "run-1"
+
+    @pytest.mark.asyncio
+    async def test_only_subscribed_connections_receive(self, workers):
+        a, b = workers
+        deals_ws, props_ws = _websocket(), _websocket()
+        await b.connect(deals_ws, channels=[Channel.DEALS])
+        await b.connect(props_ws, channels=[Channel.PROPERTIES])
+
+        await a.notify_deal_update(deal_id=7, action="updated", data={})
+
+        await _eventually(lambda: _received(deals_ws, "deal_update"))
+        await _settle()
+        assert _received(props_ws, "deal_update") == []
+
+    @pytest.mark.asyncio
+    async def test_user_notification_reaches_other_worker(self, workers):
+        a, b = workers
+        mine, other = _websocket(), _websocket()
+        await b.connect(mine, user_id=42)
+        await b.connect(other, user_id=43)
+
+        await a.notify_user(42, title="Report ready", body="Q3 report")
+
+        await _eventually(lambda: _received(mine, "notification"))
+        await _settle()
+        assert _received(other, "notification") == []
+
+    @pytest.mark.asyncio
+    async def test_broadcast_respects_exclude(self, workers):
+        a, b = workers
+        ws_b1, ws_b2 = _websocket(), _websocket()
+        await b.connect(ws_b1)
+        excluded = await b.connect(ws_b2)
+
+        await a.broadcast({"type": "maintenance"}, exclude=excluded)
+
+        await _eventually(lambda: _received(ws_b1, "maintenance"))
+        await _settle()
+        assert _received(ws_b2, "maintenance") == []
+
+
+class TestSubscriptions:
+    @pytest.mark.asyncio
+    async def test_redis_subscription_per_channel_not_per_connection(self, workers):
+        a, _ = workers
+        topics = a.broker._topics
+
+        first = await a.connect(_websocket(), channels=[Channel.DEALS])
+        second = await a.connect(_websocket(), channels=[Channel.DEALS])
+        assert "ws:channel:deals" in topics
+        assert len(a.broker._pubsub.channels) == len(topics)
+
+        await a.disconnect(first)
+        assert "ws:channel:deals" in topics
+
+        await a.disconnect(second)
+        assert "ws:channel:deals" not in topics
+        # redis-py drops the channel once Redis confirms the unsubscribe
+        await _eventually(lambda: len(a.broker._pubsub.channels) == len(topics))
+
+    @pytest.mark.asyncio
+    async def test_no_delivery_after_last_local_unsubscribe(self, workers):
+        a, b = workers
+        ws = _websocket()
+        cid = await b.connect(ws, channels=[Channel.DEALS])
+        await b.unsubscribe(cid, Channel.DEALS)
+
+        await a.notify_deal_update(deal_id=1, action="updated", data={})
+        await _settle()
+
+        assert _received(ws, "deal_update") == []
+
+
+class TestWithoutRedis:
+    @pytest.mark.asyncio
+    async def test_local_delivery_when_not_started(self):
+        manager = ConnectionManager()
+        ws = _websocket()
+        with patch.object(ConnectionManager, "_heartbeat_loop", new=AsyncMock()):
+            cid = await manager.connect(ws, channels=[Channel.DEALS])
+
+        sent = await manager.send_to_channel(Channel.DEALS, {"type": "deal_update"})
+        await _eventually(lambda: _received(ws, "deal_update"))
+
+        assert manager.broker.active is False
+        assert sent == 1
+        await manager.disconnect(cid)
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_setting(self, monkeypatch):
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "WS_FANOUT_ENABLED", False)
+        manager = ConnectionManager()
+        manager.broker._redis = fakeredis.aioredis.FakeRedis()
+
+        await manager.broker.start()
+
+        assert manager.broker.active is False
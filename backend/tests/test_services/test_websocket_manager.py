@@ -0,0 +1,195 @@
+"""
+Tests for ConnectionManager's outbound path.
+
+Covers:
+- Messages serialized once per broadcast, not once per connection
+- Per-connection writers: a slow client does not delay the others
+- Per-connection ordering
+- Slow-consumer policies (drop_oldest, coalesce, disconnect)
+- Failed sends disconnecting the connection
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.websocket_manager import Channel, ConnectionManager
+
+
+def _websocket() -> AsyncMock:
+    ws = AsyncMock()
+    ws.accept = AsyncMock()
+    ws.send_text = AsyncMock()
+    ws.close = AsyncMock()
+    return ws
+
+
+def _blocked_websocket() -> tuple[AsyncMock, asyncio.Event]:
+    """A client whose sends hang until the returned event is set."""
+    release = asyncio.Event()
+    ws = _websocket()
+
+    async def _send_text(text: str) -> None:
+        await release.wait()
+
+    ws.send_text = AsyncMock(side_effect=_send_text)
+    return ws, release
+
+
+def _sent(ws: AsyncMock) -> list[dict]:
+    return [json.loads(call.args[0]) for call in ws.send_text.await_args_list]
+
+
+def _updates(ws: AsyncMock) -> list[dict]:
+    return [m for m in _sent(ws) if m["type"] != "connected"]
+
+
+async def _eventually(predicate, timeout: float = 2.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        assert loop.time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+async def make_manager():
+    managers: list[ConnectionManager] = []
+
+    def _make(**kwargs) -> ConnectionManager:
+        manager = ConnectionManager(**kwargs)
+        managers.append(manager)
+        return manager
+
+    with patch.object(ConnectionManager, "_heartbeat_loop", new=AsyncMock()):
+        yield _make
+
+    for manager in managers:
+        for cid in list(manager._connections):
+            await manager.disconnect(cid)
+
+
+class TestFanOut:
+    @pytest.mark.asyncio
+    async def test_payload_serialized_once(self, make_manager):
+        manager = make_manager()
+        sockets = [_websocket() for _ in range(5)]
+        for ws in sockets:
+            await manager.connect(ws, channels=[Channel.DEALS])
+
+        with patch(
+            "app.services.websocket_manager.json.dumps", wraps=json.dumps
+        ) as dumps:
+            sent = await manager.notify_deal_update(deal_id=1, action="x", data={})
+        await _eventually(lambda: all(len(_sent(ws)) == 2 for ws in sockets))
+
+        assert sent is None
+        assert dumps.call_count == 1
+        frames = {ws.send_text.await_args.args[0] for ws in sockets}
+        assert len(frames) == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_delay_others(self, make_manager):
+        manager = make_manager()
+        slow, release = _blocked_websocket()
+        fast = _websocket()
+        await manager.connect(slow, channels=[Channel.DEALS])
+        await manager.connect(fast, channels=[Channel.DEALS])
+
+        sent = await manager.send_to_channel(Channel.DEALS, {"type": "deal_update"})
+
+        assert sent == 2
+        await _eventually(lambda: _updates(fast))
+        assert _updates(slow) == []
+        release.set()
+        await _eventually(lambda: _updates(slow))
+
+    @pytest.mark.asyncio
+    async def test_messages_delivered_in_order(self, make_manager):
+        manager = make_manager()
+        ws = _websocket()
+        cid = await manager.connect(ws)
+
+        for i in range(20):
+            await manager.send_to_connection(cid, {"type": "tick", "n": i})
+
+        await _eventually(lambda: len(_updates(ws)) == 20)
+        assert [m["n"] for m in _updates(ws)] == list(range(20))
+
+    @pytest.mark.asyncio
+    async def test_failed_send_disconnects(self, make_manager):
+        manager = make_manager()
+        ws = _websocket()
+        ws.send_text = AsyncMock(side_effect=RuntimeError("connection reset"))
+        await manager.connect(ws, user_id=7, channels=[Channel.DEALS])
+
+        await _eventually(lambda: manager.connection_count == 0)
+        assert manager.channel_counts == {}
+        assert manager.get_user_connection_count(7) == 0
+        ws.close.assert_awaited_once()
+
+
+class TestSlowConsumerPolicies:
+    @staticmethod
+    async def _stalled_client(manager: ConnectionManager):
+        """Connect a client whose writer is stuck on the welcome message."""
+        ws, release = _blocked_websocket()
+        cid = await manager.connect(ws, channels=[Channel.DEALS])
+        await _eventually(lambda: ws.send_text.await_count == 1)
+        return ws, release, cid
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest(self, make_manager):
+        manager = make_manager(send_queue_size=3, slow_consumer_policy="drop_oldest")
+        ws, release, _ = await self._stalled_client(manager)
+
+        for i in range(5):
+            await manager.send_to_channel(Channel.DEALS, {"type": "tick", "n": i})
+        release.set()
+
+        await _eventually(lambda: len(_updates(ws)) == 3)
+        assert [m["n"] for m in _updates(ws)] == [2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_coalesce_replaces_update_for_same_entity(self, make_manager):
+        manager = make_manager(send_queue_size=3, slow_consumer_policy="coalesce")
+        ws, release, _ = await self._stalled_client(manager)
+
+        await manager.notify_deal_update(deal_id=1, action="v1", data={})
+        await manager.notify_deal_update(deal_id=2, action="v1", data={})
+        await manager.notify_deal_update(deal_id=3, action="v1", data={})
+        await manager.notify_deal_update(deal_id=2, action="v2", data={})
+        # No queued message for deal 4: falls back to dropping the oldest
+        await manager.notify_deal_update(deal_id=4, action="v1", data={})
+        release.set()
+
+        await _eventually(lambda: len(_updates(ws)) == 3)
+        assert [(m["deal_id"], m["action"]) for m in _updates(ws)] == [
+            (3, "v1"),
+            (2, "v2"),
+            (4, "v1"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_disconnect(self, make_manager):
+        manager = make_manager(send_queue_size=2, slow_consumer_policy="disconnect")
+        ws, _, cid = await self._stalled_client(manager)
+        other = _websocket()
+        await manager.connect(other, channels=[Channel.DEALS])
+
+        sent = []
+        for i in range(3):
+            sent.append(
+                await manager.send_to_channel(Channel.DEALS, {"type": "tick", "n": i})
+            )
+            await asyncio.sleep(0.01)  # let the healthy client's writer drain
+
+        assert sent == [2, 2, 1]
+        await _eventually(lambda: cid not in manager._connections)
+        ws.close.assert_awaited_once()
+        assert manager.connection_count == 1
+        await _eventually(lambda: len(_updates(other)) == 3)
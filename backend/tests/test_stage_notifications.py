@@ -54,6 +54,15 @@ def _make_deal(
     )
 
 
+def _sent(mock_manager: AsyncMock, msg_type: str) -> list[dict]:
+    """Messages of *msg_type* sent to the "deals" channel."""
+    return [
+        c.args[1]
+        for c in mock_manager.send_to_channel.call_args_list
+        if c.args[0] == "deals" and c.args[1]["type"] == msg_type
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -116,7 +125,7 @@ def monitor(db_session: AsyncSession) -> SharePointFileMonitor:
 
 
 class TestIndividualStageNotification:
-    """Emit notify_deal_update() for each stage change when <= threshold."""
+    """Emit a deal_update event for each stage change when <= threshold."""
 
     @pytest.mark.asyncio
     async def test_single_stage_change_emits_notification(
@@ -125,7 +134,7 @@ class TestIndividualStageNotification:
         monitor: SharePointFileMonitor,
         deal_active: Deal,
     ) -> None:
-        """A single stage change should fire one notify_deal_update call."""
+        """A single stage change should fire one deal_update event."""
         mock_manager = AsyncMock()
         with patch(
             "app.services.websocket_manager.get_connection_manager",
@@ -137,13 +146,14 @@ class TestIndividualStageNotification:
                 ]
             )
 
-        mock_manager.notify_deal_update.assert_called_once()
-        call_kwargs = mock_manager.notify_deal_update.call_args
-        assert call_kwargs.kwargs["deal_id"] == deal_active.id
-        assert call_kwargs.kwargs["action"] == "stage_changed"
-        assert call_kwargs.kwargs["data"]["old_stage"] == "active_review"
-        assert call_kwargs.kwargs["data"]["new_stage"] == "under_contract"
-        assert call_kwargs.kwargs["data"]["source"] == "sharepoint_sync"
+        (event,) = _sent(mock_manager, "deal_update")
+        assert event["deal_id"] == deal_active.id
+        assert event["action"] == "stage_changed"
+        assert event["data"]["old_stage"] == "active_review"
+        assert event["data"]["new_stage"] == "under_contract"
+        assert event["data"]["source"] == "sharepoint_sync"
+        assert event["stream"] == "deal-stages"
+        assert event["seq"] > 0
 
     @pytest.mark.asyncio
     async def test_multiple_below_threshold_emits_individual(
@@ -169,9 +179,9 @@ class TestIndividualStageNotification:
             )
 
         assert count == 3
-        assert mock_manager.notify_deal_update.call_count == 3
+        assert len(_sent(mock_manager, "deal_update")) == 3
         # No batch notification should have been sent
-        mock_manager.send_to_channel.assert_not_called()
+        assert _sent(mock_manager, "batch_stage_changed") == []
 
     @pytest.mark.asyncio
     async def test_notification_includes_deal_name(
@@ -192,7 +202,7 @@ class TestIndividualStageNotification:
                 ]
             )
 
-        data = mock_manager.notify_deal_update.call_args.kwargs["data"]
+        data = _sent(mock_manager, "deal_update")[0]["data"]
         assert data["deal_name"] == "The Clubhouse"
 
     @pytest.mark.asyncio
@@ -239,6 +249,7 @@ class TestIndividualStageNotification:
 
         assert count == 0
         mock_manager.notify_deal_update.assert_not_called()
+        mock_manager.send_to_channel.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_notification_failure_does_not_block_sync(
@@ -249,7 +260,7 @@ class TestIndividualStageNotification:
     ) -> None:
         """If WebSocket notification fails, the sync still succeeds."""
         mock_manager = AsyncMock()
-        mock_manager.notify_deal_update.side_effect = RuntimeError("WS down")
+        mock_manager.send_to_channel.side_effect = RuntimeError("WS down")
         with patch(
             "app.services.websocket_manager.get_connection_manager",
             return_value=mock_manager,
@@ -351,8 +362,8 @@ class TestBatchStageNotification:
             )
 
         assert count == 5
-        assert mock_manager.notify_deal_update.call_count == 5
-        mock_manager.send_to_channel.assert_not_called()
+        assert len(_sent(mock_manager, "deal_update")) == 5
+        assert _sent(mock_manager, "batch_stage_changed") == []
 
     @pytest.mark.asyncio
     async def test_batch_threshold_configurable(
@@ -651,7 +662,7 @@ class TestSyncDealStagesIntegration:
         assert logs[0].new_stage == "under_contract"
 
         # Notification fired
-        mock_manager.notify_deal_update.assert_called_once()
+        assert len(_sent(mock_manager, "deal_update")) == 1
 
     @pytest.mark.asyncio
     async def test_sync_with_unmatched_deal_name(
@@ -673,3 +684,4 @@ class TestSyncDealStagesIntegration:
 
         assert count == 0
         mock_manager.notify_deal_update.assert_not_called()
+        mock_manager.send_to_channel.assert_not_called()
@@ -0,0 +1,246 @@
+"""
+Tests for fan-out / fan-in extraction across ARQ workers.
+
+Uses fakeredis as a local Redis stand-in and runs a real ARQ worker in
+burst mode, so jobs are enqueued, picked up and chained exactly as they
+would be in production.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.v1.endpoints.extraction import common
+from app.crud.extraction import ExtractionRunCRUD
+from app.db.base import Base
+from app.models.extraction import ExtractedValue
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("arq", reason="arq not installed (requires Redis)")
+
+from arq.connections import ArqRedis  # noqa: E402
+from arq.worker import Worker  # noqa: E402
+
+from app.tasks.extraction import (  # noqa: E402
+    extract_file_task,
+    finalize_extraction_task,
+    run_extraction_task,
+)
+
+sync_test_engine = create_engine(
+    "sqlite:///:memory:",
+    echo=False,
+    poolclass=StaticPool,
+    connect_args={"check_same_thread": False},
+)
+
+SyncTestSession = sessionmaker(
+    bind=sync_test_engine,
+    class_=Session,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
+
+@pytest.fixture
+def sync_db_session() -> Generator[Session, None, None]:
+    """Sync session; task code gets sessions from the same engine."""
+    Base.metadata.create_all(bind=sync_test_engine)
+    session = SyncTestSession()
+    try:
+        with patch("app.db.session.SessionLocal", SyncTestSession):
+            yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=sync_test_engine)
+
+
+@pytest.fixture
+def mock_extractor() -> Generator[MagicMock, None, None]:
+    """Deterministic extractor; no reference file or Excel parsing."""
+    extractor = MagicMock()
+    extractor.extract_from_file.side_effect = lambda path, **kw: {
+        "PROPERTY_NAME": f"Prop {path.rsplit('/', 1)[-1]}",
+        "FIELD_A": 1.0,
+    }
+    with (
+        patch("app.extraction.ExcelDataExtractor", return_value=extractor),
+        patch("app.tasks.extraction._get_mappings", return_value={}),
+    ):
+        yield extractor
+
+
+async def _run_worker(pool: ArqRedis) -> Worker:
+    """Drain the queue with a burst-mode worker."""
+    worker = Worker(
+        functions=[run_extraction_task, extract_file_task, finalize_extraction_task],
+        redis_pool=pool,
+        burst=True,
+        poll_delay=0.01,
+        max_jobs=1,
+        handle_signals=False,
+    )
+    # fakeredis does not implement INFO
+    with patch("arq.worker.log_redis_info", new_callable=AsyncMock):
+        await worker.main()
+    return worker
+
+
+@pytest.fixture
+def arq_pool() -> ArqRedis:
+    server = fakeredis.FakeServer()
+    return ArqRedis(
+        connection_pool=fakeredis.aioredis.FakeRedis(server=server).connection_pool
+    )
+
+
+class TestExtractionFanOut:
+    """End-to-end fan-out through a real ARQ worker."""
+
+    @pytest.mark.asyncio
+    async def test_run_fans_out_and_fans_in_once(
+        self, sync_db_session: Session, mock_extractor, arq_pool: ArqRedis
+    ):
+        run = ExtractionRunCRUD.create(sync_db_session, trigger_type="manual")
+        paths = [f"/tmp/file_{i}.xlsb" for i in range(4)]
+
+        await arq_pool.enqueue_job("run_extraction_task", str(run.id), "local", paths)
+        with patch.object(
+            common,
+            "finalize_extraction_run",
+            wraps=common.finalize_extraction_run,
+        ) as finalize:
+            worker = await _run_worker(arq_pool)
+
+        # 1 coordinator + 4 file jobs + 1 fan-in
+        assert worker.jobs_complete == 6
+        assert worker.jobs_failed == 0
+        finalize.assert_called_once()
+
+        sync_db_session.expire_all()
+        updated = ExtractionRunCRUD.get(sync_db_session, run.id)
+        assert updated.status == "completed"
+        assert updated.jobs_total == 4
+        assert updated.jobs_completed == 4
+        assert updated.files_processed == 4
+        assert set(updated.per_file_status) == set(paths)
+        assert updated.file_metadata["jobs_total"] == 4
+        assert updated.file_metadata["files_completed"] == 4
+
+        names = sync_db_session.execute(
+            select(ExtractedValue.property_name)
+            .where(ExtractedValue.extraction_run_id == run.id)
+            .distinct()
+        ).scalars()
+        assert len(set(names)) == 4
+
+    @pytest.mark.asyncio
+    async def test_cancelled_run_skips_remaining_files(
+        self, sync_db_session: Session, mock_extractor
+    ):
+        run = ExtractionRunCRUD.create(sync_db_session, trigger_type="manual")
+        ExtractionRunCRUD.start_fan_out(sync_db_session, run.id, 2)
+        ExtractionRunCRUD.cancel(sync_db_session, run.id)
+
+        ctx: dict[str, Any] = {"job_id": "file-1", "redis": AsyncMock()}
+        result = await extract_file_task(
+            ctx, str(run.id), {"file_path": "/tmp/a.xlsb", "deal_name": "A"}
+        )
+
+        assert result["status"] == "skipped_run_closed"
+        mock_extractor.extract_from_file.assert_not_called()
+        ctx["redis"].enqueue_job.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_persist_error_is_recorded_and_fans_in(
+        self, sync_db_session: Session, mock_extractor
+    ):
+        run = ExtractionRunCRUD.create(sync_db_session, trigger_type="manual")
+        ExtractionRunCRUD.start_fan_out(sync_db_session, run.id, 1)
+
+        ctx: dict[str, Any] = {"job_id": "file-1", "job_try": 1, "redis": AsyncMock()}
+        with patch.object(
+            common, "persist_extraction_result", side_effect=RuntimeError("db gone")
+        ):
+            result = await extract_file_task(
+                ctx, str(run.id), {"file_path": "/tmp/a.xlsb", "deal_name": "A"}
+            )
+
+        assert result["status"] == "failed"
+        assert result["run_finished"] is True
+        ctx["redis"].enqueue_job.assert_awaited_once()
+        sync_db_session.expire_all()
+        updated = ExtractionRunCRUD.get(sync_db_session, run.id)
+        assert updated.files_failed == 1
+        assert updated.per_file_status["/tmp/a.xlsb"]["error"] == "db gone"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_job_is_recorded_only_on_last_try(
+        self, sync_db_session: Session, mock_extractor
+    ):
+        run = ExtractionRunCRUD.create(sync_db_session, trigger_type="manual")
+        ExtractionRunCRUD.start_fan_out(sync_db_session, run.id, 1)
+        file_info = {"file_path": "/tmp/a.xlsb", "deal_name": "A"}
+
+        for job_try, recorded in ((1, 0), (3, 1)):
+            ctx: dict[str, Any] = {
+                "job_id": "file-1",
+                "job_try": job_try,
+                "redis": AsyncMock(),
+            }
+            with (
+                patch.object(
+                    common,
+                    "persist_extraction_result",
+                    side_effect=asyncio.CancelledError,
+                ),
+                pytest.raises(asyncio.CancelledError),
+            ):
+                await extract_file_task(ctx, str(run.id), file_info)
+
+            sync_db_session.expire_all()
+            updated = ExtractionRunCRUD.get(sync_db_session, run.id)
+            assert updated.jobs_completed == recorded
+        ctx["redis"].enqueue_job.assert_awaited_once()
+
+
+class TestRecordFileResult:
+    """Tests for fan-out completion tracking on ExtractionRun."""
+
+    def test_last_job_completes_run(self, sync_db_session: Session):
+        run = ExtractionRunCRUD.create(sync_db_session, trigger_type="manual")
+        ExtractionRunCRUD.start_fan_out(sync_db_session, run.id, 2)
+
+        assert not ExtractionRunCRUD.record_file_result(
+            sync_db_session, run.id, "/tmp/a.xlsb", {"status": "completed"}
+        )
+        assert ExtractionRunCRUD.record_file_result(
+            sync_db_session, run.id, "/tmp/b.xlsb", {"status": "failed", "error": "x"}
+        )
+
+        updated = ExtractionRunCRUD.get(sync_db_session, run.id)
+        assert updated.files_processed == 1
+        assert updated.files_failed == 1
+
+    def test_retried_job_not_counted_twice(self, sync_db_session: Session):
+        run = ExtractionRunCRUD.create(sync_db_session, trigger_type="manual")
+        ExtractionRunCRUD.start_fan_out(sync_db_session, run.id, 2)
+
+        for _ in range(2):
+            finished = ExtractionRunCRUD.record_file_result(
+                sync_db_session, run.id, "/tmp/a.xlsb", {"status": "completed"}
+            )
+
+        assert not finished
+        updated = ExtractionRunCRUD.get(sync_db_session, run.id)
+        assert updated.jobs_completed == 1
+        assert updated.files_processed == 1
@@ -191,8 +191,8 @@ class TestExtractionTasks:
 
     @pytest.mark.asyncio
     async def test_run_extraction_task(self):
-        """Extraction task calls the existing run_extraction_task function."""
-        mock_extract = AsyncMock()
+        """Inline extraction task runs the existing run_extraction_task function."""
+        mock_extract = MagicMock()
 
         with patch(
             "app.api.v1.endpoints.extraction.common.run_extraction_task",
@@ -216,7 +216,7 @@ class TestExtractionTasks:
     @pytest.mark.asyncio
     async def test_run_extraction_task_no_file_paths(self):
         """Extraction task works with no explicit file paths (auto-discover)."""
-        mock_extract = AsyncMock()
+        mock_extract = MagicMock()
 
         with patch(
             "app.api.v1.endpoints.extraction.common.run_extraction_task",
@@ -237,7 +237,7 @@ class TestExtractionTasks:
     @pytest.mark.asyncio
     async def test_run_extraction_task_propagates_error(self):
         """Extraction errors propagate up to ARQ for retry handling."""
-        mock_extract = AsyncMock(side_effect=RuntimeError("Extraction failed"))
+        mock_extract = MagicMock(side_effect=RuntimeError("Extraction failed"))
 
         with patch(
             "app.api.v1.endpoints.extraction.common.run_extraction_task",